@@ -14,37 +14,191 @@ This enhanced version provides more thorough link extraction from:
 - JavaScript-generated links
 - Meta tags and structured data
 
-Focus: More comprehensive content parsing and better categorization
+Crawling: pages are seeded from sitemap.xml (following sitemap indexes)
+and the home page, then fetched by a fixed pool of workers pulling from
+one queue. Each host has its own concurrency limit, so a slow host only
+holds up its own links, and links found on a page are checked while the
+crawl continues. Links are checked with HEAD, falling back to GET when a
+server rejects HEAD.
+
+Caching: results are kept in .link_check_cache.json. A result younger
+than its domain's TTL is reused without a request; an older one is
+revalidated with If-None-Match/If-Modified-Since, and a 304 keeps it.
+Internal links are always rechecked, and broken links are never cached.
+
+Offline mode serves the site from a local Django live server on the
+configured database and reports external links from the cache (or as
+skipped) instead of fetching them, so it can run in CI without network:
+
+    USE_SQLITE=true python enhanced_link_checker.py --offline
+
+To probe only a known set of URLs, such as the external URLs from the
+page link index, skip the crawl:
+
+    python manage.py check_page_links --external > external_urls.txt
+    python enhanced_link_checker.py --urls external_urls.txt
+
+Exits with status 1 when internal links are broken.
 """
 
+import argparse
 import asyncio
 import json
 import logging
+import os
 import re
-import ssl
+import sys
 import time
-from collections import defaultdict
+from collections import Counter, defaultdict
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Optional
 from urllib.parse import unquote, urljoin, urlparse
+from xml.etree import ElementTree
 
-import aiohttp
+import httpx
 from bs4 import BeautifulSoup
 
+# lxml parses several times faster than the stdlib parser
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
 
+CACHE_FILE = ".link_check_cache.json"
+DEFAULT_TTL = 24 * 60 * 60
+WORKING_STATUSES = {200, 202, 204}
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+# Servers that reject or mishandle HEAD answer these; retry with GET
+HEAD_FALLBACK_STATUSES = {400, 403, 405, 501}
+NON_PAGE_EXTENSIONS = (".pdf", ".jpg", ".jpeg", ".png", ".gif", ".css", ".js")
+SITEMAP_NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+RESULT_FIELDS = (
+    "url",
+    "status",
+    "status_code",
+    "response_time",
+    "redirect_url",
+    "error_message",
+)
+
+
+class ResultCache:
+    """Link check results on disk, keyed by URL, with per-domain TTLs."""
+
+    def __init__(
+        self,
+        path: Optional[str],
+        ttls: Optional[dict[str, int]] = None,
+        default_ttl: int = DEFAULT_TTL,
+    ):
+        self.path = path
+        self.ttls = ttls or {}
+        self.default_ttl = default_ttl
+        self.entries = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable link cache {path}: {e}")
+
+    def ttl_for(self, url: str) -> int:
+        """TTL of the most specific configured domain covering the URL's host."""
+        host = urlparse(url).netloc
+        for domain in sorted(self.ttls, key=len, reverse=True):
+            if host == domain or host.endswith(f".{domain}"):
+                return self.ttls[domain]
+        return self.default_ttl
+
+    def get(self, url: str) -> Optional[dict]:
+        return self.entries.get(url)
+
+    def is_fresh(self, entry: dict) -> bool:
+        return time.time() - entry["checked_at"] < self.ttl_for(entry["url"])
+
+    def validators(self, entry: Optional[dict]) -> dict[str, str]:
+        """Conditional request headers for revalidating a cached result."""
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, result: dict, headers) -> None:
+        if result["status"] not in ("working", "redirect"):
+            # Broken links and errors are rechecked on every run
+            self.entries.pop(result["url"], None)
+            return
+        self.entries[result["url"]] = {
+            **result,
+            "etag": headers.get("ETag", ""),
+            "last_modified": headers.get("Last-Modified", ""),
+            "checked_at": time.time(),
+        }
+
+    def touch(self, url: str) -> None:
+        self.entries[url]["checked_at"] = time.time()
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f)
+        os.replace(tmp_path, self.path)
+
+
+class HostLimiter:
+    """One semaphore per host, so no single host gets more than ``per_host`` requests."""
+
+    def __init__(self, per_host: int):
+        self.per_host = per_host
+        self.semaphores = {}
+
+    def __call__(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc
+        if host not in self.semaphores:
+            self.semaphores[host] = asyncio.Semaphore(self.per_host)
+        return self.semaphores[host]
+
 
 class EnhancedLinkChecker:
-    def __init__(self, base_url: str, max_concurrent: int = 10):
+    def __init__(
+        self,
+        base_url: str,
+        max_concurrent: int = 10,
+        per_host: int = 4,
+        cache_path: Optional[str] = CACHE_FILE,
+        ttls: Optional[dict[str, int]] = None,
+        offline: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        urls: Optional[list[str]] = None,
+    ):
         self.base_url = base_url.rstrip("/")
         self.domain = urlparse(base_url).netloc
         self.max_concurrent = max_concurrent
+        self.offline = offline
+        self.transport = transport
+        self.urls = urls
         self.session = None
 
+        # Internal links are what we're checking; never trust a cached result
+        self.cache = ResultCache(cache_path, {self.domain: 0, **(ttls or {})})
+        self.host_limit = HostLimiter(per_host)
+        self.queue = None
+        self.queued = set()
+        self.stats = Counter()
+
         # Comprehensive link storage
         self.all_links = set()
         self.pages_crawled = set()
@@ -53,7 +207,13 @@ class EnhancedLinkChecker:
         self.link_types = {}  # Categorize link types
 
         # Results storage
-        self.results = {"working": [], "broken": [], "redirects": [], "errors": []}
+        self.results = {
+            "working": [],
+            "broken": [],
+            "redirects": [],
+            "errors": [],
+            "skipped": [],
+        }
 
         # Enhanced extraction patterns
         self.css_url_pattern = re.compile(
@@ -75,32 +235,26 @@ class EnhancedLinkChecker:
 
     async def __aenter__(self):
         """Async context manager entry"""
-        connector = aiohttp.TCPConnector(
-            limit=self.max_concurrent,
-            ssl=ssl.create_default_context(),
-            ttl_dns_cache=300,
-            use_dns_cache=True,
-        )
-
-        timeout = aiohttp.ClientTimeout(total=30, connect=10, sock_read=10)
-
-        self.session = aiohttp.ClientSession(
-            connector=connector,
-            timeout=timeout,
+        self.session = httpx.AsyncClient(
+            timeout=httpx.Timeout(30, connect=10, read=10),
+            limits=httpx.Limits(
+                max_connections=self.max_concurrent,
+                max_keepalive_connections=self.max_concurrent,
+            ),
             headers={
                 "User-Agent": "Mozilla/5.0 (compatible; EthicicLinkChecker/2.0; +https://ethicic.com/robots.txt)",
                 "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
                 "Accept-Language": "en-US,en;q=0.5",
-                "Accept-Encoding": "gzip, deflate",
-                "Connection": "keep-alive",
             },
+            transport=self.transport,
         )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
         if self.session:
-            await self.session.close()
+            await self.session.aclose()
+        self.cache.save()
 
     def is_valid_link(self, url: str) -> bool:
         """Enhanced link validation with better filtering"""
@@ -163,6 +317,23 @@ class EnhancedLinkChecker:
         url = unquote(url)
         return re.sub(r"#.*$", "", url)  # Remove fragments for checking
 
+    def is_internal(self, url: str) -> bool:
+        return urlparse(url).netloc == self.domain
+
+    def is_crawlable(self, url: str) -> bool:
+        """Internal pages are fetched and parsed for more links."""
+        return self.is_internal(url) and not urlparse(url).path.endswith(
+            NON_PAGE_EXTENSIONS
+        )
+
+    def local_url(self, url: str) -> str:
+        """Point a sitemap URL at the host being checked.
+
+        Sitemaps use the Wagtail Site's hostname, which differs from the
+        checked host when running against a local server.
+        """
+        base = urlparse(self.base_url)
+        return urlparse(url)._replace(scheme=base.scheme, netloc=base.netloc).geturl()
 
     def extract_links_from_css(self, css_content: str, base_url: str) -> set[str]:
         """Extract URLs from CSS content"""
@@ -317,168 +488,195 @@ class EnhancedLinkChecker:
 
         return links
 
-    async def fetch_page(
-        self, url: str
-    ) -> tuple[Optional[str], Optional[BeautifulSoup]]:
-        """Fetch and parse a page"""
+    def add_link(self, url: str, found_on: str) -> None:
+        """Record where a link was found and queue it once."""
+        self.all_links.add(url)
+        self.link_sources[url].append(found_on)
+        if url not in self.queued:
+            self.queued.add(url)
+            self.queue.put_nowait(url)
+
+    async def seed_from_sitemap(self, url: Optional[str] = None, nested: bool = False) -> int:
+        """Queue every page listed in sitemap.xml, following a sitemap index."""
+        url = url or f"{self.base_url}/sitemap.xml"
         try:
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    content = await response.text()
-                    soup = BeautifulSoup(content, "html.parser")
-                    return content, soup
-                logger.warning(f"Failed to fetch {url}: HTTP {response.status}")
-                return None, None
-        except Exception as e:
-            logger.error(f"Error fetching {url}: {str(e)}")
-            return None, None
-
-    async def discover_pages(self) -> set[str]:
-        """Discover all pages on the site"""
-        pages_to_crawl = {self.base_url}
-        discovered_pages = set()
-
-        while pages_to_crawl:
-            current_batch = list(pages_to_crawl)[:20]  # Process in batches
-            pages_to_crawl -= set(current_batch)
-
-            tasks = []
-            for page_url in current_batch:
-                if page_url not in discovered_pages:
-                    tasks.append(self.fetch_page(page_url))
-
-            if not tasks:
-                continue
-
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for i, result in enumerate(results):
-                page_url = current_batch[i]
-
-                if isinstance(result, Exception):
-                    logger.error(f"Exception crawling {page_url}: {result}")
-                    continue
-
-                content, soup = result
-                if soup is None:
-                    continue
-
-                discovered_pages.add(page_url)
-
-                # Extract links from this page
-                page_links = self.extract_comprehensive_links(soup, page_url)
-
-                # Add internal pages for further crawling
-                for link in page_links:
-                    self.all_links.add(link)
-                    self.link_sources[link].append(page_url)
-
-                    # If it's an internal page we haven't seen, add it for crawling
-                    if (
-                        urlparse(link).netloc == self.domain
-                        and link not in discovered_pages
-                        and link not in pages_to_crawl
-                        and not link.endswith(
-                            (".pdf", ".jpg", ".jpeg", ".png", ".gif", ".css", ".js")
-                        )
-                    ):
-                        pages_to_crawl.add(link)
+            response = await self.session.get(url)
+        except httpx.HTTPError as e:
+            logger.warning(f"Could not fetch sitemap {url}: {e}")
+            return 0
+        if response.status_code != 200:
+            logger.info(f"No sitemap at {url}: HTTP {response.status_code}")
+            return 0
 
-        logger.info(f"Discovered {len(discovered_pages)} pages")
-        return discovered_pages
+        try:
+            # Our own sitemap, fetched from the site under test
+            root = ElementTree.fromstring(response.content)  # noqa: S314
+        except ElementTree.ParseError as e:
+            logger.warning(f"Invalid sitemap {url}: {e}")
+            return 0
+
+        locs = [
+            self.local_url(loc.text.strip())
+            for loc in root.iter(f"{SITEMAP_NS}loc")
+            if loc.text
+        ]
+        if root.tag == f"{SITEMAP_NS}sitemapindex":
+            if nested:
+                return 0
+            counts = await asyncio.gather(
+                *(self.seed_from_sitemap(loc, nested=True) for loc in locs)
+            )
+            return sum(counts)
+
+        for loc in locs:
+            self.add_link(loc, url)
+        return len(locs)
+
+    def make_result(
+        self,
+        url: str,
+        status: str,
+        started: float,
+        status_code: Optional[int] = None,
+        redirect_url: str = "",
+        error_message: str = "",
+    ) -> dict:
+        return {
+            "url": url,
+            "status": status,
+            "status_code": status_code,
+            "response_time": time.time() - started,
+            "redirect_url": redirect_url,
+            "error_message": error_message,
+        }
 
-    async def check_link(self, url: str) -> dict:
-        """Check a single link with enhanced error handling"""
-        start_time = time.time()
+    def result_from_response(self, url: str, response: httpx.Response, started: float) -> dict:
+        status_code = response.status_code
+        if status_code in WORKING_STATUSES:
+            return self.make_result(url, "working", started, status_code)
+        if status_code in REDIRECT_STATUSES:
+            redirect_url = response.headers.get("Location", "")
+            if redirect_url:
+                redirect_url = self.normalize_url(redirect_url, url)
+            return self.make_result(url, "redirect", started, status_code, redirect_url)
+        return self.make_result(
+            url, "broken", started, status_code, error_message=f"HTTP {status_code}"
+        )
 
+    async def crawl_page(self, url: str) -> dict:
+        """Fetch an internal page, queue its links and return its own check result."""
+        started = time.time()
         try:
-            async with self.session.head(url, allow_redirects=False) as response:
-                response_time = time.time() - start_time
-
-                if response.status in [200, 202, 204]:
-                    return {
-                        "url": url,
-                        "status": "working",
-                        "status_code": response.status,
-                        "response_time": response_time,
-                        "redirect_url": "",
-                        "error_message": "",
-                    }
-                if response.status in [301, 302, 303, 307, 308]:
-                    redirect_url = response.headers.get("Location", "")
-                    if redirect_url:
-                        redirect_url = self.normalize_url(redirect_url, url)
-
-                    return {
-                        "url": url,
-                        "status": "redirect",
-                        "status_code": response.status,
-                        "response_time": response_time,
-                        "redirect_url": redirect_url,
-                        "error_message": "",
-                    }
-                return {
-                    "url": url,
-                    "status": "broken",
-                    "status_code": response.status,
-                    "response_time": response_time,
-                    "redirect_url": "",
-                    "error_message": f"HTTP {response.status}",
-                }
+            async with self.host_limit(url):
+                response = await self.session.get(url)
+        except httpx.TimeoutException:
+            return self.make_result(url, "error", started, error_message="Timeout")
+        except httpx.HTTPError as e:
+            return self.make_result(url, "error", started, error_message=str(e))
+
+        result = self.result_from_response(url, response, started)
+        if response.status_code == 200 and "html" in response.headers.get(
+            "Content-Type", ""
+        ):
+            self.pages_crawled.add(url)
+            soup = BeautifulSoup(response.text, HTML_PARSER)
+            for link in self.extract_comprehensive_links(soup, url):
+                self.add_link(link, url)
+        elif result["status"] == "redirect" and result["redirect_url"]:
+            self.add_link(result["redirect_url"], url)
+        return result
 
-        except asyncio.TimeoutError:
-            return {
-                "url": url,
-                "status": "error",
-                "status_code": None,
-                "response_time": time.time() - start_time,
-                "redirect_url": "",
-                "error_message": "Timeout",
-            }
-        except Exception as e:
-            return {
-                "url": url,
-                "status": "error",
-                "status_code": None,
-                "response_time": time.time() - start_time,
-                "redirect_url": "",
-                "error_message": str(e),
-            }
-
-    async def check_all_links(self) -> None:
-        """Check all discovered links"""
-        logger.info(f"Checking {len(self.all_links)} unique links...")
-
-        # Convert to list for processing
-        links_to_check = list(self.all_links)
-
-        # Process in batches to avoid overwhelming servers
-        batch_size = self.max_concurrent
-        for i in range(0, len(links_to_check), batch_size):
-            batch = links_to_check[i : i + batch_size]
-
-            tasks = [self.check_link(url) for url in batch]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for result in results:
-                if isinstance(result, Exception):
-                    logger.error(f"Exception checking link: {result}")
-                    continue
-
-                # Categorize results
-                status = result["status"]
-                if status == "working":
-                    self.results["working"].append(result)
-                elif status == "broken":
-                    self.results["broken"].append(result)
-                elif status == "redirect":
-                    self.results["redirects"].append(result)
+    async def check_link(self, url: str) -> dict:
+        """Check a single link, reusing or revalidating a cached result"""
+        started = time.time()
+        if not url.startswith(("http://", "https://")):
+            return self.make_result(url, "skipped", started, error_message="Not an HTTP link")
+
+        cached = self.cache.get(url)
+        if cached and self.cache.is_fresh(cached):
+            self.stats["cache_hits"] += 1
+            return {field: cached[field] for field in RESULT_FIELDS}
+        if self.offline and not self.is_internal(url):
+            if cached:
+                self.stats["cache_hits"] += 1
+                return {field: cached[field] for field in RESULT_FIELDS}
+            return self.make_result(url, "skipped", started, error_message="Offline")
+
+        headers = self.cache.validators(cached)
+        try:
+            async with self.host_limit(url):
+                response = await self.session.head(url, headers=headers)
+                if response.status_code in HEAD_FALLBACK_STATUSES:
+                    self.stats["get_fallbacks"] += 1
+                    # Status and headers only; the body is never downloaded
+                    async with self.session.stream("GET", url, headers=headers) as response:
+                        pass
+        except httpx.TimeoutException:
+            return self.make_result(url, "error", started, error_message="Timeout")
+        except httpx.HTTPError as e:
+            return self.make_result(url, "error", started, error_message=str(e))
+
+        if response.status_code == 304 and cached:
+            self.stats["revalidated"] += 1
+            self.cache.touch(url)
+            return {field: cached[field] for field in RESULT_FIELDS}
+
+        result = self.result_from_response(url, response, started)
+        self.cache.store(result, response.headers)
+        return result
+
+    def record(self, result: dict) -> None:
+        status = result["status"]
+        if status == "working":
+            self.results["working"].append(result)
+        elif status == "broken":
+            self.results["broken"].append(result)
+        elif status == "redirect":
+            self.results["redirects"].append(result)
+        elif status == "skipped":
+            self.results["skipped"].append(result)
+        else:
+            self.results["errors"].append(result)
+
+        checked = sum(len(results) for results in self.results.values())
+        if checked % 100 == 0:
+            logger.info(f"Checked {checked} links, {self.queue.qsize()} queued...")
+
+    async def worker(self) -> None:
+        while True:
+            url = await self.queue.get()
+            try:
+                if self.is_crawlable(url):
+                    result = await self.crawl_page(url)
                 else:
-                    self.results["errors"].append(result)
+                    result = await self.check_link(url)
+                self.record(result)
+            except Exception as e:
+                logger.error(f"Exception checking {url}: {e}")
+            finally:
+                self.queue.task_done()
+
+    async def crawl(self) -> None:
+        """Crawl the site and check every link found, until the queue drains."""
+        self.queue = asyncio.Queue()
+        if self.urls is not None:
+            # A known URL set (e.g. the page link index's external URLs); no crawl
+            for url in self.urls:
+                self.add_link(url, "url list")
+        else:
+            seeded = await self.seed_from_sitemap()
+            logger.info(f"Seeded {seeded} pages from sitemap")
+            self.add_link(f"{self.base_url}/", self.base_url)
+
+        workers = [asyncio.create_task(self.worker()) for _ in range(self.max_concurrent)]
+        try:
+            await self.queue.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
 
-            # Progress indication
-            if i + batch_size < len(links_to_check):
-                logger.info(f"Checked {i + batch_size}/{len(links_to_check)} links...")
+        logger.info(f"Discovered {len(self.pages_crawled)} pages")
 
     def generate_enhanced_report(self) -> dict:
         """Generate comprehensive report with enhanced categorization"""
@@ -487,6 +685,7 @@ class EnhancedLinkChecker:
         broken_count = len(self.results["broken"])
         redirect_count = len(self.results["redirects"])
         error_count = len(self.results["errors"])
+        skipped_count = len(self.results["skipped"])
 
         success_rate = (working_count / total_links * 100) if total_links > 0 else 0
 
@@ -531,6 +730,9 @@ class EnhancedLinkChecker:
                 "broken_links": broken_count,
                 "redirect_links": redirect_count,
                 "error_links": error_count,
+                "skipped_links": skipped_count,
+                "cache_hits": self.stats["cache_hits"],
+                "revalidated": self.stats["revalidated"],
                 "success_rate": round(success_rate, 1),
             },
             "link_categories": {
@@ -543,10 +745,10 @@ class EnhancedLinkChecker:
                 "broken": self.results["broken"],
                 "redirects": self.results["redirects"],
                 "errors": self.results["errors"],
+                "skipped": self.results["skipped"],
             },
         }
 
-
     def _categorize_by_domain(self) -> dict[str, int]:
         """Categorize links by domain"""
         domain_counts = defaultdict(int)
@@ -563,15 +765,11 @@ class EnhancedLinkChecker:
 
         logger.info(f"Starting enhanced comprehensive link check for {self.base_url}")
 
-        # Step 1: Discover all pages
-        self.pages_crawled = await self.discover_pages()
-
-        # Step 2: Check all discovered links
-        await self.check_all_links()
+        # Discover pages and check links in one pass
+        await self.crawl()
 
         execution_time = time.time() - start_time
 
-        # Step 3: Generate report
         report = self.generate_enhanced_report()
         report["summary"]["execution_time_seconds"] = round(execution_time, 1)
 
@@ -580,21 +778,93 @@ class EnhancedLinkChecker:
             f"Found {len(self.all_links)} unique links across {len(self.pages_crawled)} pages"
         )
         logger.info(
-            f"Results: {len(self.results['working'])} working, {len(self.results['broken'])} broken, {len(self.results['redirects'])} redirects"
+            f"Results: {len(self.results['working'])} working, {len(self.results['broken'])} broken, {len(self.results['redirects'])} redirects, {self.stats['cache_hits']} from cache"
         )
 
         return report
 
 
-# Import Counter for report generation
-from collections import Counter
-
-
-async def main():
+@contextmanager
+def local_server():
+    """Serve the Django site from a live server thread on a free localhost port."""
+    import django
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "ethicic.settings")
+    # Keep error and slow-request reports from the crawl off the network
+    os.environ.setdefault("POSTHOG_API_KEY", "")
+    django.setup()
+
+    from django.conf import settings
+    from django.contrib.staticfiles.handlers import StaticFilesHandler
+    from django.test.testcases import LiveServerThread
+
+    if "*" not in settings.ALLOWED_HOSTS:
+        settings.ALLOWED_HOSTS = [*settings.ALLOWED_HOSTS, "localhost"]
+
+    server = LiveServerThread("localhost", StaticFilesHandler)
+    server.daemon = True
+    server.start()
+    server.is_ready.wait()
+    if server.error:
+        raise server.error
+    try:
+        yield f"http://localhost:{server.port}"
+    finally:
+        server.terminate()
+
+
+def parse_ttl(value: str) -> tuple[str, int]:
+    domain, _, seconds = value.partition("=")
+    try:
+        return domain, int(seconds)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected DOMAIN=SECONDS, got {value!r}") from None
+
+
+def read_urls(path: str) -> list[str]:
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Check every link on ethicic.com")
+    parser.add_argument("--base-url", default="https://ethicic.com")
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Check a local Django server; don't fetch external links",
+    )
+    parser.add_argument("--max-concurrent", type=int, default=8, help="Worker count")
+    parser.add_argument("--per-host", type=int, default=4, help="Requests per host at once")
+    parser.add_argument("--cache", default=CACHE_FILE, help="Result cache file")
+    parser.add_argument("--no-cache", action="store_true", help="Don't read or write the cache")
+    parser.add_argument(
+        "--urls",
+        metavar="FILE",
+        help="Check the URLs listed in FILE (one per line) instead of crawling",
+    )
+    parser.add_argument(
+        "--ttl",
+        type=parse_ttl,
+        action="append",
+        default=[],
+        metavar="DOMAIN=SECONDS",
+        help=f"Cache TTL for a domain and its subdomains (default {DEFAULT_TTL}s)",
+    )
+    return parser.parse_args(argv)
+
+
+async def main(base_url: str, options: argparse.Namespace) -> dict:
     """Main execution function"""
-    base_url = "https://ethicic.com"
-
-    async with EnhancedLinkChecker(base_url, max_concurrent=8) as checker:
+    async with EnhancedLinkChecker(
+        base_url,
+        max_concurrent=options.max_concurrent,
+        per_host=options.per_host,
+        cache_path=None if options.no_cache else options.cache,
+        ttls=dict(options.ttl),
+        offline=options.offline,
+        urls=read_urls(options.urls) if options.urls else None,
+    ) as checker:
         report = await checker.run_comprehensive_check()
 
         # Save detailed JSON report
@@ -624,6 +894,8 @@ def generate_markdown_summary(report: dict) -> None:
 - **Broken Links**: {summary["broken_links"]}
 - **Redirects**: {summary["redirect_links"]}
 - **Errors**: {summary["error_links"]}
+- **Skipped**: {summary["skipped_links"]}
+- **From Cache**: {summary["cache_hits"]} ({summary["revalidated"]} revalidated)
 
 ## 🚨 Critical Issues by Category
 
@@ -680,5 +952,15 @@ All references to the defunct investvegan.org domain are failing.
     print("📊 Detailed data: enhanced_link_report.json")
 
 
+def run(argv=None) -> int:
+    options = parse_args(argv)
+    if options.offline:
+        with local_server() as base_url:
+            report = asyncio.run(main(base_url, options))
+    else:
+        report = asyncio.run(main(options.base_url, options))
+    return 1 if report["broken_link_categories"].get("internal_broken") else 0
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    sys.exit(run())
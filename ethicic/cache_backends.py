@@ -0,0 +1,122 @@
+"""
+Cache backends for ethicic-public.
+
+FailoverRedisCache lets settings point at Redis without contacting it at
+import time. The connection is made on first use; while Redis is
+unreachable, calls are served by a per-process LocMemCache and Redis is
+retried every FAILOVER_RETRY_SECONDS, so an outage degrades caching
+instead of failing requests (or worker boot).
+
+The fallback is per process, so entries that rely on being shared between
+workers - version keys, and artifacts dropped on publish - must not be used
+while it is active: check ``shared_cache_available()``, and wrap the
+invalidation in ``DeferredInvalidation`` so it reaches Redis once it is back.
+"""
+
+import logging
+import threading
+import time
+
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.redis import RedisCache
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+
+logger = logging.getLogger(__name__)
+
+FAILOVER_METHODS = (
+    "add",
+    "get",
+    "set",
+    "touch",
+    "delete",
+    "get_many",
+    "has_key",
+    "incr",
+    "set_many",
+    "delete_many",
+    "clear",
+)
+
+
+class FailoverRedisCache(RedisCache):
+    """RedisCache that falls back to a local cache while Redis is down.
+
+    Accepts ``FAILOVER_RETRY_SECONDS`` in OPTIONS (default 30); all other
+    OPTIONS go to the redis connection pool as usual.
+    """
+
+    # Errors that mean Redis is unreachable, as opposed to a bad command
+    unavailable_errors = (RedisConnectionError, RedisTimeoutError)
+
+    def __init__(self, server, params):
+        params = {**params, "OPTIONS": dict(params.get("OPTIONS", {}))}
+        self.retry_seconds = params["OPTIONS"].pop("FAILOVER_RETRY_SECONDS", 30)
+        super().__init__(server, params)
+        self.fallback = LocMemCache(
+            f"failover-{self.key_prefix}",
+            {"TIMEOUT": params.get("TIMEOUT", 300), "KEY_PREFIX": self.key_prefix},
+        )
+        self.retry_after = 0.0
+
+    @property
+    def using_fallback(self):
+        return time.monotonic() < self.retry_after
+
+    def fail_over(self, error):
+        """Serve from the local cache until the retry window has passed."""
+        self.retry_after = time.monotonic() + self.retry_seconds
+        logger.warning(
+            f"Redis unavailable ({error}); using local cache for {self.retry_seconds}s"
+        )
+
+    def _call(self, method, *args, **kwargs):
+        if not self.using_fallback:
+            try:
+                return getattr(RedisCache, method)(self, *args, **kwargs)
+            except self.unavailable_errors as e:
+                self.fail_over(e)
+        return getattr(self.fallback, method)(*args, **kwargs)
+
+
+def _failover(method):
+    def call(self, *args, **kwargs):
+        return self._call(method, *args, **kwargs)
+
+    call.__name__ = method
+    return call
+
+
+for _method in FAILOVER_METHODS:
+    setattr(FailoverRedisCache, _method, _failover(_method))
+
+
+def shared_cache_available(cache) -> bool:
+    """Whether ``cache`` currently reaches the store shared by every worker."""
+    return not getattr(cache, "using_fallback", False)
+
+
+class DeferredInvalidation:
+    """
+    An invalidation of shared cache entries that survives a Redis outage.
+
+    Calling it runs ``invalidate``. If that only reached this process's
+    fallback, it runs again on the first ``flush()`` after Redis is back, so
+    entries stored before the outage don't outlive changes made during it.
+    """
+
+    def __init__(self, cache, invalidate):
+        self.cache = cache
+        self.invalidate = invalidate
+        self.pending = False
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.invalidate()
+            self.pending = not shared_cache_available(self.cache)
+
+    def flush(self):
+        """Re-run a pending invalidation if the shared cache is reachable again."""
+        if self.pending and shared_cache_available(self.cache):
+            self()
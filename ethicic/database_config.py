@@ -3,38 +3,60 @@ Centralized database configuration module for ethicic-public
 Based on garden app's database configuration approach
 """
 
+import functools
+import importlib.util
+import logging
 import os
+from contextlib import contextmanager
 from pathlib import Path
 from urllib.parse import urlparse
 
+# Supported values for DB_POOL_MODE
+POOL_MODE_PERSISTENT = "persistent"  # Django persistent connections (default)
+POOL_MODE_PSYCOPG = "psycopg"  # psycopg 3 connection pool inside each worker
+POOL_MODE_PGBOUNCER = "pgbouncer"  # External PgBouncer in transaction mode
+POOL_MODES = (POOL_MODE_PERSISTENT, POOL_MODE_PSYCOPG, POOL_MODE_PGBOUNCER)
 
+# Imported from settings: log instead of printing, and never touch the network
+logger = logging.getLogger(__name__)
+
+# Checked in order when no certificate path is set in the environment
+SSL_CERT_PATHS = (
+    "/app/config/ssl/ubicloud-root-ca.pem",  # Docker/production (Kinsta)
+    "./config/ssl/ubicloud-root-ca.pem",  # Relative path from app root
+    "/home/ec1c/garden/ethicic-public/config/ssl/ubicloud-root-ca.pem",  # Full path
+)
+SSL_CERT_ENV_VARS = ("SSL_ROOT_CERT", "DB_CA_CERT_PATH", "UBI_DB_CA_CERT_PATH")
+
+
+@functools.lru_cache(maxsize=1)
 def get_ssl_cert_path():
     """
-    Find SSL certificate following garden app's pattern
-    Checks multiple locations in order of preference
-    """
-    # SSL certificate paths for different environments
-    ssl_cert_paths = [
-        "/app/config/ssl/ubicloud-root-ca.pem",  # Docker/production (Kinsta)
-        "./config/ssl/ubicloud-root-ca.pem",  # Relative path from app root
-        "/home/ec1c/garden/ethicic-public/config/ssl/ubicloud-root-ca.pem",  # Full path
-        os.environ.get("SSL_ROOT_CERT"),  # Environment override
-        os.environ.get("DB_CA_CERT_PATH"),  # Alternative env var
-        os.environ.get("UBI_DB_CA_CERT_PATH"),  # Ubicloud specific env var
-    ]
-
-    # Find the first available SSL certificate
-    for cert_path in ssl_cert_paths:
+    Find SSL certificate following garden app's pattern.
+
+    An explicitly configured path (SSL_ROOT_CERT, DB_CA_CERT_PATH,
+    UBI_DB_CA_CERT_PATH) wins; otherwise the known locations are probed
+    once per process.
+    """
+    for var in SSL_CERT_ENV_VARS:
+        cert_path = os.environ.get(var)
         if cert_path and Path(cert_path).exists():
-            return str(cert_path)  # Ensure it's a string, not Path object
+            return str(cert_path)
+
+    for cert_path in SSL_CERT_PATHS:
+        if Path(cert_path).exists():
+            return cert_path
 
     return None
 
 
-def get_database_config(database_url=None):
+def get_database_config(database_url=None, statement_timeout_ms=None):
     """
     Generate database configuration with SSL and optimization settings
     Following garden app's configuration pattern
+
+    statement_timeout_ms overrides DB_STATEMENT_TIMEOUT_MS for this
+    connection; 0 disables the timeout.
     """
     if not database_url:
         database_url = os.getenv("UBI_DATABASE_URL") or os.getenv("DATABASE_URL")
@@ -48,9 +70,10 @@ def get_database_config(database_url=None):
 
         base_config = dj_database_url.parse(database_url)
 
-        print(f"🔍 Configuring database connection to: {base_config['HOST']}")
-        print(f"   Port: {base_config['PORT']}")
-        print(f"   Database: {base_config['NAME']}")
+        logger.debug(
+            f"Configuring database connection to {base_config['HOST']}:"
+            f"{base_config['PORT']}/{base_config['NAME']}"
+        )
 
         # Extract connection details from parsed config
         host = base_config["HOST"]
@@ -62,9 +85,10 @@ def get_database_config(database_url=None):
     except ImportError:
         # Fallback to manual parsing
         parsed = urlparse(database_url)
-        print(f"🔍 Configuring database connection to: {parsed.hostname}")
-        print(f"   Port: {parsed.port or 5432}")
-        print(f"   Database: {parsed.path[1:]}")
+        logger.debug(
+            f"Configuring database connection to {parsed.hostname}:"
+            f"{parsed.port or 5432}/{parsed.path[1:]}"
+        )
 
         host = parsed.hostname
         port = parsed.port or 5432
@@ -85,28 +109,190 @@ def get_database_config(database_url=None):
         # Try full SSL verification with certificate first
         ssl_options["sslmode"] = "verify-full"
         ssl_options["sslrootcert"] = ssl_cert_path
-        print(
-            f"✅ Found SSL certificate, attempting secure connection: {ssl_cert_path}"
-        )
+        logger.debug(f"Using SSL certificate {ssl_cert_path}")
     else:
         # Fallback to SSL without certificate verification (still encrypted)
         ssl_options["sslmode"] = "require"
-        print(
-            "⚠️  No SSL certificate found - using encrypted connection without verification"
-        )
+        logger.info("No SSL certificate found - using encrypted connection without verification")
 
-    return {
-        "ENGINE": "django.db.backends.postgresql",
-        "NAME": name,
-        "USER": user,
-        "PASSWORD": password,
-        "HOST": host,
-        "PORT": port,
-        "OPTIONS": ssl_options,
-        "CONN_MAX_AGE": 600,  # 10 minutes connection pooling
-        "CONN_HEALTH_CHECKS": True,  # Enable health checks
+    return apply_connection_pooling(
+        {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": name,
+            "USER": user,
+            "PASSWORD": password,
+            "HOST": host,
+            "PORT": port,
+            "OPTIONS": ssl_options,
+            "CONN_MAX_AGE": 600,  # 10 minutes connection pooling
+            "CONN_HEALTH_CHECKS": True,  # Enable health checks
+        },
+        statement_timeout_ms=statement_timeout_ms,
+    )
+
+
+def get_ubicloud_database_config(database_url=None):
+    """
+    Configuration for the ``ubicloud`` alias used by migrations and the
+    import commands, whose long-running queries must not hit the request
+    statement timeout. UBI_DB_STATEMENT_TIMEOUT_MS sets one (default: none).
+    """
+    return get_database_config(
+        database_url,
+        statement_timeout_ms=os.getenv("UBI_DB_STATEMENT_TIMEOUT_MS", "0"),
+    )
+
+
+def _psycopg3_available():
+    """Check whether psycopg 3 is installed (required for native pooling)"""
+    return importlib.util.find_spec("psycopg") is not None
+
+
+def _psycopg_pool_available():
+    """Check whether psycopg 3 and psycopg_pool are both installed"""
+    return _psycopg3_available() and importlib.util.find_spec("psycopg_pool") is not None
+
+
+def get_pool_mode():
+    """
+    Resolve the configured connection pooling mode from DB_POOL_MODE
+    Falls back to persistent connections when the value is unknown
+    """
+    mode = os.getenv("DB_POOL_MODE", POOL_MODE_PERSISTENT).strip().lower()
+    if mode not in POOL_MODES:
+        return POOL_MODE_PERSISTENT
+    return mode
+
+
+def apply_connection_pooling(config, mode=None, statement_timeout_ms=None):
+    """
+    Apply pooling, health check and statement timeout settings to a
+    PostgreSQL DATABASES entry.
+
+    The statement timeout comes from DB_STATEMENT_TIMEOUT_MS (default 30s)
+    unless statement_timeout_ms is given; 0 disables it.
+
+    Modes (DB_POOL_MODE):
+    - persistent: one long-lived connection per worker (CONN_MAX_AGE)
+    - psycopg: psycopg 3 pool per worker, connections checked on checkout
+    - pgbouncer: short client connections to PgBouncer, no server-side
+      cursors or named prepared statements (transaction pooling safe)
+    """
+    if not config or "postgresql" not in config.get("ENGINE", ""):
+        return config
+
+    mode = mode or get_pool_mode()
+    options = dict(config.get("OPTIONS") or {})
+    if statement_timeout_ms is None:
+        statement_timeout_ms = os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000")
+    statement_timeout = int(statement_timeout_ms or 0)
+
+    if mode == POOL_MODE_PSYCOPG and not _psycopg_pool_available():
+        # Native pooling needs psycopg 3 + psycopg_pool; keep persistent connections
+        mode = POOL_MODE_PERSISTENT
+
+    if mode == POOL_MODE_PSYCOPG:
+        options["pool"] = {
+            "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+            "max_size": int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+            "timeout": float(os.getenv("DB_POOL_TIMEOUT", "10")),
+            "max_idle": float(os.getenv("DB_POOL_MAX_IDLE", "300")),
+            "name": options.get("application_name", "ethicic_public"),
+        }
+        # Server-side prepared statements after N executions of the same query
+        options["prepare_threshold"] = int(os.getenv("DB_PREPARE_THRESHOLD", "5"))
+        # Pooled connections must not also be persistent
+        config["CONN_MAX_AGE"] = 0
+        # Django passes ConnectionPool.check_connection as the pool's checkout
+        # hook when health checks are on, reconnecting dropped sockets
+        config["CONN_HEALTH_CHECKS"] = True
+    elif mode == POOL_MODE_PGBOUNCER:
+        # Transaction pooling: no session state can outlive a transaction
+        config["DISABLE_SERVER_SIDE_CURSORS"] = True
+        config["CONN_MAX_AGE"] = int(os.getenv("DB_CONN_MAX_AGE", "0"))
+        config["CONN_HEALTH_CHECKS"] = config["CONN_MAX_AGE"] > 0
+        if _psycopg3_available():
+            options["prepare_threshold"] = None
+        # PgBouncer rejects the "options" startup parameter by default, so
+        # statement_timeout must be configured on the database role instead
+        statement_timeout = 0
+    else:
+        config["CONN_MAX_AGE"] = config.get("CONN_MAX_AGE") or 600
+        config["CONN_HEALTH_CHECKS"] = True
+
+    if statement_timeout and "options" not in options:
+        options["options"] = f"-c statement_timeout={statement_timeout}"
+
+    config["OPTIONS"] = options
+    return config
+
+
+def get_pool_stats(alias="default"):
+    """
+    Return connection pool metrics for a database alias.
+
+    For psycopg pools this reports connections in use, requests waiting and
+    average acquire latency. Other modes report the persistent connection state.
+    """
+    from django.db import connections
+
+    connection = connections[alias]
+    stats = {
+        "mode": get_pool_mode(),
+        "vendor": connection.vendor,
+        "conn_max_age": connection.settings_dict.get("CONN_MAX_AGE"),
     }
 
+    pool = getattr(connection, "pool", None)
+    if pool is None:
+        stats["connected"] = connection.connection is not None
+        return stats
+
+    raw = pool.get_stats()
+    pool_size = raw.get("pool_size", 0)
+    pool_available = raw.get("pool_available", 0)
+    requests_num = raw.get("requests_num", 0)
+    stats.update(
+        {
+            "pool_min": raw.get("pool_min"),
+            "pool_max": raw.get("pool_max"),
+            "pool_size": pool_size,
+            "in_use": max(pool_size - pool_available, 0),
+            "available": pool_available,
+            "waiting": raw.get("requests_waiting", 0),
+            "requests": requests_num,
+            "requests_errors": raw.get("requests_errors", 0),
+            "acquire_latency_ms_avg": (
+                round(raw.get("requests_wait_ms", 0) / requests_num, 2)
+                if requests_num
+                else 0.0
+            ),
+            "connection_errors": raw.get("connections_errors", 0),
+        }
+    )
+    return stats
+
+
+@contextmanager
+def statement_timeout(milliseconds, using="default"):
+    """
+    Apply a statement timeout to the queries inside the block only.
+
+    Uses SET LOCAL so the timeout is scoped to the surrounding transaction
+    and is safe behind PgBouncer transaction pooling.
+    """
+    from django.db import connections, transaction
+
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        yield
+        return
+
+    with transaction.atomic(using=using):
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL statement_timeout = %s", [int(milliseconds)])
+        yield
+
 
 def validate_database_config():
     """
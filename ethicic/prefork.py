@@ -0,0 +1,121 @@
+"""
+Preload-friendly application init for ethicic-public.
+
+With gunicorn's ``preload_app`` the master imports the app once and forks
+its workers, so whatever it loaded (Wagtail, models, views, compiled
+templates) is shared copy-on-write instead of rebuilt per worker. The
+hooks in ``gunicorn.conf.py`` call into this module:
+
+- ``warm_up()`` in the master, after the app is loaded: imports every view
+  module and compiles every template into the cached loader.
+- ``before_fork()`` in the master: closes DB and cache connections so no
+  socket is inherited, shuts down any psycopg connection pool (its
+  sockets and maintenance threads must not cross the fork; each worker
+  builds its own on first query), and moves loaded objects out of the garbage
+  collector's reach (``gc.freeze``) so collections in the workers don't
+  write to, and so un-share, their pages.
+
+Redis, PostHog and the platform API client connect lazily on first use,
+which is in the worker, after the fork.
+"""
+
+import gc
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_EXTENSIONS = (".html", ".txt", ".xml")
+
+
+def import_views() -> int:
+    """Resolve the URLconf and import every lazily loaded view module."""
+    from django.urls import get_resolver
+
+    from public_site import views
+
+    # Reading url_patterns imports the URLconf and the modules it references
+    _ = get_resolver().url_patterns
+    for name in views.__all__:
+        getattr(views, name)
+    return len(views.__all__)
+
+
+def iter_template_names(engine):
+    """Names of templates found in the engine's template directories."""
+    seen = set()
+    for loader in engine.template_loaders:
+        # Unwrap the cached loader to reach the directories it searches
+        for inner in getattr(loader, "loaders", [loader]):
+            for template_dir in inner.get_dirs():
+                for root, _dirs, files in os.walk(template_dir):
+                    for filename in files:
+                        if not filename.endswith(TEMPLATE_EXTENSIONS):
+                            continue
+                        name = os.path.relpath(os.path.join(root, filename), template_dir)
+                        name = name.replace(os.sep, "/")
+                        if name not in seen:
+                            seen.add(name)
+                            yield name
+
+
+def compile_templates() -> tuple[int, int]:
+    """Compile every template into the cached loader; (compiled, failed).
+
+    Only useful when the cached loader is active (DEBUG off); otherwise
+    templates are re-read per request anyway and nothing is done.
+    """
+    from django.template import engines
+
+    compiled = failed = 0
+    for backend in engines.all():
+        engine = getattr(backend, "engine", None)
+        if engine is None or engine.debug:
+            continue
+        for name in iter_template_names(engine):
+            try:
+                engine.get_template(name)
+                compiled += 1
+            except Exception as e:
+                # Partials and templates for uninstalled apps don't compile standalone
+                logger.debug(f"Template {name} not precompiled: {e}")
+                failed += 1
+    return compiled, failed
+
+
+def warm_up() -> dict:
+    """Load everything a request would otherwise load lazily in each worker."""
+    started = time.perf_counter()
+    views = import_views()
+    compiled, failed = compile_templates()
+    # Collect import-time garbage now, so it isn't frozen and shared
+    gc.collect()
+    stats = {
+        "views": views,
+        "templates": compiled,
+        "templates_failed": failed,
+        "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+    logger.info(
+        f"Preloaded {views} views and {compiled} templates in {stats['duration_ms']} ms"
+    )
+    return stats
+
+
+def close_connections() -> None:
+    from django.core.cache import caches
+    from django.db import connections
+
+    connections.close_all()
+    for connection in connections.all(initialized_only=True):
+        # close() only returns a pooled connection to the pool (DB_POOL_MODE=psycopg)
+        if connection.settings_dict.get("OPTIONS", {}).get("pool"):
+            connection.close_pool()
+    for cache in caches.all(initialized_only=True):
+        cache.close()
+
+
+def before_fork() -> None:
+    close_connections()
+    gc.freeze()
\ No newline at end of file
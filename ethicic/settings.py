@@ -5,11 +5,16 @@ This settings file is designed for standalone deployment of the public site
 without dependencies on the main garden platform.
 """
 
+import logging
 import os
 from pathlib import Path
 
 from dotenv import load_dotenv
 
+# Settings import must stay free of network I/O and output: it runs for
+# every worker boot, manage.py command and test run
+logger = logging.getLogger(__name__)
+
 # Load environment variables
 load_dotenv()
 
@@ -23,7 +28,7 @@ if not SECRET_KEY:
     import uuid
 
     SECRET_KEY = f"build-phase-key-{uuid.uuid4().hex}"
-    print("⚠️  Using temporary SECRET_KEY for build phase")
+    logger.warning("Using temporary SECRET_KEY for build phase")
 
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = os.getenv("DEBUG", "False").lower() == "true"
@@ -80,6 +85,7 @@ CRISPY_TEMPLATE_PACK = "bootstrap4"
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",  # Re-enable for static files
+    "public_site.middleware.RequestPerformanceMiddleware",  # Per-route request metrics
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -138,9 +144,9 @@ if os.getenv("USE_SQLITE", "False").lower() == "true":
     # Add Ubicloud database for importing if configured
     if UBI_DATABASE_URL:
         try:
-            from .database_config import get_database_config
+            from .database_config import get_ubicloud_database_config
 
-            ubicloud_config = get_database_config(UBI_DATABASE_URL)
+            ubicloud_config = get_ubicloud_database_config(UBI_DATABASE_URL)
             if ubicloud_config:
                 DATABASES["ubicloud"] = ubicloud_config
         except Exception:
@@ -149,89 +155,47 @@ elif DB_URL:
     # Primary: Use new Ethicic Public PostgreSQL database
     import dj_database_url
 
-    DATABASES = {"default": dj_database_url.parse(DB_URL, conn_max_age=600)}
+    from .database_config import apply_connection_pooling
+
+    DATABASES = {
+        "default": apply_connection_pooling(
+            dj_database_url.parse(DB_URL, conn_max_age=600)
+        )
+    }
 
     # Add Ubicloud as secondary database for importing content
     if UBI_DATABASE_URL:
         try:
-            from .database_config import get_database_config
+            from .database_config import get_ubicloud_database_config
 
-            ubicloud_config = get_database_config(UBI_DATABASE_URL)
+            ubicloud_config = get_ubicloud_database_config(UBI_DATABASE_URL)
             if ubicloud_config:
                 DATABASES["ubicloud"] = ubicloud_config
-                print("✅ Added Ubicloud database for content import")
         except Exception as e:
-            print(f"⚠️  Could not configure Ubicloud database: {e}")
-
-    print(f"✅ Using Ethicic Public PostgreSQL database: {os.getenv('DB_HOST')}")
+            logger.warning(f"Could not configure Ubicloud database: {e}")
 elif UBI_DATABASE_URL:
-    # Production mode: Try Ubicloud, fallback to SQLite
-    from .database_config import get_database_config
-
-    # Test if we can connect to Ubicloud first
-    def test_database_connection(config):
-        """Test database connection without hanging the startup"""
-        try:
-            import socket
-
-            import psycopg2
-
-            # Quick socket test first (5 second timeout)
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(5)
-            result = sock.connect_ex((config["HOST"], int(config["PORT"])))
-            sock.close()
-
-            if result != 0:
-                return False
-
-            # Quick database connection test
-            conn = psycopg2.connect(
-                host=config["HOST"],
-                port=config["PORT"],
-                database=config["NAME"],
-                user=config["USER"],
-                password=config["PASSWORD"],
-                connect_timeout=10,
-                sslmode="require",
-            )
-            conn.close()
-            return True
-        except Exception as e:
-            print(f"⚠️  Database connection test failed: {e}")
-            return False
-
-    # Get Ubicloud configuration
-    ubicloud_config = get_database_config(UBI_DATABASE_URL)
-
-    if ubicloud_config and test_database_connection(ubicloud_config):
-        print("✅ Ubicloud database connection successful")
-        DATABASES = {
-            # Ubicloud as primary database with SSL - SIMPLIFIED
-            "default": ubicloud_config,
-            # Also add as 'ubicloud' for import commands
-            "ubicloud": ubicloud_config,
-        }
+    # Ubicloud as primary database (also aliased as 'ubicloud' for import
+    # commands). It is not probed here; an unreachable database surfaces on
+    # first query (connect_timeout=10) and Django reconnects on the next request.
+    # Only the request alias gets the statement timeout
+    from .database_config import get_database_config, get_ubicloud_database_config
 
-        # Removed hybrid database setup to fix routing issues
-    else:
-        # Fallback to SQLite if Ubicloud is unavailable
-        print("⚠️  Ubicloud database unavailable, using SQLite fallback")
-        DATABASES = {
-            "default": {
-                "ENGINE": "django.db.backends.sqlite3",
-                "NAME": BASE_DIR / "db.sqlite3",
-            }
-        }
-        # Still try to add Ubicloud for import commands if we have config
-        if ubicloud_config:
-            DATABASES["ubicloud"] = ubicloud_config
+    DATABASES = {
+        "default": get_database_config(UBI_DATABASE_URL),
+        "ubicloud": get_ubicloud_database_config(UBI_DATABASE_URL),
+    }
 
 elif DATABASE_URL and DATABASE_URL != "sqlite":
     # Kinsta database only (fallback)
     import dj_database_url
 
-    DATABASES = {"default": dj_database_url.parse(DATABASE_URL, conn_max_age=600)}
+    from .database_config import apply_connection_pooling
+
+    DATABASES = {
+        "default": apply_connection_pooling(
+            dj_database_url.parse(DATABASE_URL, conn_max_age=600)
+        )
+    }
 
 else:
     # Manual PostgreSQL configuration
@@ -318,6 +282,12 @@ WHITENOISE_MIMETYPES = {
 # Media files configuration
 MEDIA_URL = "/media/"
 MEDIA_ROOT = "/var/lib/data"
+# Hand media bodies to the front proxy: "nginx" (X-Accel-Redirect) or "apache"/"lighttpd" (X-Sendfile)
+MEDIA_SENDFILE_BACKEND = os.getenv("MEDIA_SENDFILE_BACKEND", "")
+# Internal nginx location aliased to MEDIA_ROOT, used with the nginx backend
+MEDIA_ACCEL_REDIRECT_PREFIX = os.getenv("MEDIA_ACCEL_REDIRECT_PREFIX", "/protected-media/")
+# How long file stat results for media serving are cached in-process
+MEDIA_STAT_CACHE_SECONDS = int(os.getenv("MEDIA_STAT_CACHE_SECONDS", "60"))
 
 # Storage configuration - use R2 for media files in production
 USE_R2 = os.getenv("USE_R2", "False").lower() == "true"
@@ -393,6 +363,26 @@ WAGTAILIMAGES_WEBP_QUALITY = 85
 # Ensure image renditions are saved properly
 WAGTAILIMAGES_EXTENSIONS = ["gif", "jpg", "jpeg", "png", "webp", "avif"]
 
+# Pre-generate template renditions in the background after uploads
+# (see public_site.services.renditions)
+IMAGE_RENDITION_PREGENERATE = os.getenv("IMAGE_RENDITION_PREGENERATE", "true").lower() == "true"
+IMAGE_RENDITION_WORKERS = int(os.getenv("IMAGE_RENDITION_WORKERS", "2"))
+# Extra filter specs to pre-generate, e.g. "width-800|format-webp,width-400|format-avif"
+IMAGE_RENDITION_SPECS = [s for s in os.getenv("IMAGE_RENDITION_SPECS", "").split(",") if s]
+
+# Signed cookie holding the visitor's light/dark choice, applied client-side
+# before paint so pages render the same for everyone (see public_site.utils.theme)
+THEME_COOKIE_NAME = os.getenv("THEME_COOKIE_NAME", "theme")
+
+# Precomputed sitemap (see public_site.services.sitemap): split into
+# per-section shards above this many URLs
+SITEMAP_SHARD_THRESHOLD = int(os.getenv("SITEMAP_SHARD_THRESHOLD", "1000"))
+
+# Append a listing of live blog posts, encyclopedia entries and FAQ articles
+# to static/llms.txt, regenerated after publishes (see public_site.services.text_files)
+LLMS_TXT_AUTOGENERATE = os.getenv("LLMS_TXT_AUTOGENERATE", "false").lower() == "true"
+LLMS_TXT_MAX_ENTRIES = int(os.getenv("LLMS_TXT_MAX_ENTRIES", "200"))
+
 # Disable avatar uploads to prevent 404 errors with missing media files
 # Users can still have avatars but uploads are disabled since media isn't persistent on Kinsta
 WAGTAIL_USER_EDIT_FORM = "public_site.forms.CustomUserEditForm"
@@ -483,37 +473,38 @@ if not DEBUG:
     CSRF_COOKIE_SECURE = True
     X_FRAME_OPTIONS = "DENY"
 
-# Cache configuration - Use Redis for query/session caching with fallback
-REDIS_URL = os.getenv("REDIS_URL")
-
-# Check if Redis is actually available before configuring it
-redis_available = False
-if REDIS_URL and REDIS_URL.strip():
-    try:
-        import redis
-
-        # Test Redis connection
-        r = redis.from_url(REDIS_URL)
-        r.ping()
-        redis_available = True
-        print(f"✅ Redis connection successful: {REDIS_URL}")
-    except Exception as e:
-        print(f"⚠️  Redis connection failed ({e}), falling back to local cache")
-        redis_available = False
-
-if redis_available:
+# Cache configuration - Use Redis for query/session caching with fallback.
+# Redis is not contacted here: FailoverRedisCache connects on first use and
+# serves from a per-process local cache while Redis is unreachable.
+REDIS_URL = os.getenv("REDIS_URL", "").strip()
+REDIS_OPTIONS = {
+    "socket_connect_timeout": float(os.getenv("REDIS_CONNECT_TIMEOUT", "1")),
+    "socket_timeout": float(os.getenv("REDIS_SOCKET_TIMEOUT", "1")),
+    "FAILOVER_RETRY_SECONDS": int(os.getenv("REDIS_RETRY_SECONDS", "30")),
+}
+
+if REDIS_URL:
     # Production: Use Redis for caching
     CACHES = {
         "default": {
-            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "BACKEND": "ethicic.cache_backends.FailoverRedisCache",
             "LOCATION": REDIS_URL,
+            "OPTIONS": REDIS_OPTIONS,
         },
-        # Separate cache for sessions
+        # Separate cache for sessions. Plain RedisCache on purpose: a
+        # per-process fallback would split sessions (and logins) between
+        # workers. While Redis is down, session reads come back empty
+        # (visitors are anonymous) and logins fail instead.
         "session": {
             "BACKEND": "django.core.cache.backends.redis.RedisCache",
             "LOCATION": REDIS_URL,
             "KEY_PREFIX": "session",
             "TIMEOUT": 86400,  # 24 hours
+            "OPTIONS": {
+                key: value
+                for key, value in REDIS_OPTIONS.items()
+                if key != "FAILOVER_RETRY_SECONDS"
+            },
         },
     }
 
@@ -545,14 +536,66 @@ MAIN_PLATFORM_API_URL = os.getenv(
     "MAIN_PLATFORM_API_URL", "http://garden-platform:8000"
 )
 
+# Platform API client connection pool and circuit breaker
+PLATFORM_API_POOL_SIZE = int(os.getenv("PLATFORM_API_POOL_SIZE", "10"))
+PLATFORM_API_CIRCUIT_THRESHOLD = int(os.getenv("PLATFORM_API_CIRCUIT_THRESHOLD", "5"))
+PLATFORM_API_CIRCUIT_RESET_SECONDS = int(
+    os.getenv("PLATFORM_API_CIRCUIT_RESET_SECONDS", "30")
+)
+
+# Sliding-window rate limits for public forms (see public_site.utils.rate_limit)
+# Per-scope overrides: RATE_LIMITS = {"contact": (3, 3600), ...}
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "True").lower() == "true"
+# Header set by the edge with the client IP (e.g. CF-Connecting-IP), and the
+# number of proxies that append to X-Forwarded-For when it is absent
+RATE_LIMIT_CLIENT_IP_HEADER = os.getenv("RATE_LIMIT_CLIENT_IP_HEADER", "")
+RATE_LIMIT_TRUSTED_PROXIES = int(os.getenv("RATE_LIMIT_TRUSTED_PROXIES", "1"))
+
+# Shared cache for read-only platform endpoints (see services.platform_cache)
+PLATFORM_API_NEGATIVE_CACHE_SECONDS = int(
+    os.getenv("PLATFORM_API_NEGATIVE_CACHE_SECONDS", "60")
+)
+PLATFORM_API_STALE_IF_ERROR_SECONDS = int(
+    os.getenv("PLATFORM_API_STALE_IF_ERROR_SECONDS", "21600")
+)
+
+# Outbox delivery for platform submissions (see public_site.services.outbox)
+OUTBOX_DISPATCH_ON_COMMIT = (
+    os.getenv("OUTBOX_DISPATCH_ON_COMMIT", "True").lower() == "true"
+)
+OUTBOX_THREADS = int(os.getenv("OUTBOX_THREADS", "2"))
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "8"))
+# Days to keep finished messages (and the submission data in their payloads)
+OUTBOX_RETENTION_DAYS = int(os.getenv("OUTBOX_RETENTION_DAYS", "7"))
+OUTBOX_FAILED_RETENTION_DAYS = int(os.getenv("OUTBOX_FAILED_RETENTION_DAYS", "30"))
+
+# Seconds to wait after the last PRI DDQ page save before syncing FAQ articles
+DDQ_SYNC_DEBOUNCE_SECONDS = int(os.getenv("DDQ_SYNC_DEBOUNCE_SECONDS", "10"))
+
 # Cloudflare Turnstile Configuration
 TURNSTILE_SITE_KEY = os.getenv("TURNSTILE_SITE_KEY")
 TURNSTILE_SECRET_KEY = os.getenv("TURNSTILE_SECRET_KEY")
+# Latency budget for siteverify; slower answers let the form through
+TURNSTILE_TIMEOUT_SECONDS = float(os.getenv("TURNSTILE_TIMEOUT_SECONDS", "3"))
+TURNSTILE_VERIFIER = os.getenv(
+    "TURNSTILE_VERIFIER", "public_site.services.turnstile.TurnstileVerifier"
+)
 
 # PostHog Configuration
 POSTHOG_API_KEY = os.getenv("POSTHOG_API_KEY", "phc_iPeP4HP7NhtEKJmbwwFt65mjlVJjJb1MLe8RXYwIszc")
 POSTHOG_HOST = os.getenv("POSTHOG_HOST", "https://us.i.posthog.com")
 
+# Background exception reporting (see public_site.services.error_reporting)
+ERROR_REPORT_QUEUE_SIZE = int(os.getenv("ERROR_REPORT_QUEUE_SIZE", "1000"))
+ERROR_REPORT_DEDUPE_SECONDS = int(os.getenv("ERROR_REPORT_DEDUPE_SECONDS", "60"))
+
+# Request performance metrics (see public_site.utils.request_metrics)
+PERF_METRICS_ENABLED = os.getenv("PERF_METRICS_ENABLED", "true").lower() == "true"
+PERF_SLOW_REQUEST_MS = int(os.getenv("PERF_SLOW_REQUEST_MS", "1000"))
+PERF_SLOW_SAMPLE_RATE = float(os.getenv("PERF_SLOW_SAMPLE_RATE", "0.1"))
+# Bearer token for scraping /metrics/ (staff can always read it)
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
 # Initialize PostHog for error tracking
 if POSTHOG_API_KEY:
     import posthog
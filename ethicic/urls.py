@@ -9,12 +9,10 @@ import datetime
 from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
-from django.contrib.sitemaps.views import sitemap
 from django.http import JsonResponse
 from django.urls import include, path
 from wagtail import urls as wagtail_urls
 from wagtail.admin import urls as wagtailadmin_urls
-from wagtail.contrib.sitemaps import Sitemap
 from wagtail.documents import urls as wagtaildocs_urls
 
 from public_site.homepage_view_cms import homepage_view_cms
@@ -185,105 +183,44 @@ def favicon_view(request):
 
 def carbon_txt_view(request):
     """Serve carbon.txt file for sustainability transparency"""
-    import os
-
-    from django.conf import settings
-    from django.http import Http404, HttpResponse
-
-    carbon_txt_path = os.path.join(settings.BASE_DIR, "static", "carbon.txt")
+    from public_site.services import text_files
 
-    if os.path.exists(carbon_txt_path):
-        try:
-            with open(carbon_txt_path, encoding="utf-8") as f:
-                content = f.read()
-
-            response = HttpResponse(content, content_type="text/plain")
-            response["Cache-Control"] = "max-age=86400"  # 24 hour cache
-            return response
-        except Exception as e:
-            raise Http404(f"Error reading carbon.txt: {e}")
-    else:
-        raise Http404("carbon.txt file not found")
+    return text_files.serve(request, "carbon.txt")
 
 
 def llms_txt_view(request):
     """Serve llms.txt file for AI/LLM consumption"""
-    import os
-
-    from django.conf import settings
-    from django.http import Http404, HttpResponse
-
-    llms_txt_path = os.path.join(settings.BASE_DIR, "static", "llms.txt")
+    from public_site.services import text_files
 
-    if os.path.exists(llms_txt_path):
-        try:
-            with open(llms_txt_path, encoding="utf-8") as f:
-                content = f.read()
-
-            response = HttpResponse(content, content_type="text/plain; charset=utf-8")
-            response["Cache-Control"] = "max-age=86400"  # 24 hour cache
-            return response
-        except Exception as e:
-            raise Http404(f"Error reading llms.txt: {e}")
-    else:
-        raise Http404("llms.txt file not found")
+    return text_files.serve(request, "llms.txt")
 
 
 def robots_txt_view(request):
     """Serve robots.txt file for search engine crawlers"""
-    import os
-
-    from django.conf import settings
-    from django.http import Http404, HttpResponse
-
-    robots_txt_path = os.path.join(settings.BASE_DIR, "static", "robots.txt")
+    from public_site.services import text_files
 
-    if os.path.exists(robots_txt_path):
-        try:
-            with open(robots_txt_path, encoding="utf-8") as f:
-                content = f.read()
-
-            response = HttpResponse(content, content_type="text/plain")
-            response["Cache-Control"] = "max-age=86400"  # 24 hour cache
-            return response
-        except Exception as e:
-            raise Http404(f"Error reading robots.txt: {e}")
-    else:
-        raise Http404("robots.txt file not found")
+    return text_files.serve(request, "robots.txt")
 
 
 def serve_media_file(request, filepath):
-    """Serve media files directly in production"""
-    import mimetypes
-    import os
+    """Serve media files directly in production.
 
-    from django.conf import settings
-    from django.http import FileResponse, Http404
+    Supports conditional GETs, byte ranges and X-Accel-Redirect/X-Sendfile
+    offload; see public_site.services.media_files.
+    """
+    from public_site.services import media_files
 
-    # Build the full file path
-    media_root = getattr(settings, "MEDIA_ROOT", "/var/lib/data")
-    full_path = os.path.join(media_root, filepath)
+    return media_files.serve(request, filepath)
 
-    # Simplified security check: ensure no path traversal
-    if ".." in filepath or filepath.startswith("/"):
-        raise Http404("Invalid file path")
 
-    # Check if file exists
-    if not os.path.exists(full_path) or not os.path.isfile(full_path):
-        raise Http404(f"Media file not found: {filepath}")
+def sitemap_view(request, section=None):
+    """Serve the precomputed sitemap or one of its shards.
 
-    # Determine content type
-    content_type, _ = mimetypes.guess_type(full_path)
-    if not content_type:
-        content_type = "application/octet-stream"
+    See public_site.services.sitemap.
+    """
+    from public_site.services import sitemap
 
-    # Serve the file
-    try:
-        response = FileResponse(open(full_path, "rb"), content_type=content_type)
-        response["Cache-Control"] = "public, max-age=31536000"  # 1 year cache
-        return response
-    except Exception as e:
-        raise Http404(f"Error serving media file: {e}")
+    return sitemap.serve(request, section)
 
 
 def debug_homepage(request):
@@ -587,7 +524,8 @@ urlpatterns = [
     # Search engine crawler instructions
     path("robots.txt", robots_txt_view, name="robots_txt"),
     # SEO sitemap
-    path("sitemap.xml", sitemap, {"sitemaps": {"wagtail": Sitemap}}, name="sitemap"),
+    path("sitemap.xml", sitemap_view, name="sitemap"),
+    path("sitemap-<slug:section>.xml", sitemap_view, name="sitemap_section"),
     # Admin
     path("admin/", admin.site.urls),
     path("cms/", include(wagtailadmin_urls)),
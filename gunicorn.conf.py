@@ -0,0 +1,29 @@
+"""
+Gunicorn configuration for ethicic-public.
+
+Picked up automatically from the working directory, so the Procfile,
+Dockerfile and start.sh commands all use it. Command-line flags still
+take precedence.
+
+GUNICORN_PRELOAD (default: true) loads the app in the master before
+forking workers; see ethicic/prefork.py for what is warmed up and what is
+deferred until after the fork.
+"""
+
+import os
+
+preload_app = os.getenv("GUNICORN_PRELOAD", "true").lower() == "true"
+
+
+def when_ready(server):
+    if server.cfg.preload_app:
+        from ethicic import prefork
+
+        prefork.warm_up()
+
+
+def pre_fork(server, worker):
+    if server.cfg.preload_app:
+        from ethicic import prefork
+
+        prefork.before_fork()
@@ -7,7 +7,7 @@ from typing import ClassVar
 
 from django.contrib import admin
 
-from .models import SupportTicket
+from .models import OutboxMessage, SupportTicket
 
 
 @admin.register(SupportTicket)
@@ -80,3 +80,43 @@ class SupportTicketAdmin(admin.ModelAdmin):
         self.message_user(request, f"{updated} tickets marked as closed.")
 
     mark_closed.short_description = "Mark selected tickets as closed"
+
+
+@admin.register(OutboxMessage)
+class OutboxMessageAdmin(admin.ModelAdmin):
+    """Admin interface for queued platform API deliveries."""
+
+    list_display: ClassVar[list] = [
+        "id",
+        "message_type",
+        "status",
+        "attempts",
+        "next_attempt_at",
+        "ticket",
+        "created_at",
+        "delivered_at",
+    ]
+    list_filter: ClassVar[list] = ["status", "message_type", "created_at"]
+    search_fields: ClassVar[list] = ["dedupe_key", "submission_id", "last_error"]
+    readonly_fields: ClassVar[list] = [
+        "dedupe_key",
+        "submission_id",
+        "created_at",
+        "delivered_at",
+        "fallback_sent_at",
+    ]
+    list_per_page = 25
+    ordering: ClassVar[list] = ["-created_at"]
+
+    actions: ClassVar[list] = ["retry_now"]
+
+    def retry_now(self, request, queryset):
+        """Bulk action to requeue messages for immediate delivery."""
+        from django.utils import timezone
+
+        updated = queryset.exclude(status="delivered").update(
+            status="pending", next_attempt_at=timezone.now()
+        )
+        self.message_user(request, f"{updated} messages queued for retry.")
+
+    retry_now.short_description = "Retry selected messages now"
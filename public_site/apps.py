@@ -4,3 +4,58 @@ from django.apps import AppConfig
 class PublicSiteConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "public_site"
+
+    def ready(self):
+        from django.db.models.signals import post_delete, post_save
+        from wagtail.images import get_image_model
+        from wagtail.models import Page
+        from wagtail.signals import page_published, page_unpublished, post_page_move
+
+        from .models import NavigationMenuItem, SiteConfiguration
+        from .services import link_index, text_files
+        from .services.related_content import handle_publish_change
+        from .services.renditions import handle_image_saved
+        from .services.site_settings import handle_settings_changed
+        from .services.sitemap import handle_page_change
+
+        # Keep the related-content graph in step with what is live
+        page_published.connect(handle_publish_change, dispatch_uid="related_content_publish")
+        page_unpublished.connect(
+            handle_publish_change, dispatch_uid="related_content_unpublish"
+        )
+
+        # Generate template renditions off the request path after uploads
+        post_save.connect(
+            handle_image_saved, sender=get_image_model(), dispatch_uid="rendition_pregenerate"
+        )
+
+        # Tell every worker to reload its SiteConfiguration snapshot
+        for model in (SiteConfiguration, NavigationMenuItem):
+            for signal in (post_save, post_delete):
+                signal.connect(
+                    handle_settings_changed,
+                    sender=model,
+                    dispatch_uid=f"site_settings_{model._meta.model_name}_{signal is post_save}",
+                )
+
+        # Rebuild the stored sitemap when the set of live URLs changes
+        page_published.connect(handle_page_change, dispatch_uid="sitemap_publish")
+        page_unpublished.connect(handle_page_change, dispatch_uid="sitemap_unpublish")
+        post_page_move.connect(handle_page_change, dispatch_uid="sitemap_move")
+
+        # robots.txt, llms.txt and carbon.txt are served from memory
+        text_files.preload()
+        page_published.connect(text_files.handle_page_change, dispatch_uid="llms_txt_publish")
+        page_unpublished.connect(
+            text_files.handle_page_change, dispatch_uid="llms_txt_unpublish"
+        )
+
+        # Index links at publish time and re-flag links to pages that go away
+        page_published.connect(link_index.handle_publish, dispatch_uid="link_index_publish")
+        page_unpublished.connect(
+            link_index.handle_unpublish, dispatch_uid="link_index_unpublish"
+        )
+        post_delete.connect(
+            link_index.handle_unpublish, sender=Page, dispatch_uid="link_index_delete"
+        )
+        post_page_move.connect(link_index.handle_move, dispatch_uid="link_index_move")
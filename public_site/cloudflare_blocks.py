@@ -4,6 +4,7 @@ Provides image blocks that integrate with Cloudflare Images for optimized delive
 """
 
 import contextlib
+from functools import lru_cache
 
 from django.utils.html import format_html
 from integrations.services.cloudflare_images_service import cloudflare_images
@@ -11,6 +12,80 @@ from wagtail import blocks
 from wagtail.admin.widgets import AdminTextInput
 
 
+# Cloudflare delivery URLs depend only on the image ID and the requested
+# transforms, so each block's URL set is built once per process and reused
+# across renders. Callers must treat the returned dicts as read-only.
+URL_CACHE_SIZE = 1024
+
+# Display widths for CloudflareImageBlock sizes ("full" is unconstrained)
+IMAGE_BLOCK_WIDTHS = {"small": 400, "medium": 600, "large": 800, "xl": 1000}
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def image_block_urls(image_id, variant, size):
+    """Format variants, thumbnail and 1x/2x URLs for a CloudflareImageBlock."""
+    width = IMAGE_BLOCK_WIDTHS.get(size)
+    transforms = {"width": width} if width else {}
+
+    urls = {
+        "image_url": cloudflare_images.get_image_url(
+            image_id, variant=variant, **transforms
+        ),
+        "image_url_webp": cloudflare_images.get_image_url(
+            image_id, variant=variant, format="webp", **transforms
+        ),
+        "image_url_avif": cloudflare_images.get_image_url(
+            image_id, variant=variant, format="avif", **transforms
+        ),
+        "thumbnail_url": cloudflare_images.get_image_url(
+            image_id, variant=variant, width=300, height=200
+        ),
+        "configured": True,
+    }
+
+    # Generate responsive image URLs
+    if size != "full":
+        base_width = width or 600
+        urls["responsive_urls"] = {
+            "1x": cloudflare_images.get_image_url(
+                image_id, variant=variant, width=base_width
+            ),
+            "2x": cloudflare_images.get_image_url(
+                image_id, variant=variant, width=base_width * 2
+            ),
+        }
+    return urls
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def gallery_image_urls(image_id, variant):
+    """Thumbnail, full and original URLs for one gallery image."""
+    return {
+        "thumbnail_url": cloudflare_images.get_image_url(
+            image_id, variant=variant, width=400, height=300
+        ),
+        "full_url": cloudflare_images.get_image_url(
+            image_id, variant=variant, width=1200
+        ),
+        "original_url": cloudflare_images.get_image_url(image_id, variant=variant),
+    }
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def hero_image_urls(image_id):
+    """Per-breakpoint URLs for a CloudflareHeroImageBlock."""
+    return {
+        "mobile_url": cloudflare_images.get_image_url(image_id, width=768, quality=80),
+        "tablet_url": cloudflare_images.get_image_url(image_id, width=1024, quality=85),
+        "desktop_url": cloudflare_images.get_image_url(image_id, width=1920, quality=90),
+        "retina_url": cloudflare_images.get_image_url(image_id, width=3840, quality=85),
+        "webp_url": cloudflare_images.get_image_url(
+            image_id, width=1920, format="webp", quality=80
+        ),
+        "configured": True,
+    }
+
+
 class CloudflareImageChooserWidget(AdminTextInput):
     """Custom widget for choosing Cloudflare Images."""
 
@@ -169,51 +244,13 @@ class CloudflareImageBlock(blocks.StructBlock):
         context = super().get_context(value, parent_context)
 
         if value.get("image_id") and cloudflare_images.is_configured():
-            image_id = value["image_id"]
-            variant = value.get("variant", "public")
-            size = value.get("size", "medium")
-
-            # Size mappings
-            size_map = {
-                "small": {"width": 400},
-                "medium": {"width": 600},
-                "large": {"width": 800},
-                "xl": {"width": 1000},
-                "full": {},  # No size constraints for full width
-            }
-
-            transforms = size_map.get(size, {})
-
-            # Generate URLs for different formats
             context.update(
-                {
-                    "image_url": cloudflare_images.get_image_url(
-                        image_id, variant=variant, **transforms
-                    ),
-                    "image_url_webp": cloudflare_images.get_image_url(
-                        image_id, variant=variant, format="webp", **transforms
-                    ),
-                    "image_url_avif": cloudflare_images.get_image_url(
-                        image_id, variant=variant, format="avif", **transforms
-                    ),
-                    "thumbnail_url": cloudflare_images.get_image_url(
-                        image_id, variant=variant, width=300, height=200
-                    ),
-                    "configured": True,
-                }
+                image_block_urls(
+                    value["image_id"],
+                    value.get("variant", "public"),
+                    value.get("size", "medium"),
+                )
             )
-
-            # Generate responsive image URLs
-            if size != "full":
-                base_width = transforms.get("width", 600)
-                context["responsive_urls"] = {
-                    "1x": cloudflare_images.get_image_url(
-                        image_id, variant=variant, width=base_width
-                    ),
-                    "2x": cloudflare_images.get_image_url(
-                        image_id, variant=variant, width=base_width * 2
-                    ),
-                }
         else:
             context.update(
                 {
@@ -308,15 +345,7 @@ class CloudflareGalleryBlock(blocks.StructBlock):
                             "id": image_id,
                             "caption": image_data.get("caption", ""),
                             "alt_text": image_data.get("alt_text", ""),
-                            "thumbnail_url": cloudflare_images.get_image_url(
-                                image_id, variant=variant, width=400, height=300
-                            ),
-                            "full_url": cloudflare_images.get_image_url(
-                                image_id, variant=variant, width=1200
-                            ),
-                            "original_url": cloudflare_images.get_image_url(
-                                image_id, variant=variant
-                            ),
+                            **gallery_image_urls(image_id, variant),
                         }
                     )
 
@@ -378,29 +407,7 @@ class CloudflareHeroImageBlock(blocks.StructBlock):
         context = super().get_context(value, parent_context)
 
         if value.get("image_id") and cloudflare_images.is_configured():
-            image_id = value["image_id"]
-
-            # Generate URLs for different screen sizes
-            context.update(
-                {
-                    "mobile_url": cloudflare_images.get_image_url(
-                        image_id, width=768, quality=80
-                    ),
-                    "tablet_url": cloudflare_images.get_image_url(
-                        image_id, width=1024, quality=85
-                    ),
-                    "desktop_url": cloudflare_images.get_image_url(
-                        image_id, width=1920, quality=90
-                    ),
-                    "retina_url": cloudflare_images.get_image_url(
-                        image_id, width=3840, quality=85
-                    ),
-                    "webp_url": cloudflare_images.get_image_url(
-                        image_id, width=1920, format="webp", quality=80
-                    ),
-                    "configured": True,
-                }
-            )
+            context.update(hero_image_urls(value["image_id"]))
         else:
             context["configured"] = False
 
@@ -4,14 +4,16 @@ Context processors for the public site
 
 import os
 
+from .utils.theme import DEFAULT_THEME, cookie_name
+
 
 def theme_context(request):
-    """Add theme information to all template contexts"""
-    # Handle cases where session might not exist or doesn't have get method
-    theme = "dark"  # Changed default to dark theme
-    if hasattr(request, "session") and hasattr(request.session, "get"):
-        theme = request.session.get("theme", "dark")  # Changed default to dark theme
-    return {"current_theme": theme}
+    """Add theme information to all template contexts.
+
+    Always the default: the visitor's choice is applied client-side from
+    the theme cookie, so rendered HTML is the same for every visitor.
+    """
+    return {"current_theme": DEFAULT_THEME, "THEME_COOKIE_NAME": cookie_name()}
 
 
 def analytics_context(request):  # noqa: ARG001
@@ -7,10 +7,12 @@ from crispy_forms.bootstrap import FormActions
 from crispy_forms.helper import FormHelper
 from crispy_forms.layout import HTML, Field, Fieldset, Layout, Submit
 from django import forms
-from django.core.cache import cache
 from django.utils import timezone
 from wagtail.users.forms import UserEditForm
 
+from .services.turnstile import get_turnstile_verifier
+from .utils.rate_limit import check_rate_limit
+
 
 class AccessibleContactForm(forms.Form):
     """Accessible contact form following WCAG 2.1 AA guidelines"""
@@ -222,19 +224,7 @@ class AccessibleContactForm(forms.Form):
         if not request:
             return False
 
-        ip_address = self._get_client_ip(request)
-        cache_key = f"contact_form_submissions:{ip_address}"
-
-        # Get current submission count for this IP
-        submissions = cache.get(cache_key, 0)
-
-        # Allow max 3 submissions per hour
-        if submissions >= 3:
-            return True
-
-        # Increment counter
-        cache.set(cache_key, submissions + 1, 3600)  # 1 hour timeout
-        return False
+        return not check_rate_limit(request, "contact").allowed
 
     def _get_client_ip(self, request):
         """Get the client's IP address."""
@@ -273,9 +263,6 @@ class AccessibleContactForm(forms.Form):
 
     def _validate_turnstile(self, cleaned_data):
         """Validate Cloudflare Turnstile response."""
-        import requests
-        from django.conf import settings
-
         turnstile_response = cleaned_data.get("cf_turnstile_response", "")
 
         if not turnstile_response:
@@ -287,30 +274,13 @@ class AccessibleContactForm(forms.Form):
         request = getattr(self, "_request", None)
         client_ip = self._get_client_ip(request) if request else None
 
-        # Validate with Cloudflare
-        validation_url = "https://challenges.cloudflare.com/turnstile/v0/siteverify"
-        data = {
-            "secret": settings.TURNSTILE_SECRET_KEY,
-            "response": turnstile_response,
-        }
-        if client_ip:
-            data["remoteip"] = client_ip
-
-        try:
-            response = requests.post(validation_url, data=data, timeout=10)
-            result = response.json()
-
-            if not result.get("success", False):
-                raise forms.ValidationError(
-                    "Security challenge verification failed. Please try again."
-                )
-        except requests.RequestException:
-            # If Turnstile API is down, log but don't block the form
-            # This provides graceful degradation
-            import logging
-
-            logger = logging.getLogger(__name__)
-            logger.warning("Turnstile validation failed due to network error")
+        # If Turnstile is unreachable the verifier reports it as unavailable
+        # and we let the form through (graceful degradation)
+        result = get_turnstile_verifier().verify(turnstile_response, client_ip)
+        if not result.success and not result.unavailable:
+            raise forms.ValidationError(
+                "Security challenge verification failed. Please try again."
+            )
 
     def _validate_form_timing(self, cleaned_data):
         """Validate form submission timing to detect bots."""
@@ -1449,9 +1419,6 @@ class OnboardingForm(forms.Form):
 
     def _validate_turnstile(self, cleaned_data):
         """Validate Cloudflare Turnstile response."""
-        import requests
-        from django.conf import settings
-
         turnstile_response = cleaned_data.get("cf_turnstile_response", "")
 
         if not turnstile_response:
@@ -1463,30 +1430,13 @@ class OnboardingForm(forms.Form):
         request = getattr(self, "_request", None)
         client_ip = self._get_client_ip(request) if request else None
 
-        # Validate with Cloudflare
-        validation_url = "https://challenges.cloudflare.com/turnstile/v0/siteverify"
-        data = {
-            "secret": settings.TURNSTILE_SECRET_KEY,
-            "response": turnstile_response,
-        }
-        if client_ip:
-            data["remoteip"] = client_ip
-
-        try:
-            response = requests.post(validation_url, data=data, timeout=10)
-            result = response.json()
-
-            if not result.get("success", False):
-                raise forms.ValidationError(
-                    "Security challenge verification failed. Please try again."
-                )
-        except requests.RequestException:
-            # If Turnstile API is down, log but don't block the form
-            # This provides graceful degradation
-            import logging
-
-            logger = logging.getLogger(__name__)
-            logger.warning("Turnstile validation failed due to network error")
+        # If Turnstile is unreachable the verifier reports it as unavailable
+        # and we let the form through (graceful degradation)
+        result = get_turnstile_verifier().verify(turnstile_response, client_ip)
+        if not result.success and not result.unavailable:
+            raise forms.ValidationError(
+                "Security challenge verification failed. Please try again."
+            )
 
     def _get_client_ip(self, request):
         """Get the client's IP address."""
@@ -5,6 +5,7 @@ Usage:
     python manage.py build_css
     python manage.py build_css --development
     python manage.py build_css --watch
+    python manage.py build_css --force --jobs 4
 """
 
 import subprocess
@@ -34,6 +35,16 @@ class Command(BaseCommand):
             action="store_true",
             help="Watch for file changes and rebuild automatically",
         )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Rebuild every bundle even if its inputs are unchanged",
+        )
+        parser.add_argument(
+            "--jobs",
+            type=int,
+            help="Number of bundles built in parallel",
+        )
 
     def handle(self, *args, **options):
         self.stdout.write(self.style.SUCCESS("🚀 Garden UI CSS Bundle Builder"))
@@ -65,6 +76,13 @@ class Command(BaseCommand):
             cmd.append("--watch")
             self.stdout.write("👀 File watching enabled...")
 
+        if options["force"]:
+            cmd.append("--force")
+            self.stdout.write("♻️  Forcing a full rebuild...")
+
+        if options["jobs"]:
+            cmd.extend(["--jobs", str(options["jobs"])])
+
         try:
             # Run the build script
             result = subprocess.run(cmd, capture_output=True, text=True, check=False)
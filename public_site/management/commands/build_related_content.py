@@ -0,0 +1,19 @@
+"""
+Management command to rebuild the related-content graph.
+
+Publishing a FAQ article or encyclopedia entry updates the rows it affects
+automatically; run this after bulk imports, the first deploy, or now and
+then to refresh scores on rows no publish has touched.
+"""
+
+from django.core.management.base import BaseCommand
+
+from public_site.services import related_content
+
+
+class Command(BaseCommand):
+    help = "Rebuild related-content links for FAQ articles and encyclopedia entries"
+
+    def handle(self, *args, **options):
+        for model_name, link_count in related_content.rebuild_all().items():
+            self.stdout.write(self.style.SUCCESS(f"✅ {model_name}: {link_count} links"))
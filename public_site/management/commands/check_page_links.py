@@ -0,0 +1,61 @@
+"""
+Management command to rebuild the link index and report broken links.
+
+Publishing keeps the index current; run this after the first deploy or to
+audit every page. ``--external`` prints the deduplicated external URLs,
+one per line, for the crawler to probe without crawling:
+
+    python manage.py check_page_links --external > external_urls.txt
+    python enhanced_link_checker.py --urls external_urls.txt
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from public_site.services import link_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the page link index and list broken internal links"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--no-rebuild",
+            action="store_true",
+            help="Report from the stored index instead of rebuilding it",
+        )
+        parser.add_argument(
+            "--external",
+            action="store_true",
+            help="Print the distinct external URLs and exit",
+        )
+        parser.add_argument(
+            "--fail-on-broken",
+            action="store_true",
+            help="Exit with an error if any broken links are found",
+        )
+
+    def handle(self, *args, **options):
+        from public_site.models import PageLink
+
+        if options["external"]:
+            for url in link_index.external_urls():
+                self.stdout.write(url)
+            return
+
+        if not options["no_rebuild"]:
+            stats = link_index.rebuild_index()
+            self.stdout.write(f"🔗 Indexed {stats['links']} links on live pages")
+
+        broken = PageLink.objects.filter(is_broken=True).select_related("source")
+        for link in broken:
+            self.stdout.write(
+                f"   ❌ {link.source.url_path} ({link.field}): {link_index.describe(link)}"
+            )
+
+        count = len(broken)
+        if count and options["fail_on_broken"]:
+            raise CommandError(f"{count} broken links")
+        if count:
+            self.stdout.write(self.style.WARNING(f"\n⚠️  {count} broken links"))
+        else:
+            self.stdout.write(self.style.SUCCESS("\n✅ No broken links"))
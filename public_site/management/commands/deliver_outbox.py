@@ -0,0 +1,79 @@
+"""
+Management command to deliver queued platform submissions from the outbox.
+
+Run with --loop as a long-lived worker (the Procfile's ``worker`` process),
+or from cron without it to drain whatever is due. Each run also purges
+finished messages past their retention period.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from public_site.services import outbox
+
+
+class Command(BaseCommand):
+    help = "Deliver pending outbox messages to the garden platform API"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=50,
+            help="Maximum number of messages to claim per batch",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling for due messages instead of exiting",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5.0,
+            help="Seconds to sleep between polls when --loop is set",
+        )
+        parser.add_argument(
+            "--metrics",
+            action="store_true",
+            help="Print outbox metrics and exit",
+        )
+
+    def handle(self, *args, **options):
+        if options["metrics"]:
+            self._print_metrics()
+            return
+
+        while True:
+            purged = outbox.purge_if_due()
+            if purged:
+                self.stdout.write(f"🧹 Purged {purged} finished outbox messages")
+
+            summary = outbox.deliver_pending(batch_size=options["batch_size"])
+            processed = sum(summary.values())
+
+            if processed:
+                self.stdout.write(
+                    f"📬 Delivered {summary['delivered']}, retrying {summary['retried']}, "
+                    f"failed {summary['failed']}, skipped {summary['skipped']}"
+                )
+
+            if not options["loop"]:
+                if not processed:
+                    self.stdout.write("✅ No outbox messages due")
+                self._print_metrics()
+                return
+
+            # Drain full batches back to back, otherwise wait for new work
+            if processed < options["batch_size"]:
+                time.sleep(options["interval"])
+
+    def _print_metrics(self):
+        metrics = outbox.get_outbox_metrics()
+        self.stdout.write(
+            f"Outbox: {metrics['pending']} pending "
+            f"(oldest {metrics['oldest_pending_seconds']}s), "
+            f"{metrics['delivered']} delivered, {metrics['failed']} failed, "
+            f"{metrics['skipped']} skipped"
+        )
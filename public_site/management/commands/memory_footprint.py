@@ -0,0 +1,174 @@
+"""
+Management command to report the memory footprint of gunicorn workers.
+
+Reads ``/proc/<pid>/smaps_rollup`` for the gunicorn master and each of its
+workers and reports RSS, PSS (shared pages divided among the processes
+that map them) and USS (pages private to the process). USS is what each
+extra worker really costs. To compare preload against per-worker loading,
+save a snapshot with one setting and compare with the other:
+
+    GUNICORN_PRELOAD=false gunicorn ethicic.wsgi:application ...
+    python manage.py memory_footprint --save before.json
+    GUNICORN_PRELOAD=true gunicorn ethicic.wsgi:application ...
+    python manage.py memory_footprint --baseline before.json
+
+Linux only.
+"""
+
+import json
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+SMAPS_FIELDS = {
+    "Rss": "rss",
+    "Pss": "pss",
+    "Shared_Clean": "shared_clean",
+    "Shared_Dirty": "shared_dirty",
+    "Private_Clean": "private_clean",
+    "Private_Dirty": "private_dirty",
+}
+REPORTED = ("rss", "pss", "uss")
+
+
+def parse_smaps_rollup(text: str) -> dict[str, float]:
+    """Memory fields of ``smaps_rollup`` in megabytes, plus USS."""
+    usage = dict.fromkeys(SMAPS_FIELDS.values(), 0.0)
+    for line in text.splitlines():
+        name, _, value = line.partition(":")
+        if name in SMAPS_FIELDS:
+            usage[SMAPS_FIELDS[name]] = int(value.split()[0]) / 1024
+    usage["uss"] = usage["private_clean"] + usage["private_dirty"]
+    return usage
+
+
+def read_usage(pid: int) -> dict[str, float]:
+    with open(f"/proc/{pid}/smaps_rollup", encoding="ascii") as f:
+        return parse_smaps_rollup(f.read())
+
+
+def read_cmdline(pid: int) -> list[str]:
+    with open(f"/proc/{pid}/cmdline", "rb") as f:
+        return f.read().decode(errors="replace").split("\0")
+
+
+def is_gunicorn(cmdline: list[str]) -> bool:
+    """``gunicorn ...`` or ``python .../gunicorn ...`` (not e.g. ``timeout gunicorn``)."""
+    names = [os.path.basename(arg) for arg in cmdline[:2]]
+    return names[0].startswith("gunicorn") or (
+        names[0].startswith("python") and len(names) > 1 and names[1].startswith("gunicorn")
+    )
+
+
+def read_ppid(pid: int) -> int:
+    with open(f"/proc/{pid}/stat", encoding="ascii") as f:
+        # The command name may contain spaces; fields resume after its ")"
+        return int(f.read().rpartition(")")[2].split()[1])
+
+
+def list_pids() -> list[int]:
+    return [int(entry) for entry in os.listdir("/proc") if entry.isdigit()]
+
+
+def find_master() -> int | None:
+    """The oldest gunicorn process whose parent isn't gunicorn."""
+    gunicorn = set()
+    for pid in list_pids():
+        try:
+            if is_gunicorn(read_cmdline(pid)):
+                gunicorn.add(pid)
+        except OSError:
+            continue
+    masters = []
+    for pid in gunicorn:
+        try:
+            if read_ppid(pid) not in gunicorn:
+                masters.append(pid)
+        except OSError:
+            continue
+    return min(masters, default=None)
+
+
+def find_workers(master: int) -> list[int]:
+    workers = []
+    for pid in list_pids():
+        try:
+            if read_ppid(pid) == master:
+                workers.append(pid)
+        except OSError:
+            continue
+    return sorted(workers)
+
+
+def summarize(processes: list[dict]) -> dict[str, float]:
+    """Totals across all processes and averages across workers."""
+    workers = [row for row in processes if row["role"] == "worker"]
+    summary = {f"total_{key}": sum(row[key] for row in processes) for key in REPORTED}
+    for key in REPORTED:
+        summary[f"worker_{key}"] = (
+            sum(row[key] for row in workers) / len(workers) if workers else 0.0
+        )
+    return summary
+
+
+class Command(BaseCommand):
+    help = "Report RSS/PSS/USS for the gunicorn master and its workers"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--pid", type=int, default=None, help="Master PID (default: find gunicorn)"
+        )
+        parser.add_argument("--save", help="Write the snapshot to this JSON file")
+        parser.add_argument("--baseline", help="Compare against a saved snapshot")
+        parser.add_argument("--json", action="store_true", help="Print JSON")
+
+    def handle(self, *args, **options):
+        if not os.path.exists("/proc/self/smaps_rollup"):
+            raise CommandError("memory_footprint needs Linux /proc/<pid>/smaps_rollup")
+
+        master = options["pid"] or find_master()
+        if master is None:
+            raise CommandError("No gunicorn master found; pass --pid")
+
+        processes = []
+        for role, pid in [("master", master)] + [("worker", pid) for pid in find_workers(master)]:
+            try:
+                usage = read_usage(pid)
+            except OSError as e:
+                raise CommandError(f"Cannot read memory of PID {pid}: {e}") from e
+            processes.append({"pid": pid, "role": role, **usage})
+
+        snapshot = {"master": master, "processes": processes, "summary": summarize(processes)}
+        if options["save"]:
+            with open(options["save"], "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, indent=2)
+
+        baseline = None
+        if options["baseline"]:
+            with open(options["baseline"], encoding="utf-8") as f:
+                baseline = json.load(f)["summary"]
+
+        if options["json"]:
+            if baseline is not None:
+                snapshot["baseline"] = baseline
+            self.stdout.write(json.dumps(snapshot, indent=2))
+            return
+
+        self.stdout.write(f"🧠 Memory of gunicorn master {master} and {len(processes) - 1} workers")
+        self.stdout.write(f"   {'pid':>8}  {'role':<6}  {'RSS':>9}  {'PSS':>9}  {'USS':>9}")
+        for row in processes:
+            self.stdout.write(
+                f"   {row['pid']:>8}  {row['role']:<6}  {row['rss']:6.1f} MB"
+                f"  {row['pss']:6.1f} MB  {row['uss']:6.1f} MB"
+            )
+
+        summary = snapshot["summary"]
+        self.stdout.write("\n📊 Summary:")
+        for key, value in summary.items():
+            line = f"   {key:<12} {value:8.1f} MB"
+            if baseline is not None and key in baseline:
+                line += f"  ({value - baseline[key]:+.1f} MB vs baseline)"
+            self.stdout.write(line)
+        if options["save"]:
+            self.stdout.write(f"\n💾 Snapshot saved to {options['save']}")
+        self.stdout.write(self.style.SUCCESS("\n✅ Memory footprint complete"))
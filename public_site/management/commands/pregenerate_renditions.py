@@ -0,0 +1,34 @@
+"""
+Management command to pre-generate template image renditions.
+
+New uploads are handled automatically in the background; run this after
+bulk imports or when TEMPLATE_RENDITIONS / IMAGE_RENDITION_SPECS change.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from wagtail.images import get_image_model
+
+from public_site.services import renditions
+
+
+class Command(BaseCommand):
+    help = "Generate the renditions public templates use for every image"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers", type=int, default=4, help="Images processed in parallel"
+        )
+
+    def handle(self, *args, **options):
+        image_ids = list(get_image_model().objects.values_list("pk", flat=True))
+        specs = renditions.get_rendition_specs()
+        self.stdout.write(
+            f"🖼️  Generating {len(specs)} renditions for {len(image_ids)} images"
+        )
+
+        with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+            list(executor.map(renditions.pregenerate_by_id, image_ids))
+
+        self.stdout.write(self.style.SUCCESS(f"✅ Processed {len(image_ids)} images"))
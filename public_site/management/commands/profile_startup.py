@@ -0,0 +1,155 @@
+"""
+Management command to profile a cold worker start.
+
+Runs ``django.setup()``, builds the WSGI handler (middleware) and imports
+the URLconf (and with it every view module) in a fresh interpreter under
+``python -X importtime``, then reports the slowest modules and the peak
+RSS of the process. Use it to check that a change hasn't added seconds (or
+megabytes) to worker boot on Kinsta restarts; ``--target`` narrows the
+import to one module, e.g. ``public_site.views.forms``.
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+BOOT_SCRIPT = (
+    "import django; django.setup(); "
+    "from django.core.handlers.wsgi import WSGIHandler; WSGIHandler(); "
+    "import {target}; "
+    "import resource; print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)"
+)
+
+IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def parse_importtime(output: str) -> list[dict]:
+    """Rows of ``-X importtime`` output as dicts (times in milliseconds)."""
+    modules = []
+    for line in output.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules.append(
+                {
+                    "module": name,
+                    "self_ms": int(self_us) / 1000,
+                    "cumulative_ms": int(cumulative_us) / 1000,
+                    "depth": (len(indent) - 1) // 2,
+                }
+            )
+    return modules
+
+
+def parse_max_rss_mb(output: str) -> float | None:
+    """Peak RSS printed by BOOT_SCRIPT, in megabytes."""
+    lines = output.strip().splitlines()
+    if not lines or not lines[-1].isdigit():
+        return None
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return int(lines[-1]) / divisor
+
+
+def summarize_packages(modules: list[dict]) -> dict[str, float]:
+    """Self time per top-level package, slowest first."""
+    totals = defaultdict(float)
+    for row in modules:
+        totals[row["module"].split(".")[0]] += row["self_ms"]
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+class Command(BaseCommand):
+    help = "Report per-module import time for a cold worker start"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit", type=int, default=25, help="Modules to list (default: 25)"
+        )
+        parser.add_argument(
+            "--sort",
+            choices=["cumulative", "self"],
+            default="cumulative",
+            help="Order modules by cumulative or self import time",
+        )
+        parser.add_argument(
+            "--target",
+            default=None,
+            help="Module imported after setup (default: ROOT_URLCONF)",
+        )
+        parser.add_argument("--json", action="store_true", help="Print JSON")
+
+    def handle(self, *args, **options):
+        target = options["target"] or settings.ROOT_URLCONF
+        env = {
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": os.environ.get(
+                "DJANGO_SETTINGS_MODULE", "ethicic.settings"
+            ),
+        }
+
+        started = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", BOOT_SCRIPT.format(target=target)],
+            capture_output=True,
+            text=True,
+            env=env,
+            cwd=settings.BASE_DIR,
+            check=False,
+        )
+        wall_ms = (time.perf_counter() - started) * 1000
+
+        modules = parse_importtime(result.stderr)
+        if result.returncode != 0:
+            errors = [line for line in result.stderr.splitlines() if not IMPORTTIME_RE.match(line)]
+            self.stderr.write(self.style.ERROR("❌ Startup failed:"))
+            self.stderr.write("\n".join(errors[-20:]))
+            return
+
+        key = f"{options['sort']}_ms"
+        slowest = sorted(modules, key=lambda row: row[key], reverse=True)[: options["limit"]]
+        import_ms = sum(row["self_ms"] for row in modules)
+        max_rss_mb = parse_max_rss_mb(result.stdout)
+        packages = summarize_packages(modules)
+
+        if options["json"]:
+            self.stdout.write(
+                json.dumps(
+                    {
+                        "target": target,
+                        "wall_ms": round(wall_ms, 1),
+                        "import_ms": round(import_ms, 1),
+                        "module_count": len(modules),
+                        "max_rss_mb": max_rss_mb and round(max_rss_mb, 1),
+                        "packages": {name: round(ms, 1) for name, ms in packages.items()},
+                        "modules": slowest,
+                    },
+                    indent=2,
+                )
+            )
+            return
+
+        self.stdout.write(f"🚀 Cold start importing {target}")
+        self.stdout.write(
+            f"   Wall time {wall_ms:.0f} ms, of which imports {import_ms:.0f} ms "
+            f"across {len(modules)} modules"
+        )
+        if max_rss_mb is not None:
+            self.stdout.write(f"   Peak RSS {max_rss_mb:.1f} MB")
+        self.stdout.write("\n📦 Self time by package:")
+        for name, ms in list(packages.items())[:10]:
+            self.stdout.write(f"   {ms:8.1f} ms  {name}")
+        self.stdout.write(f"\n🐢 Slowest modules by {options['sort']} time:")
+        self.stdout.write(f"   {'cumulative':>10}  {'self':>8}  module")
+        for row in slowest:
+            self.stdout.write(
+                f"   {row['cumulative_ms']:8.1f} ms {row['self_ms']:7.1f} ms  {row['module']}"
+            )
+        self.stdout.write(self.style.SUCCESS("\n✅ Startup profile complete"))
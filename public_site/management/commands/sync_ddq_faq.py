@@ -0,0 +1,31 @@
+"""
+Management command to sync PRI DDQ questions into FAQ articles immediately.
+
+Page saves schedule this sync in the background; use this to run it by hand,
+e.g. after a deploy or if a worker restarted before its debounce timer fired.
+"""
+
+from django.core.management.base import BaseCommand
+
+from public_site.models import PRIDDQPage
+from public_site.services import ddq_sync
+
+
+class Command(BaseCommand):
+    help = "Create or update FAQ articles from PRI DDQ pages"
+
+    def handle(self, *args, **options):
+        pages = PRIDDQPage.objects.all()
+        if not pages:
+            self.stdout.write(self.style.WARNING("⚠️  No PRI DDQ pages found"))
+            return
+
+        for page in pages:
+            summary = ddq_sync.sync_page(page)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"✅ {page.title}: {summary['created']} created, "
+                    f"{summary['updated']} updated, {summary['unchanged']} unchanged, "
+                    f"{summary['failed']} failed"
+                )
+            )
@@ -1,11 +1,17 @@
 """
-PostHog Error Tracking Middleware
+PostHog Error Tracking and Request Performance Middleware
 """
+import random
 import traceback
+from contextlib import ExitStack
 from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
 from django.utils.deprecation import MiddlewareMixin
 import logging
 
+from public_site.utils import request_metrics
+
 
 class PostHogErrorMiddleware(MiddlewareMixin):
     """Middleware to capture exceptions and send them to PostHog"""
@@ -15,19 +21,18 @@ class PostHogErrorMiddleware(MiddlewareMixin):
         if settings.DEBUG:
             return None
             
+        logger = logging.getLogger('public_site')
+
         try:
-            import posthog
-            import logging
-            
-            logger = logging.getLogger('public_site')
-            
+            from public_site.services.error_reporting import get_error_reporter
+
             # Get user info if available
             user_id = None
             user_email = None
             if hasattr(request, 'user') and request.user.is_authenticated:
                 user_id = str(request.user.id)
                 user_email = request.user.email
-            
+
             # Format stack trace frames
             tb_frames = []
             tb = exception.__traceback__
@@ -40,16 +45,11 @@ class PostHogErrorMiddleware(MiddlewareMixin):
                     'raw': f"  File \"{frame.f_code.co_filename}\", line {tb.tb_lineno}, in {frame.f_code.co_name}"
                 })
                 tb = tb.tb_next
-            
-            # Log that we're capturing an error
-            logger.info(f"Capturing exception {type(exception).__name__} for PostHog")
-            logger.debug(f"PostHog project_api_key: {posthog.project_api_key[:10]}...") 
-            logger.debug(f"PostHog host: {posthog.host}")
-            
-            # Capture the exception using $exception event format
-            result = posthog.capture(
+
+            # Queue the $exception event; a background thread sends it so the
+            # failing request never waits on PostHog
+            queued = get_error_reporter().report(
                 user_id or 'anonymous',
-                '$exception',
                 {
                     '$exception_type': type(exception).__name__,
                     '$exception_message': str(exception),
@@ -61,7 +61,9 @@ class PostHogErrorMiddleware(MiddlewareMixin):
                             'frames': tb_frames
                         }
                     }],
-                    '$exception_stack_trace_raw': traceback.format_exc(),
+                    '$exception_stack_trace_raw': ''.join(
+                        traceback.format_exception(type(exception), exception, exception.__traceback__)
+                    ),
                     # Additional context
                     'request_path': request.path,
                     'request_method': request.method,
@@ -69,23 +71,18 @@ class PostHogErrorMiddleware(MiddlewareMixin):
                     'request_ip': self.get_client_ip(request),
                     'user_email': user_email,
                     'user_authenticated': request.user.is_authenticated if hasattr(request, 'user') else False,
-                    'django_view': getattr(request, 'resolver_match', {}).view_name if hasattr(request, 'resolver_match') else None,
+                    'django_view': getattr(getattr(request, 'resolver_match', None), 'view_name', None),
                 }
             )
-            
-            # Log capture result
-            logger.info(f"PostHog capture result: {result}")
-            
-            # Force flush to ensure event is sent immediately
-            posthog.flush()
-            
-            # Log successful capture
-            logger.info(f"Successfully sent {type(exception).__name__} to PostHog")
+
+            if queued:
+                logger.info(f"Queued {type(exception).__name__} for PostHog")
+            else:
+                logger.debug(f"{type(exception).__name__} deduplicated or dropped for PostHog")
         except Exception as posthog_error:
             # Log PostHog errors
-            logger.error(f"Failed to send error to PostHog: {posthog_error}")
-            logger.error(f"PostHog error traceback: {traceback.format_exc()}")
-            
+            logger.error(f"Failed to queue error for PostHog: {posthog_error}")
+
         return None
     
     def get_client_ip(self, request):
@@ -95,4 +92,110 @@ class PostHogErrorMiddleware(MiddlewareMixin):
             ip = x_forwarded_for.split(',')[0]
         else:
             ip = request.META.get('REMOTE_ADDR')
-        return ip
\ No newline at end of file
+        return ip
+
+
+class RequestPerformanceMiddleware:
+    """Record per-route latency, DB, template, cache and size metrics.
+
+    Staff responses get a Server-Timing header; requests slower than
+    PERF_SLOW_REQUEST_MS are sampled to PostHog as slow_request events.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'PERF_METRICS_ENABLED', True):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.slow_ms = getattr(settings, 'PERF_SLOW_REQUEST_MS', 1000)
+        self.sample_rate = getattr(settings, 'PERF_SLOW_SAMPLE_RATE', 0.1)
+        request_metrics.install()
+
+    def __call__(self, request):
+        stats = request_metrics.RequestStats()
+        token = request_metrics.activate(stats)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(stats))
+                response = self.get_response(request)
+        finally:
+            request_metrics.deactivate(token)
+
+        duration_ms = stats.elapsed_ms()
+        route = self.get_route(request)
+        request_metrics.record(route, stats, duration_ms, self.get_response_size(response))
+
+        user = self.get_session_user(request)
+        if user is not None and user.is_staff:
+            response['Server-Timing'] = self.server_timing(stats, duration_ms)
+
+        if duration_ms >= self.slow_ms and not settings.DEBUG and random.random() < self.sample_rate:
+            self.report_slow_request(request, response, route, stats, duration_ms)
+
+        return response
+
+    def get_route(self, request):
+        """Low-cardinality route label: URL pattern, or Wagtail page type."""
+        page_type = getattr(request, 'perf_page_type', None)
+        if page_type:
+            label = f'page:{page_type}'
+            subroute = getattr(request, 'routable_resolver_match', None)
+            if subroute is not None:
+                label += f':{subroute.url_name or subroute.func.__name__}'
+            return label
+
+        match = getattr(request, 'resolver_match', None)
+        if match is None:
+            return 'unresolved'
+        if match.url_name == 'wagtail_serve':
+            return 'page:not_found'
+        return match.route or match.view_name
+
+    def get_session_user(self, request):
+        """The user, but only for requests that carry a session cookie.
+
+        Touching ``request.user`` loads the session and adds ``Vary: Cookie``,
+        which would make anonymous responses uncacheable.
+        """
+        if settings.SESSION_COOKIE_NAME not in request.COOKIES:
+            return None
+        return getattr(request, 'user', None)
+
+    def get_response_size(self, response):
+        if getattr(response, 'streaming', False):
+            length = response.get('Content-Length')
+            return int(length) if length and length.isdigit() else None
+        return len(response.content)
+
+    def server_timing(self, stats, duration_ms):
+        return ', '.join([
+            f'total;dur={duration_ms:.1f}',
+            f'db;dur={stats.db_ms:.1f};desc="{stats.db_queries} queries"',
+            f'tpl;dur={stats.template_ms:.1f}',
+            f'cache;desc="{stats.cache_hits} hits, {stats.cache_misses} misses"',
+        ])
+
+    def report_slow_request(self, request, response, route, stats, duration_ms):
+        try:
+            from public_site.services.error_reporting import get_error_reporter
+
+            user = self.get_session_user(request)
+            get_error_reporter().capture(
+                str(user.id) if user is not None and user.is_authenticated else 'anonymous',
+                'slow_request',
+                {
+                    'route': route,
+                    'request_path': request.path,
+                    'request_method': request.method,
+                    'status_code': response.status_code,
+                    'duration_ms': round(duration_ms, 1),
+                    'db_queries': stats.db_queries,
+                    'db_ms': round(stats.db_ms, 1),
+                    'template_ms': round(stats.template_ms, 1),
+                    'cache_hits': stats.cache_hits,
+                    'cache_misses': stats.cache_misses,
+                    'sample_rate': self.sample_rate,
+                },
+            )
+        except Exception as e:
+            logging.getLogger('public_site').debug(f"Failed to queue slow request event: {e}")
@@ -0,0 +1,71 @@
+# Generated by Django 5.1.5 on 2026-10-19 18:51
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("public_site", "0042_add_outbox_message"),
+        ("wagtailcore", "0094_alter_page_locale"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RelatedContentLink",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "relation",
+                    models.CharField(
+                        choices=[
+                            ("manual", "Editor specified"),
+                            ("suggested", "Suggested"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("score", models.FloatField(default=0)),
+                ("rank", models.PositiveSmallIntegerField(default=0)),
+                (
+                    "source",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="related_links_from",
+                        to="wagtailcore.page",
+                    ),
+                ),
+                (
+                    "target",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="related_links_to",
+                        to="wagtailcore.page",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Related Content Link",
+                "verbose_name_plural": "Related Content Links",
+                "ordering": ["source", "rank"],
+                "indexes": [
+                    models.Index(
+                        fields=["source", "rank"], name="related_link_source_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("source", "target"), name="related_link_unique_pair"
+                    )
+                ],
+            },
+        ),
+    ]
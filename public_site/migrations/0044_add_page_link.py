@@ -0,0 +1,76 @@
+# Generated by Django 5.1.5 on 2026-10-19 20:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("public_site", "0043_add_related_content_link"),
+        ("wagtailcore", "0094_alter_page_locale"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PageLink",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "field",
+                    models.CharField(
+                        help_text="Field, and block path within it, holding the link",
+                        max_length=255,
+                    ),
+                ),
+                (
+                    "link_type",
+                    models.CharField(
+                        choices=[
+                            ("page", "Page"),
+                            ("document", "Document"),
+                            ("image", "Image"),
+                            ("internal", "Internal URL"),
+                            ("external", "External URL"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "target_object_id",
+                    models.PositiveIntegerField(blank=True, null=True),
+                ),
+                ("url", models.CharField(blank=True, max_length=2048)),
+                ("is_broken", models.BooleanField(default=False)),
+                (
+                    "source",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="outgoing_links",
+                        to="wagtailcore.page",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Page Link",
+                "verbose_name_plural": "Page Links",
+                "ordering": ["source", "id"],
+                "indexes": [
+                    models.Index(
+                        fields=["link_type", "target_object_id"],
+                        name="page_link_target_idx",
+                    ),
+                    models.Index(
+                        fields=["is_broken", "link_type"], name="page_link_broken_idx"
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.5 on 2026-10-19 21:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("public_site", "0044_add_page_link"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="outboxmessage",
+            name="fallback_sent_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="When the team was emailed because platform delivery failed",
+                null=True,
+            ),
+        ),
+    ]
@@ -1,7 +1,9 @@
 from typing import ClassVar
 
 from django.core.paginator import Paginator
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.db.models.functions import Substr, Upper
 from django.utils import timezone
 from modelcluster.contrib.taggit import ClusterTaggableManager
 from modelcluster.fields import ParentalKey
@@ -3594,23 +3596,32 @@ class FAQIndexPage(SafeUrlMixin, RoutablePageMixin, Page):
 
     def get_categories(self):
         """Get all categories that have articles."""
-        articles = self.get_articles()
-        categories = set()
+        return list(
+            self.get_articles()
+            .exclude(category="")
+            .order_by("category")
+            .values_list("category", flat=True)
+            .distinct()
+        )
+
+    def get_articles_grouped(self):
+        """
+        Load all articles in one query and group them by category.
+
+        Returns (articles, categories, articles_by_category), where the
+        grouping preserves the category/title ordering of get_articles().
+        """
+        articles = list(self.get_articles())
+        articles_by_category = {}
         for article in articles:
             if article.category:
-                categories.add(article.category)
-        return sorted(categories)
+                articles_by_category.setdefault(article.category, []).append(article)
+        return articles, sorted(articles_by_category), articles_by_category
 
     @path("")
     def index_view(self, request):
         """Default support listing."""
-        articles = self.get_articles()
-        categories = self.get_categories()
-
-        # Group articles by category
-        articles_by_category = {}
-        for category in categories:
-            articles_by_category[category] = self.get_articles_by_category(category)
+        articles, categories, articles_by_category = self.get_articles_grouped()
 
         return self.render(
             request,
@@ -3722,15 +3733,24 @@ class FAQArticle(SafeUrlMixin, Page):
     ]
 
     def get_related_articles_list(self):
-        """Get related articles based on related_articles field."""
-        if not self.related_articles:
-            return FAQArticle.objects.none()
+        """Get related articles from the precomputed related-content graph."""
+        related = (
+            FAQArticle.objects.live()
+            .public()
+            .filter(related_links_to__source_id=self.id)
+            .order_by("related_links_to__rank")
+        )
+        if related or not self.related_articles:
+            return related
 
+        # Graph not built for this page yet - fall back to a title lookup
         related_titles = [title.strip() for title in self.related_articles.split(",")]
-        return FAQArticle.objects.filter(
-            live=True,
-            title__in=related_titles,
-        ).exclude(id=self.id)
+        return (
+            FAQArticle.objects.live()
+            .public()
+            .filter(title__in=related_titles)
+            .exclude(id=self.id)
+        )
 
     class Meta:
         verbose_name = "FAQ Article"
@@ -4527,6 +4547,158 @@ class SupportTicket(models.Model):
         return f"#{self.id} - {self.subject or 'General Inquiry'} - {self.email}"
 
 
+class OutboxMessage(models.Model):
+    """
+    Transactional outbox entry for deferred platform API delivery.
+
+    Rows are written in the same transaction as the SupportTicket they
+    belong to and delivered afterwards by public_site.services.outbox.
+    """
+
+    MESSAGE_TYPES: ClassVar[list] = [
+        ("contact", "Contact Submission"),
+        ("onboarding", "Onboarding Submission"),
+        ("newsletter", "Newsletter Signup"),
+    ]
+
+    STATUS_CHOICES: ClassVar[list] = [
+        ("pending", "Pending"),
+        ("delivered", "Delivered"),
+        ("failed", "Failed"),
+        ("skipped", "Skipped"),
+    ]
+
+    message_type = models.CharField(max_length=20, choices=MESSAGE_TYPES)
+    payload = models.JSONField(encoder=DjangoJSONEncoder)
+    ticket = models.ForeignKey(
+        SupportTicket,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="outbox_messages",
+    )
+
+    # Stable identifiers so retries never create duplicates
+    dedupe_key = models.CharField(max_length=255, unique=True)
+    submission_id = models.CharField(
+        max_length=64,
+        help_text="Submission ID sent to the platform, reused across retries",
+    )
+
+    # Delivery state
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    fallback_sent_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        help_text="When the team was emailed because platform delivery failed",
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    delivered_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        verbose_name = "Outbox Message"
+        verbose_name_plural = "Outbox Messages"
+        ordering = ["created_at"]
+        indexes: ClassVar[list] = [
+            models.Index(
+                fields=["status", "next_attempt_at"], name="outbox_status_due_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.message_type} #{self.id} ({self.status})"
+
+
+class RelatedContentLink(models.Model):
+    """
+    Precomputed "related content" edge between two pages.
+
+    Built at publish time by public_site.services.related_content from
+    editor-entered related terms, shared categories/keywords and text
+    similarity, so pages read their related items with one indexed lookup.
+    """
+
+    RELATION_CHOICES: ClassVar[list] = [
+        ("manual", "Editor specified"),
+        ("suggested", "Suggested"),
+    ]
+
+    source = models.ForeignKey(
+        Page, on_delete=models.CASCADE, related_name="related_links_from"
+    )
+    target = models.ForeignKey(
+        Page, on_delete=models.CASCADE, related_name="related_links_to"
+    )
+    relation = models.CharField(max_length=20, choices=RELATION_CHOICES)
+    score = models.FloatField(default=0)
+    rank = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Related Content Link"
+        verbose_name_plural = "Related Content Links"
+        ordering = ["source", "rank"]
+        constraints: ClassVar[list] = [
+            models.UniqueConstraint(
+                fields=["source", "target"], name="related_link_unique_pair"
+            ),
+        ]
+        indexes: ClassVar[list] = [
+            models.Index(fields=["source", "rank"], name="related_link_source_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.source_id} -> {self.target_id} ({self.relation})"
+
+
+class PageLink(models.Model):
+    """
+    Outgoing link from a live page's rich text or StreamField content.
+
+    Extracted at publish time by public_site.services.link_index, which
+    validates internal targets against the page tree, so broken internal
+    links are known without crawling the site.
+    """
+
+    LINK_TYPES: ClassVar[list] = [
+        ("page", "Page"),
+        ("document", "Document"),
+        ("image", "Image"),
+        ("internal", "Internal URL"),
+        ("external", "External URL"),
+    ]
+
+    source = models.ForeignKey(
+        Page, on_delete=models.CASCADE, related_name="outgoing_links"
+    )
+    field = models.CharField(
+        max_length=255, help_text="Field, and block path within it, holding the link"
+    )
+    link_type = models.CharField(max_length=20, choices=LINK_TYPES)
+    # Page, document or image ID; for internal URLs, the page they resolve to
+    target_object_id = models.PositiveIntegerField(null=True, blank=True)
+    url = models.CharField(max_length=2048, blank=True)
+    is_broken = models.BooleanField(default=False)
+
+    class Meta:
+        verbose_name = "Page Link"
+        verbose_name_plural = "Page Links"
+        ordering = ["source", "id"]
+        indexes: ClassVar[list] = [
+            models.Index(
+                fields=["link_type", "target_object_id"], name="page_link_target_idx"
+            ),
+            models.Index(fields=["is_broken", "link_type"], name="page_link_broken_idx"),
+        ]
+
+    def __str__(self):
+        target = self.url or f"{self.link_type} #{self.target_object_id}"
+        return f"{self.source_id} -> {target}"
+
+
 class EncyclopediaIndexPage(SafeUrlMixin, RoutablePageMixin, Page):
     """Investment Encyclopedia index page with alphabetical navigation."""
 
@@ -4567,24 +4739,37 @@ class EncyclopediaIndexPage(SafeUrlMixin, RoutablePageMixin, Page):
 
     def get_available_letters(self):
         """Get all letters that have entries."""
-        entries = self.get_entries()
-        letters = set()
+        letters = (
+            self.get_entries()
+            .exclude(title="")
+            .annotate(letter=Upper(Substr("title", 1, 1)))
+            .order_by("letter")
+            .values_list("letter", flat=True)
+            .distinct()
+        )
+        return list(letters)
+
+    @staticmethod
+    def group_entries_by_letter(entries):
+        """Group already-loaded entries by the upper-cased first letter of the title."""
+        entries_by_letter = {}
         for entry in entries:
             if entry.title:
-                letters.add(entry.title[0].upper())
-        return sorted(letters)
+                entries_by_letter.setdefault(entry.title[0].upper(), []).append(entry)
+        return entries_by_letter
 
     @path("")
     def index_view(self, request):
         """Default encyclopedia listing."""
-        entries = self.get_entries()
-        letters = self.get_available_letters()
+        entries = list(self.get_entries())
+        entries_by_letter = self.group_entries_by_letter(entries)
 
         return self.render(
             request,
             context_overrides={
                 "entries": entries,
-                "available_letters": letters,
+                "entries_by_letter": entries_by_letter,
+                "available_letters": sorted(entries_by_letter),
                 "selected_letter": None,
             },
         )
@@ -4593,7 +4778,7 @@ class EncyclopediaIndexPage(SafeUrlMixin, RoutablePageMixin, Page):
     def entries_by_letter(self, request, letter):
         """Filter entries by first letter."""
         letter = letter.upper()
-        entries = self.get_entries_by_letter(letter)
+        entries = list(self.get_entries_by_letter(letter))
         available_letters = self.get_available_letters()
 
         return self.render(
@@ -4689,14 +4874,24 @@ class EncyclopediaEntry(SafeUrlMixin, Page):
     ]
 
     def get_related_entries(self):
-        """Get entries related to this one based on related_terms."""
-        if not self.related_terms:
-            return EncyclopediaEntry.objects.none()
+        """Get related entries from the precomputed related-content graph."""
+        related = (
+            EncyclopediaEntry.objects.live()
+            .public()
+            .filter(related_links_to__source_id=self.id)
+            .order_by("related_links_to__rank")[:5]
+        )
+        if related or not self.related_terms:
+            return related
 
+        # Graph not built for this page yet - fall back to matching titles
         related_terms = [term.strip().lower() for term in self.related_terms.split(",")]
-        return EncyclopediaEntry.objects.filter(
-            live=True, title__iregex=r"\b(?:" + "|".join(related_terms) + r")\b"
-        ).exclude(id=self.id)[:5]
+        return (
+            EncyclopediaEntry.objects.live()
+            .public()
+            .filter(title__iregex=r"\b(?:" + "|".join(related_terms) + r")\b")
+            .exclude(id=self.id)[:5]
+        )
 
     class Meta:
         verbose_name = "Encyclopedia Entry"
@@ -5529,72 +5724,32 @@ class PRIDDQPage(SafeUrlMixin, Page):
 
         return questions
 
-    def sync_to_support_articles(self):  # noqa: PLR0912
+    def sync_to_support_articles(self):
         """Create or update FAQArticle entries for DDQ questions."""
         import logging
 
-        logger = logging.getLogger(__name__)
+        from .services import ddq_sync
 
         try:
-            questions = self.get_ddq_questions_for_faq()
-
-            # Find FAQ index page
-            try:
-                faq_index = FAQIndexPage.objects.first()
-            except Exception as e:
-                logger.warning(f"Failed to get FAQ index page: {e}")
-                return
-
-            if not faq_index:
-                logger.info("No FAQ index page found, skipping DDQ sync")
-                return
-
-            # Process questions - collect failures for logging
-            failed_articles = []
-
-            for q in questions:
-                try:
-                    article = FAQArticle.objects.filter(title=q["question"]).first()
-                    if not article:
-                        # Create new article
-                        article = FAQArticle(
-                            title=q["question"],
-                            slug=q["question"].lower().replace(" ", "-")[:50],
-                            content=f"<p>{q['answer']}</p>",
-                            category=q["category"],
-                            keywords="PRI DDQ responsible investment ESG",
-                            priority=5,
-                            locale=self.locale,
-                        )
-                        faq_index.add_child(instance=article)
-                    else:
-                        # Update existing article
-                        article.content = f"<p>{q['answer']}</p>"
-                        article.category = q["category"]
-                        article.save()
-                except Exception as e:  # noqa: PERF203
-                    logger.warning(
-                        f"Failed to sync FAQ article '{q.get('question', 'unknown')}': {e}"
-                    )
-                    failed_articles.append(q.get("question", "unknown"))
-
-            if failed_articles:
-                logger.info(f"Failed to sync {len(failed_articles)} FAQ articles")
-
+            return ddq_sync.sync_page(self)
         except Exception as e:
-            logger.error(f"DDQ to FAQ sync failed completely: {e}")
+            logging.getLogger(__name__).error(f"DDQ to FAQ sync failed completely: {e}")
             # Don't re-raise - this is a non-critical operation that shouldn't break page saving
+            return None
 
     def save(self, *args, **kwargs):
-        """Override save to auto-update updated_at and sync to support articles when saved."""
+        """Override save to auto-update updated_at and schedule a support article sync."""
         from django.utils import timezone
 
+        from .services import ddq_sync
+
         # Auto-update the updated_at field with current month/year
         current_date = timezone.now()
         self.updated_at = current_date.strftime("%B %Y")
 
         super().save(*args, **kwargs)
-        self.sync_to_support_articles()
+        # Deferred and debounced so save latency doesn't depend on the DDQ size
+        ddq_sync.schedule_sync(self.pk)
 
     class Meta:
         verbose_name = "PRI DDQ Page"
@@ -5851,6 +6006,27 @@ class SiteConfiguration(ClusterableModel, BaseSiteSetting):
     class Meta:
         verbose_name = "Site Configuration"
 
+    @classmethod
+    def for_request(cls, request):
+        """Per-request settings from the worker's snapshot cache.
+
+        The admin edits through ``for_site``, which still reads the database.
+        """
+        from wagtail.models import Site
+
+        from .services.site_settings import get_site_configuration
+
+        attr_name = cls.get_cache_attr_name()
+        if hasattr(request, attr_name):
+            return getattr(request, attr_name)
+        site = Site.find_for_request(request)
+        if site is None:
+            raise cls.DoesNotExist(f"{cls} does not exist for site None.")
+        site_settings = get_site_configuration(site)
+        site_settings._request = request
+        setattr(request, attr_name, site_settings)
+        return site_settings
+
 
 class NavigationMenuItem(Orderable):
     """Individual navigation menu item."""
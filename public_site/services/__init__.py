@@ -1,4 +1 @@
 # Public site services for enhanced integration
-from .brochure_service import BrochureService, BrochureContentAggregator
-
-__all__ = ["BrochureService", "BrochureContentAggregator"]
@@ -0,0 +1,284 @@
+"""
+Async Platform API Client for ASGI Deployment
+
+Same API as PlatformAPIClient, but every call is a coroutine built on
+httpx.AsyncClient, so async views can fan out several platform calls
+concurrently without holding a thread per request. Read-only endpoints
+are served from the shared PlatformResponseCache.
+
+Each event loop gets its own pooled httpx client, which is only worth
+keeping on a long-lived loop (an ASGI server). Code running on a
+short-lived loop - such as an async view under WSGI, which Django runs
+through ``async_to_sync`` - must close it when done:
+
+    async with async_platform_client:
+        status = await async_platform_client.check_submission_status(sid)
+
+Sync views under WSGI should use the pooled PlatformAPIClient instead.
+"""
+
+import asyncio
+import logging
+import time
+import weakref
+from typing import Any
+
+from django.conf import settings
+
+from public_site.services.platform_client import PlatformAPIClient
+
+# httpx is only needed when the async client is actually used
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncPlatformAPIClient(PlatformAPIClient):
+    """Async client for optional integration with main garden platform."""
+
+    def __init__(self):
+        super().__init__()
+        # One httpx client per event loop - clients cannot cross loops
+        self._async_clients = weakref.WeakKeyDictionary()
+
+    def _get_async_client(self) -> "httpx.AsyncClient":
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                base_url=self.base_url.rstrip("/"),
+                headers={"Content-Type": "application/json"},
+                limits=httpx.Limits(
+                    max_connections=self.pool_size,
+                    max_keepalive_connections=self.pool_size,
+                ),
+                transport=httpx.AsyncHTTPTransport(retries=self.max_retries),
+            )
+            self._async_clients[loop] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close the httpx client bound to the running event loop."""
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    async def __aenter__(self) -> "AsyncPlatformAPIClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _make_request(
+        self,
+        endpoint: str,
+        data: dict[str, Any] | None = None,
+        timeout: int | None = None,
+        method: str = "POST",
+        use_secure_api: bool = False,
+    ) -> dict[str, Any] | None:
+        """Make API request with graceful error handling."""
+        label = self._endpoint_label(endpoint)
+
+        if httpx is None:
+            logger.warning("httpx not installed - async platform client disabled")
+            return None
+
+        if not self.circuit_breaker.allow_request():
+            logger.debug(f"Platform API circuit open, skipping {endpoint}")
+            return None
+
+        started = time.perf_counter()
+        try:
+            client = self._get_async_client()
+            timeout = httpx.Timeout(timeout or self.timeout, connect=self.connect_timeout)
+            headers = {}
+
+            # Add API key authentication for secure endpoints
+            if use_secure_api and self.api_key:
+                headers["X-API-Key"] = self.api_key
+
+            path = "/" + endpoint.lstrip("/")
+            if method.upper() == "POST":
+                response = await client.post(
+                    path, json=data, headers=headers, timeout=timeout
+                )
+            else:
+                response = await client.get(
+                    path, params=data, headers=headers, timeout=timeout
+                )
+
+            # Any HTTP answer means the platform is reachable
+            self.circuit_breaker.record_success()
+
+            if response.status_code == 200:
+                return response.json()
+            self._record_error(label)
+            logger.warning(
+                f"Platform API returned {response.status_code} for {endpoint}"
+            )
+            return None
+
+        except httpx.TimeoutException:
+            self.circuit_breaker.record_failure()
+            self._record_error(label)
+            logger.warning(f"Platform API timeout for {endpoint}")
+            return None
+        except httpx.TransportError:
+            self.circuit_breaker.record_failure()
+            self._record_error(label)
+            logger.debug(f"Platform API unavailable for {endpoint}")
+            return None
+        except Exception:
+            self._record_error(label)
+            logger.exception(f"Platform API error for {endpoint}")
+            return None
+        finally:
+            self.latency.observe(label, (time.perf_counter() - started) * 1000)
+
+    async def _cached_get(
+        self, endpoint: str, params: dict[str, Any] | None, timeout: int
+    ) -> dict[str, Any] | None:
+        """GET a read-only endpoint through the shared response cache."""
+        return await self.response_cache.afetch(
+            endpoint,
+            params,
+            lambda: self._make_request(endpoint, params, timeout, "GET"),
+        )
+
+    async def gather(self, **calls) -> dict[str, Any]:
+        """
+        Run several client coroutines concurrently.
+
+        Example:
+            data = await client.gather(
+                portfolio=client.get_portfolio_summary(),
+                insights=client.get_research_insights(limit=3),
+            )
+        """
+        results = await asyncio.gather(*calls.values(), return_exceptions=True)
+        return {
+            name: None if isinstance(result, Exception) else result
+            for name, result in zip(calls.keys(), results, strict=True)
+        }
+
+    async def analyze_content(
+        self, content: str, analysis_type: str = "comprehensive"
+    ) -> dict[str, Any] | None:
+        """Optional AI content analysis."""
+        data = {
+            "content": content,
+            "analysis_type": analysis_type,
+            "options": {
+                "include_charts": True,
+                "include_suggestions": True,
+                "min_confidence": getattr(settings, "AI_MIN_CONFIDENCE", 0.7),
+            },
+        }
+        return await self._make_request(
+            "/api/v1/ai/analyze-content/", data, self.timeout
+        )
+
+    async def quick_analyze_content(self, content: str) -> dict[str, Any] | None:
+        """Quick content analysis with shorter timeout."""
+        data = {
+            "content": content,
+            "analysis_type": "quick",
+            "options": {
+                "include_charts": False,
+                "include_suggestions": True,
+                "min_confidence": 0.6,
+            },
+        }
+        return await self._make_request(
+            "/api/v1/ai/analyze-content/", data, self.quick_timeout
+        )
+
+    async def notify_contact_submission(self, contact_data: dict[str, Any]) -> bool:
+        """Notify main platform of contact form submission."""
+        result = await self._make_request(
+            "/api/v1/contact-notifications/", contact_data, self.quick_timeout
+        )
+        return bool(result)
+
+    async def create_enhanced_contact(
+        self, form_data: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """Create contact with full CRM integration via API."""
+        return await self._make_request("/api/v1/contacts/", form_data, self.timeout)
+
+    async def get_portfolio_summary(
+        self, strategy: str | None = None
+    ) -> dict[str, Any] | None:
+        """Get portfolio summary data for public display."""
+        params = {"strategy": strategy} if strategy else {}
+        return await self._cached_get(
+            "/api/v1/portfolio/public-summary/", params, self.quick_timeout
+        )
+
+    async def get_research_insights(
+        self, topic: str | None = None, limit: int = 5
+    ) -> dict[str, Any] | None:
+        """Get recent research insights for public display."""
+        params = {"topic": topic, "limit": limit}
+        return await self._cached_get(
+            "/api/v1/research/public-insights/", params, self.quick_timeout
+        )
+
+    async def secure_contact_submission(
+        self, form_data: dict[str, Any], submission_id: str | None = None
+    ) -> dict[str, Any] | None:
+        """Submit contact form data using secure encrypted API."""
+        if not self.api_key:
+            logger.warning("No API key configured for secure contact submission")
+            return None
+
+        payload = self._build_secure_payload("contact", form_data, submission_id)
+        return await self._make_request(
+            "/api/v1/secure/contact-submission/",
+            payload,
+            self.timeout,
+            use_secure_api=True,
+        )
+
+    async def secure_onboarding_submission(
+        self, form_data: dict[str, Any], submission_id: str | None = None
+    ) -> dict[str, Any] | None:
+        """Submit onboarding form data using secure encrypted API."""
+        if not self.api_key:
+            logger.warning("No API key configured for secure onboarding submission")
+            return None
+
+        payload = self._build_secure_payload("onboarding", form_data, submission_id)
+        return await self._make_request(
+            "/api/v1/secure/onboarding-submission/",
+            payload,
+            self.timeout,
+            use_secure_api=True,
+        )
+
+    async def check_submission_status(
+        self, submission_id: str
+    ) -> dict[str, Any] | None:
+        """Check the status of a form submission."""
+        if not self.api_key or not submission_id:
+            return None
+
+        return await self._make_request(
+            f"/api/v1/secure/submission-status/{submission_id}/",
+            timeout=self.quick_timeout,
+            method="GET",
+            use_secure_api=True,
+        )
+
+    async def health_check(self) -> bool:
+        """Check if main platform is available."""
+        result = await self._cached_get("/api/v1/health/", None, 5)
+        return result is not None
+
+
+# Global async client instance
+async_platform_client = AsyncPlatformAPIClient()
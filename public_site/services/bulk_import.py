@@ -0,0 +1,475 @@
+"""
+Bulk Content Import
+
+Copies pages, media items and support tickets from another database
+(normally the ``ubicloud`` connection) into the local one. Source tables
+are read with server-side cursors in chunks. The page tree fields (path,
+depth, numchild, url_path) are computed in memory from the source tree, and
+rows are written with ``bulk_create``. This replaces an ``add_child()`` plus
+``save_revision().publish()`` per page.
+
+Columns are copied by name wherever the source table and the local model
+share them. If the two schemas have drifted apart, unmatched columns are
+dropped and the import continues. Foreign keys are not copied, except a
+media item's page, which is remapped to the local page. Imported pages
+have no revision until they are first edited.
+
+With ``since``, only rows changed at or after that time are read, and
+those that already exist locally (pages by URL path, media items by title,
+tickets by email and subject) are updated in place. Without it, existing
+rows are left alone.
+"""
+
+import logging
+from collections import Counter, defaultdict
+from datetime import datetime, time
+from datetime import timezone as dt_timezone
+from typing import NamedTuple
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from wagtail.models import Locale, Page, get_page_models
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1000
+
+PAGE_SQL = """
+    SELECT
+        p.id, p.path, p.depth, p.title, p.slug, p.seo_title,
+        p.search_description, p.show_in_menus, p.live,
+        p.first_published_at, p.last_published_at,
+        p.latest_revision_created_at, ct.model
+    FROM wagtailcore_page p
+    JOIN django_content_type ct ON p.content_type_id = ct.id
+    WHERE ct.app_label = 'public_site'
+"""
+PAGE_CHANGED_SINCE = (
+    "COALESCE(p.latest_revision_created_at, p.last_published_at, p.first_published_at) >= %s"
+)
+
+# Page fields refreshed on pages that already exist locally
+PAGE_UPDATE_FIELDS = [
+    "title",
+    "draft_title",
+    "seo_title",
+    "search_description",
+    "show_in_menus",
+    "live",
+    "first_published_at",
+    "last_published_at",
+    "latest_revision_created_at",
+]
+
+
+class TreeNode(NamedTuple):
+    pk: int | None
+    path: str
+    depth: int
+    url_path: str
+
+
+def parse_since(value: str) -> datetime:
+    """Parse ``--since`` as an ISO date or datetime (naive values are local time)."""
+    since = parse_datetime(value)
+    if since is None:
+        day = parse_date(value)
+        if day is None:
+            raise ValueError(f"Not an ISO date or datetime: {value}")
+        since = datetime.combine(day, time.min)
+    if timezone.is_naive(since):
+        since = timezone.make_aware(since)
+    return since
+
+
+def iter_chunks(connection, sql: str, params=(), chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """Yield lists of row dicts read through a server-side cursor."""
+    with connection.chunked_cursor() as cursor:
+        cursor.execute(sql, params)
+        columns = [col[0] for col in cursor.description]
+        while rows := cursor.fetchmany(chunk_size):
+            yield [dict(zip(columns, row)) for row in rows]
+
+
+def convert(field, value, connection):
+    """A raw source column value as ``field``'s Python value."""
+    if value is None:
+        return None
+    if hasattr(field, "from_db_value"):
+        value = field.from_db_value(value, None, connection)
+    value = field.to_python(value)
+    # Backends without time zone support (SQLite) store UTC without an offset
+    if isinstance(value, datetime) and settings.USE_TZ and timezone.is_naive(value):
+        value = timezone.make_aware(value, dt_timezone.utc)
+    return value
+
+
+def copy_values(model, row: dict, connection) -> dict:
+    """Values for ``model``'s own non-relational fields present in ``row``."""
+    return {
+        field.attname: convert(field, row[field.column], connection)
+        for field in model._meta.local_concrete_fields
+        if not (field.primary_key or field.is_relation) and field.column in row
+    }
+
+
+def missing_required_fields(model, columns) -> list[str]:
+    """Fields an insert would leave NULL: not null, no default and not in ``columns``."""
+    missing = []
+    for field in model._meta.local_concrete_fields:
+        if (
+            field.primary_key
+            or field.null
+            or field.has_default()
+            or getattr(field, "auto_now", False)
+            or getattr(field, "auto_now_add", False)
+            or (field.empty_strings_allowed and not field.is_relation)
+        ):
+            continue
+        if field.is_relation or field.column not in columns:
+            missing.append(field.name)
+    return missing
+
+
+class BulkImporter:
+    """Import content from ``source`` into ``using``; see the module docstring."""
+
+    def __init__(
+        self,
+        source="ubicloud",
+        using=DEFAULT_DB_ALIAS,
+        since=None,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        log=None,
+    ):
+        # A connection alias, or a connection object (e.g. in tests)
+        self.source = connections[source] if isinstance(source, str) else source
+        self.using = using
+        self.since = since
+        self.chunk_size = chunk_size
+        self.log = log or logger.info
+        self.stats = Counter()
+        self.page_ids = {}  # source page id -> local page id
+        self.imported = {}  # page model -> one imported page
+
+    def run(self) -> Counter:
+        with transaction.atomic(using=self.using):
+            self.import_pages()
+            self.import_media_items()
+            self.import_support_tickets()
+            self.send_publish_receivers()
+        return self.stats
+
+    # Source helpers
+
+    def source_columns(self, table: str) -> set[str] | None:
+        """Column names of a source table, or None if it doesn't exist."""
+        with self.source.cursor() as cursor:
+            if table not in self.source.introspection.table_names(cursor):
+                return None
+            return {
+                col.name
+                for col in self.source.introspection.get_table_description(cursor, table)
+            }
+
+    def read(self, sql: str, params=()):
+        return iter_chunks(self.source, sql, params, self.chunk_size)
+
+    # Pages
+
+    def import_pages(self) -> None:
+        models = {
+            model._meta.model_name: model
+            for model in get_page_models()
+            if model._meta.app_label == "public_site"
+        }
+
+        # Which source pages have a row in their type's table
+        available = {}
+        for name, model in models.items():
+            table = model._meta.db_table
+            columns = self.source_columns(table)
+            if columns is None:
+                continue
+            missing = missing_required_fields(model, columns)
+            if missing:
+                self.log(f"⚠️  Skipping {name}: source lacks {', '.join(missing)}")
+                continue
+            for chunk in self.read(f"SELECT page_ptr_id FROM {table}"):
+                available.update((row["page_ptr_id"], model) for row in chunk)
+
+        source_url_paths = {}
+        for chunk in self.read("SELECT id, path, url_path FROM wagtailcore_page"):
+            source_url_paths.update((row["path"], (row["id"], row["url_path"])) for row in chunk)
+
+        sql, params = PAGE_SQL, []
+        if self.since:
+            sql, params = f"{sql} AND {PAGE_CHANGED_SINCE}", [self.since]
+        rows = [row for chunk in self.read(f"{sql} ORDER BY p.path", params) for row in chunk]
+        self.log(f"Found {len(rows)} pages to import")
+
+        local, max_step = self.load_local_tree()
+        root = next((node for node in local.values() if node.depth == 1), None)
+        if root is None:
+            self.log("⚠️  No root page; skipping page import")
+            return
+
+        steplen = Page.steplen
+        planned = {}  # source path -> TreeNode
+        new_children = Counter()  # local parent path -> children added
+        creates = defaultdict(dict)  # model -> {source id: (TreeNode, row)}
+        updates = defaultdict(dict)
+
+        for row in rows:
+            model = available.get(row["id"])
+            if model is None:
+                self.stats["pages_skipped"] += 1
+                continue
+
+            parent_path = row["path"][:-steplen]
+            if row["depth"] <= 2:
+                parent = root
+            elif parent_path in planned:
+                parent = planned[parent_path]
+            else:
+                _, parent_url_path = source_url_paths.get(parent_path, (None, None))
+                parent = local.get(parent_url_path)
+            if parent is None:
+                self.log(f"⚠️  No parent for: {row['title']}")
+                self.stats["pages_orphaned"] += 1
+                continue
+
+            url_path = f"{parent.url_path}{row['slug']}/"
+            existing = local.get(url_path)
+            if existing is not None:
+                planned[row["path"]] = existing
+                self.page_ids[row["id"]] = existing.pk
+                if self.since:
+                    updates[model][row["id"]] = (existing, row)
+                else:
+                    self.stats["pages_skipped"] += 1
+                continue
+
+            step = max_step[parent.path] + 1
+            max_step[parent.path] = step
+            depth = parent.depth + 1
+            node = TreeNode(None, Page._get_path(parent.path, depth, step), depth, url_path)
+            planned[row["path"]] = node
+            new_children[parent.path] += 1
+            creates[model][row["id"]] = (node, row)
+
+        # Pages outside the changed set still map to their local copies
+        for source_id, url_path in source_url_paths.values():
+            if source_id not in self.page_ids and url_path in local:
+                self.page_ids[source_id] = local[url_path].pk
+
+        locale_id = Locale.get_default().pk
+        for model in set(creates) | set(updates):
+            self.write_pages(model, creates[model], updates[model], new_children, locale_id)
+
+        # Existing parents gained children; new pages got their count on insert
+        existing_paths = {node.path for node in local.values()}
+        by_increment = defaultdict(list)
+        for path, count in new_children.items():
+            if path in existing_paths:
+                by_increment[count].append(path)
+        for count, paths in by_increment.items():
+            Page.objects.using(self.using).filter(path__in=paths).update(
+                numchild=F("numchild") + count
+            )
+
+    def load_local_tree(self):
+        """Local pages by url_path, and the highest child step under each path."""
+        local = {}
+        max_step = Counter()
+        steplen = Page.steplen
+        pages = Page.objects.using(self.using).values_list("pk", "path", "depth", "url_path")
+        for pk, path, depth, url_path in pages.iterator(chunk_size=self.chunk_size):
+            local[url_path] = TreeNode(pk, path, depth, url_path)
+            step = Page._str2int(path[-steplen:])
+            parent_path = path[:-steplen]
+            max_step[parent_path] = max(max_step[parent_path], step)
+        return local, max_step
+
+    def write_pages(self, model, creates, updates, new_children, locale_id) -> None:
+        """Stream ``model``'s source rows and bulk insert/update the planned pages."""
+        content_type_id = ContentType.objects.db_manager(self.using).get_for_model(model).pk
+        table = model._meta.db_table
+        page_fields = [f for f in Page._meta.concrete_fields if not f.primary_key]
+        created = []
+        update_fields = None
+
+        for chunk in self.read(f"SELECT * FROM {table} ORDER BY page_ptr_id"):
+            new_pages, changed_pages = [], []
+            for specific in chunk:
+                source_id = specific["page_ptr_id"]
+                entry = creates.get(source_id) or updates.get(source_id)
+                if entry is None:
+                    continue
+                node, row = entry
+                values = copy_values(model, specific, self.source)
+                page = model(
+                    **{
+                        **copy_values(Page, row, self.source),
+                        **values,
+                        "draft_title": row["title"],
+                        "has_unpublished_changes": False,
+                        # The tree position planned locally, not the source's
+                        "path": node.path,
+                        "depth": node.depth,
+                        "numchild": new_children[node.path],
+                        "url_path": node.url_path,
+                        "content_type_id": content_type_id,
+                        "locale_id": locale_id,
+                    }
+                )
+                if source_id in creates:
+                    new_pages.append((source_id, page))
+                else:
+                    page.pk = page.id = node.pk
+                    changed_pages.append(page)
+                    update_fields = update_fields or [*values, *PAGE_UPDATE_FIELDS]
+
+            if new_pages:
+                pages = [page for _, page in new_pages]
+                # Multi-table inheritance: bulk insert the Page rows, then the
+                # subclass rows keyed by the new Page ids
+                bases = Page.objects.using(self.using).bulk_create(
+                    [Page(**{f.attname: getattr(p, f.attname) for f in page_fields}) for p in pages]
+                )
+                for (source_id, page), base in zip(new_pages, bases, strict=True):
+                    page.pk = page.id = base.pk
+                    page._state.adding = False
+                    page._state.db = self.using
+                    self.page_ids[source_id] = base.pk
+                fields = model._meta.local_concrete_fields
+                batch_size = max(connections[self.using].ops.bulk_batch_size(fields, pages), 1)
+                for start in range(0, len(pages), batch_size):
+                    model._base_manager._insert(
+                        pages[start : start + batch_size], fields=fields, using=self.using
+                    )
+                created.extend(pages)
+                self.stats["pages_created"] += len(pages)
+
+            if changed_pages:
+                model.objects.using(self.using).bulk_update(changed_pages, update_fields)
+                created.extend(changed_pages)
+                self.stats["pages_updated"] += len(changed_pages)
+
+        if created:
+            self.imported[model] = created[0]
+            self.log(f"  ✓ {model.__name__}: {len(created)} pages")
+            self.index(model, created)
+
+    def index(self, model, pages) -> None:
+        from wagtail.search.backends import get_search_backend
+
+        try:
+            get_search_backend().add_bulk(model, pages)
+        except Exception as e:
+            logger.warning(f"Search indexing of imported {model.__name__} pages failed: {e}")
+
+    # Media items and support tickets
+
+    def import_rows(self, model, key_fields, since_column=None, remap_page=False) -> None:
+        """Bulk copy ``model``'s source table, matching existing rows on ``key_fields``."""
+        label = model._meta.verbose_name_plural
+        table = model._meta.db_table
+        columns = self.source_columns(table)
+        if columns is None:
+            self.log(f"⚠️  No {table} table in source, skipping {label}")
+            return
+        missing = [f for f in key_fields if f not in columns] + missing_required_fields(
+            model, columns
+        )
+        if missing:
+            self.log(f"⚠️  Source {table} lacks {', '.join(missing)}, skipping {label}")
+            return
+
+        manager = model.objects.using(self.using)
+        seen = set()  # Keys created in this run, to drop duplicates in the source
+        existing = {
+            tuple(values[:-1]): values[-1]
+            for values in manager.values_list(*key_fields, "pk").iterator(
+                chunk_size=self.chunk_size
+            )
+        }
+
+        sql, params = f"SELECT * FROM {table}", []
+        if self.since and since_column in columns:
+            sql, params = f"{sql} WHERE {since_column} >= %s", [self.since]
+
+        for chunk in self.read(sql, params):
+            new_rows, changed_rows = [], []
+            for row in chunk:
+                values = copy_values(model, row, self.source)
+                if remap_page:
+                    values["page_id"] = self.page_ids.get(row.get("page_id"))
+                obj = model(**values)
+                key = tuple(getattr(obj, field) for field in key_fields)
+                if key in existing and self.since:
+                    obj.pk = existing[key]
+                    changed_rows.append(obj)
+                elif key in existing or key in seen:
+                    self.stats[f"{model._meta.model_name}_skipped"] += 1
+                else:
+                    seen.add(key)
+                    new_rows.append(obj)
+
+            if new_rows:
+                manager.bulk_create(new_rows, batch_size=self.chunk_size)
+                self.stats[f"{model._meta.model_name}_created"] += len(new_rows)
+            if changed_rows:
+                fields = [
+                    f.name
+                    for f in model._meta.local_concrete_fields
+                    if f.attname in values and not f.primary_key
+                ]
+                manager.bulk_update(changed_rows, fields, batch_size=self.chunk_size)
+                self.stats[f"{model._meta.model_name}_updated"] += len(changed_rows)
+
+        name = model._meta.model_name
+        self.log(
+            f"  ✓ {label}: {self.stats[f'{name}_created']} created, "
+            f"{self.stats[f'{name}_updated']} updated"
+        )
+
+    def import_media_items(self) -> None:
+        from public_site.models import MediaItem
+
+        # No change timestamp on media items: --since re-reads them all
+        self.import_rows(MediaItem, ["title"], remap_page=True)
+
+    def import_support_tickets(self) -> None:
+        from public_site.models import SupportTicket
+
+        self.import_rows(SupportTicket, ["email", "subject"], since_column="updated_at")
+
+    # Derived content
+
+    def send_publish_receivers(self) -> None:
+        """Run the page_published receivers once per imported page type.
+
+        bulk_create doesn't publish, so the sitemap, llms.txt, the
+        related-content graph and the link index are refreshed here, on
+        commit, as they would be after a publish. The related-content
+        graph of each imported type is rebuilt whole: its publish receiver
+        only updates the rows of the one page it is given.
+        """
+        from public_site.services import (
+            link_index,
+            related_content,
+            sitemap,
+            text_files,
+        )
+
+        for model, page in self.imported.items():
+            for receiver in (sitemap.handle_page_change, text_files.handle_page_change):
+                receiver(sender=model, instance=page)
+        related_content.handle_bulk_publish(self.imported)
+        if self.page_ids:
+            link_index.handle_bulk_publish(self.page_ids.values())
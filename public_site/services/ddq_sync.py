@@ -0,0 +1,159 @@
+"""
+PRI DDQ to FAQ Article Sync
+
+Saving a PRIDDQPage schedules a sync instead of running it inline. Saves
+in quick succession are debounced: each save restarts the timer and bumps
+a token in the shared cache, and a timer only runs if its token is still
+the latest, so one sync follows a burst of edits across all workers.
+
+The sync itself loads every matching FAQArticle in one query, creates only
+missing articles and bulk-updates only the ones whose content changed.
+Run ``python manage.py sync_ddq_faq`` to sync immediately.
+"""
+
+import logging
+import threading
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections, transaction
+from django.utils.text import slugify
+
+logger = logging.getLogger(__name__)
+
+DDQ_KEYWORDS = "PRI DDQ responsible investment ESG"
+
+_timers = {}
+_timers_lock = threading.Lock()
+
+
+def _token_key(page_id: int) -> str:
+    return f"ddq_sync:token:{page_id}"
+
+
+def schedule_sync(page_id: int) -> None:
+    """Debounce a sync for ``page_id`` until after the current transaction."""
+    delay = getattr(settings, "DDQ_SYNC_DEBOUNCE_SECONDS", 10)
+    token = uuid.uuid4().hex
+    try:
+        cache.set(_token_key(page_id), token, delay + 300)
+    except Exception as e:
+        logger.debug(f"Could not record DDQ sync token: {e}")
+    transaction.on_commit(lambda: _start_timer(page_id, token, delay))
+
+
+def _start_timer(page_id: int, token: str, delay: float) -> None:
+    timer = threading.Timer(delay, _run_debounced, args=(page_id, token))
+    timer.daemon = True
+    with _timers_lock:
+        previous = _timers.pop(page_id, None)
+        if previous is not None:
+            previous.cancel()
+        _timers[page_id] = timer
+    timer.start()
+
+
+def _run_debounced(page_id: int, token: str) -> None:
+    with _timers_lock:
+        if _timers.get(page_id) is threading.current_thread():
+            del _timers[page_id]
+
+    try:
+        latest = cache.get(_token_key(page_id))
+        if latest not in (None, token):
+            # A later save (possibly on another worker) will run the sync
+            return
+        sync_page_by_id(page_id)
+    except Exception:
+        logger.exception("Deferred DDQ to FAQ sync failed for page %s", page_id)
+    finally:
+        close_old_connections()
+
+
+def sync_page_by_id(page_id: int) -> dict:
+    from public_site.models import PRIDDQPage
+
+    page = PRIDDQPage.objects.filter(pk=page_id).first()
+    if page is None:
+        return _summary()
+    return sync_page(page)
+
+
+def sync_page(page) -> dict:
+    """Create or update FAQArticle entries for a DDQ page's questions."""
+    from public_site.models import FAQArticle, FAQIndexPage
+
+    summary = _summary()
+    questions = page.get_ddq_questions_for_faq()
+
+    faq_index = FAQIndexPage.objects.first()
+    if not faq_index:
+        logger.info("No FAQ index page found, skipping DDQ sync")
+        return summary
+
+    # One query for every existing article; the oldest wins on duplicates
+    existing = {}
+    for article in FAQArticle.objects.filter(
+        title__in=[q["question"] for q in questions]
+    ).order_by("-pk"):
+        existing[article.title] = article
+
+    changed = []
+    missing = []
+    for q in questions:
+        content = f"<p>{q['answer']}</p>"
+        article = existing.get(q["question"])
+        if article is None:
+            missing.append(q)
+        elif article.content != content or article.category != q["category"]:
+            article.content = content
+            article.category = q["category"]
+            changed.append(article)
+        else:
+            summary["unchanged"] += 1
+
+    if changed:
+        FAQArticle.objects.bulk_update(changed, ["content", "category"])
+        summary["updated"] = len(changed)
+        _reindex(changed)
+
+    for q in missing:
+        try:
+            with transaction.atomic():
+                faq_index.add_child(
+                    instance=FAQArticle(
+                        title=q["question"],
+                        slug=slugify(q["question"])[:50].rstrip("-"),
+                        content=f"<p>{q['answer']}</p>",
+                        category=q["category"],
+                        keywords=DDQ_KEYWORDS,
+                        priority=5,
+                        locale=page.locale,
+                    )
+                )
+            summary["created"] += 1
+        except Exception as e:
+            logger.warning(f"Failed to sync FAQ article '{q['question']}': {e}")
+            summary["failed"] += 1
+            # The rolled-back insert leaves stale tree counters on the parent
+            faq_index.refresh_from_db()
+
+    if summary["failed"]:
+        logger.info(f"Failed to sync {summary['failed']} FAQ articles")
+    return summary
+
+
+def _reindex(articles) -> None:
+    """bulk_update skips save signals, so refresh the search index directly."""
+    try:
+        from wagtail.search import index
+
+        for article in articles:
+            index.insert_or_update_object(article)
+    except Exception as e:
+        logger.warning(f"Failed to reindex synced FAQ articles: {e}")
+
+
+def _summary() -> dict:
+    return {"created": 0, "updated": 0, "unchanged": 0, "failed": 0}
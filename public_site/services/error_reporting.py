@@ -0,0 +1,193 @@
+"""
+Background Exception Reporting to PostHog
+
+The error middleware hands each exception event to ErrorReporter.report(),
+which only does in-memory work: events go onto a bounded queue drained by
+a daemon thread that calls posthog.capture and flushes once per batch.
+
+- Repeats of the same fingerprint (exception type + top frames) within the
+  dedupe window are counted instead of queued; the next event sent for that
+  fingerprint carries the suppressed count.
+- When the queue is full new events are dropped and counted.
+- Other events (e.g. sampled slow requests) can share the queue through
+  capture(), which skips deduplication.
+- The queue is flushed on interpreter exit so graceful worker restarts
+  (deploys) do not lose reports.
+"""
+
+import atexit
+import hashlib
+import logging
+import queue
+import threading
+import time
+from collections import Counter, OrderedDict
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Frames (innermost first) that make up an exception's fingerprint
+FINGERPRINT_FRAMES = 5
+# Fingerprints remembered for deduplication
+MAX_TRACKED_FINGERPRINTS = 1000
+BATCH_SIZE = 50
+
+_STOP = object()
+
+
+def fingerprint(exception_type: str, frames: list[dict]) -> str:
+    """Stable hash of the exception type and its innermost frames."""
+    top = [
+        f"{frame['filename']}:{frame['function']}:{frame['lineno']}"
+        for frame in frames[-FINGERPRINT_FRAMES:]
+    ]
+    return hashlib.sha1(
+        "|".join([exception_type, *top]).encode()
+    ).hexdigest()
+
+
+class ErrorReporter:
+    """Bounded, deduplicating queue of exception events for PostHog."""
+
+    def __init__(self, maxsize=None, dedupe_seconds=None, client=None):
+        self.maxsize = maxsize or getattr(settings, "ERROR_REPORT_QUEUE_SIZE", 1000)
+        self.dedupe_seconds = (
+            dedupe_seconds
+            if dedupe_seconds is not None
+            else getattr(settings, "ERROR_REPORT_DEDUPE_SECONDS", 60)
+        )
+        self._client = client
+        self._queue = queue.Queue(maxsize=self.maxsize)
+        self._seen = OrderedDict()  # fingerprint -> [last_sent_at, suppressed]
+        self._lock = threading.Lock()
+        self._counts = Counter()
+        self._worker = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            import posthog
+
+            self._client = posthog
+        return self._client
+
+    def report(self, distinct_id: str, properties: dict) -> bool:
+        """Queue an $exception event; returns False if deduplicated or dropped."""
+        key = fingerprint(
+            properties.get("$exception_type", ""),
+            properties.get("$exception_list", [{}])[0]
+            .get("stacktrace", {})
+            .get("frames", []),
+        )
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._seen.get(key)
+            if entry is not None and now - entry[0] < self.dedupe_seconds:
+                entry[1] += 1
+                self._counts["deduplicated"] += 1
+                return False
+
+            suppressed = entry[1] if entry is not None else 0
+            self._seen[key] = [now, 0]
+            self._seen.move_to_end(key)
+            while len(self._seen) > MAX_TRACKED_FINGERPRINTS:
+                self._seen.popitem(last=False)
+
+        properties = {
+            **properties,
+            "$exception_fingerprint": key,
+            "suppressed_occurrences": suppressed,
+        }
+        return self.capture(distinct_id, "$exception", properties)
+
+    def capture(self, distinct_id: str, event: str, properties: dict) -> bool:
+        """Queue any PostHog event without deduplication; False if dropped."""
+        try:
+            self._queue.put_nowait((distinct_id, event, properties))
+        except queue.Full:
+            self._count("dropped")
+            return False
+
+        self._count("enqueued")
+        self._ensure_worker()
+        return True
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Stop the worker after it has sent everything queued so far."""
+        worker = self._worker
+        if worker is None or not worker.is_alive():
+            return
+        timeout = (
+            timeout
+            if timeout is not None
+            else getattr(settings, "ERROR_REPORT_SHUTDOWN_TIMEOUT", 5)
+        )
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return
+        worker.join(timeout)
+
+    def get_metrics(self) -> dict:
+        with self._lock:
+            counts = dict(self._counts)
+        return {**counts, "queue_depth": self._queue.qsize(), "queue_size": self.maxsize}
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name="posthog-error-reporter", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = any(item is _STOP for item in batch)
+            self._send([item for item in batch if item is not _STOP])
+            if stop:
+                return
+
+    def _send(self, events: list) -> None:
+        if not events:
+            return
+        for distinct_id, event, properties in events:
+            try:
+                self.client.capture(distinct_id, event, properties)
+                self._count("sent")
+            except Exception as e:
+                self._count("failed")
+                logger.error(f"Failed to send {event} to PostHog: {e}")
+        try:
+            self.client.flush()
+        except Exception as e:
+            logger.error(f"Failed to flush PostHog events: {e}")
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counts[counter] += 1
+
+
+_reporter = None
+_reporter_lock = threading.Lock()
+
+
+def get_error_reporter() -> ErrorReporter:
+    global _reporter
+    if _reporter is None:
+        with _reporter_lock:
+            if _reporter is None:
+                _reporter = ErrorReporter()
+                atexit.register(_reporter.flush)
+    return _reporter
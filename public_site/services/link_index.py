@@ -0,0 +1,414 @@
+"""
+Publish-Time Link Integrity Index
+
+When a page is published, every link in its RichTextFields and StreamField
+blocks is stored as a PageLink row:
+
+- page and document links and image embeds, by ID
+- hrefs to this site's own paths (``/about/`` or ``https://ethicic.com/about/``)
+- external URLs (including media embeds and URL blocks)
+
+Internal targets are validated against the page tree in bulk - one query
+per kind of target, however many links a page has - so links to missing,
+unpublished or moved pages are flagged at publish time without crawling.
+Unpublishing, deleting or moving a page re-flags the links pointing at it.
+
+``python manage.py check_page_links`` rebuilds the index and lists broken
+links; ``--external`` prints the deduplicated external URLs for
+``enhanced_link_checker.py --urls``.
+"""
+
+import logging
+from typing import NamedTuple
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.db import transaction
+from django.urls import Resolver404, resolve
+from wagtail import blocks
+from wagtail.documents.blocks import DocumentChooserBlock
+from wagtail.fields import RichTextField, StreamField
+from wagtail.images.blocks import ImageChooserBlock
+from wagtail.rich_text.rewriters import FIND_A_TAG, FIND_EMBED_TAG, extract_attrs
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 500
+SKIP_PREFIXES = ("#", "mailto:", "tel:", "sms:", "javascript:", "data:")
+
+
+class Link(NamedTuple):
+    field: str
+    link_type: str
+    target_object_id: int | None = None
+    url: str = ""
+
+
+def site_hosts() -> dict:
+    """Root page url_path for every hostname this site is served on.
+
+    The ``None`` key holds the default site's root, used for
+    site-relative links; WAGTAILADMIN_BASE_URL's host maps to it too.
+    """
+    from wagtail.models import Site
+
+    hosts = {}
+    for site in Site.objects.select_related("root_page"):
+        hosts[site.hostname] = site.root_page.url_path
+        if site.is_default_site:
+            hosts[None] = site.root_page.url_path
+    base_host = urlsplit(getattr(settings, "WAGTAILADMIN_BASE_URL", "")).hostname
+    if base_host and None in hosts:
+        hosts.setdefault(base_host, hosts[None])
+    return hosts
+
+
+def classify_href(href: str, field: str, hosts: dict) -> Link | None:
+    """An internal or external Link for an href, or None if it isn't checkable."""
+    href = (href or "").strip()
+    if not href or href.lower().startswith(SKIP_PREFIXES):
+        return None
+    parts = urlsplit(href)
+    if parts.scheme in ("http", "https"):
+        link_type = "internal" if parts.hostname in hosts else "external"
+        return Link(field, link_type, url=href)
+    if href.startswith("//"):
+        return Link(field, "external", url=f"https:{href}")
+    if href.startswith("/"):
+        return Link(field, "internal", url=href)
+    # Other schemes, and relative paths that depend on the page's own URL
+    return None
+
+
+def _id(value) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def extract_html(html: str, field: str, hosts: dict):
+    """Links in rich text, as stored in the database."""
+    for match in FIND_A_TAG.finditer(html or ""):
+        attrs = extract_attrs(match.group(1))
+        link_type = attrs.get("linktype")
+        if link_type in ("page", "document"):
+            yield Link(field, link_type, _id(attrs.get("id")))
+        elif "href" in attrs:
+            link = classify_href(attrs["href"], field, hosts)
+            if link:
+                yield link
+    for match in FIND_EMBED_TAG.finditer(html or ""):
+        attrs = extract_attrs(match.group(1))
+        if attrs.get("embedtype") == "image":
+            yield Link(field, "image", _id(attrs.get("id")))
+        elif attrs.get("embedtype") == "media" and attrs.get("url"):
+            yield Link(field, "external", url=attrs["url"])
+
+
+def extract_block(block, raw, path: str, hosts: dict):
+    """Links in the raw (JSON) value of a StreamField block."""
+    if raw in (None, "", [], {}):
+        return
+    if isinstance(block, blocks.StreamBlock):
+        for child in raw:
+            child_block = block.child_blocks.get(child.get("type"))
+            if child_block is not None:
+                yield from extract_block(
+                    child_block, child.get("value"), f"{path}.{child['type']}", hosts
+                )
+    elif isinstance(block, blocks.ListBlock):
+        for item in raw:
+            # ListBlock items are stored as {"type": "item", "value": ...} since Wagtail 2.16
+            if isinstance(item, dict) and item.get("type") == "item" and "value" in item:
+                item = item["value"]
+            yield from extract_block(block.child_block, item, path, hosts)
+    elif isinstance(block, blocks.StructBlock):
+        for name, child_block in block.child_blocks.items():
+            yield from extract_block(child_block, raw.get(name), f"{path}.{name}", hosts)
+    elif isinstance(block, blocks.PageChooserBlock):
+        yield Link(path, "page", _id(raw))
+    elif isinstance(block, DocumentChooserBlock):
+        yield Link(path, "document", _id(raw))
+    elif isinstance(block, ImageChooserBlock):
+        yield Link(path, "image", _id(raw))
+    elif isinstance(block, (blocks.RichTextBlock, blocks.RawHTMLBlock)):
+        yield from extract_html(raw, path, hosts)
+    elif isinstance(block, blocks.URLBlock):
+        link = classify_href(raw, path, hosts)
+        if link:
+            yield link
+
+
+def extract_links(page, hosts: dict) -> list[Link]:
+    """Every distinct link in a (specific) page's rich text and StreamFields."""
+    links = []
+    for field in page._meta.get_fields():
+        if isinstance(field, RichTextField):
+            links.extend(extract_html(field.value_from_object(page), field.name, hosts))
+        elif isinstance(field, StreamField):
+            value = field.value_from_object(page)
+            raw = field.stream_block.get_prep_value(value) if value else []
+            links.extend(extract_block(field.stream_block, raw, field.name, hosts))
+    return list(dict.fromkeys(links))
+
+
+def _is_page_path(path: str) -> bool:
+    """Whether a path is served by Wagtail's page tree rather than a view or files."""
+    if path.startswith((settings.STATIC_URL, settings.MEDIA_URL)):
+        return False
+    try:
+        return resolve(path).url_name == "wagtail_serve"
+    except Resolver404:
+        return True
+
+
+def _resolve_internal(links: list[Link], hosts: dict) -> dict[str, tuple]:
+    """Map internal URLs to (page id or None, is_broken) with one page query."""
+    from wagtail.contrib.routable_page.models import RoutablePageMixin
+    from wagtail.models import Page
+
+    candidates = {}
+    resolved = {}
+    for link in links:
+        parts = urlsplit(link.url)
+        path = parts.path if parts.path.endswith("/") else f"{parts.path}/"
+        root = hosts.get(parts.hostname if parts.hostname else None)
+        if root is None or not _is_page_path(path):
+            # Another host's URL we can't place, or a view, static or media file
+            resolved[link.url] = (None, False)
+            continue
+        url_path = f"{root.rstrip('/')}{path}"
+        segments = url_path.strip("/").split("/")
+        candidates[link.url] = [
+            "/" + "/".join(segments[:i]) + "/" for i in range(len(segments), 0, -1)
+        ]
+
+    wanted = {url_path for paths in candidates.values() for url_path in paths}
+    live = {
+        page.url_path: page
+        for page in Page.objects.live().filter(url_path__in=wanted).only(
+            "id", "url_path", "content_type"
+        )
+    }
+    for url, paths in candidates.items():
+        if paths[0] in live:
+            resolved[url] = (live[paths[0]].id, False)
+            continue
+        # Routable pages serve sub-paths we can't enumerate; trust the nearest one
+        parent = next((live[p] for p in paths[1:] if p in live), None)
+        if parent is not None and issubclass(parent.specific_class, RoutablePageMixin):
+            resolved[url] = (parent.id, False)
+        else:
+            resolved[url] = (None, True)
+    return resolved
+
+
+def validate(links: list[Link], hosts: dict) -> list[tuple[int | None, bool]]:
+    """(target_object_id, is_broken) for each link, using one query per target kind."""
+    from wagtail.documents import get_document_model
+    from wagtail.images import get_image_model
+    from wagtail.models import Page
+
+    def existing(queryset, link_type):
+        ids = {link.target_object_id for link in links if link.link_type == link_type}
+        ids.discard(None)
+        return set(queryset.filter(id__in=ids).values_list("id", flat=True)) if ids else set()
+
+    found = {
+        "page": existing(Page.objects.live(), "page"),
+        "document": existing(get_document_model().objects.all(), "document"),
+        "image": existing(get_image_model().objects.all(), "image"),
+    }
+    internal = _resolve_internal(
+        [link for link in links if link.link_type == "internal"], hosts
+    )
+
+    results = []
+    for link in links:
+        if link.link_type in found:
+            results.append(
+                (link.target_object_id, link.target_object_id not in found[link.link_type])
+            )
+        elif link.link_type == "internal":
+            results.append(internal[link.url])
+        else:
+            results.append((None, False))
+    return results
+
+
+def _build_rows(found: list[tuple[int, Link]], hosts: dict) -> list:
+    from public_site.models import PageLink
+
+    checked = validate([link for _source, link in found], hosts)
+    return [
+        PageLink(
+            source_id=source_id,
+            field=link.field[:255],
+            link_type=link.link_type,
+            target_object_id=target_object_id,
+            url=link.url[:2048],
+            is_broken=is_broken,
+        )
+        for (source_id, link), (target_object_id, is_broken) in zip(found, checked)
+    ]
+
+
+def index_pages(pages, hosts: dict | None = None) -> list:
+    """Replace the stored links of ``pages`` (specific instances)."""
+    from public_site.models import PageLink
+
+    hosts = site_hosts() if hosts is None else hosts
+    pages = list(pages)
+    found = [(page.pk, link) for page in pages for link in extract_links(page, hosts)]
+    rows = _build_rows(found, hosts)
+    with transaction.atomic():
+        PageLink.objects.filter(source_id__in=[page.pk for page in pages]).delete()
+        PageLink.objects.bulk_create(rows, batch_size=BATCH_SIZE)
+    return rows
+
+
+def index_page(page) -> list:
+    """Index one page's links and log any broken ones."""
+    rows = index_pages([page])
+    broken = [row for row in rows if row.is_broken]
+    if broken:
+        targets = ", ".join(describe(row) for row in broken[:10])
+        logger.warning(
+            f"Page {page.pk} ({page.title}) has {len(broken)} broken links: {targets}"
+        )
+    return rows
+
+
+def rebuild_index(chunk_size: int = BATCH_SIZE) -> dict:
+    """Re-extract and validate the links of every live page."""
+    from wagtail.models import Page
+
+    from public_site.models import PageLink
+
+    hosts = site_hosts()
+    total = broken = 0
+    with transaction.atomic():
+        PageLink.objects.all().delete()
+        chunk = []
+        for page in Page.objects.live().specific().iterator(chunk_size=chunk_size):
+            chunk.append(page)
+            if len(chunk) >= chunk_size:
+                rows = index_pages(chunk, hosts)
+                total, broken = total + len(rows), broken + sum(r.is_broken for r in rows)
+                chunk = []
+        if chunk:
+            rows = index_pages(chunk, hosts)
+            total, broken = total + len(rows), broken + sum(r.is_broken for r in rows)
+
+    logger.info(f"Rebuilt link index: {total} links, {broken} broken")
+    return {"links": total, "broken": broken}
+
+
+def revalidate(queryset) -> int:
+    """Re-check stored links against the current tree; returns how many changed."""
+    from public_site.models import PageLink
+
+    rows = list(queryset)
+    links = [Link(row.field, row.link_type, row.target_object_id, row.url) for row in rows]
+    changed = []
+    for row, (target_object_id, is_broken) in zip(rows, validate(links, site_hosts())):
+        if (row.target_object_id, row.is_broken) != (target_object_id, is_broken):
+            row.target_object_id, row.is_broken = target_object_id, is_broken
+            changed.append(row)
+    PageLink.objects.bulk_update(
+        changed, ["target_object_id", "is_broken"], batch_size=BATCH_SIZE
+    )
+    return len(changed)
+
+
+def flag_links_to(page_id: int) -> int:
+    """Mark links that land on a page as broken once it is gone or unpublished."""
+    from public_site.models import PageLink
+
+    return PageLink.objects.filter(
+        link_type__in=["page", "internal"], target_object_id=page_id
+    ).update(is_broken=True)
+
+
+def describe(link) -> str:
+    return link.url or f"{link.link_type} #{link.target_object_id}"
+
+
+def external_urls() -> list[str]:
+    """The distinct external URLs linked from live pages."""
+    from public_site.models import PageLink
+
+    return list(
+        PageLink.objects.filter(link_type="external")
+        .order_by("url")
+        .values_list("url", flat=True)
+        .distinct()
+    )
+
+
+def _publish(page_id: int) -> None:
+    from django.db.models import Q
+    from wagtail.models import Page
+
+    from public_site.models import PageLink
+
+    page = Page.objects.get(pk=page_id).specific
+    index_page(page)
+    # Links to this page, and to paths it may now serve, are fixed
+    revalidate(
+        PageLink.objects.filter(
+            Q(link_type__in=["page", "internal"], target_object_id=page_id)
+            | Q(link_type="internal", is_broken=True)
+        )
+    )
+
+
+def _unpublish(page_id: int) -> None:
+    from public_site.models import PageLink
+
+    PageLink.objects.filter(source_id=page_id).delete()
+    flag_links_to(page_id)
+
+
+def _revalidate_internal() -> None:
+    from public_site.models import PageLink
+
+    revalidate(PageLink.objects.filter(link_type="internal"))
+
+
+def handle_publish(sender, instance, **kwargs):
+    """page_published receiver."""
+    page_id = instance.pk
+    transaction.on_commit(lambda: _run_safely(_publish, page_id))
+
+
+def handle_unpublish(sender, instance, **kwargs):
+    """page_unpublished and post_delete (Page) receiver."""
+    page_id = instance.pk
+    transaction.on_commit(lambda: _run_safely(_unpublish, page_id))
+
+
+def handle_move(sender, instance, **kwargs):
+    """post_page_move receiver: URL paths under the moved page changed."""
+    transaction.on_commit(lambda: _run_safely(_revalidate_internal))
+
+
+def handle_bulk_publish(page_ids) -> None:
+    """Index pages created without publishing (bulk imports) once, on commit."""
+    page_ids = list(page_ids)
+
+    def run():
+        from wagtail.models import Page
+
+        index_pages(Page.objects.filter(pk__in=page_ids).live().specific())
+        _revalidate_internal()
+
+    transaction.on_commit(lambda: _run_safely(run))
+
+
+def _run_safely(func, *args) -> None:
+    try:
+        func(*args)
+    except Exception:
+        logger.exception(f"Failed to update the link index ({func.__name__})")
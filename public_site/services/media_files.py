@@ -0,0 +1,216 @@
+"""
+Media File Serving
+
+Used by ``serve_media_file`` for files under MEDIA_ROOT when media is not
+on object storage.
+
+- Each response carries an ETag (mtime + size) and Last-Modified, so
+  revalidations with If-None-Match / If-Modified-Since get a 304 without
+  opening the file.
+- A single ``Range: bytes=...`` request gets a 206 with just that slice
+  (If-Range is honoured); unsatisfiable ranges get a 416.
+- With MEDIA_SENDFILE_BACKEND set, the body is left to the front proxy
+  (nginx ``X-Accel-Redirect`` or Apache/lighttpd ``X-Sendfile``), which
+  also handles ranges, so large downloads never occupy a worker.
+- os.stat results are cached in-process for MEDIA_STAT_CACHE_SECONDS.
+"""
+
+import mimetypes
+import os
+import re
+import stat as stat_module
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe
+
+MAX_STAT_ENTRIES = 2048
+CHUNK_SIZE = 64 * 1024
+CACHE_CONTROL = "public, max-age=31536000"  # 1 year cache
+
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class MediaStat(NamedTuple):
+    path: str
+    size: int
+    mtime: float
+    etag: str
+    content_type: str
+
+
+_stat_cache = OrderedDict()  # path -> (expires_at, MediaStat)
+_stat_lock = threading.Lock()
+
+
+def resolve_path(filepath: str) -> str:
+    """Absolute path of ``filepath`` inside MEDIA_ROOT, or Http404."""
+    if ".." in filepath or filepath.startswith("/"):
+        raise Http404("Invalid file path")
+
+    media_root = os.path.realpath(getattr(settings, "MEDIA_ROOT", "/var/lib/data"))
+    full_path = os.path.realpath(os.path.join(media_root, filepath))
+    if os.path.commonpath([media_root, full_path]) != media_root:
+        raise Http404("Invalid file path")
+    return full_path
+
+
+def stat_file(full_path: str) -> MediaStat | None:
+    """Cached stat of a regular file; None if it does not exist.
+
+    Misses are not cached, so a newly uploaded file is served immediately.
+    """
+    ttl = getattr(settings, "MEDIA_STAT_CACHE_SECONDS", 60)
+    now = time.monotonic()
+
+    with _stat_lock:
+        cached = _stat_cache.get(full_path)
+        if cached is not None and cached[0] > now:
+            _stat_cache.move_to_end(full_path)
+            return cached[1]
+
+    try:
+        st = os.stat(full_path)
+    except OSError:
+        return None
+    if not stat_module.S_ISREG(st.st_mode):
+        return None
+
+    content_type, _ = mimetypes.guess_type(full_path)
+    result = MediaStat(
+        path=full_path,
+        size=st.st_size,
+        mtime=st.st_mtime,
+        etag=f'"{st.st_mtime_ns:x}-{st.st_size:x}"',
+        content_type=content_type or "application/octet-stream",
+    )
+
+    if ttl > 0:
+        with _stat_lock:
+            _stat_cache[full_path] = (now + ttl, result)
+            _stat_cache.move_to_end(full_path)
+            while len(_stat_cache) > MAX_STAT_ENTRIES:
+                _stat_cache.popitem(last=False)
+    return result
+
+
+def clear_stat_cache() -> None:
+    with _stat_lock:
+        _stat_cache.clear()
+
+
+def parse_range(header: str, size: int) -> tuple[int, int] | None | bool:
+    """Parse a single byte range into inclusive (start, end).
+
+    Returns None when the header should be ignored (absent, malformed or
+    multi-range; the full file is sent) and False when it is unsatisfiable.
+    """
+    match = RANGE_RE.match(header.strip()) if header else None
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+
+    if not first:
+        # Suffix range: the final N bytes
+        length = int(last)
+        if length == 0:
+            return False
+        return max(size - length, 0), size - 1
+
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or (last and int(last) < start):
+        return False
+    return start, end
+
+
+def _if_range_matches(request, stat: MediaStat) -> bool:
+    if_range = request.headers.get("If-Range")
+    if not if_range:
+        return True
+    if if_range.startswith(('"', "W/")):
+        return if_range == stat.etag
+    since = parse_http_date_safe(if_range)
+    return since is not None and int(stat.mtime) <= since
+
+
+def _read_range(path: str, start: int, length: int):
+    with open(path, "rb") as handle:
+        handle.seek(start)
+        while length > 0:
+            chunk = handle.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+def _sendfile_response(stat: MediaStat, filepath: str):
+    backend = getattr(settings, "MEDIA_SENDFILE_BACKEND", "")
+    if backend == "nginx":
+        prefix = getattr(settings, "MEDIA_ACCEL_REDIRECT_PREFIX", "/protected-media/")
+        response = HttpResponse(content_type=stat.content_type)
+        response["X-Accel-Redirect"] = prefix.rstrip("/") + "/" + quote(filepath)
+        return response
+    if backend in ("apache", "lighttpd"):
+        response = HttpResponse(content_type=stat.content_type)
+        response["X-Sendfile"] = stat.path
+        return response
+    return None
+
+
+def serve(request, filepath: str):
+    """Serve a MEDIA_ROOT file with validators, ranges and proxy offload."""
+    stat = stat_file(resolve_path(filepath))
+    if stat is None:
+        raise Http404(f"Media file not found: {filepath}")
+
+    response = get_conditional_response(
+        request, etag=stat.etag, last_modified=int(stat.mtime)
+    )
+    if response is None:
+        response = _sendfile_response(stat, filepath)
+    if response is None:
+        response = _file_response(request, stat)
+
+    response["ETag"] = stat.etag
+    response["Last-Modified"] = http_date(stat.mtime)
+    response["Cache-Control"] = CACHE_CONTROL
+    response["Accept-Ranges"] = "bytes"
+    return response
+
+
+def _file_response(request, stat: MediaStat):
+    byte_range = None
+    if request.method in ("GET", "HEAD") and _if_range_matches(request, stat):
+        byte_range = parse_range(request.headers.get("Range", ""), stat.size)
+
+    if byte_range is False:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{stat.size}"
+        return response
+
+    if request.method == "HEAD":
+        response = HttpResponse(content_type=stat.content_type)
+        response["Content-Length"] = str(stat.size)
+        return response
+
+    if byte_range is None:
+        return FileResponse(open(stat.path, "rb"), content_type=stat.content_type)
+
+    start, end = byte_range
+    length = end - start + 1
+    response = StreamingHttpResponse(
+        _read_range(stat.path, start, length), status=206, content_type=stat.content_type
+    )
+    response["Content-Length"] = str(length)
+    response["Content-Range"] = f"bytes {start}-{end}/{stat.size}"
+    return response
@@ -0,0 +1,387 @@
+"""
+Transactional Outbox for Platform Submissions
+
+Form views write a SupportTicket and an OutboxMessage in one transaction and
+return immediately. Delivery to the garden platform happens afterwards, either
+on a small background thread pool kicked off after commit or by the
+``deliver_outbox`` management command, with retries, backoff and deduplication.
+
+If the first attempt fails the team is emailed straight away, as the form
+views used to do inline; retries continue in the background. Each background
+delivery also sweeps other due messages, so retries progress even without the
+``worker`` process. Delivered payloads are purged after OUTBOX_RETENTION_DAYS.
+"""
+
+import logging
+import random
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import Avg, Count, Min, Q
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Retry policy: exponential backoff with jitter, capped
+BASE_BACKOFF_SECONDS = 30
+MAX_BACKOFF_SECONDS = 3600
+# How long a claimed message is hidden from other workers while being sent
+CLAIM_LEASE_SECONDS = 300
+# Minimum gap between retention purges in one process
+PURGE_INTERVAL_SECONDS = 3600
+
+_last_purge = 0.0
+
+_executor = None
+_executor_lock = threading.Lock()
+
+_stats_lock = threading.Lock()
+_stats = {
+    "enqueued": 0,
+    "deduplicated": 0,
+    "delivered": 0,
+    "retried": 0,
+    "failed": 0,
+    "skipped": 0,
+    "delivery_ms_total": 0.0,
+}
+
+
+def _record(counter: str, amount: float = 1) -> None:
+    with _stats_lock:
+        _stats[counter] += amount
+
+
+def _max_attempts() -> int:
+    return getattr(settings, "OUTBOX_MAX_ATTEMPTS", 8)
+
+
+def backoff_seconds(attempts: int) -> float:
+    """Delay before the next attempt, with full jitter."""
+    ceiling = min(MAX_BACKOFF_SECONDS, BASE_BACKOFF_SECONDS * (2 ** max(attempts - 1, 0)))
+    return random.uniform(ceiling / 2, ceiling)
+
+
+def enqueue(
+    message_type: str,
+    payload: dict[str, Any],
+    ticket=None,
+    dedupe_key: str | None = None,
+):
+    """
+    Record a message for delivery.
+
+    Must be called inside the transaction that creates the related ticket so
+    both rows commit (or roll back) together. Returns the OutboxMessage; an
+    existing message is returned unchanged if ``dedupe_key`` was already used.
+    """
+    from public_site.models import OutboxMessage
+
+    if dedupe_key is None:
+        dedupe_key = (
+            f"{message_type}:ticket:{ticket.id}" if ticket else f"{message_type}:{uuid.uuid4()}"
+        )
+
+    message, created = OutboxMessage.objects.get_or_create(
+        dedupe_key=dedupe_key,
+        defaults={
+            "message_type": message_type,
+            "payload": payload,
+            "ticket": ticket,
+            "submission_id": str(uuid.uuid4()),
+        },
+    )
+
+    if not created:
+        _record("deduplicated")
+        logger.info("Outbox message %s already queued, skipping duplicate", dedupe_key)
+        return message
+
+    _record("enqueued")
+    if getattr(settings, "OUTBOX_DISPATCH_ON_COMMIT", True):
+        transaction.on_commit(lambda: dispatch_async(message.pk))
+    return message
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, "OUTBOX_THREADS", 2),
+                thread_name_prefix="outbox",
+            )
+    return _executor
+
+
+def dispatch_async(message_id: int) -> None:
+    """Attempt delivery of one message on the background thread pool."""
+    _get_executor().submit(_deliver_in_thread, message_id)
+
+
+def _deliver_in_thread(message_id: int) -> None:
+    try:
+        deliver_pending(message_ids=[message_id])
+        # Retry anything else that is due while we're here
+        deliver_pending()
+        purge_if_due()
+    except Exception:
+        logger.exception("Background outbox delivery failed for message %s", message_id)
+    finally:
+        close_old_connections()
+
+
+def _claim(batch_size: int, message_ids: list[int] | None = None) -> list:
+    """Lock due messages and push their next attempt past the lease window."""
+    from public_site.models import OutboxMessage
+
+    now = timezone.now()
+    with transaction.atomic():
+        queryset = OutboxMessage.objects.select_for_update(skip_locked=True).filter(
+            status="pending", next_attempt_at__lte=now
+        )
+        if message_ids is not None:
+            queryset = queryset.filter(pk__in=message_ids)
+        claimed = list(queryset.order_by("next_attempt_at")[:batch_size])
+
+        lease_until = now + timedelta(seconds=CLAIM_LEASE_SECONDS)
+        for message in claimed:
+            message.attempts += 1
+            message.next_attempt_at = lease_until
+        OutboxMessage.objects.bulk_update(claimed, ["attempts", "next_attempt_at"])
+
+    return claimed
+
+
+def _send(message) -> dict[str, Any] | None:
+    """Deliver one message to the platform. Returns the API result or None."""
+    from public_site.services.platform_client import platform_client
+
+    if message.message_type == "contact":
+        return platform_client.secure_contact_submission(
+            message.payload, submission_id=message.submission_id
+        )
+    if message.message_type == "onboarding":
+        return platform_client.secure_onboarding_submission(
+            message.payload, submission_id=message.submission_id
+        )
+    if message.message_type == "newsletter":
+        delivered = platform_client.notify_contact_submission(
+            {**message.payload, "submission_id": message.submission_id}
+        )
+        return {"submission_id": message.submission_id} if delivered else None
+
+    raise ValueError(f"Unknown outbox message type: {message.message_type}")
+
+
+def _platform_configured() -> bool:
+    from public_site.services.platform_client import platform_client
+
+    return bool(platform_client.api_key)
+
+
+def _send_fallback(message) -> None:
+    """Email the team that platform delivery failed, at most once per message."""
+    from public_site.models import OutboxMessage
+
+    if message.fallback_sent_at:
+        return
+    try:
+        sent = _email_fallback(message)
+    except Exception:
+        logger.exception("Fallback email failed for outbox message %s", message.pk)
+        sent = False
+    if not sent:
+        # Try again on the next failed attempt
+        return
+    message.fallback_sent_at = timezone.now()
+    OutboxMessage.objects.filter(pk=message.pk).update(
+        fallback_sent_at=message.fallback_sent_at
+    )
+
+
+def _email_fallback(message) -> bool:
+    from public_site.standalone_email_utils import (
+        send_contact_notification,
+        send_newsletter_notification,
+    )
+
+    payload = message.payload
+    if message.message_type == "newsletter":
+        return send_newsletter_notification(
+            payload.get("email"), source="outbox_fallback"
+        )
+
+    return send_contact_notification(
+        {
+            "name": payload.get("name")
+            or f"{payload.get('first_name', '')} {payload.get('last_name', '')}".strip(),
+            "email": payload.get("email"),
+            "subject": payload.get("subject", "Onboarding Application"),
+            "message": payload.get("message") or payload.get("comprehensive_message"),
+            "source": "Platform API unavailable - outbox fallback",
+        }
+    )
+
+
+def _mark_delivered(message, result: dict[str, Any]) -> None:
+    from public_site.models import OutboxMessage, SupportTicket
+
+    now = timezone.now()
+    OutboxMessage.objects.filter(pk=message.pk).update(
+        status="delivered", delivered_at=now, last_error=""
+    )
+    reference = result.get("submission_id") or message.submission_id
+    if message.ticket_id:
+        SupportTicket.objects.filter(pk=message.ticket_id).update(
+            external_reference=reference
+        )
+
+
+def _mark_retry_or_failed(message, error: str) -> None:
+    """Schedule a retry, or give up; either way the team has been emailed."""
+    from public_site.models import OutboxMessage
+
+    if message.attempts >= _max_attempts():
+        OutboxMessage.objects.filter(pk=message.pk).update(
+            status="failed", last_error=error
+        )
+        _record("failed")
+        logger.error(
+            "Outbox message %s failed after %s attempts: %s",
+            message.pk,
+            message.attempts,
+            error,
+        )
+        _send_fallback(message)
+        return
+
+    OutboxMessage.objects.filter(pk=message.pk).update(
+        next_attempt_at=timezone.now()
+        + timedelta(seconds=backoff_seconds(message.attempts)),
+        last_error=error,
+    )
+    _record("retried")
+    _send_fallback(message)
+
+
+def deliver_pending(batch_size: int = 20, message_ids: list[int] | None = None) -> dict:
+    """
+    Deliver due outbox messages.
+
+    Returns a summary dict with delivered/retried/failed/skipped counts.
+    """
+    from public_site.models import OutboxMessage
+
+    summary = {"delivered": 0, "retried": 0, "failed": 0, "skipped": 0}
+
+    for message in _claim(batch_size, message_ids):
+        if not _platform_configured():
+            # Nothing to deliver to; the ticket is already stored locally
+            OutboxMessage.objects.filter(pk=message.pk).update(
+                status="skipped", last_error="Platform API not configured"
+            )
+            _record("skipped")
+            summary["skipped"] += 1
+            continue
+
+        started = time.perf_counter()
+        try:
+            result = _send(message)
+            error = "" if result else "Platform API unavailable"
+        except Exception as e:
+            result = None
+            error = str(e) or type(e).__name__
+        _record("delivery_ms_total", (time.perf_counter() - started) * 1000)
+
+        if result:
+            _mark_delivered(message, result)
+            _record("delivered")
+            summary["delivered"] += 1
+            logger.info(
+                "Delivered outbox message %s (%s)", message.pk, message.message_type
+            )
+            continue
+
+        _mark_retry_or_failed(message, error)
+        if message.attempts >= _max_attempts():
+            summary["failed"] += 1
+        else:
+            summary["retried"] += 1
+
+    return summary
+
+
+def purge_old_messages(now=None) -> int:
+    """
+    Delete finished messages (and the submission data in their payloads).
+
+    Delivered and skipped messages are kept OUTBOX_RETENTION_DAYS (default 7)
+    for deduplication and debugging; failed ones, already emailed to the
+    team, OUTBOX_FAILED_RETENTION_DAYS (default 30). Returns the number deleted.
+    """
+    from public_site.models import OutboxMessage
+
+    now = now or timezone.now()
+    done_before = now - timedelta(days=getattr(settings, "OUTBOX_RETENTION_DAYS", 7))
+    failed_before = now - timedelta(
+        days=getattr(settings, "OUTBOX_FAILED_RETENTION_DAYS", 30)
+    )
+    deleted, _ = OutboxMessage.objects.filter(
+        Q(status__in=["delivered", "skipped"], created_at__lt=done_before)
+        | Q(status="failed", created_at__lt=failed_before)
+    ).delete()
+    if deleted:
+        logger.info("Purged %s finished outbox messages", deleted)
+    return deleted
+
+
+def purge_if_due() -> int:
+    """Run purge_old_messages at most once per PURGE_INTERVAL_SECONDS per process."""
+    global _last_purge
+
+    with _stats_lock:
+        if _last_purge and time.monotonic() - _last_purge < PURGE_INTERVAL_SECONDS:
+            return 0
+        _last_purge = time.monotonic()
+    return purge_old_messages()
+
+
+def get_outbox_metrics() -> dict[str, Any]:
+    """Queue depth from the database plus this process's delivery counters."""
+    from public_site.models import OutboxMessage
+
+    by_status = {
+        row["status"]: row["count"]
+        for row in OutboxMessage.objects.values("status").annotate(count=Count("id"))
+    }
+    pending = OutboxMessage.objects.filter(status="pending").aggregate(
+        oldest=Min("created_at"), avg_attempts=Avg("attempts")
+    )
+
+    with _stats_lock:
+        process_stats = dict(_stats)
+    attempts = process_stats["delivered"] + process_stats["retried"] + process_stats["failed"]
+    process_stats["delivery_ms_avg"] = (
+        round(process_stats.pop("delivery_ms_total") / attempts, 2) if attempts else 0.0
+    )
+
+    return {
+        "pending": by_status.get("pending", 0),
+        "delivered": by_status.get("delivered", 0),
+        "failed": by_status.get("failed", 0),
+        "skipped": by_status.get("skipped", 0),
+        "oldest_pending_seconds": (
+            round((timezone.now() - pending["oldest"]).total_seconds(), 1)
+            if pending["oldest"]
+            else 0
+        ),
+        "avg_pending_attempts": round(pending["avg_attempts"] or 0, 2),
+        "process": process_stats,
+    }
@@ -0,0 +1,197 @@
+"""
+Shared Response Cache for Platform API Read Endpoints
+
+Stores read-only platform responses in the Django cache so the sync and
+async platform clients (and every worker) share the same entries.
+
+Policy per lookup:
+- fresh entry: served without calling the platform
+- recent failure (negative entry): the platform is not re-probed until it
+  expires; the last good response is served if one is still held
+- otherwise the platform is called; on failure the last good response is
+  served (stale-if-error) and a negative entry is written
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+# Seconds to keep each read-only endpoint's response fresh
+DEFAULT_TTLS = {
+    "/api/v1/portfolio/public-summary/": 900,
+    "/api/v1/research/public-insights/": 600,
+    "/api/v1/health/": 30,
+}
+
+# Endpoints where an old answer is worse than no answer
+NO_STALE_ENDPOINTS = {"/api/v1/health/"}
+
+DEFAULT_NEGATIVE_TTL = 60
+DEFAULT_STALE_IF_ERROR = 6 * 3600
+
+# Sentinel for "not served from cache" (None is a valid cached answer)
+MISSING = object()
+
+
+class PlatformResponseCache:
+    """Cache for read-only platform responses, keyed by endpoint + params."""
+
+    key_prefix = "platform_api"
+
+    def __init__(
+        self,
+        alias: str = "default",
+        ttls: dict[str, int] | None = None,
+        negative_ttl: int = DEFAULT_NEGATIVE_TTL,
+        stale_if_error: int = DEFAULT_STALE_IF_ERROR,
+    ):
+        self.alias = alias
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.negative_ttl = negative_ttl
+        self.stale_if_error = stale_if_error
+        self._stats = defaultdict(
+            lambda: {"hits": 0, "misses": 0, "stale": 0, "negative_hits": 0}
+        )
+        self._stats_lock = threading.Lock()
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def is_cacheable(self, endpoint: str) -> bool:
+        return self._normalize(endpoint) in self.ttls
+
+    def ttl_for(self, endpoint: str) -> int:
+        return self.ttls.get(self._normalize(endpoint), 0)
+
+    def make_key(self, endpoint: str, params: dict[str, Any] | None = None) -> str:
+        """Stable key: params are sorted and empty values dropped."""
+        canonical = {
+            str(key): value
+            for key, value in sorted((params or {}).items())
+            if value not in (None, "")
+        }
+        query = json.dumps(canonical, sort_keys=True, default=str)
+        digest = hashlib.sha1(
+            f"{self._normalize(endpoint)}?{query}".encode()
+        ).hexdigest()
+        return f"{self.key_prefix}:{digest}"
+
+    def fetch(self, endpoint: str, params: dict[str, Any] | None, loader) -> Any:
+        """Return a cached response or call ``loader()`` following the policy."""
+        key = self.make_key(endpoint, params)
+        entries = self._safe_get_many([key, f"{key}:neg"])
+        cached = self._from_cache(endpoint, entries.get(key), f"{key}:neg" in entries)
+        if cached is not MISSING:
+            return cached
+
+        result = loader()
+        values, timeout = self._entries_for_result(endpoint, key, result)
+        try:
+            self.cache.set_many(values, timeout)
+        except Exception as e:
+            logger.debug(f"Platform cache write failed for {endpoint}: {e}")
+        return self._result_or_stale(endpoint, entries.get(key), result)
+
+    async def afetch(
+        self, endpoint: str, params: dict[str, Any] | None, loader
+    ) -> Any:
+        """Async variant of fetch(); ``loader`` returns an awaitable."""
+        key = self.make_key(endpoint, params)
+        try:
+            entries = await self.cache.aget_many([key, f"{key}:neg"])
+        except Exception as e:
+            logger.debug(f"Platform cache read failed for {endpoint}: {e}")
+            entries = {}
+        cached = self._from_cache(endpoint, entries.get(key), f"{key}:neg" in entries)
+        if cached is not MISSING:
+            return cached
+
+        result = await loader()
+        values, timeout = self._entries_for_result(endpoint, key, result)
+        try:
+            await self.cache.aset_many(values, timeout)
+        except Exception as e:
+            logger.debug(f"Platform cache write failed for {endpoint}: {e}")
+        return self._result_or_stale(endpoint, entries.get(key), result)
+
+    def get_stats(self) -> dict[str, dict[str, int]]:
+        """Hit/miss counters per endpoint for this process."""
+        with self._stats_lock:
+            return {endpoint: dict(counts) for endpoint, counts in self._stats.items()}
+
+    def _from_cache(self, endpoint: str, entry: dict | None, negative: bool) -> Any:
+        """Serve a fresh entry, or the stale one while a failure is recorded."""
+        label = self._normalize(endpoint)
+
+        if entry is not None and entry["fresh_until"] > time.time():
+            self._count(label, "hits")
+            return entry["value"]
+
+        if negative:
+            self._count(label, "negative_hits")
+            if entry is not None and label not in NO_STALE_ENDPOINTS:
+                self._count(label, "stale")
+                return entry["value"]
+            return None
+
+        self._count(label, "misses")
+        return MISSING
+
+    def _entries_for_result(self, endpoint: str, key: str, result: Any):
+        """Cache values and timeout for a loader result."""
+        if result is None:
+            return {f"{key}:neg": True}, self.negative_ttl
+
+        ttl = self.ttl_for(endpoint)
+        keep_for = ttl
+        if self._normalize(endpoint) not in NO_STALE_ENDPOINTS:
+            keep_for += self.stale_if_error
+        return {key: {"value": result, "fresh_until": time.time() + ttl}}, keep_for
+
+    def _result_or_stale(self, endpoint: str, entry: dict | None, result: Any) -> Any:
+        """Fall back to the last good response when the platform call failed."""
+        label = self._normalize(endpoint)
+        if result is None and entry is not None and label not in NO_STALE_ENDPOINTS:
+            self._count(label, "stale")
+            logger.info(f"Serving stale platform response for {endpoint}")
+            return entry["value"]
+        return result
+
+    def _safe_get_many(self, keys: list[str]) -> dict:
+        try:
+            return self.cache.get_many(keys)
+        except Exception as e:
+            logger.debug(f"Platform cache read failed: {e}")
+            return {}
+
+    def _count(self, label: str, counter: str) -> None:
+        with self._stats_lock:
+            self._stats[label][counter] += 1
+
+    @staticmethod
+    def _normalize(endpoint: str) -> str:
+        return "/" + endpoint.strip("/") + "/"
+
+
+def get_response_cache() -> PlatformResponseCache:
+    """Build the shared cache using PLATFORM_API_CACHE_* setting overrides."""
+    return PlatformResponseCache(
+        alias=getattr(settings, "PLATFORM_API_CACHE_ALIAS", "default"),
+        ttls=getattr(settings, "PLATFORM_API_CACHE_TTLS", None),
+        negative_ttl=getattr(
+            settings, "PLATFORM_API_NEGATIVE_CACHE_SECONDS", DEFAULT_NEGATIVE_TTL
+        ),
+        stale_if_error=getattr(
+            settings, "PLATFORM_API_STALE_IF_ERROR_SECONDS", DEFAULT_STALE_IF_ERROR
+        ),
+    )
@@ -8,15 +8,92 @@ Falls back gracefully when main platform is unavailable.
 import base64
 import json
 import logging
+import re
+import threading
+import time
 import uuid
 from typing import Any
 
 import requests
-from cryptography.fernet import Fernet
 from django.conf import settings
+from django.utils.functional import cached_property
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from public_site.services.platform_cache import get_response_cache
+from public_site.utils.metrics import LabeledHistograms
 
 logger = logging.getLogger(__name__)
 
+# Path segments that identify a single resource (UUIDs, numeric IDs)
+_ID_SEGMENT = re.compile(r"/(?:[0-9a-f]{8}-[0-9a-f-]{27}|[0-9a-f]{16,}|\d+)(?=/|$)", re.I)
+
+
+class CircuitBreaker:
+    """
+    Stop calling an unreachable platform for a cool-down period.
+
+    Opens after ``failure_threshold`` consecutive timeouts or connection
+    errors, rejects calls for ``reset_timeout`` seconds, then lets a single
+    trial request through (half-open) to decide whether to close again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = 0.0
+        self._state = self.CLOSED
+        self._lock = threading.Lock()
+        self.short_circuited = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if (
+            self._state == self.OPEN
+            and time.monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            self._state = self.HALF_OPEN
+        return self._state
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN:
+                # Only one trial request; everyone else waits for its outcome
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                return True
+            self.short_circuited += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._state = self.CLOSED
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    logger.warning(
+                        "Platform API circuit opened after %s consecutive failures",
+                        self._failures,
+                    )
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
 
 class PlatformAPIClient:
     """Client for optional integration with main garden platform."""
@@ -27,40 +104,151 @@ class PlatformAPIClient:
         )
         self.timeout = getattr(settings, "AI_API_TIMEOUT", 30)
         self.quick_timeout = getattr(settings, "AI_QUICK_ANALYSIS_TIMEOUT", 10)
+        self.connect_timeout = getattr(settings, "PLATFORM_API_CONNECT_TIMEOUT", 3.05)
+        self.pool_size = getattr(settings, "PLATFORM_API_POOL_SIZE", 10)
+        self.max_retries = getattr(settings, "PLATFORM_API_MAX_RETRIES", 2)
+
+        # Session is created lazily so forked workers never share sockets
+        self._session = None
+        self._session_lock = threading.Lock()
+
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=getattr(settings, "PLATFORM_API_CIRCUIT_THRESHOLD", 5),
+            reset_timeout=getattr(settings, "PLATFORM_API_CIRCUIT_RESET_SECONDS", 30),
+        )
+        self.latency = LabeledHistograms()
+        self.error_counts = {}
+
+        # Shared cache in front of read-only endpoints (TTL, negative, stale)
+        self.response_cache = get_response_cache()
 
         # Secure API configuration
         self.api_key = getattr(settings, "BACKEND_API_KEY", None)
         self.encryption_key = getattr(settings, "FORM_ENCRYPTION_KEY", None)
-        self._cipher = None
-
-        if self.encryption_key:
-            try:
-                # Ensure key is properly formatted for Fernet
-                if isinstance(self.encryption_key, str):
-                    key_bytes = self.encryption_key.encode()
-                    if (
-                        len(key_bytes) != 44
-                    ):  # Fernet key should be 44 bytes when base64 encoded
-                        key_bytes = base64.urlsafe_b64encode(key_bytes[:32])
-                    self._cipher = Fernet(key_bytes)
-                else:
-                    self._cipher = Fernet(self.encryption_key)
-            except Exception as e:
-                logger.warning(f"Failed to initialize encryption: {e}")
-                self._cipher = None
+
+    @cached_property
+    def cipher(self):
+        """Fernet cipher for FORM_ENCRYPTION_KEY, or None.
+
+        Built on first submission so cryptography is only imported by
+        workers that actually send encrypted payloads.
+        """
+        if not self.encryption_key:
+            return None
+        # Encryption is optional - payloads are sent unencrypted without it
+        try:
+            from cryptography.fernet import Fernet
+        except ImportError:
+            logger.warning("FORM_ENCRYPTION_KEY set but cryptography is not installed")
+            return None
+        try:
+            # Ensure key is properly formatted for Fernet
+            if isinstance(self.encryption_key, str):
+                key_bytes = self.encryption_key.encode()
+                if len(key_bytes) != 44:  # Fernet key should be 44 bytes when base64 encoded
+                    key_bytes = base64.urlsafe_b64encode(key_bytes[:32])
+                return Fernet(key_bytes)
+            return Fernet(self.encryption_key)
+        except Exception as e:
+            logger.warning(f"Failed to initialize encryption: {e}")
+            return None
 
     def _encrypt_data(self, data: dict[str, Any]) -> str | None:
         """Encrypt data payload using Fernet encryption."""
-        if not self._cipher:
+        if not self.cipher:
             return None
         try:
             json_data = json.dumps(data, default=str)
-            encrypted_data = self._cipher.encrypt(json_data.encode())
+            encrypted_data = self.cipher.encrypt(json_data.encode())
             return base64.urlsafe_b64encode(encrypted_data).decode()
         except Exception as e:
             logger.error(f"Encryption failed: {e}")
             return None
 
+    def _build_secure_payload(
+        self, form_type: str, form_data: dict[str, Any], submission_id: str | None
+    ) -> dict[str, Any]:
+        """Wrap form data with submission metadata, encrypted when possible."""
+        submission_data = {
+            "submission_id": submission_id or str(uuid.uuid4()),
+            "form_type": form_type,
+            "submitted_at": str(uuid.uuid1().time),
+            "data": form_data,
+        }
+
+        # Encrypt the payload if encryption is available
+        if self.cipher:
+            encrypted_payload = self._encrypt_data(submission_data)
+            if encrypted_payload:
+                return {"encrypted_data": encrypted_payload}
+            logger.warning("Encryption failed, falling back to unencrypted submission")
+        else:
+            logger.info("No encryption key configured, sending unencrypted data")
+
+        return submission_data
+
+    @property
+    def session(self) -> requests.Session:
+        """Keep-alive session with a sized connection pool and GET retries."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._build_session()
+        return self._session
+
+    def _build_session(self) -> requests.Session:
+        # Only idempotent calls are retried; POSTs are retried by the outbox.
+        # Read timeouts aren't: a hung upstream would cost max_retries + 1
+        # timeouts before the circuit breaker saw one failure.
+        retry = Retry(
+            total=self.max_retries,
+            connect=self.max_retries,
+            read=0,
+            status=self.max_retries,
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            status_forcelist=(502, 503, 504),
+            backoff_factor=0.2,
+            backoff_jitter=0.2,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=self.pool_size,
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({"Content-Type": "application/json"})
+        return session
+
+    def _endpoint_label(self, endpoint: str) -> str:
+        """Collapse per-resource paths so histograms stay per endpoint."""
+        return _ID_SEGMENT.sub("/{id}", "/" + endpoint.strip("/")) + "/"
+
+    def _record_error(self, label: str) -> None:
+        self.error_counts[label] = self.error_counts.get(label, 0) + 1
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Latency histograms, errors, circuit state and cache hit/miss counts."""
+        return {
+            "circuit_state": self.circuit_breaker.state,
+            "short_circuited": self.circuit_breaker.short_circuited,
+            "endpoints": self.latency.snapshot(),
+            "errors": dict(self.error_counts),
+            "cache": self.response_cache.get_stats(),
+        }
+
+    def _cached_get(
+        self, endpoint: str, params: dict[str, Any] | None, timeout: int
+    ) -> dict[str, Any] | None:
+        """GET a read-only endpoint through the shared response cache."""
+        return self.response_cache.fetch(
+            endpoint,
+            params,
+            lambda: self._make_request(endpoint, params, timeout, "GET"),
+        )
+
     def _make_request(
         self,
         endpoint: str,
@@ -70,43 +258,64 @@ class PlatformAPIClient:
         use_secure_api: bool = False,
     ) -> dict[str, Any] | None:
         """Make API request with graceful error handling."""
+        label = self._endpoint_label(endpoint)
+
+        if not self.circuit_breaker.allow_request():
+            logger.debug(f"Platform API circuit open, skipping {endpoint}")
+            return None
+
+        started = time.perf_counter()
         try:
             url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
             timeout = timeout or self.timeout
-            headers = {"Content-Type": "application/json"}
+            headers = {}
 
             # Add API key authentication for secure endpoints
             if use_secure_api and self.api_key:
                 headers["X-API-Key"] = self.api_key
 
             if method.upper() == "POST":
-                response = requests.post(
+                response = self.session.post(
                     url,
                     json=data,
                     headers=headers,
-                    timeout=timeout,
+                    timeout=(self.connect_timeout, timeout),
                 )
             else:
-                response = requests.get(
-                    url, params=data, headers=headers, timeout=timeout
+                response = self.session.get(
+                    url,
+                    params=data,
+                    headers=headers,
+                    timeout=(self.connect_timeout, timeout),
                 )
 
+            # Any HTTP answer means the platform is reachable
+            self.circuit_breaker.record_success()
+
             if response.status_code == 200:
                 return response.json()
+            self._record_error(label)
             logger.warning(
                 f"Platform API returned {response.status_code} for {endpoint}"
             )
             return None
 
         except requests.exceptions.Timeout:
+            self.circuit_breaker.record_failure()
+            self._record_error(label)
             logger.warning(f"Platform API timeout for {endpoint}")
             return None
         except requests.exceptions.ConnectionError:
+            self.circuit_breaker.record_failure()
+            self._record_error(label)
             logger.debug(f"Platform API unavailable for {endpoint}")
             return None
         except Exception:
-            logger.exception("Platform API error for {endpoint}")
+            self._record_error(label)
+            logger.exception(f"Platform API error for {endpoint}")
             return None
+        finally:
+            self.latency.observe(label, (time.perf_counter() - started) * 1000)
 
     def analyze_content(
         self, content: str, analysis_type: str = "comprehensive"
@@ -199,8 +408,8 @@ class PlatformAPIClient:
             Portfolio summary if available, None otherwise
         """
         params = {"strategy": strategy} if strategy else {}
-        result = self._make_request(
-            "/api/v1/portfolio/public-summary/", params, self.quick_timeout, "GET"
+        result = self._cached_get(
+            "/api/v1/portfolio/public-summary/", params, self.quick_timeout
         )
 
         if result:
@@ -224,8 +433,8 @@ class PlatformAPIClient:
             Research insights if available, None otherwise
         """
         params = {"topic": topic, "limit": limit}
-        result = self._make_request(
-            "/api/v1/research/public-insights/", params, self.quick_timeout, "GET"
+        result = self._cached_get(
+            "/api/v1/research/public-insights/", params, self.quick_timeout
         )
 
         if result:
@@ -234,13 +443,14 @@ class PlatformAPIClient:
         return result
 
     def secure_contact_submission(
-        self, form_data: dict[str, Any]
+        self, form_data: dict[str, Any], submission_id: str | None = None
     ) -> dict[str, Any] | None:
         """
         Submit contact form data using secure encrypted API.
 
         Args:
             form_data: Contact form data to submit
+            submission_id: Stable ID for retries, so the platform can deduplicate
 
         Returns:
             Submission result with confirmation details if successful
@@ -249,27 +459,7 @@ class PlatformAPIClient:
             logger.warning("No API key configured for secure contact submission")
             return None
 
-        # Add submission metadata
-        submission_data = {
-            "submission_id": str(uuid.uuid4()),
-            "form_type": "contact",
-            "submitted_at": str(uuid.uuid1().time),
-            "data": form_data,
-        }
-
-        # Encrypt the payload if encryption is available
-        if self._cipher:
-            encrypted_payload = self._encrypt_data(submission_data)
-            if encrypted_payload:
-                payload = {"encrypted_data": encrypted_payload}
-            else:
-                logger.warning(
-                    "Encryption failed, falling back to unencrypted submission"
-                )
-                payload = submission_data
-        else:
-            logger.info("No encryption key configured, sending unencrypted data")
-            payload = submission_data
+        payload = self._build_secure_payload("contact", form_data, submission_id)
 
         result = self._make_request(
             "/api/v1/secure/contact-submission/",
@@ -286,13 +476,14 @@ class PlatformAPIClient:
         return result
 
     def secure_onboarding_submission(
-        self, form_data: dict[str, Any]
+        self, form_data: dict[str, Any], submission_id: str | None = None
     ) -> dict[str, Any] | None:
         """
         Submit onboarding form data using secure encrypted API.
 
         Args:
             form_data: Onboarding form data to submit
+            submission_id: Stable ID for retries, so the platform can deduplicate
 
         Returns:
             Submission result with confirmation details if successful
@@ -301,27 +492,7 @@ class PlatformAPIClient:
             logger.warning("No API key configured for secure onboarding submission")
             return None
 
-        # Add submission metadata
-        submission_data = {
-            "submission_id": str(uuid.uuid4()),
-            "form_type": "onboarding",
-            "submitted_at": str(uuid.uuid1().time),
-            "data": form_data,
-        }
-
-        # Encrypt the payload if encryption is available
-        if self._cipher:
-            encrypted_payload = self._encrypt_data(submission_data)
-            if encrypted_payload:
-                payload = {"encrypted_data": encrypted_payload}
-            else:
-                logger.warning(
-                    "Encryption failed, falling back to unencrypted submission"
-                )
-                payload = submission_data
-        else:
-            logger.info("No encryption key configured, sending unencrypted data")
-            payload = submission_data
+        payload = self._build_secure_payload("onboarding", form_data, submission_id)
 
         result = self._make_request(
             "/api/v1/secure/onboarding-submission/",
@@ -364,7 +535,7 @@ class PlatformAPIClient:
         Returns:
             True if platform is healthy, False otherwise
         """
-        result = self._make_request("/api/v1/health/", timeout=5, method="GET")
+        result = self._cached_get("/api/v1/health/", None, 5)
         return result is not None
 
 
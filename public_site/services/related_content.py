@@ -0,0 +1,316 @@
+"""
+Related-Content Graph for FAQ Articles and Encyclopedia Entries
+
+Built by ``python manage.py build_related_content`` for every live, public
+page of each type, scoring candidates from:
+
+- editor-entered references (``related_articles`` titles / ``related_terms``
+  matched as whole words in titles), always ranked first
+- shared category and shared keywords
+- TF-IDF cosine similarity of title, summary and body text
+
+The top MAX_RELATED candidates are stored as RelatedContentLink rows, so
+page views read them with one indexed lookup instead of regex/title scans.
+
+Publishing or unpublishing a page only recomputes the rows that can change:
+the page's own, those already pointing at it, and those it now outranks or
+is named in. That is linear in the number of pages rather than the full
+quadratic rebuild; scores on untouched rows keep their old IDF weights
+until the next full build.
+"""
+
+import logging
+import math
+import re
+from collections import Counter
+
+from django.db import transaction
+from django.utils.html import strip_tags
+
+logger = logging.getLogger(__name__)
+
+MAX_RELATED = 5
+
+# Score contributions for automatic suggestions
+CATEGORY_WEIGHT = 0.15
+KEYWORD_WEIGHT = 0.1
+MIN_SUGGESTION_SCORE = 0.1
+
+STOPWORDS = frozenset(
+    """
+    about after also and are because been but can could does each for from
+    has have how into its more most not our than that the their them then
+    there these they this those through was were what when where which while
+    who why will with would you your
+    """.split()
+)
+TOKEN_RE = re.compile(r"[a-z][a-z0-9]{2,}")
+
+
+def _models():
+    from public_site.models import EncyclopediaEntry, FAQArticle
+
+    return FAQArticle, EncyclopediaEntry
+
+
+def _page_profile(page) -> dict:
+    """Text, references and grouping keys for one page."""
+    FAQArticle, _ = _models()
+
+    if isinstance(page, FAQArticle):
+        body = page.content
+        references = page.related_articles
+        keywords = page.keywords
+    else:
+        body = f"{page.detailed_content} {page.examples}"
+        references = page.related_terms
+        keywords = ""
+
+    text = " ".join([page.title, page.title, page.summary or "", strip_tags(body or "")])
+    return {
+        "tokens": [t for t in TOKEN_RE.findall(text.lower()) if t not in STOPWORDS],
+        "references": [r.strip().lower() for r in (references or "").split(",") if r.strip()],
+        "keywords": {k.strip().lower() for k in (keywords or "").split(",") if k.strip()},
+        "category": page.category,
+    }
+
+
+def _tfidf_vectors(profiles: dict) -> dict:
+    """Unit-length TF-IDF vectors keyed by page id."""
+    document_frequency = Counter()
+    for profile in profiles.values():
+        document_frequency.update(set(profile["tokens"]))
+
+    total = len(profiles)
+    vectors = {}
+    for page_id, profile in profiles.items():
+        counts = Counter(profile["tokens"])
+        vector = {
+            term: (1 + math.log(count)) * math.log((1 + total) / (1 + document_frequency[term]))
+            for term, count in counts.items()
+        }
+        norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        vectors[page_id] = {t: w / norm for t, w in vector.items()} if norm else {}
+    return vectors
+
+
+def _cosine(a: dict, b: dict) -> float:
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(weight * b.get(term, 0.0) for term, weight in a.items())
+
+
+def _manual_targets(page, profile, pages, is_faq) -> list[int]:
+    """Resolve editor-entered references to page ids, in the order given."""
+    targets = []
+    for reference in profile["references"]:
+        if is_faq:
+            matches = [p.id for p in pages if p.title.strip().lower() == reference]
+        else:
+            pattern = re.compile(r"\b" + re.escape(reference) + r"\b", re.IGNORECASE)
+            matches = [p.id for p in pages if pattern.search(p.title)]
+        targets.extend(m for m in matches if m != page.id and m not in targets)
+    return targets
+
+
+def _score(profile, vector, other_profile, other_vector) -> float:
+    """Symmetric suggestion score between two pages."""
+    score = _cosine(vector, other_vector)
+    if profile["category"] and profile["category"] == other_profile["category"]:
+        score += CATEGORY_WEIGHT
+    return score + KEYWORD_WEIGHT * len(profile["keywords"] & other_profile["keywords"])
+
+
+def _row(page, pages, profiles, vectors, is_faq) -> list[tuple[int, int, str, float]]:
+    """(source, target, relation, score) edges for one page, best first."""
+    profile = profiles[page.id]
+    manual = _manual_targets(page, profile, pages, is_faq)
+    chosen = [(target, "manual", 1.0) for target in manual[:MAX_RELATED]]
+
+    suggestions = []
+    for other in pages:
+        if other.id == page.id or other.id in manual:
+            continue
+        score = _score(profile, vectors[page.id], profiles[other.id], vectors[other.id])
+        if score >= MIN_SUGGESTION_SCORE:
+            suggestions.append((score, other.title, other.id))
+
+    suggestions.sort(key=lambda item: (-item[0], item[1]))
+    for score, _title, target in suggestions[: MAX_RELATED - len(chosen)]:
+        chosen.append((target, "suggested", round(score, 4)))
+
+    return [(page.id, target, relation, score) for target, relation, score in chosen]
+
+
+def compute_edges(pages: list, is_faq: bool) -> list[tuple[int, int, str, float]]:
+    """Return (source, target, relation, score) edges for a set of pages."""
+    profiles = {page.id: _page_profile(page) for page in pages}
+    vectors = _tfidf_vectors(profiles)
+
+    edges = []
+    for page in pages:
+        edges.extend(_row(page, pages, profiles, vectors, is_faq))
+    return edges
+
+
+def _corpus(model) -> list:
+    """Pages that may appear in the graph: live and not in a private section."""
+    return list(model.objects.live().public().order_by("pk"))
+
+
+def _links(edges) -> list:
+    from public_site.models import RelatedContentLink
+
+    links = []
+    rank_by_source = Counter()
+    for source, target, relation, score in edges:
+        links.append(
+            RelatedContentLink(
+                source_id=source,
+                target_id=target,
+                relation=relation,
+                score=score,
+                rank=rank_by_source[source],
+            )
+        )
+        rank_by_source[source] += 1
+    return links
+
+
+def rebuild_graph(model) -> int:
+    """Recompute and store related links for every live page of ``model``."""
+    from public_site.models import RelatedContentLink
+
+    FAQArticle, _ = _models()
+    links = _links(compute_edges(_corpus(model), is_faq=model is FAQArticle))
+
+    with transaction.atomic():
+        RelatedContentLink.objects.filter(
+            source__content_type__in=_content_types(model)
+        ).delete()
+        RelatedContentLink.objects.bulk_create(links)
+
+    logger.info(f"Rebuilt related content for {model.__name__}: {len(links)} links")
+    return len(links)
+
+
+def _affected_sources(page, pages, profiles, vectors, is_faq, current) -> set:
+    """Rows other than the page's own that may change when it is (re)published."""
+    affected = set()
+    title = page.title.strip().lower()
+    for other in pages:
+        if other.id == page.id:
+            continue
+        row = current.get(other.id, [])
+        if page.id in {target for target, _relation, _score in row}:
+            affected.add(other.id)
+            continue
+        references = profiles[other.id]["references"]
+        if is_faq and title in references:
+            affected.add(other.id)
+            continue
+        if not is_faq and any(
+            re.search(r"\b" + re.escape(reference) + r"\b", page.title, re.IGNORECASE)
+            for reference in references
+        ):
+            affected.add(other.id)
+            continue
+        score = _score(
+            profiles[other.id], vectors[other.id], profiles[page.id], vectors[page.id]
+        )
+        if score < MIN_SUGGESTION_SCORE:
+            continue
+        suggested = [s for _target, relation, s in row if relation == "suggested"]
+        if len(row) < MAX_RELATED or (suggested and score > min(suggested)):
+            affected.add(other.id)
+    return affected
+
+
+def update_page(model, page_id: int) -> int:
+    """
+    Recompute the rows a publish, unpublish or delete of one page can change.
+
+    Returns the number of links written.
+    """
+    from public_site.models import RelatedContentLink
+
+    FAQArticle, _ = _models()
+    is_faq = model is FAQArticle
+    pages = _corpus(model)
+    by_id = {page.id: page for page in pages}
+
+    current = {}
+    for source, target, relation, score in RelatedContentLink.objects.filter(
+        source__content_type__in=_content_types(model)
+    ).values_list("source_id", "target_id", "relation", "score"):
+        current.setdefault(source, []).append((target, relation, score))
+
+    profiles = {page.id: _page_profile(page) for page in pages}
+    vectors = _tfidf_vectors(profiles)
+
+    if page_id in by_id:
+        sources = {page_id} | _affected_sources(
+            by_id[page_id], pages, profiles, vectors, is_faq, current
+        )
+    else:
+        # Gone from the graph: drop its row and refill the rows that showed it
+        sources = {page_id} | {
+            source
+            for source, row in current.items()
+            if page_id in {target for target, _relation, _score in row}
+        }
+
+    edges = []
+    for source in sources:
+        if source in by_id:
+            edges.extend(_row(by_id[source], pages, profiles, vectors, is_faq))
+    links = _links(edges)
+
+    with transaction.atomic():
+        RelatedContentLink.objects.filter(source_id__in=sources).delete()
+        RelatedContentLink.objects.bulk_create(links)
+
+    logger.info(
+        f"Updated related content for {model.__name__} page {page_id}: "
+        f"{len(sources)} rows, {len(links)} links"
+    )
+    return len(links)
+
+
+def rebuild_all() -> dict:
+    return {model.__name__: rebuild_graph(model) for model in _models()}
+
+
+def _content_types(model):
+    from django.contrib.contenttypes.models import ContentType
+
+    return [ContentType.objects.get_for_model(model)]
+
+
+def handle_publish_change(sender, instance, **kwargs):
+    """page_published / page_unpublished receiver for related-content pages."""
+    if isinstance(instance, _models()):
+        model = type(instance)
+        page_id = instance.pk
+        transaction.on_commit(lambda: _update_safely(model, page_id))
+
+
+def _update_safely(model, page_id) -> None:
+    try:
+        update_page(model, page_id)
+    except Exception:
+        logger.exception(f"Failed to update related content for {model.__name__}")
+
+
+def handle_bulk_publish(models) -> None:
+    """Rebuild the graphs of pages created without publishing (bulk imports), on commit."""
+    for model in models:
+        if issubclass(model, _models()):
+            transaction.on_commit(lambda model=model: _rebuild_safely(model))
+
+
+def _rebuild_safely(model) -> None:
+    try:
+        rebuild_graph(model)
+    except Exception:
+        logger.exception(f"Failed to rebuild related content for {model.__name__}")
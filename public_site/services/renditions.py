@@ -0,0 +1,94 @@
+"""
+Image Rendition Pre-generation
+
+Every ``{% image %}`` tag in the public templates is declared in
+TEMPLATE_RENDITIONS. When an image is uploaded or replaced, the renditions
+those templates will ask for are generated by a small background worker
+pool after the transaction commits, so page renders find them already in
+the database/cache instead of encoding images (and running focal-point
+feature detection, which happens on save) inside the request.
+
+Add specs with the IMAGE_RENDITION_SPECS setting (e.g. format-webp
+variants), and backfill existing images with
+``python manage.py pregenerate_renditions``.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+logger = logging.getLogger(__name__)
+
+# Keep in step with the {% image %} tags in these templates
+TEMPLATE_RENDITIONS = {
+    "public_site/partials/blog_articles.html": ["width-200"],
+    "public_site/blog_index_page.html": ["width-500", "width-400"],
+    "public_site/blog_post.html": ["width-1200"],
+    "public_site/blocks/image_block.html": ["width-400", "width-600", "width-800", "original"],
+}
+
+_executor = None
+_executor_lock = threading.Lock()
+_pending = set()
+
+
+def get_rendition_specs() -> list[str]:
+    """Unique filter specs for every declared template, in declaration order."""
+    specs = [spec for template_specs in TEMPLATE_RENDITIONS.values() for spec in template_specs]
+    specs.extend(getattr(settings, "IMAGE_RENDITION_SPECS", []))
+    return list(dict.fromkeys(specs))
+
+
+def pregenerate(image) -> int:
+    """Create any missing declared renditions for ``image``; returns how many specs."""
+    specs = get_rendition_specs()
+    image.get_renditions(*specs)
+    return len(specs)
+
+
+def pregenerate_by_id(image_id: int) -> None:
+    from wagtail.images import get_image_model
+
+    with _executor_lock:
+        _pending.discard(image_id)
+    try:
+        image = get_image_model().objects.filter(pk=image_id).first()
+        if image is not None:
+            count = pregenerate(image)
+            logger.info(f"Pre-generated {count} renditions for image {image_id}")
+    except Exception:
+        logger.exception(f"Failed to pre-generate renditions for image {image_id}")
+    finally:
+        close_old_connections()
+
+
+def schedule(image_id: int) -> None:
+    """Queue pre-generation for ``image_id`` once the current transaction commits."""
+    transaction.on_commit(lambda: _submit(image_id))
+
+
+def _submit(image_id: int) -> None:
+    global _executor
+    with _executor_lock:
+        if image_id in _pending:
+            return
+        _pending.add(image_id)
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, "IMAGE_RENDITION_WORKERS", 2),
+                thread_name_prefix="rendition-pregen",
+            )
+    _executor.submit(pregenerate_by_id, image_id)
+
+
+def handle_image_saved(sender, instance, created=False, raw=False, update_fields=None, **kwargs):
+    """post_save receiver for the image model."""
+    if raw or not getattr(settings, "IMAGE_RENDITION_PREGENERATE", True):
+        return
+    # Title/tag edits don't change renditions; new files and focal points do
+    if update_fields and not {"file", "focal_point_x", "focal_point_y"} & set(update_fields):
+        return
+    schedule(instance.pk)
@@ -0,0 +1,151 @@
+"""
+SiteConfiguration Snapshot Cache
+
+``SiteConfiguration`` and its ``NavigationMenuItem`` children are read on
+most renders. Each worker keeps a snapshot per site, loaded with a single
+LEFT JOIN query, and checks it against a version key in the shared cache
+(Redis in production) once per request. Saving or deleting the settings or
+a menu item replaces the version after the transaction commits, so every
+worker reloads on its next request without polling the database.
+
+Snapshots hold raw column values; each request gets fresh model instances
+built from them, so nothing mutable is shared between threads.
+
+While Redis is down the default cache is per process, so a version bump
+would not reach other workers: snapshots are bypassed (one query per
+request) until it is back, and bumps made meanwhile are replayed then.
+"""
+
+import logging
+import threading
+import uuid
+
+from django.core.cache import cache
+from django.db import transaction
+
+from ethicic.cache_backends import DeferredInvalidation, shared_cache_available
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "site_settings:version"
+ITEM_PREFIX = "nav_items__"
+
+_snapshots = {}  # site_id -> (version, config values, [item values])
+_lock = threading.Lock()
+_stats = {"hits": 0, "loads": 0, "invalidations": 0}
+
+
+def _models():
+    from public_site.models import NavigationMenuItem, SiteConfiguration
+
+    return SiteConfiguration, NavigationMenuItem
+
+
+def _config_fields():
+    SiteConfiguration, _ = _models()
+    return [field.attname for field in SiteConfiguration._meta.concrete_fields]
+
+
+def _item_fields():
+    _, NavigationMenuItem = _models()
+    return [field.attname for field in NavigationMenuItem._meta.concrete_fields]
+
+
+def _bump_version():
+    try:
+        cache.set(VERSION_KEY, uuid.uuid4().hex, None)
+    except Exception as e:
+        logger.error(f"Failed to bump site settings version: {e}")
+
+
+_bump = DeferredInvalidation(cache, _bump_version)
+
+
+def get_version():
+    """Current settings version, or None if the shared cache is unavailable."""
+    _bump.flush()
+    if not shared_cache_available(cache):
+        return None
+    try:
+        version = cache.get(VERSION_KEY)
+        if version is None:
+            cache.add(VERSION_KEY, uuid.uuid4().hex, None)
+            version = cache.get(VERSION_KEY)
+        # A version from a per-process fallback isn't shared with other workers
+        return version if shared_cache_available(cache) else None
+    except Exception as e:
+        logger.warning(f"Site settings version check failed: {e}")
+        return None
+
+
+def load_snapshot(site):
+    """Configuration and menu item values for ``site`` in one query."""
+    SiteConfiguration, _ = _models()
+    config_fields = _config_fields()
+    item_fields = _item_fields()
+
+    rows = list(
+        SiteConfiguration.objects.filter(site_id=site.pk)
+        .values_list(*config_fields, *[ITEM_PREFIX + name for name in item_fields])
+        .order_by(f"{ITEM_PREFIX}sort_order", f"{ITEM_PREFIX}id")
+    )
+    if not rows:
+        # First access for this site: create the defaults (no menu items yet)
+        config = SiteConfiguration.for_site(site)
+        return tuple(getattr(config, name) for name in config_fields), []
+
+    split = len(config_fields)
+    items = [row[split:] for row in rows if row[split] is not None]
+    return rows[0][:split], items
+
+
+def build(site, snapshot):
+    """Fresh model instances built from a snapshot."""
+    SiteConfiguration, NavigationMenuItem = _models()
+    config_values, item_values = snapshot
+    config = SiteConfiguration.from_db("default", _config_fields(), config_values)
+    config.site = site
+    item_fields = _item_fields()
+    config.nav_items = [
+        NavigationMenuItem.from_db("default", item_fields, values) for values in item_values
+    ]
+    return config
+
+
+def get_site_configuration(site):
+    """SiteConfiguration for ``site`` with ``nav_items`` already loaded."""
+    version = get_version()
+    with _lock:
+        cached = _snapshots.get(site.pk)
+        if version is not None and cached is not None and cached[0] == version:
+            _stats["hits"] += 1
+            return build(site, cached[1:])
+
+    # Version read before loading, so a save racing this load is picked
+    # up on the next request rather than cached under the new version
+    snapshot = load_snapshot(site)
+    with _lock:
+        _stats["loads"] += 1
+        if version is not None:
+            _snapshots[site.pk] = (version, *snapshot)
+    return build(site, snapshot)
+
+
+def invalidate():
+    """Replace the shared version; every worker reloads on its next request."""
+    with _lock:
+        _snapshots.clear()
+        _stats["invalidations"] += 1
+    _bump()
+
+
+def handle_settings_changed(sender, raw=False, **kwargs):
+    """post_save/post_delete receiver for SiteConfiguration and its menu items."""
+    if raw:
+        return
+    transaction.on_commit(invalidate)
+
+
+def get_metrics():
+    with _lock:
+        return {**_stats, "sites_cached": len(_snapshots)}
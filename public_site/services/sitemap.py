@@ -0,0 +1,223 @@
+"""
+Precomputed Sitemaps
+
+``sitemap.xml`` is built once per site from live, public pages (URL,
+lastmod from ``latest_revision_created_at``, priority by page type) and
+stored gzipped in the default cache with an ETag. Crawler hits are a cache
+read, a 304 when the ETag matches, or the stored bytes as-is.
+
+Below SITEMAP_SHARD_THRESHOLD URLs it is a single urlset. Above it,
+``sitemap.xml`` becomes a sitemap index pointing at one shard per section
+(``/sitemap-blog.xml``, ``/sitemap-encyclopedia.xml``, ...).
+
+Publishing, unpublishing or moving a page drops the stored artifact after
+the transaction commits; the next sitemap request rebuilds it (once per
+worker, under a lock), so a burst of publishes costs one rebuild. While
+Redis is down the cache is per process, so the sitemap is rendered per
+request instead of stored, and drops made meanwhile are replayed once
+Redis is back.
+"""
+
+import gzip
+import hashlib
+import logging
+import re
+import threading
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.http import Http404, HttpResponse
+from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+
+from ethicic.cache_backends import DeferredInvalidation, shared_cache_available
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY = "sitemap:site:{site_id}"
+CACHE_CONTROL = "public, max-age=3600"
+INDEX = "index"
+
+# Page type -> shard
+SECTIONS = {
+    "BlogIndexPage": "blog",
+    "BlogPost": "blog",
+    "EncyclopediaIndexPage": "encyclopedia",
+    "EncyclopediaEntry": "encyclopedia",
+    "FAQPage": "faq",
+    "FAQIndexPage": "faq",
+    "FAQArticle": "faq",
+    "StrategyListPage": "strategies",
+    "StrategyPage": "strategies",
+}
+DEFAULT_SECTION = "pages"
+
+PRIORITIES = {
+    "HomePage": "1.0",
+    "StrategyListPage": "0.9",
+    "StrategyPage": "0.9",
+    "BlogIndexPage": "0.8",
+    "BlogPost": "0.7",
+    "EncyclopediaIndexPage": "0.7",
+    "EncyclopediaEntry": "0.6",
+    "FAQIndexPage": "0.6",
+    "FAQArticle": "0.5",
+}
+DEFAULT_PRIORITY = "0.5"
+
+URLSET_OPEN = '<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+INDEX_OPEN = '<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+
+ACCEPTS_GZIP_RE = re.compile(r"\bgzip\b")
+
+_build_lock = threading.Lock()
+
+
+def collect_entries(site):
+    """(section, loc, lastmod, priority) for every live, public page of ``site``."""
+    from wagtail.models import Page
+
+    pages = (
+        Page.objects.descendant_of(site.root_page, inclusive=True)
+        .live()
+        .public()
+        .order_by("path")
+    )
+    entries = []
+    for page in pages.iterator():
+        loc = page.get_full_url()
+        if not loc:
+            continue
+        page_type = page.specific_class.__name__ if page.specific_class else ""
+        modified = page.latest_revision_created_at or page.last_published_at
+        entries.append(
+            (
+                SECTIONS.get(page_type, DEFAULT_SECTION),
+                loc,
+                modified.date().isoformat() if modified else None,
+                PRIORITIES.get(page_type, DEFAULT_PRIORITY),
+            )
+        )
+    return entries
+
+
+def render_urlset(entries) -> bytes:
+    parts = [URLSET_OPEN]
+    for _section, loc, lastmod, priority in entries:
+        parts.append(f"<url><loc>{escape(loc)}</loc>")
+        if lastmod:
+            parts.append(f"<lastmod>{lastmod}</lastmod>")
+        parts.append(f"<priority>{priority}</priority></url>\n")
+    parts.append("</urlset>\n")
+    return "".join(parts).encode()
+
+
+def render_index(site, sections) -> bytes:
+    parts = [INDEX_OPEN]
+    for name, entries in sections.items():
+        loc = site.root_url + reverse("sitemap_section", args=[name])
+        parts.append(f"<sitemap><loc>{escape(loc)}</loc>")
+        lastmods = [lastmod for _, _, lastmod, _ in entries if lastmod]
+        if lastmods:
+            parts.append(f"<lastmod>{max(lastmods)}</lastmod>")
+        parts.append("</sitemap>\n")
+    parts.append("</sitemapindex>\n")
+    return "".join(parts).encode()
+
+
+def _document(xml: bytes):
+    """(etag, gzipped bytes); mtime=0 keeps the bytes stable across builds."""
+    return f'"{hashlib.sha256(xml).hexdigest()[:16]}"', gzip.compress(xml, mtime=0)
+
+
+def build(site) -> dict:
+    """Render and store the sitemap documents for ``site``."""
+    entries = collect_entries(site)
+    threshold = getattr(settings, "SITEMAP_SHARD_THRESHOLD", 1000)
+
+    if len(entries) <= threshold:
+        documents = {INDEX: _document(render_urlset(entries))}
+    else:
+        sections = {}
+        for entry in entries:
+            sections.setdefault(entry[0], []).append(entry)
+        documents = {INDEX: _document(render_index(site, sections))}
+        for name, section_entries in sections.items():
+            documents[name] = _document(render_urlset(section_entries))
+
+    # Other workers couldn't see a drop from this one's local fallback
+    if shared_cache_available(cache):
+        cache.set(CACHE_KEY.format(site_id=site.pk), documents, None)
+    logger.info(f"Built sitemap for site {site.pk}: {len(entries)} URLs, {len(documents)} documents")
+    return documents
+
+
+def get_documents(site) -> dict:
+    _drop.flush()
+    documents = _stored(site)
+    if documents is None and not shared_cache_available(cache):
+        # Rendered per request until Redis is back; nothing to wait for
+        return build(site)
+    if documents is None:
+        with _build_lock:
+            # Another thread may have rebuilt it while we waited
+            documents = _stored(site)
+            if documents is None:
+                documents = build(site)
+    return documents
+
+
+def _stored(site):
+    if not shared_cache_available(cache):
+        return None
+    documents = cache.get(CACHE_KEY.format(site_id=site.pk))
+    # A hit from the local fallback may predate a drop in another worker
+    return documents if shared_cache_available(cache) else None
+
+
+def serve(request, section=None):
+    """Stored sitemap (or shard) for the request's site, gzipped when accepted."""
+    from wagtail.models import Site
+
+    site = Site.find_for_request(request)
+    if site is None:
+        raise Http404("No site for this host")
+
+    document = get_documents(site).get(section or INDEX)
+    if document is None:
+        raise Http404("No such sitemap")
+    etag, body = document
+
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        if ACCEPTS_GZIP_RE.search(request.META.get("HTTP_ACCEPT_ENCODING", "")):
+            response = HttpResponse(body, content_type="application/xml")
+            response["Content-Encoding"] = "gzip"
+        else:
+            response = HttpResponse(gzip.decompress(body), content_type="application/xml")
+        response["Content-Length"] = len(response.content)
+    response["ETag"] = etag
+    response["Cache-Control"] = CACHE_CONTROL
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
+
+
+def _delete_documents():
+    from wagtail.models import Site
+
+    cache.delete_many([CACHE_KEY.format(site_id=pk) for pk in Site.objects.values_list("pk", flat=True)])
+
+
+_drop = DeferredInvalidation(cache, _delete_documents)
+
+
+def invalidate():
+    """Drop every site's stored sitemap."""
+    _drop()
+
+
+def handle_page_change(sender, **kwargs):
+    """page_published/page_unpublished/post_page_move receiver."""
+    transaction.on_commit(invalidate)
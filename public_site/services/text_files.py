@@ -0,0 +1,203 @@
+"""
+Static Text Endpoints
+
+robots.txt, llms.txt and carbon.txt are read from ``static/`` once, when
+the app starts, and served from memory with an ETag, Last-Modified and
+precompressed gzip (and brotli, if installed) variants. With DEBUG on, a
+changed mtime reloads the file on the next request.
+
+With LLMS_TXT_AUTOGENERATE, llms.txt is the static file followed by a
+listing of live pages (blog excerpts, encyclopedia summaries, FAQ
+questions). The generated document is stored in the default cache, shared
+by every worker, and dropped whenever a page is published or unpublished.
+While Redis is down it is generated per request instead, and drops made
+meanwhile are replayed once Redis is back.
+"""
+
+import gzip
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.http import Http404, HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+
+from ethicic.cache_backends import DeferredInvalidation, shared_cache_available
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPES = {
+    "robots.txt": "text/plain",
+    "llms.txt": "text/plain; charset=utf-8",
+    "carbon.txt": "text/plain",
+}
+CACHE_CONTROL = "max-age=86400"  # 24 hour cache
+GENERATED_LLMS_KEY = "text_files:llms.txt"
+
+ACCEPTS_BR_RE = re.compile(r"\bbr\b")
+ACCEPTS_GZIP_RE = re.compile(r"\bgzip\b")
+
+
+class TextFile(NamedTuple):
+    body: bytes
+    gzipped: bytes
+    brotli: bytes | None
+    etag: str
+    mtime: float
+
+
+_files = {}
+_lock = threading.Lock()
+
+
+def get_path(name: str) -> str:
+    return os.path.join(settings.BASE_DIR, "static", name)
+
+
+def make_text_file(body: bytes, mtime: float) -> TextFile:
+    return TextFile(
+        body=body,
+        gzipped=gzip.compress(body, mtime=0),
+        brotli=brotli.compress(body) if brotli else None,
+        etag=f'"{hashlib.sha256(body).hexdigest()[:16]}"',
+        mtime=mtime,
+    )
+
+
+def load(name: str) -> TextFile | None:
+    """Read ``static/<name>`` into memory; None if it is missing or unreadable."""
+    path = get_path(name)
+    try:
+        with open(path, "rb") as f:
+            text_file = make_text_file(f.read(), os.fstat(f.fileno()).st_mtime)
+    except OSError as e:
+        logger.warning(f"Could not load {name}: {e}")
+        text_file = None
+    with _lock:
+        _files[name] = text_file
+    return text_file
+
+
+def preload() -> None:
+    """Load every served file; called from AppConfig.ready()."""
+    for name in CONTENT_TYPES:
+        load(name)
+
+
+def get_static(name: str) -> TextFile | None:
+    with _lock:
+        loaded = name in _files
+        text_file = _files.get(name)
+    if not loaded:
+        return load(name)
+    if settings.DEBUG:
+        try:
+            mtime = os.stat(get_path(name)).st_mtime
+        except OSError:
+            mtime = None
+        if text_file is None or mtime != text_file.mtime:
+            return load(name)
+    return text_file
+
+
+def generate_llms_txt(base: bytes) -> bytes:
+    """The static llms.txt followed by a listing of live pages."""
+    from public_site.models import BlogPost, EncyclopediaEntry, FAQArticle
+
+    limit = getattr(settings, "LLMS_TXT_MAX_ENTRIES", 200)
+    sections = [
+        ("Blog", BlogPost.objects.live().public().order_by("-publish_date"), "excerpt"),
+        ("Encyclopedia", EncyclopediaEntry.objects.live().public().order_by("title"), "summary"),
+        ("FAQ", FAQArticle.objects.live().public().order_by("-priority", "title"), "summary"),
+    ]
+
+    lines = [base.decode("utf-8").rstrip(), "", "## Site Content"]
+    for heading, queryset, summary_field in sections:
+        pages = list(queryset[:limit])
+        if not pages:
+            continue
+        lines += ["", f"### {heading}"]
+        for page in pages:
+            url = page.get_full_url()
+            if not url:
+                continue
+            summary = " ".join((getattr(page, summary_field) or "").split())
+            lines.append(f"- [{page.title}]({url})" + (f": {summary}" if summary else ""))
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def get_llms_txt() -> TextFile | None:
+    static_file = get_static("llms.txt")
+    if static_file is None or not getattr(settings, "LLMS_TXT_AUTOGENERATE", False):
+        return static_file
+
+    _drop_llms_txt.flush()
+
+    # Keyed by the static file's ETag so editing it also regenerates
+    generated = cache.get(GENERATED_LLMS_KEY)
+    if not shared_cache_available(cache):
+        # A local fallback copy may predate a drop in another worker
+        generated = None
+    if generated is None or generated[0] != static_file.etag:
+        try:
+            text_file = make_text_file(generate_llms_txt(static_file.body), time.time())
+        except Exception:
+            logger.exception("llms.txt generation failed; serving the static file")
+            return static_file
+        generated = (static_file.etag, text_file)
+        if shared_cache_available(cache):
+            cache.set(GENERATED_LLMS_KEY, generated, None)
+    return generated[1]
+
+
+def serve(request, name: str):
+    """Serve ``name`` from memory, honouring conditional and compressed requests."""
+    text_file = get_llms_txt() if name == "llms.txt" else get_static(name)
+    if text_file is None:
+        raise Http404(f"{name} file not found")
+
+    response = get_conditional_response(
+        request, etag=text_file.etag, last_modified=int(text_file.mtime)
+    )
+    if response is None:
+        accept_encoding = request.META.get("HTTP_ACCEPT_ENCODING", "")
+        if text_file.brotli is not None and ACCEPTS_BR_RE.search(accept_encoding):
+            response = HttpResponse(text_file.brotli, content_type=CONTENT_TYPES[name])
+            response["Content-Encoding"] = "br"
+        elif ACCEPTS_GZIP_RE.search(accept_encoding):
+            response = HttpResponse(text_file.gzipped, content_type=CONTENT_TYPES[name])
+            response["Content-Encoding"] = "gzip"
+        else:
+            response = HttpResponse(text_file.body, content_type=CONTENT_TYPES[name])
+        response["Content-Length"] = len(response.content)
+    response["ETag"] = text_file.etag
+    response["Last-Modified"] = http_date(text_file.mtime)
+    response["Cache-Control"] = CACHE_CONTROL
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
+
+
+_drop_llms_txt = DeferredInvalidation(cache, lambda: cache.delete(GENERATED_LLMS_KEY))
+
+
+def invalidate_llms_txt():
+    _drop_llms_txt()
+
+
+def handle_page_change(sender, **kwargs):
+    """page_published/page_unpublished receiver."""
+    if getattr(settings, "LLMS_TXT_AUTOGENERATE", False):
+        transaction.on_commit(invalidate_llms_txt)
@@ -0,0 +1,207 @@
+"""
+Cloudflare Turnstile Verification
+
+Shared verifier used by the public forms. Calls to siteverify reuse a
+pooled keep-alive session and run under a short latency budget; verdicts
+are cached per token so a double-submitted form gets the same answer
+instead of Cloudflare's "timeout-or-duplicate" on the second request.
+
+Set TURNSTILE_VERIFIER to "public_site.services.turnstile.LocalTurnstileVerifier"
+to verify tokens locally (tests, offline development).
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import Counter
+from typing import NamedTuple
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.module_loading import import_string
+from requests.adapters import HTTPAdapter
+
+from public_site.utils.metrics import LabeledHistograms
+
+logger = logging.getLogger(__name__)
+
+SITEVERIFY_URL = "https://challenges.cloudflare.com/turnstile/v0/siteverify"
+
+# Turnstile tokens are valid for 300 seconds
+VERDICT_CACHE_SECONDS = 300
+
+
+class TurnstileResult(NamedTuple):
+    success: bool
+    error_codes: tuple = ()
+    # True when Cloudflare could not be reached within the budget
+    unavailable: bool = False
+    cached: bool = False
+
+
+class TurnstileVerifier:
+    """Verify Turnstile tokens against Cloudflare's siteverify endpoint."""
+
+    def __init__(self):
+        self.timeout = float(getattr(settings, "TURNSTILE_TIMEOUT_SECONDS", 3))
+        self.connect_timeout = min(1.0, self.timeout)
+        self.pool_size = getattr(settings, "TURNSTILE_POOL_SIZE", 10)
+        self.latency = LabeledHistograms()
+        self._counts = Counter()
+        self._counts_lock = threading.Lock()
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """Keep-alive session, created on first use."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=1, pool_maxsize=self.pool_size
+                    )
+                    session.mount("https://", adapter)
+                    self._session = session
+        return self._session
+
+    def verify(self, token: str, remote_ip: str | None = None) -> TurnstileResult:
+        """Return the verdict for ``token``, from cache when already checked."""
+        cache_key = self._cache_key(token)
+        cached = self._cached_verdict(cache_key)
+        if cached is not None:
+            self._count("cache_hits")
+            return cached
+
+        started = time.perf_counter()
+        result = self._verify_remote(token, remote_ip)
+        outcome = (
+            "unavailable"
+            if result.unavailable
+            else ("success" if result.success else "failure")
+        )
+        self.latency.observe(outcome, (time.perf_counter() - started) * 1000)
+        self._count(outcome)
+
+        if result.unavailable:
+            return result
+
+        # A concurrent double-submit may have verified this token first
+        if "timeout-or-duplicate" in result.error_codes:
+            cached = self._cached_verdict(cache_key)
+            if cached is not None:
+                return cached
+
+        try:
+            cache.set(
+                cache_key,
+                {"success": result.success, "error_codes": list(result.error_codes)},
+                VERDICT_CACHE_SECONDS,
+            )
+        except Exception as e:
+            logger.debug(f"Could not cache Turnstile verdict: {e}")
+        return result
+
+    def get_metrics(self) -> dict:
+        """Verification latency by outcome plus counters for this process."""
+        with self._counts_lock:
+            counts = dict(self._counts)
+        checked = sum(counts.get(k, 0) for k in ("success", "failure", "unavailable"))
+        return {
+            "latency_ms": self.latency.snapshot(),
+            "counts": counts,
+            "failure_rate": (
+                round(counts.get("failure", 0) / checked, 4) if checked else 0.0
+            ),
+            "unavailable_rate": (
+                round(counts.get("unavailable", 0) / checked, 4) if checked else 0.0
+            ),
+        }
+
+    def _verify_remote(self, token: str, remote_ip: str | None) -> TurnstileResult:
+        data = {
+            "secret": getattr(settings, "TURNSTILE_SECRET_KEY", None),
+            "response": token,
+        }
+        if remote_ip:
+            data["remoteip"] = remote_ip
+
+        try:
+            response = self.session.post(
+                SITEVERIFY_URL,
+                data=data,
+                timeout=(self.connect_timeout, self.timeout),
+            )
+        except requests.RequestException as e:
+            logger.warning(f"Turnstile validation failed due to network error: {e}")
+            return TurnstileResult(False, unavailable=True)
+
+        # Only network errors fail open; an unreadable answer is a failure
+        try:
+            result = response.json()
+        except ValueError:
+            result = None
+        if not isinstance(result, dict):
+            logger.warning(f"Malformed Turnstile siteverify response ({response.status_code})")
+            return TurnstileResult(False, ("malformed-response",))
+
+        return TurnstileResult(
+            success=bool(result.get("success", False)),
+            error_codes=tuple(result.get("error-codes", ())),
+        )
+
+    def _cached_verdict(self, cache_key: str) -> TurnstileResult | None:
+        try:
+            verdict = cache.get(cache_key)
+        except Exception:
+            return None
+        if verdict is None:
+            return None
+        return TurnstileResult(
+            verdict["success"], tuple(verdict["error_codes"]), cached=True
+        )
+
+    def _count(self, counter: str) -> None:
+        with self._counts_lock:
+            self._counts[counter] += 1
+
+    @staticmethod
+    def _cache_key(token: str) -> str:
+        return "turnstile:" + hashlib.sha256(token.encode()).hexdigest()
+
+
+class LocalTurnstileVerifier(TurnstileVerifier):
+    """
+    Stand-in verifier that never calls Cloudflare.
+
+    Tokens starting with "fail" are rejected, tokens starting with
+    "unavailable" simulate an outage, and everything else passes.
+    """
+
+    def _verify_remote(self, token: str, remote_ip: str | None) -> TurnstileResult:
+        if token.startswith("unavailable"):
+            return TurnstileResult(False, unavailable=True)
+        if token.startswith("fail"):
+            return TurnstileResult(False, ("invalid-input-response",))
+        return TurnstileResult(True)
+
+
+_verifier = None
+_verifier_path = None
+
+
+def get_turnstile_verifier() -> TurnstileVerifier:
+    """Return the shared verifier configured by TURNSTILE_VERIFIER."""
+    global _verifier, _verifier_path
+    path = getattr(
+        settings,
+        "TURNSTILE_VERIFIER",
+        "public_site.services.turnstile.TurnstileVerifier",
+    )
+    if _verifier is None or path != _verifier_path:
+        _verifier = import_string(path)()
+        _verifier_path = path
+    return _verifier
@@ -0,0 +1,103 @@
+"""
+Tests for the async platform API client.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from public_site.services.async_platform_client import (
+    AsyncPlatformAPIClient,
+    async_platform_client,
+)
+from public_site.services.platform_client import platform_client
+
+
+@override_settings(MAIN_PLATFORM_API_URL="http://platform.test")
+class AsyncPlatformAPIClientTest(SimpleTestCase):
+    """Test async client caching and concurrent fan-out."""
+
+    def setUp(self):
+        cache.clear()
+        self.client_api = AsyncPlatformAPIClient()
+
+    def test_read_endpoints_use_shared_cache(self):
+        """A second portfolio summary call is served from the cache."""
+        with patch.object(
+            AsyncPlatformAPIClient,
+            "_make_request",
+            new=AsyncMock(return_value={"holdings": 18}),
+        ) as mock_request:
+            first = async_to_sync(self.client_api.get_portfolio_summary)("growth")
+            second = async_to_sync(self.client_api.get_portfolio_summary)("growth")
+
+        self.assertEqual(first, {"holdings": 18})
+        self.assertEqual(second, {"holdings": 18})
+        mock_request.assert_awaited_once()
+
+    def test_failures_are_negatively_cached(self):
+        """A failed call is not re-probed while its negative entry is fresh."""
+        with patch.object(
+            AsyncPlatformAPIClient, "_make_request", new=AsyncMock(return_value=None)
+        ) as mock_request:
+            async_to_sync(self.client_api.get_research_insights)("climate")
+            async_to_sync(self.client_api.get_research_insights)("climate")
+
+        mock_request.assert_awaited_once()
+
+    def test_gather_runs_calls_concurrently(self):
+        """gather() returns results by name and maps exceptions to None."""
+
+        async def ok():
+            return {"ok": True}
+
+        async def broken():
+            raise RuntimeError("boom")
+
+        async def run():
+            return await self.client_api.gather(first=ok(), second=broken())
+
+        results = async_to_sync(run)()
+
+        self.assertEqual(results, {"first": {"ok": True}, "second": None})
+
+    def test_submission_status_requires_api_key(self):
+        """Status checks short-circuit without an API key."""
+        self.client_api.api_key = None
+
+        result = async_to_sync(self.client_api.check_submission_status)("abc")
+
+        self.assertIsNone(result)
+
+    def test_context_manager_closes_loop_client(self):
+        """A short-lived loop (async_to_sync) closes the client it opened."""
+
+        async def run():
+            async with self.client_api:
+                return self.client_api._get_async_client()
+
+        client = async_to_sync(run)()
+
+        self.assertTrue(client.is_closed)
+        self.assertEqual(len(self.client_api._async_clients), 0)
+
+
+class SubmissionStatusViewTest(TestCase):
+    """Test the submission status endpoint under WSGI."""
+
+    @patch.object(platform_client, "api_key", "test-key")
+    def test_uses_pooled_sync_client(self):
+        """The view reuses the sync client's pool and opens no async client."""
+        with patch.object(
+            platform_client,
+            "check_submission_status",
+            return_value={"status": "received"},
+        ) as mock_status:
+            response = self.client.get("/api/submission-status/abc-123/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["api"], {"status": "received"})
+        mock_status.assert_called_once_with("abc-123")
+        self.assertEqual(len(async_platform_client._async_clients), 0)
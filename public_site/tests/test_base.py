@@ -10,6 +10,7 @@ from typing import Optional
 from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import RequestFactory, TestCase, TransactionTestCase
 from django.utils import timezone
 from wagtail.models import Locale, Page, Site
@@ -158,6 +159,8 @@ class BasePublicSiteTestCase(WagtailTestCase):
     def setUp(self):
         """Set up each test."""
         super().setUp()
+        # Rate-limit counters live in the cache; don't leak them between tests
+        cache.clear()
 
     def create_test_contact_data(self, **overrides):
         """Create test data for contact forms."""
@@ -530,7 +533,7 @@ class TurnstileMixin:
         super().setUp()
 
         # Mock Turnstile validation to always succeed
-        self.turnstile_patcher = patch("requests.post")
+        self.turnstile_patcher = patch("requests.Session.post")
         self.mock_turnstile = self.turnstile_patcher.start()
 
         # Configure mock to return successful Turnstile response
@@ -544,6 +547,8 @@ class TurnstileMixin:
 
     def mock_turnstile_failure(self):
         """Configure mock to return failed Turnstile response."""
+        # Verdicts are cached per token, so forget the earlier success
+        cache.clear()
         self.mock_turnstile.return_value.json.return_value = {"success": False}
 
     def mock_turnstile_network_error(self):
@@ -0,0 +1,270 @@
+"""
+Tests for the bulk content importer.
+"""
+
+import os
+import shutil
+import tempfile
+import uuid
+from datetime import date, datetime
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.utils import ConnectionHandler
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+from wagtail.models import Locale, Page
+
+from public_site.models import (
+    EncyclopediaEntry,
+    EncyclopediaIndexPage,
+    MediaItem,
+    MediaPage,
+    RelatedContentLink,
+    SupportTicket,
+)
+from public_site.services.bulk_import import BulkImporter, parse_since
+
+OLD = timezone.make_aware(datetime(2024, 1, 1))
+NEW = timezone.make_aware(datetime(2025, 6, 1))
+
+
+class SourceDatabase:
+    """A throwaway SQLite database shaped like the production schema."""
+
+    MODELS = [
+        ContentType,
+        Page,
+        EncyclopediaIndexPage,
+        EncyclopediaEntry,
+        MediaPage,
+        MediaItem,
+        SupportTicket,
+    ]
+
+    def __init__(self, path):
+        handler = ConnectionHandler(
+            {"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": path}}
+        )
+        self.connection = handler["default"]
+        # Tables only: foreign keys point at tables this database doesn't have
+        self.execute("PRAGMA foreign_keys = OFF")
+        editor = self.connection.schema_editor()
+        editor.deferred_sql = []
+        for model in self.MODELS:
+            self.execute(*editor.table_sql(model))
+        self.content_types = {}
+        self.next_id = 1
+
+    def insert(self, obj, fields):
+        fields = [f for f in fields if not (f.primary_key and getattr(obj, f.attname) is None)]
+        values = [f.get_db_prep_save(f.pre_save(obj, True), self.connection) for f in fields]
+        columns = ", ".join(self.connection.ops.quote_name(f.column) for f in fields)
+        placeholders = ", ".join(["%s"] * len(fields))
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {fields[0].model._meta.db_table} ({columns}) VALUES ({placeholders})",
+                values,
+            )
+
+    def content_type(self, model):
+        key = model._meta.model_name
+        if key not in self.content_types:
+            ct = ContentType(id=len(self.content_types) + 1, app_label=model._meta.app_label, model=key)
+            self.insert(ct, ContentType._meta.concrete_fields)
+            self.content_types[key] = ct.id
+        return self.content_types[key]
+
+    def add_page(self, page, path, url_path, changed=OLD):
+        page.id = self.next_id
+        self.next_id += 1
+        page.path, page.depth, page.url_path = path, len(path) // 4, url_path
+        page.draft_title = page.title
+        page.locale_id = 1
+        page.translation_key = uuid.uuid4()
+        page.live = True
+        page.first_published_at = page.last_published_at = changed
+        page.latest_revision_created_at = changed
+        page.content_type_id = self.content_type(type(page))
+        self.insert(page, Page._meta.local_concrete_fields)
+        if type(page) is not Page:
+            page.page_ptr_id = page.id
+            self.insert(page, type(page)._meta.local_concrete_fields)
+        return page
+
+    def execute(self, sql, params=()):
+        with self.connection.cursor() as cursor:
+            cursor.execute(sql, params)
+
+    def close(self):
+        self.connection.close()
+
+
+class BulkImporterTest(TestCase):
+    """Test page tree reconstruction and row copying from a source database."""
+
+    def setUp(self):
+        Locale.objects.get_or_create(language_code="en")
+        self.root = Page.add_root(title="Root", slug="root")
+
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir, ignore_errors=True)
+        self.source = SourceDatabase(os.path.join(tmpdir, "source.sqlite3"))
+        self.addCleanup(self.source.close)
+
+        self.source.add_page(Page(title="Root", slug="root"), "0001", "/")
+        self.index = self.source.add_page(
+            EncyclopediaIndexPage(title="Encyclopedia", slug="encyclopedia"),
+            "00010001",
+            "/encyclopedia/",
+        )
+        for step, title in enumerate(["Negative Screening", "Proxy Voting"], start=1):
+            self.source.add_page(
+                EncyclopediaEntry(
+                    title=title,
+                    slug=title.lower().replace(" ", "-"),
+                    summary=f"About {title}.",
+                    detailed_content="<p>Details</p>",
+                ),
+                f"00010001000{step}",
+                f"/encyclopedia/{title.lower().replace(' ', '-')}/",
+            )
+
+    def run_import(self, **kwargs):
+        return BulkImporter(source=self.source.connection, log=lambda message: None, **kwargs).run()
+
+    def test_builds_valid_tree_in_bulk(self):
+        stats = self.run_import()
+
+        self.assertEqual(stats["pages_created"], 3)
+        self.assertEqual(Page.find_problems(), ([], [], [], [], []))
+        index = EncyclopediaIndexPage.objects.get()
+        self.assertEqual(index.get_parent().pk, self.root.pk)
+        self.assertEqual(index.numchild, 2)
+        self.assertEqual(Page.objects.get(pk=self.root.pk).numchild, 1)
+        entry = EncyclopediaEntry.objects.get(slug="proxy-voting")
+        self.assertEqual(entry.url_path, "/encyclopedia/proxy-voting/")
+        self.assertEqual(entry.summary, "About Proxy Voting.")
+        self.assertTrue(entry.live)
+
+    def test_rerun_skips_existing_pages(self):
+        self.run_import()
+
+        stats = self.run_import()
+
+        self.assertEqual(stats["pages_created"], 0)
+        self.assertEqual(stats["pages_skipped"], 3)
+        self.assertEqual(EncyclopediaEntry.objects.count(), 2)
+
+    def test_since_updates_changed_and_adds_new_pages(self):
+        self.run_import()
+        self.source.execute(
+            "UPDATE public_site_encyclopediaentry SET summary = %s WHERE page_ptr_id = 3",
+            ["Revised."],
+        )
+        self.source.execute(
+            "UPDATE wagtailcore_page SET latest_revision_created_at = %s WHERE id = 3",
+            [NEW.isoformat()],
+        )
+        self.source.add_page(
+            EncyclopediaEntry(
+                title="Stewardship",
+                slug="stewardship",
+                summary="New.",
+                detailed_content="<p>Details</p>",
+            ),
+            "000100010003",
+            "/encyclopedia/stewardship/",
+            changed=NEW,
+        )
+
+        stats = self.run_import(since=timezone.make_aware(datetime(2025, 1, 1)))
+
+        self.assertEqual((stats["pages_created"], stats["pages_updated"]), (1, 1))
+        self.assertEqual(EncyclopediaEntry.objects.get(slug="negative-screening").summary, "Revised.")
+        self.assertEqual(EncyclopediaIndexPage.objects.get().numchild, 3)
+        self.assertEqual(Page.find_problems(), ([], [], [], [], []))
+
+    def test_related_content_built_for_every_imported_page(self):
+        self.source.add_page(
+            EncyclopediaEntry(
+                title="Stewardship",
+                slug="stewardship",
+                summary="About voting.",
+                detailed_content="<p>Details</p>",
+                related_terms="Negative Screening, Proxy Voting",
+            ),
+            "000100010003",
+            "/encyclopedia/stewardship/",
+        )
+        self.source.execute(
+            "UPDATE public_site_encyclopediaentry SET related_terms = %s WHERE page_ptr_id != 5",
+            ["Stewardship"],
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.run_import()
+
+        sources = set(RelatedContentLink.objects.values_list("source_id", flat=True))
+        self.assertEqual(sources, set(EncyclopediaEntry.objects.values_list("pk", flat=True)))
+
+    def test_media_items_remap_page_and_dedupe(self):
+        media_page = self.source.add_page(
+            MediaPage(
+                title="Media",
+                slug="media",
+                sidebar_interview_show=False,
+                sidebar_contact_show=False,
+            ),
+            "00010002",
+            "/media/",
+        )
+        for title in ["Interview", "Interview", "Podcast"]:
+            self.source.insert(
+                MediaItem(page_id=media_page.id, title=title, publication="Radio"),
+                [f for f in MediaItem._meta.concrete_fields if not f.primary_key],
+            )
+
+        stats = self.run_import()
+
+        self.assertEqual(stats["mediaitem_created"], 2)
+        self.assertEqual(stats["mediaitem_skipped"], 1)
+        local_page = MediaPage.objects.get()
+        self.assertEqual(set(local_page.media_items.values_list("title", flat=True)), {"Interview", "Podcast"})
+
+    def test_support_tickets_matched_on_email_and_subject(self):
+        SupportTicket.objects.create(name="Ann", email="ann@example.com", subject="Hi", message="Old")
+        for email in ["ann@example.com", "bob@example.com"]:
+            self.source.insert(
+                SupportTicket(
+                    name="Someone",
+                    email=email,
+                    subject="Hi",
+                    message="From source",
+                    created_at=OLD,
+                    updated_at=OLD,
+                ),
+                [f for f in SupportTicket._meta.concrete_fields if not f.primary_key],
+            )
+
+        stats = self.run_import()
+
+        self.assertEqual(stats["supportticket_created"], 1)
+        self.assertEqual(SupportTicket.objects.get(email="ann@example.com").message, "Old")
+
+    def test_source_missing_table_is_skipped(self):
+        self.source.execute("DROP TABLE public_site_supportticket")
+
+        stats = self.run_import()
+
+        self.assertEqual(stats["pages_created"], 3)
+        self.assertEqual(stats["supportticket_created"], 0)
+
+
+class ParseSinceTest(SimpleTestCase):
+    def test_date_and_datetime(self):
+        self.assertEqual(parse_since("2025-01-02").date(), date(2025, 1, 2))
+        self.assertTrue(timezone.is_aware(parse_since("2025-01-02T03:04:05")))
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            parse_since("yesterday")
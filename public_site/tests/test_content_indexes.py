@@ -0,0 +1,102 @@
+"""
+Tests for the grouped category and letter indexes on FAQ and encyclopedia pages.
+"""
+
+from django.contrib.auth.models import AnonymousUser
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from public_site.models import (
+    EncyclopediaEntry,
+    EncyclopediaIndexPage,
+    FAQArticle,
+    FAQIndexPage,
+)
+from public_site.tests.test_base import WagtailPublicSiteTestCase
+
+
+class FAQIndexGroupingTest(WagtailPublicSiteTestCase):
+    """Test FAQ category grouping and index query counts."""
+
+    def setUp(self):
+        super().setUp()
+        self.faq_index = FAQIndexPage(title="FAQ", slug="faq")
+        self.home_page.add_child(instance=self.faq_index)
+
+    def add_article(self, title, category):
+        self.faq_index.add_child(
+            instance=FAQArticle(title=title, content="<p>Answer</p>", category=category)
+        )
+
+    def test_articles_grouped_by_category(self):
+        """Categories and groups come from a single load of the articles."""
+        self.add_article("Fees", "account")
+        self.add_article("Minimums", "account")
+        self.add_article("Screening", "investment")
+        self.add_article("Uncategorised", "")
+
+        with self.assertNumQueries(2):
+            articles, categories, grouped = self.faq_index.get_articles_grouped()
+
+        self.assertEqual(len(articles), 4)
+        self.assertEqual(categories, ["account", "investment"])
+        self.assertEqual([a.title for a in grouped["account"]], ["Fees", "Minimums"])
+        self.assertEqual(self.faq_index.get_categories(), categories)
+
+    def test_index_queries_independent_of_article_count(self):
+        """The index view's query count doesn't grow with more articles."""
+        self.add_article("Fees", "account")
+        self.add_article("Screening", "investment")
+        self._count_index_queries()  # warm per-process caches (content types, settings)
+        before = self._count_index_queries()
+
+        for number, category in enumerate(["company", "general", "help", "planning"]):
+            self.add_article(f"Question {number}", category)
+        after = self._count_index_queries()
+
+        self.assertEqual(before, after)
+
+    def _count_index_queries(self):
+        self.faq_index.refresh_from_db()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.faq_index.index_view(self.create_request("/faq/"))
+            response.render()
+        return len(queries)
+
+    def create_request(self, path):
+        request = RequestFactory().get(path)
+        request.user = AnonymousUser()
+        return request
+
+
+class EncyclopediaLetterIndexTest(WagtailPublicSiteTestCase):
+    """Test encyclopedia letter indexes."""
+
+    def setUp(self):
+        super().setUp()
+        self.index = EncyclopediaIndexPage(title="Encyclopedia", slug="encyclopedia")
+        self.home_page.add_child(instance=self.index)
+        for title in ["alpha", "Beta", "Bond", "Yield"]:
+            self.index.add_child(
+                instance=EncyclopediaEntry(
+                    title=title, summary="Summary", detailed_content="<p>Detail</p>"
+                )
+            )
+
+    def test_available_letters_single_query(self):
+        """Letters are computed by one grouped query, upper-cased."""
+        with self.assertNumQueries(2):
+            letters = self.index.get_available_letters()
+
+        self.assertEqual(letters, ["A", "B", "Y"])
+
+    def test_group_entries_by_letter(self):
+        """Loaded entries are grouped without further queries."""
+        entries = list(self.index.get_entries())
+
+        with self.assertNumQueries(0):
+            grouped = self.index.group_entries_by_letter(entries)
+
+        self.assertEqual(sorted(grouped), ["A", "B", "Y"])
+        self.assertEqual([e.title for e in grouped["B"]], ["Beta", "Bond"])
@@ -0,0 +1,139 @@
+"""
+Tests for database connection pooling configuration.
+"""
+
+import os
+import unittest
+from unittest.mock import patch
+
+from django.db.utils import ConnectionHandler
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from ethicic import database_config
+from ethicic.database_config import apply_connection_pooling, get_pool_stats
+
+
+def _postgres_config():
+    return {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": "public_site",
+        "OPTIONS": {"application_name": "ethicic_public"},
+        "CONN_MAX_AGE": 600,
+    }
+
+
+class ConnectionPoolingConfigTest(SimpleTestCase):
+    """Test apply_connection_pooling for each pool mode."""
+
+    def test_non_postgres_config_untouched(self):
+        """SQLite configs are returned unchanged."""
+        config = {"ENGINE": "django.db.backends.sqlite3", "NAME": "db.sqlite3"}
+        self.assertEqual(apply_connection_pooling(dict(config)), config)
+
+    @patch.dict(os.environ, {"DB_STATEMENT_TIMEOUT_MS": "5000"})
+    def test_persistent_mode_sets_statement_timeout(self):
+        """Persistent mode keeps CONN_MAX_AGE and adds a statement timeout."""
+        config = apply_connection_pooling(_postgres_config(), mode="persistent")
+
+        self.assertEqual(config["CONN_MAX_AGE"], 600)
+        self.assertTrue(config["CONN_HEALTH_CHECKS"])
+        self.assertEqual(config["OPTIONS"]["options"], "-c statement_timeout=5000")
+        self.assertNotIn("pool", config["OPTIONS"])
+
+    def test_pgbouncer_mode_is_transaction_pooling_safe(self):
+        """PgBouncer mode disables server-side cursors and startup options."""
+        config = apply_connection_pooling(_postgres_config(), mode="pgbouncer")
+
+        self.assertTrue(config["DISABLE_SERVER_SIDE_CURSORS"])
+        self.assertEqual(config["CONN_MAX_AGE"], 0)
+        self.assertNotIn("options", config["OPTIONS"])
+
+    def test_psycopg_mode_falls_back_without_psycopg_pool(self):
+        """Native pooling falls back to persistent connections if unavailable."""
+        with patch.object(database_config, "_psycopg_pool_available", return_value=False):
+            config = apply_connection_pooling(_postgres_config(), mode="psycopg")
+
+        self.assertNotIn("pool", config["OPTIONS"])
+        self.assertEqual(config["CONN_MAX_AGE"], 600)
+
+    def test_psycopg_mode_configures_pool(self):
+        """Native pooling disables persistent connections and enables prepares."""
+        with patch.object(database_config, "_psycopg_pool_available", return_value=True):
+            config = apply_connection_pooling(_postgres_config(), mode="psycopg")
+
+        self.assertIn("pool", config["OPTIONS"])
+        self.assertEqual(config["CONN_MAX_AGE"], 0)
+        self.assertTrue(config["CONN_HEALTH_CHECKS"])
+        self.assertEqual(config["OPTIONS"]["prepare_threshold"], 5)
+
+    @unittest.skipUnless(
+        database_config._psycopg_pool_available(), "psycopg[pool] is not installed"
+    )
+    def test_psycopg_mode_builds_django_pool(self):
+        """Django can build the pool from the options, with checks on checkout."""
+        from psycopg import Connection
+        from psycopg_pool import ConnectionPool
+
+        config = apply_connection_pooling(_postgres_config(), mode="psycopg")
+        handler = ConnectionHandler(
+            {"default": {"ENGINE": "django.db.backends.dummy"}, "pooled": config}
+        )
+        connection = handler["pooled"]
+        self.addCleanup(connection.close_pool)
+
+        with patch.object(Connection, "connect") as connect:
+            pool = connection.pool
+            connect.assert_not_called()
+
+        self.assertIsInstance(pool, ConnectionPool)
+        self.assertEqual(pool._check, ConnectionPool.check_connection)
+        self.assertEqual((pool.min_size, pool.max_size), (2, 10))
+
+    @patch.dict(os.environ, {"DB_STATEMENT_TIMEOUT_MS": "5000"})
+    def test_statement_timeout_override(self):
+        """A per-alias timeout overrides the default; 0 disables it."""
+        config = apply_connection_pooling(
+            _postgres_config(), mode="persistent", statement_timeout_ms=120000
+        )
+        self.assertEqual(config["OPTIONS"]["options"], "-c statement_timeout=120000")
+
+        config = apply_connection_pooling(
+            _postgres_config(), mode="persistent", statement_timeout_ms="0"
+        )
+        self.assertNotIn("options", config["OPTIONS"])
+
+    @patch.dict(os.environ, {"DB_STATEMENT_TIMEOUT_MS": "5000"})
+    def test_ubicloud_alias_has_no_statement_timeout(self):
+        """Migrations and imports on the ubicloud alias are not cut off."""
+        url = "postgres://user:pw@db.example:5432/public_site"
+
+        self.assertIn("options", database_config.get_database_config(url)["OPTIONS"])
+        self.assertNotIn(
+            "options", database_config.get_ubicloud_database_config(url)["OPTIONS"]
+        )
+
+    @patch.dict(os.environ, {"DB_POOL_MODE": "bogus"})
+    def test_unknown_mode_defaults_to_persistent(self):
+        """Unknown DB_POOL_MODE values fall back to persistent."""
+        self.assertEqual(database_config.get_pool_mode(), "persistent")
+
+
+class PoolStatsTest(TestCase):
+    """Test pool metrics reporting."""
+
+    def test_stats_without_pool(self):
+        """Non-pooled connections report mode and connection state."""
+        stats = get_pool_stats()
+
+        self.assertEqual(stats["mode"], "persistent")
+        self.assertIn("connected", stats)
+
+    @override_settings(METRICS_TOKEN="scrape-token")
+    def test_status_api_includes_pool_stats(self):
+        """The status API exposes database pool metrics to metrics readers."""
+        response = self.client.get(
+            "/api/status/", HTTP_AUTHORIZATION="Bearer scrape-token"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("database_pool", response.json())
@@ -0,0 +1,77 @@
+"""
+Tests for the deferred PRI DDQ to FAQ article sync.
+"""
+
+from unittest.mock import patch
+
+from django.test import override_settings
+
+from public_site.models import FAQArticle, FAQIndexPage, PRIDDQPage
+from public_site.services import ddq_sync
+from public_site.tests.test_base import WagtailPublicSiteTestCase
+
+
+@override_settings(DDQ_SYNC_DEBOUNCE_SECONDS=5)
+class DDQSyncTest(WagtailPublicSiteTestCase):
+    """Test scheduling and batched diffing of DDQ questions."""
+
+    def setUp(self):
+        super().setUp()
+        self.faq_index = FAQIndexPage(title="FAQ", slug="faq")
+        self.home_page.add_child(instance=self.faq_index)
+        self.ddq_page = PRIDDQPage(
+            title="PRI DDQ",
+            slug="pri-ddq",
+            hero_title="PRI Due Diligence Questionnaire",
+            hero_subtitle="Our comprehensive ESG approach",
+        )
+        with patch.object(ddq_sync, "schedule_sync"):
+            self.home_page.add_child(instance=self.ddq_page)
+        self.question_count = len(self.ddq_page.get_ddq_questions_for_faq())
+
+    @patch.object(ddq_sync, "sync_page")
+    @patch("public_site.services.ddq_sync.threading.Timer")
+    def test_save_defers_and_debounces_sync(self, mock_timer, mock_sync):
+        """Saves schedule a timer after commit; later saves cancel earlier ones."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.ddq_page.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.ddq_page.save()
+
+        mock_sync.assert_not_called()
+        self.assertEqual(mock_timer.call_count, 2)
+        self.assertEqual(mock_timer.call_args.args[0], 5)
+        mock_timer.return_value.cancel.assert_called_once()
+
+    @patch.object(ddq_sync, "sync_page_by_id")
+    def test_superseded_timer_does_not_sync(self, mock_sync):
+        """Only the timer holding the latest token runs the sync."""
+        with patch("public_site.services.ddq_sync.threading.Timer"):
+            ddq_sync.schedule_sync(self.ddq_page.pk)
+
+        ddq_sync._run_debounced(self.ddq_page.pk, "stale-token")
+
+        mock_sync.assert_not_called()
+
+    def test_sync_creates_then_skips_unchanged(self):
+        """A second sync with no DDQ changes writes nothing."""
+        first = ddq_sync.sync_page(self.ddq_page)
+        second = ddq_sync.sync_page(self.ddq_page)
+
+        self.assertEqual(first["created"], self.question_count)
+        self.assertEqual(second["unchanged"], self.question_count)
+        self.assertEqual(second["created"] + second["updated"], 0)
+        self.assertEqual(FAQArticle.objects.count(), self.question_count)
+
+    def test_sync_updates_only_changed_articles(self):
+        """Edited articles are restored in one batch; the rest are untouched."""
+        ddq_sync.sync_page(self.ddq_page)
+        article = FAQArticle.objects.first()
+        FAQArticle.objects.filter(pk=article.pk).update(content="<p>Edited</p>")
+
+        summary = ddq_sync.sync_page(self.ddq_page)
+
+        self.assertEqual(summary["updated"], 1)
+        self.assertEqual(summary["unchanged"], self.question_count - 1)
+        article.refresh_from_db()
+        self.assertNotEqual(article.content, "<p>Edited</p>")
@@ -0,0 +1,82 @@
+"""
+Tests for background PostHog exception reporting.
+"""
+
+from unittest.mock import Mock, patch
+
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from public_site.middleware import PostHogErrorMiddleware
+from public_site.services.error_reporting import ErrorReporter, fingerprint
+
+
+def make_properties(exception_type="ValueError", lineno=10):
+    frames = [{"filename": "views.py", "function": "view", "lineno": lineno}]
+    return {
+        "$exception_type": exception_type,
+        "$exception_list": [{"stacktrace": {"frames": frames}}],
+    }
+
+
+class ErrorReporterTest(SimpleTestCase):
+    """Test queueing, deduplication and shutdown flush."""
+
+    def setUp(self):
+        self.client_mock = Mock()
+        self.reporter = ErrorReporter(maxsize=2, dedupe_seconds=60, client=self.client_mock)
+
+    def test_fingerprint_uses_type_and_frames(self):
+        """Different lines or exception types give different fingerprints."""
+        frames = make_properties()["$exception_list"][0]["stacktrace"]["frames"]
+
+        self.assertEqual(fingerprint("ValueError", frames), fingerprint("ValueError", frames))
+        self.assertNotEqual(fingerprint("ValueError", frames), fingerprint("KeyError", frames))
+
+    def test_repeats_are_deduplicated(self):
+        """The same error within the window is counted, not queued."""
+        with patch.object(self.reporter, "_ensure_worker"):
+            self.assertTrue(self.reporter.report("anonymous", make_properties()))
+            self.assertFalse(self.reporter.report("anonymous", make_properties()))
+
+        metrics = self.reporter.get_metrics()
+        self.assertEqual(metrics["deduplicated"], 1)
+        self.assertEqual(metrics["queue_depth"], 1)
+
+    def test_full_queue_drops_events(self):
+        """New events are dropped and counted when the queue is full."""
+        with patch.object(self.reporter, "_ensure_worker"):
+            for lineno in range(3):
+                self.reporter.report("anonymous", make_properties(lineno=lineno))
+
+        self.assertEqual(self.reporter.get_metrics()["dropped"], 1)
+
+    def test_flush_sends_queued_events(self):
+        """Flushing on shutdown delivers everything that was queued."""
+        self.reporter.report("anonymous", make_properties("ValueError"))
+        self.reporter.report("anonymous", make_properties("KeyError"))
+
+        self.reporter.flush(timeout=5)
+
+        self.assertEqual(self.client_mock.capture.call_count, 2)
+        self.client_mock.flush.assert_called()
+        self.assertEqual(self.reporter.get_metrics()["sent"], 2)
+
+
+@override_settings(DEBUG=False)
+class PostHogErrorMiddlewareTest(SimpleTestCase):
+    """Test the middleware hands exceptions to the reporter."""
+
+    @patch("public_site.services.error_reporting.get_error_reporter")
+    def test_exception_is_queued_not_sent_inline(self, mock_get_reporter):
+        request = RequestFactory().get("/broken/")
+        try:
+            raise ValueError("boom")
+        except ValueError as e:
+            exception = e
+
+        PostHogErrorMiddleware(lambda r: None).process_exception(request, exception)
+
+        distinct_id, properties = mock_get_reporter.return_value.report.call_args.args
+        self.assertEqual(distinct_id, "anonymous")
+        self.assertEqual(properties["$exception_type"], "ValueError")
+        self.assertIn("boom", properties["$exception_stack_trace_raw"])
@@ -0,0 +1,213 @@
+"""
+Tests for the concurrent, cache-aware link checker.
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import time
+from unittest.mock import patch
+
+import httpx
+import posthog
+from django.test import LiveServerTestCase, SimpleTestCase
+from wagtail.models import Locale, Page, Site
+
+from enhanced_link_checker import EnhancedLinkChecker, HostLimiter, ResultCache
+from public_site.models import BlogIndexPage, HomePage
+
+SITEMAP_INDEX = b"""<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://ethicic.com/sitemap-pages.xml</loc></sitemap>
+</sitemapindex>"""
+
+SITEMAP = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://ethicic.com/about/</loc></url>
+  <url><loc>https://ethicic.com/orphan/</loc></url>
+</urlset>"""
+
+PAGES = {
+    "/": '<a href="/about/">About</a>',
+    "/about/": '<a href="/missing/">Gone</a> <a href="https://ext.example/doc">Doc</a>',
+    "/orphan/": '<a href="mailto:hello@ethicic.com">Email</a>',
+}
+
+
+class FakeSite:
+    """An httpx transport serving a tiny site plus one external host."""
+
+    def __init__(self, reject_head=False, external_delay=0):
+        self.reject_head = reject_head
+        self.external_delay = external_delay
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request):
+        self.requests.append((request.method, str(request.url), dict(request.headers)))
+        if request.url.host == "ext.example":
+            return await self.external(request)
+        path = request.url.path
+        if path == "/sitemap.xml":
+            return httpx.Response(200, content=SITEMAP_INDEX)
+        if path == "/sitemap-pages.xml":
+            return httpx.Response(200, content=SITEMAP)
+        if path in PAGES:
+            return httpx.Response(200, html=f"<html><body>{PAGES[path]}</body></html>")
+        return httpx.Response(404)
+
+    async def external(self, request):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.external_delay)
+        finally:
+            self.in_flight -= 1
+        if self.reject_head and request.method == "HEAD":
+            return httpx.Response(405)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, headers={"ETag": '"v1"'})
+
+    def external_requests(self):
+        return [request for request in self.requests if "ext.example" in request[1]]
+
+
+class LinkCheckerTest(SimpleTestCase):
+    """Test crawling, HEAD fallback, caching and offline mode."""
+
+    def setUp(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir, ignore_errors=True)
+        self.cache_path = os.path.join(tmpdir, "cache.json")
+
+    def check(self, site, **kwargs):
+        async def run():
+            async with EnhancedLinkChecker(
+                "https://ethicic.test",
+                cache_path=self.cache_path,
+                transport=httpx.MockTransport(site),
+                **kwargs,
+            ) as checker:
+                await checker.crawl()
+                return checker
+
+        return asyncio.run(run())
+
+    def urls(self, checker, status):
+        return {result["url"] for result in checker.results[status]}
+
+    def test_crawls_sitemap_and_linked_pages(self):
+        checker = self.check(FakeSite())
+
+        self.assertEqual(
+            checker.pages_crawled,
+            {
+                "https://ethicic.test/",
+                "https://ethicic.test/about/",
+                "https://ethicic.test/orphan/",
+            },
+        )
+        self.assertEqual(self.urls(checker, "broken"), {"https://ethicic.test/missing/"})
+        self.assertIn("https://ext.example/doc", self.urls(checker, "working"))
+        self.assertEqual(self.urls(checker, "skipped"), {"mailto:hello@ethicic.com"})
+
+    def test_head_rejected_falls_back_to_get(self):
+        site = FakeSite(reject_head=True)
+
+        checker = self.check(site)
+
+        self.assertEqual(
+            [method for method, _url, _headers in site.external_requests()], ["HEAD", "GET"]
+        )
+        self.assertIn("https://ext.example/doc", self.urls(checker, "working"))
+
+    def test_fresh_cache_skips_request_and_stale_cache_revalidates(self):
+        self.check(FakeSite())
+
+        site = FakeSite()
+        checker = self.check(site)
+        self.assertEqual(site.external_requests(), [])
+        self.assertEqual(checker.stats["cache_hits"], 1)
+
+        site = FakeSite()
+        checker = self.check(site, ttls={"ext.example": 0})
+        [(_method, _url, headers)] = site.external_requests()
+        self.assertEqual(headers["if-none-match"], '"v1"')
+        self.assertEqual(checker.stats["revalidated"], 1)
+        self.assertIn("https://ext.example/doc", self.urls(checker, "working"))
+
+    def test_offline_does_not_fetch_external_links(self):
+        site = FakeSite()
+
+        checker = self.check(site, offline=True)
+
+        self.assertEqual(site.external_requests(), [])
+        self.assertIn("https://ext.example/doc", self.urls(checker, "skipped"))
+        self.assertEqual(self.urls(checker, "broken"), {"https://ethicic.test/missing/"})
+
+    def test_url_list_is_checked_without_crawling(self):
+        site = FakeSite()
+
+        checker = self.check(site, urls=["https://ext.example/doc"])
+
+        self.assertEqual(checker.pages_crawled, set())
+        self.assertEqual([url for _method, url, _headers in site.requests], ["https://ext.example/doc"])
+
+    def test_per_host_limit(self):
+        async def run():
+            limiter = HostLimiter(per_host=2)
+            site = FakeSite(external_delay=0.01)
+            transport = httpx.MockTransport(site)
+            async with httpx.AsyncClient(transport=transport) as client:
+
+                async def fetch(i):
+                    async with limiter(f"https://ext.example/{i}"):
+                        await client.get(f"https://ext.example/{i}")
+
+                await asyncio.gather(*(fetch(i) for i in range(6)))
+            return site
+
+        self.assertEqual(asyncio.run(run()).max_in_flight, 2)
+
+    def test_ttl_uses_most_specific_domain(self):
+        cache = ResultCache(None, {"example.com": 10, "docs.example.com": 20}, default_ttl=5)
+
+        self.assertEqual(cache.ttl_for("https://docs.example.com/a"), 20)
+        self.assertEqual(cache.ttl_for("https://www.example.com/a"), 10)
+        self.assertEqual(cache.ttl_for("https://other.org/"), 5)
+        self.assertFalse(cache.is_fresh({"url": "https://other.org/", "checked_at": time.time() - 6}))
+
+
+class OfflineCrawlTest(LiveServerTestCase):
+    """Crawl a real Django server without touching the network."""
+
+    def setUp(self):
+        # Keep slow-request and exception reports from the server off the network
+        posthog_off = patch.object(posthog, "disabled", True)
+        posthog_off.start()
+        self.addCleanup(posthog_off.stop)
+        Locale.objects.get_or_create(language_code="en")
+        root = Page.add_root(title="Root", slug="root")
+        home = root.add_child(
+            instance=HomePage(title="Home", slug="home", hero_title="Home", hero_tagline="Hi")
+        )
+        home.add_child(instance=BlogIndexPage(title="Blog", slug="blog"))
+        Site.objects.create(hostname="ethicic.com", root_page=home, is_default_site=True)
+
+    def test_crawls_local_server(self):
+        async def run():
+            async with EnhancedLinkChecker(
+                self.live_server_url, cache_path=None, offline=True
+            ) as checker:
+                await checker.crawl()
+                return checker
+
+        checker = asyncio.run(run())
+
+        self.assertIn(f"{self.live_server_url}/", checker.pages_crawled)
+        external = [url for url in checker.all_links if not checker.is_internal(url)]
+        skipped = {result["url"] for result in checker.results["skipped"]}
+        self.assertTrue(set(external) <= skipped)
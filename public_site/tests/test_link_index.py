@@ -0,0 +1,177 @@
+"""
+Tests for the publish-time link integrity index.
+"""
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase, TestCase, override_settings
+from wagtail import blocks
+from wagtail.models import Locale, Page, Site
+
+from public_site.models import BlogPost, EncyclopediaIndexPage, PageLink
+from public_site.services import link_index
+
+BODY = """
+<p><a linktype="page" id="{about}">About</a> <a linktype="page" id="999999">Gone</a></p>
+<p><a href="/about">About path</a> <a href="/nope/">Nope</a> <a href="/health/">Health</a></p>
+<p><a href="https://ethicic.com/encyclopedia/letter/a/">Letter A</a></p>
+<p><a href="https://example.org/report">Report</a> <a href="mailto:hi@ethicic.com">Mail</a></p>
+<p><a linktype="document" id="999999">Doc</a></p>
+<embed embedtype="image" id="999999" format="left" alt="" />
+"""
+
+
+@override_settings(WAGTAILADMIN_BASE_URL="https://ethicic.com")
+class LinkIndexTest(TestCase):
+    """Test extraction, bulk validation and signal-driven updates."""
+
+    @classmethod
+    def setUpTestData(cls):
+        Locale.objects.get_or_create(language_code="en")
+        root = Page.add_root(title="Root", slug="root")
+        cls.home = root.add_child(instance=Page(title="Home", slug="home"))
+        Site.objects.create(hostname="localhost", root_page=cls.home, is_default_site=True)
+        cls.about = cls.home.add_child(instance=Page(title="About", slug="about"))
+        cls.home.add_child(
+            instance=EncyclopediaIndexPage(title="Encyclopedia", slug="encyclopedia")
+        )
+
+    def publish(self, page):
+        with self.captureOnCommitCallbacks(execute=True):
+            page.save_revision().publish()
+
+    def make_post(self):
+        post = BlogPost(
+            title="Post",
+            slug="post",
+            body=BODY.format(about=self.about.id),
+            content=[("rich_text", '<p><a href="https://example.org/report">Again</a></p>')],
+            live=False,
+        )
+        self.home.add_child(instance=post)
+        self.publish(post)
+        return post
+
+    def links(self, post):
+        return {
+            (link.link_type, link.url or link.target_object_id): link.is_broken
+            for link in PageLink.objects.filter(source=post)
+        }
+
+    def test_publish_indexes_and_validates_links(self):
+        post = self.make_post()
+
+        self.assertEqual(
+            self.links(post),
+            {
+                ("page", self.about.id): False,
+                ("page", 999999): True,
+                ("internal", "/about"): False,
+                ("internal", "/nope/"): True,
+                ("internal", "/health/"): False,
+                ("internal", "https://ethicic.com/encyclopedia/letter/a/"): False,
+                ("external", "https://example.org/report"): False,
+                ("document", 999999): True,
+                ("image", 999999): True,
+            },
+        )
+        self.assertEqual(
+            set(PageLink.objects.filter(source=post).values_list("field", flat=True)),
+            {"body", "content.rich_text"},
+        )
+        self.assertEqual(link_index.external_urls(), ["https://example.org/report"])
+
+    def test_unpublishing_a_target_flags_links_to_it(self):
+        post = self.make_post()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.about.unpublish()
+
+        links = self.links(post)
+        self.assertTrue(links[("page", self.about.id)])
+        self.assertTrue(links[("internal", "/about")])
+
+    def test_deleting_a_target_flags_links_to_it(self):
+        post = self.make_post()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Page.objects.get(pk=self.about.pk).delete()
+
+        self.assertTrue(self.links(post)[("page", self.about.id)])
+
+    def test_publishing_a_missing_path_fixes_links_to_it(self):
+        post = self.make_post()
+
+        nope = self.home.add_child(instance=Page(title="Nope", slug="nope", live=False))
+        self.publish(nope)
+
+        self.assertFalse(self.links(post)[("internal", "/nope/")])
+
+    def test_unpublished_source_is_dropped(self):
+        post = self.make_post()
+
+        post.refresh_from_db()
+        with self.captureOnCommitCallbacks(execute=True):
+            post.unpublish()
+
+        self.assertFalse(PageLink.objects.filter(source=post).exists())
+
+    def test_command_rebuilds_and_reports(self):
+        post = self.make_post()
+        PageLink.objects.all().delete()
+
+        out = StringIO()
+        call_command("check_page_links", stdout=out)
+
+        self.assertIn("/nope/", out.getvalue())
+        self.assertEqual(PageLink.objects.filter(source=post, is_broken=True).count(), 4)
+        with self.assertRaises(CommandError):
+            call_command("check_page_links", "--no-rebuild", "--fail-on-broken", stdout=StringIO())
+
+        external = StringIO()
+        call_command("check_page_links", "--external", stdout=external)
+        self.assertEqual(external.getvalue().split(), ["https://example.org/report"])
+
+
+class ExtractBlockTest(SimpleTestCase):
+    """Test walking nested StreamField block values."""
+
+    def test_nested_blocks(self):
+        block = blocks.StreamBlock(
+            [
+                (
+                    "cards",
+                    blocks.ListBlock(
+                        blocks.StructBlock(
+                            [
+                                ("page", blocks.PageChooserBlock()),
+                                ("link", blocks.URLBlock()),
+                                ("text", blocks.CharBlock()),
+                            ]
+                        )
+                    ),
+                ),
+            ]
+        )
+        raw = [
+            {
+                "type": "cards",
+                "value": [
+                    {"type": "item", "value": {"page": 3, "link": "https://example.org/", "text": "/x/"}},
+                    {"page": None, "link": "/about/", "text": ""},
+                ],
+            }
+        ]
+
+        links = list(link_index.extract_block(block, raw, "body", {None: "/home/"}))
+
+        self.assertEqual(
+            links,
+            [
+                link_index.Link("body.cards.page", "page", 3),
+                link_index.Link("body.cards.link", "external", url="https://example.org/"),
+                link_index.Link("body.cards.link", "internal", url="/about/"),
+            ],
+        )
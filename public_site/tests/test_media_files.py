@@ -0,0 +1,120 @@
+"""
+Tests for conditional, ranged and offloaded media file serving.
+"""
+
+import os
+import tempfile
+
+from django.http import Http404
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from public_site.services import media_files
+
+CONTENT = b"0123456789" * 10
+
+
+class MediaFileServingTest(SimpleTestCase):
+    """Test media_files.serve against a temporary MEDIA_ROOT."""
+
+    def setUp(self):
+        self.media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(self.media_root.cleanup)
+        os.makedirs(os.path.join(self.media_root.name, "documents"))
+        with open(os.path.join(self.media_root.name, "documents", "report.pdf"), "wb") as f:
+            f.write(CONTENT)
+
+        override = override_settings(MEDIA_ROOT=self.media_root.name)
+        override.enable()
+        self.addCleanup(override.disable)
+        media_files.clear_stat_cache()
+        self.addCleanup(media_files.clear_stat_cache)
+        self.factory = RequestFactory()
+
+    def serve(self, method="get", **headers):
+        request = getattr(self.factory, method)("/media/documents/report.pdf", headers=headers)
+        return media_files.serve(request, "documents/report.pdf")
+
+    def test_full_response_has_validators(self):
+        response = self.serve()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), CONTENT)
+        self.assertEqual(response["Content-Type"], "application/pdf")
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertIn("Last-Modified", response)
+
+    def test_if_none_match_returns_304(self):
+        etag = self.serve()["ETag"]
+
+        response = self.serve(if_none_match=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_if_modified_since_returns_304(self):
+        last_modified = self.serve()["Last-Modified"]
+
+        self.assertEqual(self.serve(if_modified_since=last_modified).status_code, 304)
+
+    def test_range_returns_partial_content(self):
+        response = self.serve(range="bytes=10-19")
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b"".join(response.streaming_content), CONTENT[10:20])
+        self.assertEqual(response["Content-Range"], "bytes 10-19/100")
+        self.assertEqual(response["Content-Length"], "10")
+
+    def test_suffix_and_open_ended_ranges(self):
+        self.assertEqual(self.serve(range="bytes=-5")["Content-Range"], "bytes 95-99/100")
+        self.assertEqual(self.serve(range="bytes=90-")["Content-Range"], "bytes 90-99/100")
+
+    def test_unsatisfiable_range(self):
+        response = self.serve(range="bytes=500-600")
+
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response["Content-Range"], "bytes */100")
+
+    def test_stale_if_range_sends_full_file(self):
+        response = self.serve(range="bytes=0-9", if_range='"stale"')
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_head_has_length_without_body(self):
+        response = self.serve(method="head")
+
+        self.assertEqual(response["Content-Length"], "100")
+        self.assertEqual(response.content, b"")
+
+    @override_settings(MEDIA_SENDFILE_BACKEND="nginx", MEDIA_ACCEL_REDIRECT_PREFIX="/internal/")
+    def test_nginx_offload(self):
+        response = self.serve()
+
+        self.assertEqual(response["X-Accel-Redirect"], "/internal/documents/report.pdf")
+        self.assertEqual(response.content, b"")
+
+    @override_settings(MEDIA_SENDFILE_BACKEND="apache")
+    def test_x_sendfile_offload(self):
+        response = self.serve()
+
+        self.assertEqual(
+            response["X-Sendfile"],
+            os.path.realpath(os.path.join(self.media_root.name, "documents", "report.pdf")),
+        )
+
+    def test_stat_results_are_cached(self):
+        self.serve()
+        os.remove(os.path.join(self.media_root.name, "documents", "report.pdf"))
+
+        # Within the TTL the cached stat still answers revalidations
+        etag = media_files.stat_file(
+            media_files.resolve_path("documents/report.pdf")
+        ).etag
+        self.assertEqual(self.serve(if_none_match=etag).status_code, 304)
+
+    def test_missing_and_traversal_paths_404(self):
+        request = self.factory.get("/media/missing.pdf")
+        with self.assertRaises(Http404):
+            media_files.serve(request, "missing.pdf")
+        with self.assertRaises(Http404):
+            media_files.serve(request, "../etc/passwd")
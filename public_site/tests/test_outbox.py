@@ -0,0 +1,197 @@
+"""
+Tests for the transactional outbox used by form submissions.
+"""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from public_site.models import OutboxMessage, SupportTicket
+from public_site.services import outbox
+from public_site.services.platform_client import platform_client
+
+
+@override_settings(OUTBOX_DISPATCH_ON_COMMIT=False, OUTBOX_MAX_ATTEMPTS=3)
+class OutboxDeliveryTest(TestCase):
+    """Test enqueueing, delivery, retries and deduplication."""
+
+    def setUp(self):
+        self.ticket = SupportTicket.objects.create(
+            name="Test User",
+            email="test@example.com",
+            subject="Question",
+            message="Test message",
+            ticket_type="contact",
+        )
+
+    def _enqueue(self):
+        return outbox.enqueue(
+            "contact",
+            {"email": "test@example.com", "message": "Test message"},
+            ticket=self.ticket,
+        )
+
+    def test_enqueue_deduplicates_by_ticket(self):
+        """Enqueueing the same ticket twice keeps a single message."""
+        first = self._enqueue()
+        second = self._enqueue()
+
+        self.assertEqual(first.pk, second.pk)
+        self.assertEqual(OutboxMessage.objects.count(), 1)
+
+    @patch.object(platform_client, "api_key", "test-key")
+    def test_successful_delivery_sets_external_reference(self):
+        """Delivered messages update the ticket's external reference."""
+        message = self._enqueue()
+
+        with patch.object(
+            platform_client,
+            "secure_contact_submission",
+            return_value={"submission_id": "abc-123"},
+        ) as mock_submit:
+            summary = outbox.deliver_pending()
+
+        self.assertEqual(summary["delivered"], 1)
+        mock_submit.assert_called_once_with(
+            message.payload, submission_id=message.submission_id
+        )
+        message.refresh_from_db()
+        self.ticket.refresh_from_db()
+        self.assertEqual(message.status, "delivered")
+        self.assertEqual(self.ticket.external_reference, "abc-123")
+
+    @patch.object(platform_client, "api_key", "test-key")
+    def test_failed_delivery_is_retried_with_backoff(self):
+        """Failures push the next attempt into the future."""
+        message = self._enqueue()
+
+        with patch.object(
+            platform_client, "secure_contact_submission", return_value=None
+        ):
+            summary = outbox.deliver_pending()
+
+        self.assertEqual(summary["retried"], 1)
+        message.refresh_from_db()
+        self.assertEqual(message.status, "pending")
+        self.assertEqual(message.attempts, 1)
+        self.assertGreater(message.next_attempt_at, timezone.now())
+
+    @patch.object(platform_client, "api_key", "test-key")
+    @patch("public_site.standalone_email_utils.send_contact_notification")
+    def test_gives_up_after_max_attempts(self, mock_fallback):
+        """Messages are marked failed and emailed after the last attempt."""
+        message = self._enqueue()
+        OutboxMessage.objects.filter(pk=message.pk).update(attempts=2)
+
+        with patch.object(
+            platform_client,
+            "secure_contact_submission",
+            side_effect=Exception("timeout"),
+        ):
+            summary = outbox.deliver_pending()
+
+        self.assertEqual(summary["failed"], 1)
+        message.refresh_from_db()
+        self.assertEqual(message.status, "failed")
+        self.assertEqual(message.last_error, "timeout")
+        mock_fallback.assert_called_once()
+
+    @patch.object(platform_client, "api_key", "test-key")
+    @patch("public_site.standalone_email_utils.send_contact_notification")
+    def test_first_failure_emails_team_once(self, mock_fallback):
+        """The team is emailed after the first failed attempt, not on every retry."""
+        message = self._enqueue()
+
+        with patch.object(
+            platform_client, "secure_contact_submission", return_value=None
+        ):
+            outbox.deliver_pending()
+            OutboxMessage.objects.filter(pk=message.pk).update(
+                next_attempt_at=timezone.now()
+            )
+            outbox.deliver_pending()
+            OutboxMessage.objects.filter(pk=message.pk).update(
+                next_attempt_at=timezone.now()
+            )
+            summary = outbox.deliver_pending()
+
+        self.assertEqual(summary["failed"], 1)
+        mock_fallback.assert_called_once()
+        message.refresh_from_db()
+        self.assertIsNotNone(message.fallback_sent_at)
+
+    @patch.object(platform_client, "api_key", "test-key")
+    def test_background_delivery_sweeps_due_retries(self):
+        """Delivering a new message also retries other due messages."""
+        earlier = outbox.enqueue("newsletter", {"email": "a@example.com"})
+        OutboxMessage.objects.filter(pk=earlier.pk).update(attempts=1)
+        message = self._enqueue()
+
+        with (
+            patch.object(
+                platform_client,
+                "secure_contact_submission",
+                return_value={"submission_id": "abc-123"},
+            ),
+            patch.object(
+                platform_client, "notify_contact_submission", return_value=True
+            ),
+            patch.object(outbox, "close_old_connections"),
+        ):
+            outbox._deliver_in_thread(message.pk)
+
+        self.assertEqual(
+            set(OutboxMessage.objects.values_list("status", flat=True)), {"delivered"}
+        )
+
+    @patch.object(platform_client, "api_key", None)
+    def test_skipped_without_platform_configuration(self):
+        """Messages are skipped when no platform API key is configured."""
+        message = self._enqueue()
+
+        summary = outbox.deliver_pending()
+
+        self.assertEqual(summary["skipped"], 1)
+        message.refresh_from_db()
+        self.assertEqual(message.status, "skipped")
+
+    def test_metrics_report_queue_depth(self):
+        """Metrics include pending counts and process counters."""
+        self._enqueue()
+
+        metrics = outbox.get_outbox_metrics()
+
+        self.assertEqual(metrics["pending"], 1)
+        self.assertIn("delivered", metrics["process"])
+
+
+class OutboxRetentionTest(TestCase):
+    """Test purging finished messages and their submission data."""
+
+    def _message(self, status, age_days):
+        message = outbox.enqueue("newsletter", {"email": "a@example.com"})
+        OutboxMessage.objects.filter(pk=message.pk).update(
+            status=status, created_at=timezone.now() - timedelta(days=age_days)
+        )
+        return message.pk
+
+    @override_settings(
+        OUTBOX_DISPATCH_ON_COMMIT=False,
+        OUTBOX_RETENTION_DAYS=7,
+        OUTBOX_FAILED_RETENTION_DAYS=30,
+    )
+    def test_purge_old_messages(self):
+        """Old delivered, skipped and failed messages go; pending ones stay."""
+        kept = {
+            self._message("delivered", 1),
+            self._message("failed", 10),
+            self._message("pending", 60),
+        }
+        self._message("delivered", 8)
+        self._message("skipped", 8)
+        self._message("failed", 31)
+
+        self.assertEqual(outbox.purge_old_messages(), 3)
+        self.assertEqual(set(OutboxMessage.objects.values_list("pk", flat=True)), kept)
@@ -0,0 +1,156 @@
+"""
+Tests for the platform API client's session, circuit breaker and cache.
+"""
+
+from unittest.mock import Mock, patch
+
+import requests
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from public_site.services.platform_cache import PlatformResponseCache
+from public_site.services.platform_client import CircuitBreaker, PlatformAPIClient
+
+
+class CircuitBreakerTest(SimpleTestCase):
+    """Test circuit breaker state transitions."""
+
+    def test_opens_after_threshold(self):
+        """Repeated failures open the circuit and reject requests."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+        breaker.record_failure()
+        self.assertTrue(breaker.allow_request())
+        breaker.record_failure()
+
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(breaker.allow_request())
+        self.assertEqual(breaker.short_circuited, 1)
+
+    def test_half_open_allows_single_trial(self):
+        """After the cool-down one trial request is let through."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertTrue(breaker.allow_request())
+
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+
+@override_settings(
+    MAIN_PLATFORM_API_URL="http://platform.test",
+    PLATFORM_API_CIRCUIT_THRESHOLD=2,
+    PLATFORM_API_CIRCUIT_RESET_SECONDS=60,
+)
+class PlatformAPIClientSessionTest(SimpleTestCase):
+    """Test request handling through the pooled session."""
+
+    def setUp(self):
+        self.client_api = PlatformAPIClient()
+        self.session = Mock()
+        self.client_api._session = self.session
+
+    def test_reuses_session_and_records_latency(self):
+        """Requests go through the shared session and are timed per endpoint."""
+        self.session.get.return_value = Mock(status_code=200, json=lambda: {"ok": True})
+
+        result = self.client_api._make_request(
+            "/api/v1/secure/submission-status/1234/", method="GET"
+        )
+
+        self.assertEqual(result, {"ok": True})
+        metrics = self.client_api.get_metrics()
+        self.assertIn("/api/v1/secure/submission-status/{id}/", metrics["endpoints"])
+        self.assertEqual(metrics["circuit_state"], "closed")
+
+    def test_timeouts_open_circuit(self):
+        """Timeouts trip the breaker so later calls return immediately."""
+        self.session.post.side_effect = requests.exceptions.Timeout()
+
+        self.assertIsNone(self.client_api._make_request("/api/v1/contacts/", {}))
+        self.assertIsNone(self.client_api._make_request("/api/v1/contacts/", {}))
+        self.assertIsNone(self.client_api._make_request("/api/v1/contacts/", {}))
+
+        self.assertEqual(self.session.post.call_count, 2)
+        self.assertEqual(self.client_api.get_metrics()["short_circuited"], 1)
+
+    def test_session_mounts_retrying_adapter(self):
+        """The built session retries idempotent methods only."""
+        session = PlatformAPIClient()._build_session()
+        retry = session.get_adapter("http://platform.test").max_retries
+
+        self.assertIn("GET", retry.allowed_methods)
+        self.assertNotIn("POST", retry.allowed_methods)
+        self.assertEqual(retry.read, 0)
+
+    @patch.object(PlatformAPIClient, "_build_session")
+    def test_session_created_lazily(self, mock_build):
+        """No session (and no sockets) exist until the first request."""
+        client_api = PlatformAPIClient()
+        mock_build.assert_not_called()
+
+        client_api.session  # noqa: B018 - triggers lazy creation
+        mock_build.assert_called_once()
+
+
+class PlatformResponseCacheTest(SimpleTestCase):
+    """Test TTL, negative caching and stale-if-error behaviour."""
+
+    def setUp(self):
+        cache.clear()
+        self.response_cache = PlatformResponseCache(
+            ttls={"/api/v1/research/public-insights/": 0}, negative_ttl=60
+        )
+        self.endpoint = "/api/v1/portfolio/public-summary/"
+
+    def test_keys_canonicalize_params(self):
+        """Param order and empty values do not change the key."""
+        self.assertEqual(
+            self.response_cache.make_key(self.endpoint, {"b": 2, "a": 1, "c": None}),
+            self.response_cache.make_key(self.endpoint, {"a": 1, "b": 2}),
+        )
+
+    def test_fresh_entries_are_hits(self):
+        """Cached responses are served without calling the loader again."""
+        loader = Mock(return_value={"ok": True})
+
+        self.response_cache.fetch(self.endpoint, {}, loader)
+        result = self.response_cache.fetch(self.endpoint, {}, loader)
+
+        self.assertEqual(result, {"ok": True})
+        loader.assert_called_once()
+        stats = self.response_cache.get_stats()[self.endpoint]
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+    def test_failures_are_negatively_cached(self):
+        """A failed call is not retried until the negative entry expires."""
+        loader = Mock(return_value=None)
+
+        self.assertIsNone(self.response_cache.fetch(self.endpoint, {}, loader))
+        self.assertIsNone(self.response_cache.fetch(self.endpoint, {}, loader))
+
+        loader.assert_called_once()
+        self.assertEqual(
+            self.response_cache.get_stats()[self.endpoint]["negative_hits"], 1
+        )
+
+    def test_stale_response_served_on_error(self):
+        """An expired response is served when the refresh fails."""
+        endpoint = "/api/v1/research/public-insights/"
+        self.response_cache.fetch(endpoint, {}, Mock(return_value={"v": 1}))
+
+        result = self.response_cache.fetch(endpoint, {}, Mock(return_value=None))
+
+        self.assertEqual(result, {"v": 1})
+        self.assertEqual(self.response_cache.get_stats()[endpoint]["stale"], 1)
+
+    def test_health_check_never_served_stale(self):
+        """Health checks report failures instead of an old success."""
+        response_cache = PlatformResponseCache(ttls={"/api/v1/health/": 0})
+        response_cache.fetch("/api/v1/health/", None, Mock(return_value={"ok": 1}))
+
+        result = response_cache.fetch("/api/v1/health/", None, Mock(return_value=None))
+
+        self.assertIsNone(result)
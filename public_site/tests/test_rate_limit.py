@@ -0,0 +1,150 @@
+"""
+Tests for the sliding-window rate limiter.
+"""
+
+from unittest.mock import Mock, PropertyMock, patch
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from ethicic.cache_backends import FailoverRedisCache
+from public_site.utils.rate_limit import (
+    SlidingWindowRateLimiter,
+    get_client_ip,
+    rate_limit,
+)
+
+
+class SlidingWindowRateLimiterTest(SimpleTestCase):
+    """Test counting against the local cache backend."""
+
+    def setUp(self):
+        cache.clear()
+        self.limiter = SlidingWindowRateLimiter()
+
+    def test_rejects_after_limit(self):
+        """Requests beyond the limit are rejected with a retry hint."""
+        results = [self.limiter.hit("contact", "1.2.3.4", 3, 3600) for _ in range(4)]
+
+        self.assertEqual([r.allowed for r in results], [True, True, True, False])
+        self.assertEqual(results[2].remaining, 0)
+        self.assertGreater(results[3].retry_after, 0)
+
+    def test_clients_and_scopes_are_independent(self):
+        """Each client IP and scope has its own counter."""
+        self.limiter.hit("contact", "1.2.3.4", 1, 3600)
+
+        self.assertTrue(self.limiter.hit("contact", "5.6.7.8", 1, 3600).allowed)
+        self.assertTrue(self.limiter.hit("newsletter", "1.2.3.4", 1, 3600).allowed)
+
+    @patch("public_site.utils.rate_limit.time.time")
+    def test_previous_window_is_weighted(self, mock_time):
+        """Early in a new window most of the previous window still counts."""
+        mock_time.return_value = 1000 * 60 + 30
+        for _ in range(4):
+            self.limiter.hit("search", "1.2.3.4", 4, 60)
+
+        # 15s into the next window, 75% of the 4 previous requests remain
+        mock_time.return_value = 1001 * 60 + 15
+        self.assertTrue(self.limiter.hit("search", "1.2.3.4", 4, 60).allowed)
+        self.assertFalse(self.limiter.hit("search", "1.2.3.4", 4, 60).allowed)
+
+
+class FailoverRateLimitTest(SimpleTestCase):
+    """Test limiting while Redis is down."""
+
+    def test_counts_on_local_fallback_during_outage(self):
+        """An outage switches to the fallback instead of failing open."""
+        # Nothing listens on port 1, so connecting fails immediately
+        failover = FailoverRedisCache(
+            "redis://127.0.0.1:1/0",
+            {"OPTIONS": {"socket_connect_timeout": 0.2, "FAILOVER_RETRY_SECONDS": 60}},
+        )
+        limiter = SlidingWindowRateLimiter()
+
+        with patch.object(
+            SlidingWindowRateLimiter, "cache", new_callable=PropertyMock
+        ) as mock_cache:
+            mock_cache.return_value = failover
+            first = limiter.hit("contact", "1.2.3.4", 2, 3600)
+            self.assertTrue(failover.using_fallback)
+
+            with patch.object(limiter, "_hit_redis") as mock_redis:
+                results = [limiter.hit("contact", "1.2.3.4", 2, 3600) for _ in range(2)]
+            mock_redis.assert_not_called()
+
+        self.assertTrue(first.allowed)
+        self.assertEqual([r.allowed for r in results], [True, False])
+
+
+class ClientIPTest(SimpleTestCase):
+    """Test which address identifies a client."""
+
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def request(self, **headers):
+        return self.factory.get("/", REMOTE_ADDR="10.0.0.1", **headers)
+
+    def test_spoofed_forwarded_entries_ignored(self):
+        """Only the entry appended by our proxy is trusted."""
+        request = self.request(HTTP_X_FORWARDED_FOR="6.6.6.6, 1.2.3.4")
+
+        self.assertEqual(get_client_ip(request), "1.2.3.4")
+
+    @override_settings(RATE_LIMIT_TRUSTED_PROXIES=2)
+    def test_multiple_trusted_proxies(self):
+        request = self.request(HTTP_X_FORWARDED_FOR="6.6.6.6, 1.2.3.4, 172.16.0.9")
+
+        self.assertEqual(get_client_ip(request), "1.2.3.4")
+
+    @override_settings(RATE_LIMIT_TRUSTED_PROXIES=0)
+    def test_no_proxy_uses_socket_address(self):
+        request = self.request(HTTP_X_FORWARDED_FOR="6.6.6.6")
+
+        self.assertEqual(get_client_ip(request), "10.0.0.1")
+
+    @override_settings(RATE_LIMIT_CLIENT_IP_HEADER="CF-Connecting-IP")
+    def test_platform_header_wins(self):
+        request = self.request(
+            HTTP_CF_CONNECTING_IP="1.2.3.4", HTTP_X_FORWARDED_FOR="6.6.6.6"
+        )
+
+        self.assertEqual(get_client_ip(request), "1.2.3.4")
+
+
+@override_settings(RATE_LIMITS={"newsletter": (1, 60)})
+class RateLimitDecoratorTest(SimpleTestCase):
+    """Test rejecting requests before the view runs."""
+
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.view = Mock(return_value=HttpResponse("ok"))
+        self.limited_view = rate_limit("newsletter")(self.view)
+
+    def test_rejects_with_429_without_calling_view(self):
+        """Over-limit requests get a 429 and never reach form parsing."""
+        self.limited_view(self.factory.post("/api/newsletter/"))
+        response = self.limited_view(self.factory.post("/api/newsletter/"))
+
+        self.assertEqual(response.status_code, 429)
+        self.assertIn("Retry-After", response)
+        self.view.assert_called_once()
+
+    @override_settings(RATE_LIMIT_ENABLED=False)
+    def test_disabled_allows_everything(self):
+        """RATE_LIMIT_ENABLED=False turns the check off."""
+        for _ in range(3):
+            response = self.limited_view(self.factory.post("/api/newsletter/"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.view.call_count, 3)
+
+    def test_api_view_is_limited(self):
+        """The decorator is applied to the newsletter API endpoint."""
+        self.client.post("/api/newsletter/", {"email": "not-an-email"})
+        response = self.client.post("/api/newsletter/", {"email": "not-an-email"})
+
+        self.assertEqual(response.status_code, 429)
@@ -0,0 +1,168 @@
+"""
+Tests for the precomputed related-content graph.
+"""
+
+from wagtail.models import PageViewRestriction
+
+from public_site.models import (
+    EncyclopediaEntry,
+    EncyclopediaIndexPage,
+    FAQArticle,
+    FAQIndexPage,
+    RelatedContentLink,
+)
+from public_site.services import related_content
+from public_site.tests.test_base import WagtailPublicSiteTestCase
+
+
+class EncyclopediaRelatedContentTest(WagtailPublicSiteTestCase):
+    """Test related encyclopedia entries."""
+
+    def setUp(self):
+        super().setUp()
+        self.index = EncyclopediaIndexPage(title="Encyclopedia", slug="encyclopedia")
+        self.home_page.add_child(instance=self.index)
+        self.bond = self.add_entry(
+            "Bond",
+            "A fixed income security whose price falls when interest rates rise",
+            "Yield, Duration",
+        )
+        self.yield_entry = self.add_entry("Bond Yield", "Return on a bond", "")
+        self.duration = self.add_entry(
+            "Duration", "How far a bond price falls when interest rates rise", ""
+        )
+        self.equity = self.add_entry("Equity", "Ownership shares in a company", "")
+
+    def add_entry(self, title, summary, related_terms):
+        entry = EncyclopediaEntry(
+            title=title,
+            summary=summary,
+            detailed_content=f"<p>{summary}</p>",
+            related_terms=related_terms,
+        )
+        self.index.add_child(instance=entry)
+        return entry
+
+    def test_manual_terms_resolved_and_ranked_first(self):
+        """Editor-entered terms become the first related entries."""
+        related_content.rebuild_graph(EncyclopediaEntry)
+
+        links = list(RelatedContentLink.objects.filter(source=self.bond))
+        self.assertEqual(
+            [(link.target_id, link.relation) for link in links[:2]],
+            [(self.yield_entry.id, "manual"), (self.duration.id, "manual")],
+        )
+
+    def test_related_entries_use_one_query(self):
+        """Entry pages read related items with a single lookup."""
+        related_content.rebuild_graph(EncyclopediaEntry)
+
+        # Plus Wagtail's lookup of private sections for .public()
+        with self.assertNumQueries(2):
+            related = list(self.bond.get_related_entries())
+
+        self.assertEqual(related[:2], [self.yield_entry, self.duration])
+
+    def test_similar_text_suggested(self):
+        """Entries without manual terms get text-similarity suggestions."""
+        related_content.rebuild_graph(EncyclopediaEntry)
+
+        suggested = list(self.duration.get_related_entries())
+
+        self.assertIn(self.bond, suggested)
+        self.assertNotIn(self.equity, suggested)
+
+    def edges(self, *sources):
+        return list(
+            RelatedContentLink.objects.filter(source__in=sources).values_list(
+                "source_id", "target_id", "relation", "rank"
+            )
+        )
+
+    def test_publish_updates_affected_rows(self):
+        """Publishing updates the page's row and the rows it now belongs in."""
+        related_content.rebuild_graph(EncyclopediaEntry)
+        equity_edges = self.edges(self.equity)
+
+        convexity = self.add_entry(
+            "Convexity", "How a bond price curve bends as interest rates rise", ""
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            convexity.save_revision().publish()
+
+        self.assertIn(convexity, self.duration.get_related_entries())
+        self.assertTrue(RelatedContentLink.objects.filter(source=convexity).exists())
+        self.assertEqual(self.edges(self.equity), equity_edges)
+
+        # The same rows a full rebuild would produce for the touched pages
+        touched = (convexity, self.bond, self.duration)
+        incremental = self.edges(*touched)
+        related_content.rebuild_graph(EncyclopediaEntry)
+        self.assertEqual(
+            [edge[:3] for edge in incremental], [edge[:3] for edge in self.edges(*touched)]
+        )
+
+    def test_unpublish_removes_page_from_rows(self):
+        """Unpublishing drops the page's row and refills rows that showed it."""
+        related_content.rebuild_graph(EncyclopediaEntry)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.duration.unpublish()
+
+        self.assertFalse(RelatedContentLink.objects.filter(source=self.duration).exists())
+        self.assertFalse(RelatedContentLink.objects.filter(target=self.duration).exists())
+        self.assertIn(self.yield_entry, self.bond.get_related_entries())
+
+    def test_private_entries_are_not_related(self):
+        """Entries in private sections never show up as related links."""
+        related_content.rebuild_graph(EncyclopediaEntry)
+        PageViewRestriction.objects.create(
+            page=self.duration, restriction_type=PageViewRestriction.LOGIN
+        )
+
+        self.assertNotIn(self.duration, self.bond.get_related_entries())
+
+        related_content.rebuild_graph(EncyclopediaEntry)
+        self.assertFalse(RelatedContentLink.objects.filter(target=self.duration).exists())
+
+    def test_rebuild_replaces_existing_links(self):
+        """Rebuilding does not duplicate edges."""
+        related_content.rebuild_graph(EncyclopediaEntry)
+        count = RelatedContentLink.objects.count()
+
+        related_content.rebuild_graph(EncyclopediaEntry)
+
+        self.assertEqual(RelatedContentLink.objects.count(), count)
+
+
+class FAQRelatedContentTest(WagtailPublicSiteTestCase):
+    """Test related FAQ articles."""
+
+    def setUp(self):
+        super().setUp()
+        self.faq_index = FAQIndexPage(title="FAQ", slug="faq")
+        self.home_page.add_child(instance=self.faq_index)
+
+    def add_article(self, title, **kwargs):
+        article = FAQArticle(title=title, content="<p>Answer</p>", **kwargs)
+        self.faq_index.add_child(instance=article)
+        return article
+
+    def test_shared_keywords_and_titles(self):
+        """Titles resolve exactly; shared keywords suggest further articles."""
+        fees = self.add_article(
+            "What are your fees?", related_articles="Minimums", keywords="fees, pricing"
+        )
+        minimums = self.add_article("Minimums", keywords="accounts")
+        pricing = self.add_article("Pricing tiers", keywords="pricing")
+
+        related_content.rebuild_graph(FAQArticle)
+
+        self.assertEqual(list(fees.get_related_articles_list()), [minimums, pricing])
+
+    def test_falls_back_before_graph_is_built(self):
+        """Pages still show editor-entered relations before the first build."""
+        minimums = self.add_article("Minimums")
+        fees = self.add_article("Fees", related_articles="Minimums")
+
+        self.assertEqual(list(fees.get_related_articles_list()), [minimums])
@@ -0,0 +1,83 @@
+"""
+Tests for background image rendition pre-generation.
+"""
+
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from django.template import engines
+from django.test import TestCase, override_settings
+from wagtail.images import get_image_model
+from wagtail.images.tests.utils import get_test_image_file
+from wagtail.models import Collection
+
+from public_site.services import renditions
+
+
+class RenditionPregenerationTest(TestCase):
+    """Test scheduling and generation of declared renditions."""
+
+    @classmethod
+    def setUpTestData(cls):
+        if not Collection.get_first_root_node():
+            Collection.add_root(name="Root")
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        override = override_settings(MEDIA_ROOT=media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def create_image(self):
+        with patch.object(renditions, "_submit"):
+            with self.captureOnCommitCallbacks(execute=True):
+                return get_image_model().objects.create(
+                    title="Chart", file=get_test_image_file()
+                )
+
+    @override_settings(IMAGE_RENDITION_SPECS=["width-800|format-webp", "width-400"])
+    def test_specs_merge_templates_and_settings(self):
+        specs = renditions.get_rendition_specs()
+
+        self.assertIn("width-1200", specs)
+        self.assertIn("width-800|format-webp", specs)
+        self.assertEqual(specs.count("width-400"), 1)
+
+    def test_upload_schedules_after_commit(self):
+        with patch.object(renditions, "_submit") as mock_submit:
+            with self.captureOnCommitCallbacks(execute=True):
+                image = get_image_model().objects.create(
+                    title="Chart", file=get_test_image_file()
+                )
+
+        mock_submit.assert_called_with(image.pk)
+
+    def test_title_edits_not_scheduled(self):
+        image = self.create_image()
+
+        with patch.object(renditions, "_submit") as mock_submit:
+            with self.captureOnCommitCallbacks(execute=True):
+                image.title = "Renamed"
+                image.save(update_fields=["title"])
+
+        mock_submit.assert_not_called()
+
+    def test_page_render_does_not_generate(self):
+        """After pre-generation the template tag only reads renditions."""
+        image = self.create_image()
+        renditions.pregenerate_by_id(image.pk)
+
+        template = engines["django"].from_string(
+            "{% load wagtailimages_tags %}{% image image width-400 %}"
+        )
+        with patch.object(
+            type(image), "generate_rendition_file", side_effect=AssertionError("encoded")
+        ):
+            html = template.render({"image": get_image_model().objects.get(pk=image.pk)})
+
+        self.assertIn("<img", html)
+        self.assertEqual(
+            image.renditions.count(), len(renditions.get_rendition_specs())
+        )
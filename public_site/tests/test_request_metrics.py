@@ -0,0 +1,185 @@
+"""
+Tests for per-route request performance metrics.
+"""
+
+import os
+from unittest.mock import Mock, patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from ethicic.cache_backends import FailoverRedisCache
+from public_site.services.error_reporting import ErrorReporter, get_error_reporter
+from public_site.tests.test_base import WagtailPublicSiteTestCase
+from public_site.utils import request_metrics
+
+
+class RequestMetricsMiddlewareTest(WagtailPublicSiteTestCase):
+    """Test route labels, Server-Timing and slow-request sampling."""
+
+    def setUp(self):
+        super().setUp()
+        request_metrics.reset()
+
+    def test_api_route_recorded_with_db_queries(self):
+        """Routes are labelled by URL pattern and count their queries."""
+        self.client.get("/api/status/")
+
+        self.assertIn("api/status/", request_metrics.get_metrics())
+        self.assertIn(
+            f'ethicic_request_db_queries_count{{route="api/status/",pid="{os.getpid()}"}} 1',
+            request_metrics.render_prometheus(),
+        )
+        self.assertNotIn(
+            f'ethicic_request_db_queries_bucket{{route="api/status/",pid="{os.getpid()}",le="0"}} 1',
+            request_metrics.render_prometheus(),
+        )
+
+    def test_wagtail_pages_labelled_by_type_and_subroute(self):
+        """Wagtail pages use page type and RoutablePage sub-route, not the URL."""
+        self.create_test_blog_index()
+
+        self.client.get("/blog/")
+        self.client.get("/blog/tag/esg/")
+
+        routes = request_metrics.get_metrics()
+        self.assertIn("page:BlogIndexPage:post_list", routes)
+        self.assertIn("page:BlogIndexPage:post_by_tag", routes)
+
+    def test_server_timing_only_for_staff(self):
+        """Staff see a Server-Timing breakdown; anonymous visitors do not."""
+        response = self.client.get("/api/status/")
+        self.assertNotIn("Server-Timing", response)
+
+        self.client.force_login(self.user)
+        response = self.client.get("/api/status/")
+        self.assertRegex(response["Server-Timing"], r"total;dur=[\d.]+, db;dur=")
+
+    @override_settings(PERF_SLOW_REQUEST_MS=0, PERF_SLOW_SAMPLE_RATE=1.0)
+    def test_slow_requests_sampled_to_posthog(self):
+        """Requests over the threshold are queued as slow_request events."""
+        with patch.object(get_error_reporter(), "capture") as mock_capture:
+            self.client.get("/api/status/")
+
+        distinct_id, event, properties = mock_capture.call_args[0]
+        self.assertEqual((distinct_id, event), ("anonymous", "slow_request"))
+        self.assertEqual(properties["route"], "api/status/")
+
+    @override_settings(PERF_SLOW_REQUEST_MS=0, PERF_SLOW_SAMPLE_RATE=0.0)
+    def test_unsampled_slow_requests_not_sent(self):
+        with patch.object(get_error_reporter(), "capture") as mock_capture:
+            self.client.get("/api/status/")
+
+        mock_capture.assert_not_called()
+
+
+class MetricsEndpointTest(WagtailPublicSiteTestCase):
+    """Test access to the Prometheus endpoint."""
+
+    def test_anonymous_forbidden(self):
+        self.assertEqual(self.client.get("/metrics/").status_code, 403)
+
+    @override_settings(METRICS_TOKEN="scrape-token")
+    def test_bearer_token(self):
+        """Scrapers authenticate with the configured token."""
+        wrong = self.client.get("/metrics/", HTTP_AUTHORIZATION="Bearer nope")
+        response = self.client.get("/metrics/", HTTP_AUTHORIZATION="Bearer scrape-token")
+
+        self.assertEqual(wrong.status_code, 403)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("# TYPE ethicic_request_duration_ms histogram", response.content.decode())
+
+    def test_staff_allowed(self):
+        self.client.force_login(self.user)
+
+        self.assertEqual(self.client.get("/metrics/").status_code, 200)
+
+    @override_settings(METRICS_TOKEN="scrape-token")
+    def test_status_api_internals_share_the_gate(self):
+        """/api/status/ only shows internal metrics to metrics readers."""
+        internal = {"requests", "database_pool", "outbox", "platform_api"}
+
+        public = self.client.get("/api/status/").json()
+        scraper = self.client.get(
+            "/api/status/", HTTP_AUTHORIZATION="Bearer scrape-token"
+        ).json()
+        self.client.force_login(self.user)
+        staff = self.client.get("/api/status/").json()
+
+        self.assertEqual(public["status"], "healthy")
+        self.assertFalse(internal & public.keys())
+        self.assertTrue(internal <= scraper.keys())
+        self.assertTrue(internal <= staff.keys())
+
+
+class RequestStatsTest(SimpleTestCase):
+    """Test cache and template instrumentation."""
+
+    def setUp(self):
+        request_metrics.install()
+        self.stats = request_metrics.RequestStats()
+        self.token = request_metrics.activate(self.stats)
+        self.addCleanup(request_metrics.deactivate, self.token)
+
+    def test_cache_hits_and_misses_counted(self):
+        cache.set("metrics-test", "value")
+
+        cache.get("metrics-test")
+        cache.get("metrics-missing")
+        cache.get_many(["metrics-test", "metrics-missing"])
+
+        self.assertEqual((self.stats.cache_hits, self.stats.cache_misses), (2, 2))
+
+    def test_delegating_backend_counted_once(self):
+        """FailoverRedisCache calls an instrumented backend; count the outer call only."""
+        failover = FailoverRedisCache(
+            "redis://127.0.0.1:1/0",
+            {"OPTIONS": {"socket_connect_timeout": 0.2, "FAILOVER_RETRY_SECONDS": 60}},
+        )
+        failover.set("metrics-test", "value")
+        outer = patch.multiple(
+            FailoverRedisCache,
+            get=request_metrics._counted_get(FailoverRedisCache.get),
+            get_many=request_metrics._counted_get_many(FailoverRedisCache.get_many),
+        )
+        inner = patch.object(
+            type(failover.fallback),
+            "get",
+            request_metrics._counted_get(type(failover.fallback).get),
+        )
+
+        with outer, inner:
+            for _ in range(3):
+                failover.get("metrics-test")
+            failover.get_many(["metrics-test", "metrics-missing"])
+
+        self.assertEqual((self.stats.cache_hits, self.stats.cache_misses), (4, 1))
+
+    def test_nested_templates_timed_once(self):
+        """Includes don't double-count render time."""
+        from django.template import engines
+
+        template = engines["django"].from_string(
+            "{% include 'public_site/partials/form_error.html' %}"
+        )
+        with patch(
+            "public_site.utils.request_metrics.time.perf_counter", side_effect=[1.0, 1.25]
+        ):
+            template.render({})
+
+        self.assertEqual(self.stats.template_ms, 250.0)
+
+
+class ErrorReporterCaptureTest(SimpleTestCase):
+    """Test non-exception events on the reporter queue."""
+
+    def test_capture_sends_named_event(self):
+        client = Mock()
+        reporter = ErrorReporter(maxsize=10, client=client)
+
+        reporter.capture("anonymous", "slow_request", {"route": "api/status/"})
+        reporter.flush(timeout=5)
+
+        client.capture.assert_called_once_with(
+            "anonymous", "slow_request", {"route": "api/status/"}
+        )
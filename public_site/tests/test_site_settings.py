@@ -0,0 +1,91 @@
+"""
+Tests for the SiteConfiguration snapshot cache.
+"""
+
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+from wagtail.models import Locale, Page, Site
+
+from public_site.models import NavigationMenuItem, SiteConfiguration
+from public_site.services import site_settings
+
+
+class SiteConfigurationSnapshotTest(TestCase):
+    """Test single-query loading and version-key invalidation."""
+
+    @classmethod
+    def setUpTestData(cls):
+        Locale.objects.get_or_create(language_code="en")
+        root = Page.add_root(title="Root", slug="root")
+        cls.site = Site.objects.create(
+            hostname="localhost", root_page=root, is_default_site=True
+        )
+        cls.config = SiteConfiguration.objects.create(site=cls.site, company_name="EC")
+        NavigationMenuItem.objects.create(parent=cls.config, label="Blog", url="/blog/", sort_order=1)
+        NavigationMenuItem.objects.create(parent=cls.config, label="About", url="/about/", sort_order=0)
+
+    def setUp(self):
+        cache.delete(site_settings.VERSION_KEY)
+        site_settings._snapshots.clear()
+
+    def get_config(self):
+        request = RequestFactory().get("/")
+        request._wagtail_site = self.site
+        return SiteConfiguration.for_request(request)
+
+    def test_loads_config_and_menu_in_one_query(self):
+        with self.assertNumQueries(1):
+            config = self.get_config()
+            labels = [item.label for item in config.nav_items.all()]
+
+        self.assertEqual(config.company_name, "EC")
+        self.assertEqual(labels, ["About", "Blog"])
+
+    def test_repeat_requests_served_from_snapshot(self):
+        self.get_config()
+
+        with self.assertNumQueries(0):
+            config = self.get_config()
+            self.assertEqual(len(config.nav_items.all()), 2)
+
+    def test_each_request_gets_its_own_instance(self):
+        self.assertIsNot(self.get_config(), self.get_config())
+
+    def test_save_invalidates_after_commit(self):
+        self.get_config()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            NavigationMenuItem.objects.create(
+                parent=self.config, label="FAQ", url="/faq/", sort_order=2
+            )
+
+        labels = [item.label for item in self.get_config().nav_items.all()]
+        self.assertEqual(labels, ["About", "Blog", "FAQ"])
+
+    def test_version_change_from_another_worker_reloads(self):
+        self.get_config()
+        SiteConfiguration.objects.filter(pk=self.config.pk).update(company_name="Changed")
+
+        self.assertEqual(self.get_config().company_name, "EC")
+        cache.set(site_settings.VERSION_KEY, "bumped-elsewhere", None)
+        self.assertEqual(self.get_config().company_name, "Changed")
+
+    def test_no_snapshots_while_on_local_fallback_cache(self):
+        # A per-process cache can't carry version bumps to other workers
+        with patch.object(site_settings, "shared_cache_available", return_value=False):
+            for _ in range(2):
+                with self.assertNumQueries(1):
+                    self.get_config()
+
+        self.assertEqual(site_settings._snapshots, {})
+
+    def test_missing_configuration_created_with_defaults(self):
+        SiteConfiguration.objects.all().delete()
+
+        config = self.get_config()
+
+        self.assertEqual(config.company_name, "Ethical Capital")
+        self.assertEqual(list(config.nav_items.all()), [])
+        self.assertTrue(SiteConfiguration.objects.filter(site=self.site).exists())
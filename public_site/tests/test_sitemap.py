@@ -0,0 +1,93 @@
+"""
+Tests for the precomputed, sharded sitemap.
+"""
+
+import gzip
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from wagtail.models import Locale, Page, Site
+
+from public_site.models import BlogIndexPage
+from public_site.services import sitemap
+
+
+class SitemapTest(TestCase):
+    """Test building, storing and serving sitemap documents."""
+
+    @classmethod
+    def setUpTestData(cls):
+        Locale.objects.get_or_create(language_code="en")
+        cls.root = Page.add_root(title="Root", slug="root")
+        Site.objects.create(hostname="testserver", root_page=cls.root, is_default_site=True)
+        cls.about = cls.root.add_child(instance=Page(title="About", slug="about"))
+        cls.blog = cls.root.add_child(instance=BlogIndexPage(title="Blog", slug="blog"))
+        cls.root.add_child(instance=Page(title="Draft", slug="draft", live=False))
+        cls.blog.save_revision().publish()
+
+    def setUp(self):
+        cache.clear()
+
+    def get(self, path="/sitemap.xml", **headers):
+        return self.client.get(path, HTTP_ACCEPT_ENCODING="gzip", **headers)
+
+    def test_urlset_served_gzipped_with_etag(self):
+        response = self.get()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        xml = gzip.decompress(response.content).decode()
+        self.assertIn("<urlset", xml)
+        self.assertIn("<loc>http://testserver/about/</loc>", xml)
+        self.assertIn("<priority>0.8</priority>", xml)
+        self.assertIn("<lastmod>", xml)
+        self.assertNotIn("/draft/", xml)
+
+    def test_plain_xml_without_gzip(self):
+        response = self.client.get("/sitemap.xml")
+
+        self.assertNotIn("Content-Encoding", response)
+        self.assertIn(b"<urlset", response.content)
+
+    def test_matching_etag_gets_304(self):
+        etag = self.get()["ETag"]
+
+        response = self.get(HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_stored_artifact_reused(self):
+        self.get()
+
+        with patch.object(sitemap, "collect_entries", side_effect=AssertionError("rebuilt")):
+            self.assertEqual(self.get().status_code, 200)
+
+    def test_not_stored_while_on_local_fallback_cache(self):
+        with patch.object(sitemap, "shared_cache_available", return_value=False):
+            self.assertEqual(self.get().status_code, 200)
+
+        self.assertIsNone(cache.get(sitemap.CACHE_KEY.format(site_id=Site.objects.get().pk)))
+
+    @override_settings(SITEMAP_SHARD_THRESHOLD=1)
+    def test_index_with_section_shards(self):
+        index = gzip.decompress(self.get().content).decode()
+
+        self.assertIn("<sitemapindex", index)
+        self.assertIn("<loc>http://testserver/sitemap-blog.xml</loc>", index)
+        blog = gzip.decompress(self.get("/sitemap-blog.xml").content).decode()
+        self.assertIn("/blog/", blog)
+        self.assertNotIn("/about/", blog)
+        self.assertEqual(self.get("/sitemap-nope.xml").status_code, 404)
+
+    def test_publish_rebuilds_on_next_request(self):
+        self.get()
+        self.about.title = "About us"
+        self.about.slug = "about-us"
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.about.save_revision().publish()
+
+        self.assertIsNone(cache.get(sitemap.CACHE_KEY.format(site_id=Site.objects.get().pk)))
+        self.assertIn(b"/about-us/", gzip.decompress(self.get().content))
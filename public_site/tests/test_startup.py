@@ -0,0 +1,232 @@
+"""
+Tests for import-time-safe cache selection, lazily loaded views, preload
+warm-up and the startup and memory profilers.
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+from unittest.mock import patch
+
+from django.db.utils import ConnectionHandler
+from django.test import SimpleTestCase
+
+from ethicic import database_config, prefork
+from ethicic.cache_backends import DeferredInvalidation, FailoverRedisCache
+from public_site import views
+from public_site.management.commands.memory_footprint import (
+    is_gunicorn,
+    parse_smaps_rollup,
+    summarize,
+)
+from public_site.management.commands.profile_startup import (
+    parse_importtime,
+    parse_max_rss_mb,
+    summarize_packages,
+)
+
+
+class FailoverRedisCacheTest(SimpleTestCase):
+    """Redis is contacted lazily and an outage degrades to a local cache."""
+
+    def make_cache(self):
+        # Nothing listens on port 1, so connecting fails immediately
+        return FailoverRedisCache(
+            "redis://127.0.0.1:1/0",
+            {"OPTIONS": {"socket_connect_timeout": 0.2, "FAILOVER_RETRY_SECONDS": 60}},
+        )
+
+    def test_construction_does_not_connect(self):
+        with patch("redis.connection.Connection.connect") as mock_connect:
+            self.make_cache()
+
+        mock_connect.assert_not_called()
+
+    def test_unreachable_redis_falls_back_to_local_cache(self):
+        cache = self.make_cache()
+
+        cache.set("key", "value")
+
+        self.assertTrue(cache.using_fallback)
+        self.assertEqual(cache.get("key"), "value")
+        self.assertEqual(cache.get_many(["key", "missing"]), {"key": "value"})
+
+    def test_retries_redis_after_cooldown(self):
+        cache = self.make_cache()
+        cache.get("key")
+
+        cache.retry_after = 0
+        with patch("django.core.cache.backends.redis.RedisCache.get", return_value="remote") as mock_get:
+            self.assertEqual(cache.get("key"), "remote")
+
+        mock_get.assert_called_once()
+
+    def test_failover_option_not_passed_to_redis_pool(self):
+        self.assertNotIn("FAILOVER_RETRY_SECONDS", self.make_cache()._options)
+
+    def test_invalidation_during_outage_replayed_after_recovery(self):
+        cache = self.make_cache()
+        cache.get("key")
+        calls = []
+        invalidate = DeferredInvalidation(cache, lambda: calls.append(cache.using_fallback))
+
+        invalidate()
+        invalidate.flush()
+        self.assertEqual(calls, [True])
+
+        cache.retry_after = 0
+        with patch("django.core.cache.backends.redis.RedisCache.get", return_value=None):
+            cache.get("key")
+        invalidate.flush()
+        invalidate.flush()
+        self.assertEqual(calls, [True, False])
+
+
+class LazyViewsTest(SimpleTestCase):
+    """View areas are imported on first access, not with the package."""
+
+    def test_package_import_loads_no_view_modules(self):
+        script = (
+            "import django, sys; django.setup(); import public_site.views; "
+            "print(sorted(m for m in sys.modules if m.startswith('public_site.views.')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        )
+
+        self.assertEqual(result.stdout.strip().splitlines()[-1], "[]")
+
+    def test_attribute_resolves_to_area_module(self):
+        from public_site.views import search
+
+        self.assertIs(views.site_search, search.site_search)
+
+    def test_unknown_attribute_raises(self):
+        with self.assertRaises(AttributeError):
+            views.not_a_view
+
+
+class ImportTimeParsingTest(SimpleTestCase):
+    """Test parsing of ``python -X importtime`` output."""
+
+    OUTPUT = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       120 |        120 |     django.utils",
+            "import time:      2500 |       2620 |   django.conf",
+            "import time:      1000 |       1000 | public_site.views",
+            "Traceback noise",
+        ]
+    )
+
+    def test_rows_in_milliseconds_with_depth(self):
+        modules = parse_importtime(self.OUTPUT)
+
+        self.assertEqual([row["module"] for row in modules], ["django.utils", "django.conf", "public_site.views"])
+        self.assertEqual(modules[1]["cumulative_ms"], 2.62)
+        self.assertEqual([row["depth"] for row in modules], [2, 1, 0])
+
+    def test_package_totals_use_self_time(self):
+        packages = summarize_packages(parse_importtime(self.OUTPUT))
+
+        self.assertEqual(list(packages), ["django", "public_site"])
+        self.assertAlmostEqual(packages["django"], 2.62)
+
+    def test_max_rss_from_last_stdout_line(self):
+        with patch("sys.platform", "linux"):
+            self.assertEqual(parse_max_rss_mb("startup noise\n204800\n"), 200.0)
+        self.assertIsNone(parse_max_rss_mb("Traceback"))
+
+
+class PreforkTest(SimpleTestCase):
+    """Test the gunicorn preload hooks."""
+
+    def test_warm_up_compiles_templates_into_cached_loader(self):
+        from django.template import engines
+
+        stats = prefork.warm_up()
+
+        self.assertEqual(stats["views"], len(views.__all__))
+        self.assertGreater(stats["templates"], 0)
+        cached_loader = engines["django"].engine.template_loaders[0]
+        self.assertTrue(any("base_tailwind.html" in key for key in cached_loader.get_template_cache))
+
+    def test_before_fork_closes_connections_and_freezes_gc(self):
+        with (
+            patch("django.db.connections.close_all") as mock_close_all,
+            patch("gc.freeze") as mock_freeze,
+        ):
+            prefork.before_fork()
+
+        mock_close_all.assert_called_once()
+        mock_freeze.assert_called_once()
+
+    @unittest.skipUnless(
+        database_config._psycopg_pool_available(), "psycopg[pool] is not installed"
+    )
+    def test_before_fork_shuts_down_psycopg_pool(self):
+        """Workers must not inherit the master's pool, sockets or threads."""
+        with patch.dict(os.environ, {"DB_POOL_MIN_SIZE": "0"}):
+            config = database_config.apply_connection_pooling(
+                {"ENGINE": "django.db.backends.postgresql", "NAME": "public_site"},
+                mode="psycopg",
+            )
+        handler = ConnectionHandler(
+            {"default": {"ENGINE": "django.db.backends.dummy"}, "pooled": config}
+        )
+        connection = handler["pooled"]
+        pool = connection.pool
+        pool.open()
+        self.addCleanup(pool.close)
+        self.assertFalse(pool.closed)
+
+        with (
+            patch("django.db.connections.all", return_value=[connection]),
+            patch("django.db.connections.close_all"),
+            patch("gc.freeze"),
+        ):
+            prefork.before_fork()
+
+        self.assertTrue(pool.closed)
+        self.assertNotIn("pooled", type(connection)._connection_pools)
+
+
+class MemoryFootprintTest(SimpleTestCase):
+    """Test parsing of /proc memory accounting."""
+
+    SMAPS_ROLLUP = "\n".join(
+        [
+            "55d0c0000000-7ffd00000000 ---p 00000000 00:00 0    [rollup]",
+            "Rss:              102400 kB",
+            "Pss:               40960 kB",
+            "Shared_Clean:      81920 kB",
+            "Shared_Dirty:       2048 kB",
+            "Private_Clean:      1024 kB",
+            "Private_Dirty:     17408 kB",
+        ]
+    )
+
+    def test_parse_smaps_rollup_in_megabytes_with_uss(self):
+        usage = parse_smaps_rollup(self.SMAPS_ROLLUP)
+
+        self.assertEqual(usage["rss"], 100.0)
+        self.assertEqual(usage["pss"], 40.0)
+        self.assertEqual(usage["uss"], 18.0)
+
+    def test_summary_averages_workers_only(self):
+        processes = [
+            {"role": "master", "rss": 120.0, "pss": 45.0, "uss": 15.0},
+            {"role": "worker", "rss": 100.0, "pss": 40.0, "uss": 18.0},
+            {"role": "worker", "rss": 100.0, "pss": 38.0, "uss": 16.0},
+        ]
+
+        summary = summarize(processes)
+
+        self.assertEqual(summary["total_uss"], 49.0)
+        self.assertEqual(summary["worker_uss"], 17.0)
+
+    def test_is_gunicorn(self):
+        self.assertTrue(is_gunicorn(["/usr/bin/gunicorn", "ethicic.wsgi:application"]))
+        self.assertTrue(is_gunicorn(["python3.11", "/venv/bin/gunicorn", "--preload"]))
+        self.assertFalse(is_gunicorn(["timeout", "40", "gunicorn"]))
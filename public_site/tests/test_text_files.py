@@ -0,0 +1,129 @@
+"""
+Tests for the in-memory robots.txt / llms.txt / carbon.txt endpoints.
+"""
+
+import gzip
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.http import Http404
+from django.test import RequestFactory, TestCase, override_settings
+from wagtail.models import Locale, Page, Site
+
+from public_site.models import EncyclopediaEntry, EncyclopediaIndexPage
+from public_site.services import text_files
+
+
+class TextFilesTest(TestCase):
+    """Test preloading, conditional and compressed responses."""
+
+    def setUp(self):
+        base_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, base_dir, ignore_errors=True)
+        os.mkdir(os.path.join(base_dir, "static"))
+        for name in text_files.CONTENT_TYPES:
+            self.write(base_dir, name, f"# {name}\n")
+        override = override_settings(BASE_DIR=base_dir)
+        override.enable()
+        self.addCleanup(override.disable)
+        self.base_dir = base_dir
+
+        cache.clear()
+        text_files.preload()
+        self.addCleanup(text_files._files.clear)
+
+    def write(self, base_dir, name, content, mtime=None):
+        path = os.path.join(base_dir, "static", name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+
+    def test_served_from_memory(self):
+        with patch("builtins.open", side_effect=AssertionError("read from disk")):
+            response = self.client.get("/robots.txt")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b"# robots.txt\n")
+        self.assertEqual(response["Cache-Control"], "max-age=86400")
+        self.assertIn("Last-Modified", response)
+
+    def test_gzip_variant_and_etag_revalidation(self):
+        response = self.client.get("/carbon.txt", HTTP_ACCEPT_ENCODING="gzip")
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(response.content), b"# carbon.txt\n")
+        revalidated = self.client.get("/carbon.txt", HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(revalidated.status_code, 304)
+
+    def test_missing_file_is_404(self):
+        os.remove(os.path.join(self.base_dir, "static", "llms.txt"))
+        text_files.preload()
+
+        with self.assertRaises(Http404):
+            text_files.serve(RequestFactory().get("/llms.txt"), "llms.txt")
+
+    @override_settings(DEBUG=True)
+    def test_debug_reloads_changed_file(self):
+        self.write(self.base_dir, "robots.txt", "User-agent: *\n", mtime=1)
+
+        self.assertEqual(self.client.get("/robots.txt").content, b"User-agent: *\n")
+
+    def test_without_debug_keeps_loaded_copy(self):
+        self.write(self.base_dir, "robots.txt", "User-agent: *\n", mtime=1)
+
+        self.assertEqual(self.client.get("/robots.txt").content, b"# robots.txt\n")
+
+
+@override_settings(LLMS_TXT_AUTOGENERATE=True)
+class GeneratedLlmsTxtTest(TestCase):
+    """Test llms.txt generation from live pages."""
+
+    @classmethod
+    def setUpTestData(cls):
+        Locale.objects.get_or_create(language_code="en")
+        root = Page.add_root(title="Root", slug="root")
+        Site.objects.create(hostname="testserver", root_page=root, is_default_site=True)
+        cls.index = root.add_child(
+            instance=EncyclopediaIndexPage(title="Encyclopedia", slug="encyclopedia")
+        )
+        cls.index.add_child(
+            instance=EncyclopediaEntry(
+                title="Negative Screening",
+                slug="negative-screening",
+                summary="Excluding  companies\nby criteria.",
+                detailed_content="<p>Details</p>",
+            )
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_lists_live_pages_after_static_content(self):
+        body = self.client.get("/llms.txt").content.decode()
+
+        self.assertIn("### Encyclopedia", body)
+        self.assertIn(
+            "- [Negative Screening](http://testserver/encyclopedia/negative-screening/): "
+            "Excluding companies by criteria.",
+            body,
+        )
+        self.assertTrue(body.startswith(text_files.get_static("llms.txt").body.decode().rstrip()))
+
+    def test_publish_regenerates(self):
+        self.client.get("/llms.txt")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.index.add_child(
+                instance=EncyclopediaEntry(
+                    title="Proxy Voting",
+                    slug="proxy-voting",
+                    summary="Voting shares.",
+                    detailed_content="<p>Details</p>",
+                )
+            ).save_revision().publish()
+
+        self.assertIn(b"Proxy Voting", self.client.get("/llms.txt").content)
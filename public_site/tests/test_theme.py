@@ -0,0 +1,78 @@
+"""
+Tests for the cookie-based theme preference.
+"""
+
+import json
+
+from django.conf import settings
+from django.contrib.sessions.models import Session
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+from wagtail.models import Locale, Page, Site
+
+from public_site.context_processors import theme_context
+from public_site.utils import theme
+
+
+class ThemeCookieTest(TestCase):
+    """Theme choice lives in a signed cookie, never in the session."""
+
+    @classmethod
+    def setUpTestData(cls):
+        # The base template's navigation needs a default site
+        Locale.objects.get_or_create(language_code="en")
+        root = Page.add_root(title="Root", slug="root")
+        Site.objects.create(hostname="localhost", root_page=root, is_default_site=True)
+
+    def set_theme(self, value):
+        return self.client.post(
+            reverse("public_site:api_theme"),
+            data=json.dumps({"theme": value}),
+            content_type="application/json",
+        )
+
+    def test_theme_api_sets_signed_cookie_without_session(self):
+        response = self.set_theme("light")
+
+        self.assertEqual(response.status_code, 200)
+        cookie = response.cookies[theme.cookie_name()]
+        self.assertTrue(cookie.value.startswith("light:"))
+        self.assertFalse(cookie["httponly"])
+        self.assertNotIn(settings.SESSION_COOKIE_NAME, response.cookies)
+        self.assertFalse(Session.objects.exists())
+
+    def test_theme_api_rejects_unknown_theme(self):
+        response = self.set_theme("neon")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertNotIn(theme.cookie_name(), response.cookies)
+
+    def test_get_theme_reads_cookie_and_rejects_tampering(self):
+        self.set_theme("light")
+        request = RequestFactory().get("/")
+        request.COOKIES = {k: v.value for k, v in self.client.cookies.items()}
+
+        self.assertEqual(theme.get_theme(request), "light")
+
+        request.COOKIES[theme.cookie_name()] = "light:forged"
+        self.assertEqual(theme.get_theme(request), theme.DEFAULT_THEME)
+
+    def test_anonymous_page_is_session_free(self):
+        response = self.client.get(reverse("public_site:test_form"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.wsgi_request.session.accessed)
+        self.assertNotIn(settings.SESSION_COOKIE_NAME, response.cookies)
+        # Pre-paint script that applies the cookie client-side
+        self.assertContains(response, f'var name = "{theme.cookie_name()}"')
+
+    def test_rendered_html_independent_of_theme_cookie(self):
+        self.set_theme("light")
+        response = self.client.get(reverse("public_site:test_form"))
+
+        self.assertContains(response, f'data-theme="{theme.DEFAULT_THEME}"')
+
+    def test_context_processor_is_constant(self):
+        request = RequestFactory().get("/")
+
+        self.assertEqual(theme_context(request)["current_theme"], theme.DEFAULT_THEME)
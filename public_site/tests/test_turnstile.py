@@ -0,0 +1,98 @@
+"""
+Tests for the shared Turnstile verifier.
+"""
+
+from unittest.mock import Mock
+
+import requests
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from public_site.services.turnstile import (
+    LocalTurnstileVerifier,
+    TurnstileVerifier,
+    get_turnstile_verifier,
+)
+
+
+class TurnstileVerifierTest(SimpleTestCase):
+    """Test verdict caching, outages and metrics."""
+
+    def setUp(self):
+        cache.clear()
+        self.verifier = TurnstileVerifier()
+        self.verifier._session = Mock()
+        self.response = self.verifier._session.post.return_value
+        self.response.json.return_value = {"success": True}
+
+    def test_verdict_cached_per_token(self):
+        """A double-submitted token is verified with Cloudflare only once."""
+        first = self.verifier.verify("token-1", "1.2.3.4")
+        second = self.verifier.verify("token-1", "1.2.3.4")
+
+        self.assertTrue(first.success)
+        self.assertTrue(second.success)
+        self.assertTrue(second.cached)
+        self.verifier._session.post.assert_called_once()
+
+    def test_failure_reports_error_codes(self):
+        """Rejected tokens carry Cloudflare's error codes."""
+        self.response.json.return_value = {
+            "success": False,
+            "error-codes": ["invalid-input-response"],
+        }
+
+        result = self.verifier.verify("bad-token")
+
+        self.assertFalse(result.success)
+        self.assertFalse(result.unavailable)
+        self.assertEqual(result.error_codes, ("invalid-input-response",))
+
+    def test_network_error_is_unavailable_and_not_cached(self):
+        """Outages are reported as unavailable and retried on the next call."""
+        self.verifier._session.post.side_effect = requests.Timeout()
+
+        result = self.verifier.verify("token-2")
+        self.verifier.verify("token-2")
+
+        self.assertTrue(result.unavailable)
+        self.assertEqual(self.verifier._session.post.call_count, 2)
+
+    def test_malformed_response_fails_closed(self):
+        """Only network errors count as unavailable; bad JSON is a failure."""
+        self.response.json.side_effect = requests.JSONDecodeError("Expecting value", "<html>", 0)
+
+        result = self.verifier.verify("token-4")
+
+        self.assertFalse(result.success)
+        self.assertFalse(result.unavailable)
+
+    def test_metrics_record_outcomes(self):
+        """Latency is recorded per outcome alongside cache hits."""
+        self.verifier.verify("token-3")
+        self.verifier.verify("token-3")
+
+        metrics = self.verifier.get_metrics()
+
+        self.assertEqual(metrics["counts"], {"success": 1, "cache_hits": 1})
+        self.assertEqual(metrics["latency_ms"]["success"]["count"], 1)
+        self.assertEqual(metrics["failure_rate"], 0.0)
+
+
+@override_settings(
+    TURNSTILE_VERIFIER="public_site.services.turnstile.LocalTurnstileVerifier"
+)
+class LocalTurnstileVerifierTest(SimpleTestCase):
+    """Test the offline stand-in verifier."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_configured_by_setting(self):
+        """TURNSTILE_VERIFIER selects the local verifier."""
+        verifier = get_turnstile_verifier()
+
+        self.assertIsInstance(verifier, LocalTurnstileVerifier)
+        self.assertTrue(verifier.verify("any-token").success)
+        self.assertFalse(verifier.verify("fail-token").success)
+        self.assertTrue(verifier.verify("unavailable-token").unavailable)
@@ -98,23 +98,20 @@ class ContactFormViewTest(BasePublicSiteTestCase, FormTestMixin):
         call_args = mock_requests.post.call_args
         self.assertIn("contact/submit/", call_args[0][0])
 
-    @patch("public_site.views.send_fallback_email")
-    @patch("public_site.views.requests")
-    def test_contact_form_fallback_email(self, mock_requests, mock_send_email):
-        """Test fallback email when API fails."""
-        # Mock failed API response
-        mock_requests.post.side_effect = Exception("API Error")
-
+    @override_settings(OUTBOX_DISPATCH_ON_COMMIT=False)
+    def test_contact_form_queues_platform_delivery(self):
+        """Test platform delivery is queued in the outbox, not called inline."""
         data = self.create_test_contact_data()
 
-        with self.settings(MAIN_PLATFORM_API_URL="http://api.example.com/"):
-            response = self.submit_form("/contact/submit/", data, follow=False)
+        response = self.submit_form("/contact/submit/", data, follow=False)
 
-        # Should call fallback email
-        mock_send_email.assert_called_once()
+        self.assert_redirect(response, "/contact/")
 
-        # Should still create local ticket
-        self.assertEqual(SupportTicket.objects.count(), 1)
+        # Local ticket and its outbox message are committed together
+        ticket = SupportTicket.objects.get()
+        message = ticket.outbox_messages.get()
+        self.assertEqual(message.message_type, "contact")
+        self.assertEqual(message.status, "pending")
 
 
 @override_settings(TESTING=True)
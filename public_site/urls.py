@@ -16,6 +16,7 @@ from .views import (
     contact_api,
     newsletter_api,
     site_status_api,
+    metrics_view,
     media_items_api,
     garden_overview,
     garden_interest_registration,
@@ -67,6 +68,8 @@ urlpatterns = [
     path("api/newsletter/", newsletter_api, name="api_newsletter"),
     # Site status and health check API
     path("api/status/", site_status_api, name="api_status"),
+    # Per-route request metrics (Prometheus text format)
+    path("metrics/", metrics_view, name="metrics"),
     # Media items API for infinite scroll
     path("api/media-items/", media_items_api, name="api_media_items"),
     # Performance chart data API
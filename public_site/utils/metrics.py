@@ -0,0 +1,123 @@
+"""
+Lightweight in-process metrics for monitoring endpoints.
+Thread-safe latency histograms, kept per worker process.
+"""
+
+import threading
+from bisect import bisect_left
+
+# Upper bounds in milliseconds, Prometheus-style (cumulative on export)
+DEFAULT_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+class Histogram:
+    """Fixed-bucket histogram of observed values (milliseconds by default)."""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS_MS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    def snapshot(self) -> dict:
+        """Return count, sum, mean, approximate p50/p95 and cumulative buckets."""
+        with self._lock:
+            counts = list(self._counts)
+            total = self._count
+            value_sum = self._sum
+
+        cumulative = {}
+        running = 0
+        for bound, count in zip((*self.buckets, "+Inf"), counts, strict=True):
+            running += count
+            cumulative[str(bound)] = running
+
+        return {
+            "count": total,
+            "sum": round(value_sum, 2),
+            "mean": round(value_sum / total, 2) if total else 0.0,
+            "p50": self._quantile(counts, total, 0.50),
+            "p95": self._quantile(counts, total, 0.95),
+            "buckets": cumulative,
+        }
+
+    def _quantile(self, counts, total, q):
+        """Upper bound of the bucket containing the q-th observation."""
+        if not total:
+            return 0.0
+        target = q * total
+        running = 0
+        for index, count in enumerate(counts):
+            running += count
+            if running >= target:
+                return float(self.buckets[index]) if index < len(self.buckets) else float("inf")
+        return float("inf")
+
+
+class LabeledHistograms:
+    """A family of histograms keyed by a label such as an endpoint or route."""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS_MS):
+        self.buckets = buckets
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def observe(self, label: str, value: float) -> None:
+        histogram = self._histograms.get(label)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(label, Histogram(self.buckets))
+        histogram.observe(value)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            items = list(self._histograms.items())
+        return {label: histogram.snapshot() for label, histogram in sorted(items)}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+
+def _escape_label(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(label: str, label_value, const_labels) -> str:
+    pairs = [(label, label_value), *(const_labels or {}).items()]
+    return ",".join(f'{key}="{_escape_label(value)}"' for key, value in pairs)
+
+
+def prometheus_histogram(
+    name: str, help_text: str, snapshots: dict, label: str, const_labels=None
+) -> list[str]:
+    """Render LabeledHistograms.snapshot() in the Prometheus text format.
+
+    ``const_labels`` are added to every series (e.g. the worker pid).
+    """
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    for label_value, snapshot in snapshots.items():
+        labels = _labels(label, label_value, const_labels)
+        for bound, count in snapshot["buckets"].items():
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+        lines.append(f"{name}_sum{{{labels}}} {snapshot['sum']}")
+        lines.append(f"{name}_count{{{labels}}} {snapshot['count']}")
+    return lines
+
+
+def prometheus_counter(
+    name: str, help_text: str, values: dict, label: str, const_labels=None
+) -> list[str]:
+    """Render a {label value: count} mapping in the Prometheus text format."""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+    for label_value, value in sorted(values.items()):
+        lines.append(f"{name}{{{_labels(label, label_value, const_labels)}}} {value}")
+    return lines
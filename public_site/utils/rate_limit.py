@@ -0,0 +1,240 @@
+"""
+Sliding-window rate limiting for public form and API endpoints.
+
+Each scope (contact, newsletter, ...) allows ``limit`` requests per client
+IP in a rolling ``window`` of seconds. The rolling count is approximated
+from the current and previous fixed windows, weighted by how far into the
+current window we are, so only two counters are stored per client.
+
+On Redis the check-and-increment is a single Lua script (one round trip,
+atomic across workers). Other backends (LocMem in development) use the
+same algorithm under a process lock, which is atomic for the process-local
+cache they provide. While a FailoverRedisCache is on its local fallback,
+limits are counted there (per worker) rather than waiting on Redis.
+
+Clients are identified by the IP the proxy in front of the app saw (see
+get_client_ip), not by the spoofable first X-Forwarded-For entry.
+
+Usage:
+    @rate_limit("newsletter")
+    def newsletter_api(request): ...
+"""
+
+import functools
+import logging
+import threading
+import time
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import JsonResponse
+from django.shortcuts import render
+
+try:
+    from django.core.cache.backends.redis import RedisCache
+except ImportError:
+    RedisCache = None
+
+logger = logging.getLogger(__name__)
+
+# scope: (requests allowed, window in seconds); override with RATE_LIMITS
+DEFAULT_RATE_LIMITS = {
+    "contact": (3, 3600),
+    "newsletter": (5, 3600),
+    "onboarding": (3, 3600),
+    "validate_email": (30, 60),
+    "search": (60, 60),
+}
+
+# KEYS[1] = current window, KEYS[2] = previous window
+# ARGV[1] = limit, ARGV[2] = previous window weight, ARGV[3] = key TTL
+SLIDING_WINDOW_LUA = """
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+if current + previous * tonumber(ARGV[2]) >= tonumber(ARGV[1]) then
+    return {0, current, previous}
+end
+current = redis.call('INCR', KEYS[1])
+if current == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[3])
+end
+return {1, current, previous}
+"""
+
+
+class RateLimitResult(NamedTuple):
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: int
+
+
+class SlidingWindowRateLimiter:
+    """Per-client sliding-window counter stored in a Django cache."""
+
+    key_prefix = "ratelimit"
+
+    def __init__(self, alias: str = "default"):
+        self.alias = alias
+        self._lock = threading.Lock()
+        self._scripts = {}
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def hit(self, scope: str, identifier: str, limit: int, window: int):
+        """Count one request and report whether it is allowed."""
+        now = time.time()
+        window_index = int(now // window)
+        elapsed = now - window_index * window
+        weight = 1 - elapsed / window
+        current_key = f"{self.key_prefix}:{scope}:{identifier}:{window_index}"
+        previous_key = f"{self.key_prefix}:{scope}:{identifier}:{window_index - 1}"
+
+        try:
+            allowed, current, previous = self._hit(
+                current_key, previous_key, limit, weight, window
+            )
+        except Exception as e:
+            # Never turn a cache outage into a site outage
+            logger.warning(f"Rate limit check failed for {scope}: {e}")
+            return RateLimitResult(True, limit, limit, 0)
+
+        used = current + previous * weight
+        return RateLimitResult(
+            allowed=allowed,
+            limit=limit,
+            remaining=max(0, int(limit - used)),
+            retry_after=0 if allowed else int(window - elapsed) + 1,
+        )
+
+    def _hit(self, current_key, previous_key, limit, weight, window):
+        cache = self.cache
+        args = (current_key, previous_key, limit, weight, window)
+        if getattr(cache, "using_fallback", False):
+            # Redis is known to be down; don't wait on its connect timeout
+            return self._hit_local(cache.fallback, *args)
+        if RedisCache is None or not isinstance(cache, RedisCache):
+            return self._hit_local(cache, *args)
+        try:
+            return self._hit_redis(cache, *args)
+        except getattr(cache, "unavailable_errors", ()) as e:
+            cache.fail_over(e)
+            return self._hit_local(cache.fallback, *args)
+
+    def _hit_redis(self, cache, current_key, previous_key, limit, weight, window):
+        keys = [cache.make_and_validate_key(current_key)]
+        keys.append(cache.make_and_validate_key(previous_key))
+        client = cache._cache.get_client(keys[0], write=True)
+
+        script = self._scripts.get(id(client))
+        if script is None:
+            script = self._scripts[id(client)] = client.register_script(
+                SLIDING_WINDOW_LUA
+            )
+
+        allowed, current, previous = script(
+            keys=keys, args=[limit, weight, window * 2]
+        )
+        return bool(allowed), int(current), int(previous)
+
+    def _hit_local(self, cache, current_key, previous_key, limit, weight, window):
+        with self._lock:
+            counts = cache.get_many([current_key, previous_key])
+            current = counts.get(current_key, 0)
+            previous = counts.get(previous_key, 0)
+            if current + previous * weight >= limit:
+                return False, current, previous
+            cache.set(current_key, current + 1, window * 2)
+        return True, current + 1, previous
+
+
+_limiter = None
+
+
+def get_rate_limiter() -> SlidingWindowRateLimiter:
+    global _limiter
+    if _limiter is None:
+        _limiter = SlidingWindowRateLimiter(
+            getattr(settings, "RATE_LIMIT_CACHE_ALIAS", "default")
+        )
+    return _limiter
+
+
+def get_rate_limit(scope: str) -> tuple[int, int]:
+    """Return (limit, window seconds) for a scope, honouring RATE_LIMITS."""
+    overrides = getattr(settings, "RATE_LIMITS", None) or {}
+    return overrides.get(scope, DEFAULT_RATE_LIMITS[scope])
+
+
+def get_client_ip(request) -> str:
+    """
+    Get the client's IP address as seen by our own proxies.
+
+    RATE_LIMIT_CLIENT_IP_HEADER (e.g. ``CF-Connecting-IP``) names a header
+    the platform's edge sets, overwriting anything the client sent.
+    Otherwise each of the RATE_LIMIT_TRUSTED_PROXIES proxies appends the
+    address it received from to X-Forwarded-For, so the client is the entry
+    that many places from the end; entries before it are client-supplied.
+    """
+    header = getattr(settings, "RATE_LIMIT_CLIENT_IP_HEADER", "")
+    if header:
+        value = request.headers.get(header, "").strip()
+        if value:
+            return value
+
+    trusted_proxies = getattr(settings, "RATE_LIMIT_TRUSTED_PROXIES", 1)
+    x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
+    if x_forwarded_for and trusted_proxies > 0:
+        hops = [hop.strip() for hop in x_forwarded_for.split(",") if hop.strip()]
+        if hops:
+            return hops[-min(trusted_proxies, len(hops))]
+    return request.META.get("REMOTE_ADDR", "")
+
+
+def check_rate_limit(request, scope: str) -> RateLimitResult:
+    """Count a request from this client against ``scope``."""
+    limit, window = get_rate_limit(scope)
+    if not getattr(settings, "RATE_LIMIT_ENABLED", True):
+        return RateLimitResult(True, limit, limit, 0)
+    return get_rate_limiter().hit(scope, get_client_ip(request), limit, window)
+
+
+def rate_limit(scope: str):
+    """
+    Reject requests over the scope's limit with a 429 before the view runs.
+
+    Apply outermost so the check happens before any body or form parsing.
+    """
+
+    def decorator(view_func):
+        @functools.wraps(view_func)
+        def wrapped(request, *args, **kwargs):
+            result = check_rate_limit(request, scope)
+            if not result.allowed:
+                logger.info(
+                    f"Rate limited {scope} request from {get_client_ip(request)}"
+                )
+                return _rate_limited_response(request, result)
+            return view_func(request, *args, **kwargs)
+
+        return wrapped
+
+    return decorator
+
+
+def _rate_limited_response(request, result: RateLimitResult):
+    message = "Too many requests. Please try again later or contact us directly."
+    if request.headers.get("HX-Request") == "true":
+        response = render(
+            request,
+            "public_site/partials/form_error.html",
+            {"message": message},
+            status=429,
+        )
+    else:
+        response = JsonResponse({"success": False, "message": message}, status=429)
+    response["Retry-After"] = str(result.retry_after)
+    return response
@@ -0,0 +1,263 @@
+"""
+Per-request performance measurements, aggregated per route.
+
+RequestPerformanceMiddleware opens a RequestStats for each request and
+makes it current in a context variable. While it is current:
+
+- every database query on every connection adds to its query count/time
+  (via connection.execute_wrapper)
+- the outermost Template.render call adds to its template time
+- cache get/get_many calls on the configured backends count hits/misses
+  (only the outermost call, since FailoverRedisCache goes through the
+  instrumented RedisCache methods)
+
+Template and cache calls are instrumented by wrapping the methods once per
+process (install()); outside a measured request the wrappers only do a
+context-variable lookup.
+
+Finished requests are folded into per-route histograms, exposed in the
+Prometheus text format by render_prometheus(). They live in the worker
+process, so every series carries a ``pid`` label: a scrape sees whichever
+worker answers, and the label keeps workers' counters from being read as
+one counter jumping backwards. Aggregate with ``sum without (pid)``.
+"""
+
+import os
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+
+from .metrics import LabeledHistograms, prometheus_counter, prometheus_histogram
+
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+RESPONSE_BYTES_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+_current = ContextVar("request_stats", default=None)
+
+
+@dataclass
+class RequestStats:
+    """Measurements collected while handling one request."""
+
+    started: float = field(default_factory=time.perf_counter)
+    db_queries: int = 0
+    db_ms: float = 0.0
+    template_ms: float = 0.0
+    rendering: bool = False
+    counting_cache: bool = False
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def __call__(self, execute, sql, params, many, context):
+        """connection.execute_wrapper hook."""
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_queries += 1
+            self.db_ms += (time.perf_counter() - start) * 1000
+
+
+def activate(stats: RequestStats):
+    return _current.set(stats)
+
+
+def deactivate(token) -> None:
+    _current.reset(token)
+
+
+# --- Instrumentation -------------------------------------------------------
+
+_installed = False
+_install_lock = threading.Lock()
+
+
+def install() -> None:
+    """Wrap Template.render and the cache backends' get methods (once)."""
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        from django.conf import settings
+        from django.core.cache import caches
+        from django.core.cache.backends.base import BaseCache
+        from django.template.base import Template
+
+        Template.render = _timed_render(Template.render)
+
+        backends = set()
+        for alias in getattr(settings, "CACHES", {}):
+            try:
+                backends.add(type(caches[alias]))
+            except Exception:
+                continue  # Leave broken caches uninstrumented
+        for backend in backends:
+            backend.get = _counted_get(backend.get)
+            # The default get_many loops over get(), which is already counted
+            if backend.get_many is not BaseCache.get_many:
+                backend.get_many = _counted_get_many(backend.get_many)
+
+        _installed = True
+
+
+def _timed_render(render):
+    @wraps(render)
+    def wrapper(self, context):
+        stats = _current.get()
+        # Includes render through here too; only time the outermost template
+        if stats is None or stats.rendering:
+            return render(self, context)
+        stats.rendering = True
+        start = time.perf_counter()
+        try:
+            return render(self, context)
+        finally:
+            stats.rendering = False
+            stats.template_ms += (time.perf_counter() - start) * 1000
+
+    return wrapper
+
+
+def _counted_get(get):
+    if getattr(get, "_request_metrics", False):
+        return get
+
+    @wraps(get)
+    def wrapper(self, key, default=None, version=None):
+        stats = _current.get()
+        # A backend may delegate to another instrumented one; count once
+        if stats is None or stats.counting_cache:
+            return get(self, key, default, version)
+        stats.counting_cache = True
+        try:
+            value = get(self, key, default, version)
+        finally:
+            stats.counting_cache = False
+        if value is default:
+            stats.cache_misses += 1
+        else:
+            stats.cache_hits += 1
+        return value
+
+    wrapper._request_metrics = True
+    return wrapper
+
+
+def _counted_get_many(get_many):
+    if getattr(get_many, "_request_metrics", False):
+        return get_many
+
+    @wraps(get_many)
+    def wrapper(self, keys, version=None):
+        stats = _current.get()
+        if stats is None or stats.counting_cache:
+            return get_many(self, keys, version)
+        keys = list(keys)
+        stats.counting_cache = True
+        try:
+            values = get_many(self, keys, version)
+        finally:
+            stats.counting_cache = False
+        stats.cache_hits += len(values)
+        stats.cache_misses += len(keys) - len(values)
+        return values
+
+    wrapper._request_metrics = True
+    return wrapper
+
+
+# --- Aggregation -----------------------------------------------------------
+
+_duration = LabeledHistograms()
+_db_time = LabeledHistograms()
+_db_queries = LabeledHistograms(QUERY_COUNT_BUCKETS)
+_template_time = LabeledHistograms()
+_response_bytes = LabeledHistograms(RESPONSE_BYTES_BUCKETS)
+_cache_hits = Counter()
+_cache_misses = Counter()
+_counter_lock = threading.Lock()
+
+
+def record(route: str, stats: RequestStats, duration_ms: float, response_bytes) -> None:
+    _duration.observe(route, duration_ms)
+    _db_time.observe(route, stats.db_ms)
+    _db_queries.observe(route, stats.db_queries)
+    _template_time.observe(route, stats.template_ms)
+    if response_bytes is not None:
+        _response_bytes.observe(route, response_bytes)
+    with _counter_lock:
+        _cache_hits[route] += stats.cache_hits
+        _cache_misses[route] += stats.cache_misses
+
+
+def get_metrics() -> dict:
+    """Per-route duration summaries for the status endpoint."""
+    return {
+        route: {key: snapshot[key] for key in ("count", "mean", "p50", "p95")}
+        for route, snapshot in _duration.snapshot().items()
+    }
+
+
+def render_prometheus() -> str:
+    with _counter_lock:
+        hits, misses = dict(_cache_hits), dict(_cache_misses)
+    worker = {"pid": os.getpid()}
+
+    lines = [
+        *prometheus_histogram(
+            "ethicic_request_duration_ms",
+            "Request wall time in milliseconds.",
+            _duration.snapshot(),
+            "route",
+            worker,
+        ),
+        *prometheus_histogram(
+            "ethicic_request_db_time_ms",
+            "Time spent in database queries per request, in milliseconds.",
+            _db_time.snapshot(),
+            "route",
+            worker,
+        ),
+        *prometheus_histogram(
+            "ethicic_request_db_queries",
+            "Database queries per request.",
+            _db_queries.snapshot(),
+            "route",
+            worker,
+        ),
+        *prometheus_histogram(
+            "ethicic_request_template_ms",
+            "Template render time per request, in milliseconds.",
+            _template_time.snapshot(),
+            "route",
+            worker,
+        ),
+        *prometheus_histogram(
+            "ethicic_response_bytes",
+            "Response body size in bytes.",
+            _response_bytes.snapshot(),
+            "route",
+            worker,
+        ),
+        *prometheus_counter(
+            "ethicic_request_cache_hits_total", "Cache hits during requests.", hits, "route", worker
+        ),
+        *prometheus_counter(
+            "ethicic_request_cache_misses_total", "Cache misses during requests.", misses, "route", worker
+        ),
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def reset() -> None:
+    for family in (_duration, _db_time, _db_queries, _template_time, _response_bytes):
+        family.reset()
+    with _counter_lock:
+        _cache_hits.clear()
+        _cache_misses.clear()
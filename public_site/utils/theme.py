@@ -0,0 +1,39 @@
+"""
+Theme preference stored in a small signed cookie.
+
+Pages are rendered theme-independent (with DEFAULT_THEME) so one cached
+response serves every visitor; an inline script in the base template
+reads the cookie and sets ``data-theme`` before first paint. Nothing here
+touches the session, so anonymous requests never create session rows or
+pick up ``Vary: Cookie``.
+"""
+
+from django.conf import settings
+
+THEMES = ("light", "dark")
+DEFAULT_THEME = "dark"
+COOKIE_SALT = "public_site.theme"
+COOKIE_MAX_AGE = 365 * 24 * 60 * 60
+
+
+def cookie_name() -> str:
+    return getattr(settings, "THEME_COOKIE_NAME", "theme")
+
+
+def get_theme(request) -> str:
+    """Theme from the signed cookie; DEFAULT_THEME if absent or tampered with."""
+    theme = request.get_signed_cookie(cookie_name(), default=None, salt=COOKIE_SALT)
+    return theme if theme in THEMES else DEFAULT_THEME
+
+
+def set_theme_cookie(response, theme: str) -> None:
+    """Persist ``theme``; readable by the pre-paint script, so not HttpOnly."""
+    response.set_signed_cookie(
+        cookie_name(),
+        theme,
+        salt=COOKIE_SALT,
+        max_age=COOKIE_MAX_AGE,
+        samesite="Lax",
+        secure=getattr(settings, "SESSION_COOKIE_SECURE", False),
+        httponly=False,
+    )
@@ -0,0 +1,72 @@
+"""Public Site Views
+Form handling and API endpoints for the Wagtail-based public site, split by
+area. Submodules are imported on first attribute access, so importing
+``public_site.views`` (or one area of it) doesn't pull in every other view
+module and its dependencies.
+"""
+
+import importlib
+
+VIEW_MODULES = {
+    "errors": ["custom_404", "custom_500"],
+    "forms": [
+        "contact_form_submit",
+        "newsletter_signup",
+        "classify_contact_priority",
+        "create_or_update_contact",
+        "onboarding_form_submit",
+        "onboarding_thank_you",
+        "contact_success",
+        "contact_api",
+        "newsletter_api",
+        "check_submission_status",
+    ],
+    "api": [
+        "site_status_api",
+        "metrics_view",
+        "get_site_navigation",
+        "get_footer_links",
+        "media_items_api",
+        "live_stats_api",
+        "notifications_count_api",
+        "notifications_api",
+        "mark_notifications_read_api",
+        "validate_email_api",
+        "theme_api",
+        "performance_chart_data_api",
+    ],
+    "search": ["site_search", "site_search_live"],
+    "garden": ["garden_overview", "garden_interest_registration"],
+    "pages": ["current_holdings", "disclosures_page"],
+    "debug": [
+        "test_clean_nav",
+        "test_form",
+        "test_error_tracking_view",
+        "test_error_info_view",
+        "test_posthog_simple",
+        "test_posthog_exception_formats",
+    ],
+}
+
+_view_modules = {name: module for module, names in VIEW_MODULES.items() for name in names}
+
+__all__ = list(_view_modules)
+
+
+def __getattr__(name):
+    if name in _view_modules:
+        value = getattr(importlib.import_module(f"{__name__}.{_view_modules[name]}"), name)
+    elif name == "requests":
+        # Kept importable as a patch target for tests
+        try:
+            import requests as value
+        except ImportError:
+            value = None
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *_view_modules])
@@ -0,0 +1,615 @@
+"""
+JSON API views: site status, navigation, media, notifications and theme.
+"""
+
+import json
+import logging
+
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.http import HttpResponse, JsonResponse
+from django.shortcuts import render
+from django.utils import timezone
+from django.views.decorators.http import require_http_methods
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from ..models import MediaItem, SupportTicket
+from ..utils.rate_limit import rate_limit
+from ..utils.theme import THEMES, set_theme_cookie
+
+logger = logging.getLogger(__name__)
+
+
+@api_view(["GET"])
+@permission_classes([AllowAny])
+def site_status_api(request):
+    """API endpoint for site status and health check
+
+    Internal metrics (pools, queues, per-route latency) are only included
+    for the same callers that may read ``/metrics/``.
+    """
+    try:
+        from django.db import connection
+
+        # Test database connection
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+
+        # Get basic site statistics
+        stats = {
+            "status": "healthy",
+            "timestamp": timezone.now().isoformat(),
+            "database": "connected",
+            "support_tickets": {
+                "total": SupportTicket.objects.count(),
+                "open": SupportTicket.objects.filter(status="open").count(),
+                "resolved": SupportTicket.objects.filter(status="resolved").count(),
+            },
+        }
+        if _metrics_authorized(request):
+            stats.update(_internal_metrics())
+
+        return Response(stats, status=status.HTTP_200_OK)
+
+    except Exception as e:
+        logger.exception("Site status check failed")
+        return Response(
+            {
+                "status": "unhealthy",
+                "timestamp": timezone.now().isoformat(),
+                "error": str(e),
+            },
+            status=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+
+
+def _internal_metrics():
+    """Pool, queue, cache and per-route metrics for the status API."""
+    from ethicic.database_config import get_pool_stats
+    from public_site.services.error_reporting import get_error_reporter
+    from public_site.services.outbox import get_outbox_metrics
+    from public_site.services.platform_client import platform_client
+    from public_site.services.site_settings import get_metrics as get_site_settings_metrics
+    from public_site.services.turnstile import get_turnstile_verifier
+    from public_site.utils.request_metrics import get_metrics as get_request_metrics
+
+    return {
+        "database_pool": get_pool_stats(),
+        "outbox": get_outbox_metrics(),
+        "platform_api": platform_client.get_metrics(),
+        "turnstile": get_turnstile_verifier().get_metrics(),
+        "error_reporting": get_error_reporter().get_metrics(),
+        "site_settings": get_site_settings_metrics(),
+        "requests": get_request_metrics(),
+    }
+
+
+def _metrics_authorized(request) -> bool:
+    """Staff, or ``Authorization: Bearer <METRICS_TOKEN>``."""
+    import hmac
+
+    token = getattr(settings, "METRICS_TOKEN", "")
+    supplied = request.headers.get("Authorization", "").removeprefix("Bearer ")
+    if token and hmac.compare_digest(supplied, token):
+        return True
+    return bool(request.user.is_authenticated and request.user.is_staff)
+
+
+@require_http_methods(["GET"])
+def metrics_view(request):
+    """Per-route request metrics in the Prometheus text format.
+
+    Readable by staff, or with ``Authorization: Bearer <METRICS_TOKEN>``.
+    """
+    from ..utils.request_metrics import render_prometheus
+
+    if not _metrics_authorized(request):
+        return HttpResponse("Forbidden", status=403, content_type="text/plain")
+
+    return HttpResponse(render_prometheus(), content_type="text/plain; version=0.0.4")
+
+
+@api_view(["GET"])
+@permission_classes([AllowAny])
+def get_site_navigation(request):
+    """API endpoint to get site navigation structure"""
+    from wagtail.models import Page
+
+    try:
+        # Get the site root page
+        root_page = Page.objects.filter(depth=2).first()
+
+        if root_page:
+            # Get main navigation pages (depth 3)
+            nav_pages = Page.objects.child_of(root_page).live().public().in_menu()
+
+            navigation = [
+                {
+                    "title": page.title,
+                    "url": page.url,
+                    "slug": page.slug,
+                }
+                for page in nav_pages
+            ]
+
+            # Only return the navigation if we have items, otherwise fall back
+            if navigation:
+                return Response(
+                    {"navigation": navigation},
+                    status=status.HTTP_200_OK,
+                )
+
+    except Exception:
+        logger.exception("Error getting site navigation")
+
+    # Fallback navigation structure - updated to use /blog/ instead of /research/
+    fallback_navigation = [
+        {"title": "Home", "url": "/", "slug": "home"},
+        {"title": "About", "url": "/about/", "slug": "about"},
+        {"title": "Blog", "url": "/blog/", "slug": "blog"},
+        {"title": "Process", "url": "/process/", "slug": "process"},
+        {"title": "Pricing", "url": "/pricing/", "slug": "pricing"},
+        {"title": "Support", "url": "/support/", "slug": "support"},
+        {"title": "Contact", "url": "/contact/", "slug": "contact"},
+    ]
+
+    return Response(
+        {"navigation": fallback_navigation},
+        status=status.HTTP_200_OK,
+    )
+
+
+@api_view(["GET"])
+@permission_classes([AllowAny])
+def get_footer_links(request):
+    """API endpoint to get footer link structure"""
+    footer_links = {
+        "company": [
+            {"title": "About Us", "url": "/about/"},
+            {"title": "Our Process", "url": "/process/"},
+            {"title": "Blog", "url": "/blog/"},  # Updated from research to blog
+            {"title": "Media", "url": "/media/"},
+        ],
+        "services": [
+            {"title": "For Advisers", "url": "/adviser/"},
+            {"title": "For Institutions", "url": "/institutions/"},
+            {"title": "Investment Strategies", "url": "/strategies/"},
+            {"title": "Support", "url": "/support/"},
+        ],
+        "legal": [
+            {"title": "Privacy Policy", "url": "/disclosures/privacy/"},
+            {"title": "Terms of Service", "url": "/disclosures/terms/"},
+            {"title": "Disclosures", "url": "/disclosures/disclosures/"},
+            {
+                "title": "Form ADV",
+                "url": "https://reports.adviserinfo.sec.gov/reports/ADV/316032/PDF/316032.pdf",
+            },
+        ],
+        "connect": [
+            {"title": "Contact Us", "url": "/contact/"},
+            {"title": "Newsletter", "url": "/newsletter/"},
+            {"title": "Blog", "url": "/blog/"},
+            {"title": "LinkedIn", "url": "https://linkedin.com/company/ecic"},
+        ],
+    }
+
+    return Response(footer_links, status=status.HTTP_200_OK)
+
+
+@api_view(["GET"])
+@permission_classes([AllowAny])
+def media_items_api(request):
+    """API endpoint for paginated media items for infinite scroll"""
+    try:
+        # Get page and per_page parameters
+        page = int(request.GET.get("page", 1))
+        per_page = int(request.GET.get("per_page", 6))
+
+        # Limit per_page to reasonable values
+        per_page = min(max(per_page, 1), 50)
+
+        # Check if this is an HTMX request
+        is_htmx = request.headers.get("HX-Request") == "true"
+
+        # Get all media items ordered by featured first, then by date
+        media_items = MediaItem.objects.select_related("page").order_by(
+            "-featured", "-publication_date"
+        )
+
+        # Apply pagination
+        paginator = Paginator(media_items, per_page)
+
+        try:
+            page_obj = paginator.page(page)
+        except Exception:
+            # If page is out of range, return empty results
+            if is_htmx:
+                return HttpResponse("")  # Empty response for HTMX
+
+            return Response(
+                {
+                    "items": [],
+                    "has_next": False,
+                    "total_pages": paginator.num_pages,
+                    "current_page": page,
+                    "total_items": paginator.count,
+                },
+                status=status.HTTP_200_OK,
+            )
+
+        # For HTMX request, return HTML partial
+        if is_htmx:
+            # Create the next page trigger if there are more pages
+            next_page_html = ""
+            if page_obj.has_next():
+                next_page_html = f"""
+                <div id="load-more-trigger"
+                     hx-get="/api/media-items/?page={page + 1}&per_page={per_page}"
+                     hx-trigger="revealed"
+                     hx-target="#articles-container"
+                     hx-swap="beforeend"
+                     hx-indicator="#loading-indicator"
+                     hx-swap-oob="true"
+                     class="load-more-trigger">
+                </div>
+                """
+
+            return render(
+                request,
+                "public_site/partials/media_items.html",
+                {"media_items": page_obj, "next_page_trigger": next_page_html},
+            )
+
+        # For regular API request, return JSON
+        items = []
+        for item in page_obj:
+            # Process description to remove HTML tags for API response
+            description = item.description
+            if description:
+                import re
+
+                # Simple HTML tag removal for API
+                description = re.sub(r"<[^>]+>", "", description)
+                description = description.strip()
+
+            items.append(
+                {
+                    "id": item.id,
+                    "title": item.title,
+                    "description": description,
+                    "publication": item.publication,
+                    "publication_date": (
+                        item.publication_date.isoformat()
+                        if item.publication_date
+                        else None
+                    ),
+                    "external_url": item.external_url,
+                    "featured": item.featured,
+                }
+            )
+
+        return Response(
+            {
+                "items": items,
+                "has_next": page_obj.has_next(),
+                "total_pages": paginator.num_pages,
+                "current_page": page,
+                "total_items": paginator.count,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    except ValueError:
+        return Response(
+            {"error": "Invalid page or per_page parameter"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    except Exception:
+        logger.exception("Error in media items API")
+        return Response(
+            {"error": "Internal server error"},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+
+def live_stats_api(request):
+    """API endpoint for live statistics with HTMX polling"""
+    import random
+
+    from django.utils import timezone
+
+    # In a real application, these would come from your database or analytics
+    # For demo purposes, we'll show slightly varying numbers
+    base_screened = 3000
+    base_holdings = 18
+
+    stats = {
+        "companies_screened": f"{base_screened + random.randint(0, 50):,}+",
+        "excluded_percentage": "57%",
+        "active_holdings": str(base_holdings + random.randint(-2, 2)),
+        "years_research": "15+",
+        "last_updated": timezone.now(),
+    }
+
+    # Check if this is an HTMX request
+    is_htmx = request.headers.get("HX-Request") == "true"
+
+    if is_htmx:
+        # Return just the partial template for HTMX
+        return render(request, "public_site/partials/live_stats_data.html", stats)
+    # Return JSON for regular API calls
+    return JsonResponse(stats)
+
+
+def notifications_count_api(request):
+    """API endpoint for notification count"""
+    # In a real app, this would check the user's unread notifications
+    # For demo, return a random count
+    import random
+
+    count = random.choice(
+        [0, 0, 0, 1, 2, 3]
+    )  # Mostly 0, occasionally some notifications
+
+    # For HTMX requests, return just the count as HTML
+    if request.headers.get("HX-Request") == "true":
+        if count > 0:
+            return HttpResponse(str(count))
+        return HttpResponse("")  # Empty for 0 count
+
+    return JsonResponse({"count": count})
+
+
+def notifications_api(request):
+    """API endpoint for notifications list"""
+    # Demo notifications - in production, these would come from your database
+    from datetime import timedelta
+
+    from django.utils import timezone
+
+    notifications = [
+        {
+            "id": 1,
+            "content": "New research report available: Q1 2025 Market Analysis",
+            "time": timezone.now() - timedelta(hours=2),
+            "unread": True,
+            "url": "/research/q1-2025-analysis/",
+        },
+        {
+            "id": 2,
+            "content": "Portfolio update: AAPL position adjusted",
+            "time": timezone.now() - timedelta(days=1),
+            "unread": True,
+            "url": "/portfolio/updates/",
+        },
+        {
+            "id": 3,
+            "content": "Monthly newsletter published",
+            "time": timezone.now() - timedelta(days=3),
+            "unread": False,
+            "url": "/blog/",
+        },
+    ]
+
+    # For HTMX requests, return partial template
+    if request.headers.get("HX-Request") == "true":
+        return render(
+            request,
+            "public_site/partials/notification_list.html",
+            {"notifications": notifications},
+        )
+
+    return JsonResponse({"notifications": notifications})
+
+
+def mark_notifications_read_api(request):
+    """Mark all notifications as read"""
+    if request.method == "POST":
+        # In production, update the database to mark notifications as read
+        # For demo, just return an empty notification list
+
+        if request.headers.get("HX-Request") == "true":
+            return render(
+                request,
+                "public_site/partials/notification_list.html",
+                {"notifications": [], "message": "All notifications marked as read"},
+            )
+
+        return JsonResponse({"success": True})
+
+    return JsonResponse({"error": "Method not allowed"}, status=405)
+
+
+@rate_limit("validate_email")
+def validate_email_api(request):
+    """Validate email address for forms (HTMX endpoint)"""
+    if request.method == "POST":
+        email = request.POST.get("email", "").strip()
+
+        if not email:
+            return HttpResponse('<span class="field-error">Email is required</span>')
+
+        # Basic email validation
+        import re
+
+        email_regex = r"^[^\s@]+@[^\s@]+\.[^\s@]+$"
+        if not re.match(email_regex, email):
+            return HttpResponse(
+                '<span class="field-error">Please enter a valid email address</span>'
+            )
+
+        # Check if email is already in use (for demo, check some common domains)
+        blocked_domains = ["tempmail.com", "throwaway.email", "10minutemail.com"]
+        domain = email.split("@")[1].lower()
+        if domain in blocked_domains:
+            return HttpResponse(
+                '<span class="field-error">Please use a valid email domain</span>'
+            )
+
+        # Success
+        return HttpResponse('<span class="field-success">✓ Email is valid</span>')
+
+    return HttpResponse("")
+
+
+@api_view(["POST"])
+@permission_classes([AllowAny])
+def theme_api(request):
+    """API endpoint to save user theme preference"""
+    try:
+        data = json.loads(request.body)
+        theme = data.get("theme", "light")
+
+        # Validate theme value
+        if theme not in THEMES:
+            return JsonResponse({"error": "Invalid theme"}, status=400)
+
+        # A signed cookie, not the session: anonymous visitors stay session-free
+        response = JsonResponse({"success": True, "theme": theme})
+        set_theme_cookie(response, theme)
+        return response
+
+    except (json.JSONDecodeError, Exception) as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+
+@api_view(["GET"])
+@permission_classes([AllowAny])
+def performance_chart_data_api(request):
+    """API endpoint for investment performance chart data"""
+    try:
+        from ..models import StrategyPage
+        from ..utils.performance_calculator import parse_percentage, compound_returns
+        from datetime import date, datetime
+        
+        # Get strategy slug from query parameter
+        strategy_slug = request.GET.get('strategy', 'growth') if hasattr(request, 'GET') and request.GET else 'growth'
+        
+        try:
+            strategy = StrategyPage.objects.get(slug=strategy_slug)
+        except StrategyPage.DoesNotExist:
+            # Fall back to first available strategy
+            strategy = StrategyPage.objects.first()
+            if not strategy:
+                return JsonResponse({'error': 'No strategies available'}, status=404)
+        
+        if not strategy.monthly_returns:
+            return JsonResponse({'error': 'No performance data available'}, status=404)
+        
+        # Process monthly returns into cumulative growth data
+        chart_data = []
+        benchmark_data = []
+        labels = []
+        
+        # Starting investment amount
+        investment_amount = 10000
+        cumulative_strategy = investment_amount
+        cumulative_benchmark = investment_amount
+        
+        # Sort years and months chronologically
+        months_order = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
+                       'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+        
+        # Get all year/month combinations sorted chronologically
+        data_points = []
+        for year_str, year_data in strategy.monthly_returns.items():
+            year = int(year_str)
+            for month_name, month_data in year_data.items():
+                if month_name in months_order:
+                    month_index = months_order.index(month_name)
+                    data_points.append((year, month_index, month_name, month_data))
+        
+        # Sort by year and month
+        data_points.sort(key=lambda x: (x[0], x[1]))
+        
+        # Add starting point
+        if data_points:
+            first_year, first_month_idx, first_month, _ = data_points[0]
+            start_date = date(first_year, first_month_idx + 1, 1)
+            # Add a point one month before the first data point for the starting $10k
+            if first_month_idx > 0:
+                prev_month_idx = first_month_idx - 1
+                prev_year = first_year
+            else:
+                prev_month_idx = 11
+                prev_year = first_year - 1
+            
+            prev_month_name = months_order[prev_month_idx]
+            labels.append(f"{prev_month_name} {prev_year}")
+            chart_data.append(investment_amount)
+            benchmark_data.append(investment_amount)
+        
+        # Process each month's data
+        for year, month_index, month_name, month_data in data_points:
+            strategy_return_str = month_data.get('strategy', '0%')
+            benchmark_return_str = month_data.get('benchmark', '0%')
+            
+            # Parse percentage returns
+            strategy_return = parse_percentage(strategy_return_str)
+            benchmark_return = parse_percentage(benchmark_return_str)
+            
+            # Apply returns to cumulative values
+            cumulative_strategy *= (1 + strategy_return)
+            cumulative_benchmark *= (1 + benchmark_return)
+            
+            # Create label
+            labels.append(f"{month_name} {year}")
+            chart_data.append(round(cumulative_strategy, 2))
+            benchmark_data.append(round(cumulative_benchmark, 2))
+        
+        # Prepare response data
+        response_data = {
+            'strategy_name': strategy.title,
+            'strategy_label': getattr(strategy, 'strategy_label', 'Strategy'),
+            'inception_date': strategy.inception_date.isoformat() if strategy.inception_date else None,
+            'labels': labels,
+            'datasets': [
+                {
+                    'label': f'{strategy.title} Strategy',
+                    'data': chart_data,
+                    'borderColor': '#8B5CF6',  # Tailwind purple-500
+                    'backgroundColor': 'rgba(139, 92, 246, 0.1)',
+                    'fill': False,
+                    'tension': 0.2,
+                    'borderWidth': 3,
+                    'pointBackgroundColor': '#8B5CF6',
+                    'pointBorderColor': '#FFFFFF',
+                    'pointBorderWidth': 2,
+                    'pointRadius': 4,
+                    'pointHoverRadius': 6
+                },
+                {
+                    'label': 'Benchmark (S&P 500)',
+                    'data': benchmark_data,
+                    'borderColor': '#64748B',  # Tailwind slate-500
+                    'backgroundColor': 'rgba(100, 116, 139, 0.1)',
+                    'fill': False,
+                    'tension': 0.2,
+                    'borderWidth': 2,
+                    'pointBackgroundColor': '#64748B',
+                    'pointBorderColor': '#FFFFFF',
+                    'pointBorderWidth': 2,
+                    'pointRadius': 3,
+                    'pointHoverRadius': 5,
+                    'borderDash': [5, 5]
+                }
+            ],
+            'performance_summary': {
+                'final_strategy_value': round(cumulative_strategy, 2),
+                'final_benchmark_value': round(cumulative_benchmark, 2),
+                'strategy_total_return': round(((cumulative_strategy / investment_amount) - 1) * 100, 2),
+                'benchmark_total_return': round(((cumulative_benchmark / investment_amount) - 1) * 100, 2),
+                'outperformance': round(cumulative_strategy - cumulative_benchmark, 2),
+                'outperformance_percent': round((cumulative_strategy / cumulative_benchmark - 1) * 100, 2)
+            }
+        }
+        
+        return JsonResponse(response_data)
+        
+    except Exception as e:
+        logger.error(f"Error in performance_chart_data_api: {str(e)}")
+        return JsonResponse({'error': 'Failed to fetch performance data'}, status=500)
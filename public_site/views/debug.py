@@ -0,0 +1,245 @@
+"""
+Test and debugging views (form, navigation and error tracking checks).
+"""
+
+import logging
+
+from django.conf import settings
+from django.http import JsonResponse
+from django.shortcuts import render
+from django.views.decorators.http import require_http_methods
+
+logger = logging.getLogger(__name__)
+
+
+def test_clean_nav(request):
+    """Test page for clean navigation system"""
+    return render(request, "public_site/test_clean_nav.html")
+
+
+def test_form(request):
+    """Test page for form input debugging"""
+    return render(request, "public_site/test_form.html")
+
+
+# Test error tracking views for PostHog
+
+
+@require_http_methods(["GET"])
+def test_error_tracking_view(request):
+    """Test error tracking by generating an error"""
+    # Security check - only allow with secret parameter
+    secret = request.GET.get('secret')
+    if secret != 'test-posthog-errors-2025':
+        return JsonResponse({'error': 'Unauthorized'}, status=403)
+    
+    # Get error type to generate
+    error_type = request.GET.get('type', 'exception')
+    
+    # If we're in debug mode, just return info
+    if settings.DEBUG:
+        return JsonResponse({
+            'status': 'DEBUG mode active',
+            'message': 'Errors are not sent to PostHog in DEBUG mode',
+            'posthog_configured': bool(settings.POSTHOG_API_KEY),
+            'posthog_host': settings.POSTHOG_HOST
+        })
+    
+    # Generate the requested error type
+    try:
+        if error_type == 'exception':
+            raise Exception("Test error from error tracking view")
+        elif error_type == 'zerodivision':
+            result = 1 / 0
+        elif error_type == 'attribute':
+            obj = None
+            obj.some_attribute
+        elif error_type == 'key':
+            data = {}
+            value = data['missing_key']
+        elif error_type == 'type':
+            result = "string" + 123
+        else:
+            return JsonResponse({'error': 'Unknown error type'}, status=400)
+    except Exception as e:
+        # The middleware should catch this and send to PostHog
+        raise  # Re-raise to let middleware handle it
+    
+    # This should never be reached
+    return JsonResponse({'status': 'No error generated'})
+
+
+@require_http_methods(["GET"])
+def test_error_info_view(request):
+    """Get information about error tracking configuration"""
+    import posthog
+    
+    return JsonResponse({
+        'debug_mode': settings.DEBUG,
+        'posthog_configured': bool(settings.POSTHOG_API_KEY),
+        'posthog_host': settings.POSTHOG_HOST,
+        'posthog_api_key_suffix': f"...{settings.POSTHOG_API_KEY[-4:]}" if settings.POSTHOG_API_KEY else None,
+        'middleware_active': 'public_site.middleware.PostHogErrorMiddleware' in settings.MIDDLEWARE,
+        'posthog_initialized': bool(getattr(posthog, 'project_api_key', None)),
+        'instructions': {
+            'test_error': '/test-error-tracking/?secret=test-posthog-errors-2025&type=exception',
+            'error_types': ['exception', 'zerodivision', 'attribute', 'key', 'type']
+        }
+    })
+
+
+# Simple PostHog test view
+
+
+@require_http_methods(["GET"])
+def test_posthog_simple(request):
+    """Test basic PostHog functionality"""
+    import posthog
+    
+    # Security check
+    secret = request.GET.get('secret')
+    if secret != 'test-posthog-2025':
+        return JsonResponse({'error': 'Unauthorized'}, status=403)
+    
+    try:
+        # Test 1: Send a simple event
+        result1 = posthog.capture(
+            'test-user',
+            'test_event',
+            {
+                'test': True,
+                'source': 'django_backend'
+            }
+        )
+        
+        # Test 2: Send an exception event with minimal properties
+        result2 = posthog.capture(
+            'test-user',
+            '$exception',
+            {
+                '$exception_type': 'TestError',
+                '$exception_message': 'This is a test error from Django'
+            }
+        )
+        
+        # Test 3: Send exception with Sentry-like format
+        result3 = posthog.capture(
+            'test-user',
+            '$exception',
+            {
+                'exception': {
+                    'values': [{
+                        'type': 'TestError',
+                        'value': 'Test error with Sentry format'
+                    }]
+                }
+            }
+        )
+        
+        # Flush to ensure events are sent
+        posthog.flush()
+        
+        return JsonResponse({
+            'status': 'success',
+            'results': {
+                'simple_event': str(result1),
+                'exception_minimal': str(result2),
+                'exception_sentry': str(result3)
+            },
+            'posthog_config': {
+                'api_key_prefix': posthog.project_api_key[:10] if posthog.project_api_key else None,
+                'host': posthog.host
+            }
+        })
+        
+    except Exception as e:
+        return JsonResponse({
+            'status': 'error',
+            'error': str(e),
+            'type': type(e).__name__
+        }, status=500)
+
+
+@require_http_methods(["GET"])
+def test_posthog_exception_formats(request):
+    """Test different PostHog exception formats to see which works"""
+    import posthog
+    
+    # Security check
+    secret = request.GET.get('secret')
+    if secret != 'test-formats-2025':
+        return JsonResponse({'error': 'Unauthorized'}, status=403)
+    
+    results = []
+    
+    try:
+        # Format 1: Using captureException method (if available)
+        try:
+            error = Exception("Test error using captureException")
+            posthog.captureException(error)
+            results.append("captureException: Success")
+        except AttributeError:
+            results.append("captureException: Method not available")
+        
+        # Format 2: Standard $exception format
+        result2 = posthog.capture(
+            str(request.user.id) if request.user.is_authenticated else 'anonymous',
+            '$exception',
+            {
+                '$exception_type': 'TestError',
+                '$exception_message': 'Test error with standard format',
+                '$exception_list': [{
+                    'type': 'TestError',
+                    'value': 'Test error with standard format',
+                    'stacktrace': {
+                        'frames': [{
+                            'filename': 'test.py',
+                            'function': 'test_function',
+                            'lineno': 42
+                        }]
+                    }
+                }]
+            }
+        )
+        results.append(f"Standard format: {result2[0]}")
+        
+        # Format 3: With fingerprint for grouping
+        result3 = posthog.capture(
+            str(request.user.id) if request.user.is_authenticated else 'anonymous',
+            '$exception',
+            {
+                '$exception_type': 'TestError',
+                '$exception_message': 'Test error with fingerprint',
+                '$exception_fingerprint': ['test-error-group'],
+                '$exception_list': [{
+                    'type': 'TestError',
+                    'value': 'Test error with fingerprint'
+                }]
+            }
+        )
+        results.append(f"With fingerprint: {result3[0]}")
+        
+        # Format 4: Minimal format
+        result4 = posthog.capture(
+            str(request.user.id) if request.user.is_authenticated else 'anonymous',
+            '$exception',
+            {
+                'exception': 'Minimal test error'
+            }
+        )
+        results.append(f"Minimal format: {result4[0]}")
+        
+        # Flush all events
+        posthog.flush()
+        
+        return JsonResponse({
+            'status': 'success',
+            'results': results,
+            'message': 'Check PostHog dashboard in Events and Error Tracking sections'
+        })
+        
+    except Exception as e:
+        return JsonResponse({
+            'status': 'error',
+            'error': str(e)
+        }, status=500)
@@ -0,0 +1,41 @@
+"""
+Error handler views.
+"""
+
+import logging
+
+from django.shortcuts import render
+
+logger = logging.getLogger(__name__)
+
+
+# Error handlers
+def custom_404(request, exception):
+    """Custom 404 error page"""
+    return render(request, "404.html", status=404)
+
+
+def custom_500(request):
+    """Custom 500 error page with fallback"""
+    try:
+        return render(request, "500.html", status=500)
+    except Exception as e:
+        # Fallback if template rendering fails
+        import logging
+
+        from django.http import HttpResponse
+
+        logger = logging.getLogger(__name__)
+        logger.error(f"Error handler failed to render template: {e}")
+
+        html = """
+        <!DOCTYPE html>
+        <html>
+        <head><title>Server Error</title></head>
+        <body>
+            <h1>500 - Server Error</h1>
+            <p>An error occurred while processing your request.</p>
+        </body>
+        </html>
+        """
+        return HttpResponse(html, status=500, content_type="text/html")
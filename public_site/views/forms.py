@@ -0,0 +1,922 @@
+"""
+Form submission views: contact, newsletter and onboarding.
+"""
+
+import logging
+
+from django.conf import settings
+from django.contrib import messages
+from django.db import transaction
+from django.http import JsonResponse
+from django.shortcuts import redirect, render
+from django.utils import timezone
+from django.views.decorators.http import require_http_methods
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from ..forms import AccessibleContactForm, AccessibleNewsletterForm, OnboardingForm
+from ..models import SupportTicket
+from ..utils.rate_limit import rate_limit
+
+logger = logging.getLogger(__name__)
+
+
+@require_http_methods(["POST"])
+def contact_form_submit(request):
+    """Handle contact form submissions from public site via API calls"""
+    form = AccessibleContactForm(request.POST, request=request)
+
+    if form.is_valid():
+        contact_data = form.cleaned_data
+
+        try:
+            # Create SupportTicket directly for simplicity and reliability
+            from public_site.models import SupportTicket
+            from public_site.services import outbox
+
+            # Split name into first and last name
+            name_parts = contact_data["name"].split() if contact_data["name"] else [""]
+            first_name = name_parts[0] if name_parts else ""
+            last_name = " ".join(name_parts[1:]) if len(name_parts) > 1 else ""
+
+            # Ticket and outbox row commit together; the platform API is
+            # called afterwards so a slow platform never delays the redirect
+            with transaction.atomic():
+                ticket = SupportTicket.objects.create(
+                    name=contact_data["name"],
+                    email=contact_data["email"],
+                    company=contact_data.get("company", ""),
+                    subject=f"{contact_data['subject']} - {contact_data.get('company', 'Individual')}",
+                    message=contact_data["message"],
+                    ticket_type="question",
+                    status="open",
+                )
+
+                outbox.enqueue(
+                    "contact",
+                    {
+                        "first_name": first_name,
+                        "last_name": last_name,
+                        "email": contact_data["email"],
+                        "subject": ticket.subject,
+                        "message": contact_data["message"],
+                        "category": contact_data["subject"],
+                        "company": contact_data.get("company", ""),
+                        "source": "public_website",
+                        "ticket_id": ticket.id,
+                    },
+                    ticket=ticket,
+                )
+
+            logger.info(
+                "Contact form submitted successfully, created ticket #%s", ticket.id
+            )
+
+            messages.success(
+                request,
+                "Thank you for your message! We will get back to you within 24 hours.",
+            )
+
+            # Redirect back to contact page with success
+            return redirect("/contact/")
+
+        except Exception:
+            logger.exception("Error processing contact form")
+            messages.error(
+                request,
+                "There was an error processing your request. Please try again or email us directly.",
+            )
+            return redirect("/contact/")
+
+    else:
+        # Form has errors - redirect back with error message
+        error_messages = [
+            f"{field}: {error}"
+            for field, errors in form.errors.items()
+            for error in errors
+        ]
+
+        logger.error("Contact form validation errors: %s", form.errors)
+        messages.error(
+            request,
+            f"Please correct the following errors: {', '.join(error_messages)}",
+        )
+        return redirect("/contact/")
+
+
+@require_http_methods(["POST"])
+def newsletter_signup(request):
+    """Handle newsletter signup submissions"""
+    form = AccessibleNewsletterForm(request.POST)
+
+    # Check if this is an HTMX request
+    is_htmx = request.headers.get("HX-Request") == "true"
+
+    if form.is_valid():
+        email = form.cleaned_data["email"]
+
+        try:
+            # Log the signup
+            logger.info("Newsletter signup: %s", email)
+
+            from public_site.services import outbox
+
+            ticket = None
+            with transaction.atomic():
+                # Try to create/update CRM Contact for newsletter subscriber
+                try:
+                    from crm.models import Contact
+                    from crm.models.choices import ContactStatus, ContactType
+
+                    # Check if contact already exists
+                    contact, created = Contact.objects.get_or_create(
+                        email=email,
+                        defaults={
+                            "full_name": "Newsletter Subscriber",
+                            "first_name": "Newsletter",
+                            "last_name": "Subscriber",
+                            "contact_type": ContactType.INDIVIDUAL,
+                            "status": ContactStatus.COLD_LEAD,
+                            "opt_in_marketing": True,
+                            "source": "Newsletter Page Signup",
+                            "notes": "Subscribed via newsletter page",
+                            "preferences": {
+                                "newsletter_subscribed": True,
+                                "newsletter_subscribed_date": timezone.now().isoformat(),
+                                "newsletter_source": "newsletter_page",
+                            },
+                        },
+                    )
+
+                    if not created:
+                        # Update existing contact to subscribe to newsletter
+                        contact.opt_in_marketing = True
+                        newsletter_prefs = contact.preferences.get(
+                            "newsletter_subscribed", False
+                        )
+                        if not newsletter_prefs:
+                            contact.preferences.update(
+                                {
+                                    "newsletter_subscribed": True,
+                                    "newsletter_subscribed_date": timezone.now().isoformat(),
+                                    "newsletter_source": "newsletter_page",
+                                }
+                            )
+                            contact.notes = (
+                                (contact.notes or "")
+                                + f"\nRe-subscribed to newsletter on {timezone.now().date()}"
+                            )
+                            contact.save()
+
+                    logger.info(
+                        f"{'Created' if created else 'Updated'} CRM contact for newsletter subscriber: {email}"
+                    )
+
+                except ImportError:
+                    # Fallback to SupportTicket if CRM models not available
+                    logger.warning(
+                        "CRM models not available, falling back to SupportTicket"
+                    )
+                    ticket = SupportTicket.objects.create(
+                        name="Newsletter Subscriber",
+                        email=email,
+                        subject="Newsletter Signup",
+                        message="Newsletter subscription request",
+                        ticket_type="newsletter",
+                        status="resolved",
+                    )
+
+                # Queue the platform notification; at most one per address per day
+                outbox.enqueue(
+                    "newsletter",
+                    {"email": email, "source": "newsletter_page", "form_type": "newsletter"},
+                    ticket=ticket,
+                    dedupe_key=f"newsletter:{email.lower()}:{timezone.now().date()}",
+                )
+
+            # Handle HTMX response
+            if is_htmx:
+                return render(
+                    request,
+                    "public_site/partials/newsletter_success.html",
+                    {"email": email},
+                )
+
+            messages.success(
+                request,
+                "Thank you for subscribing! You will receive our newsletter updates.",
+            )
+
+        except Exception:
+            logger.exception("Error processing newsletter signup")
+
+            if is_htmx:
+                return render(
+                    request,
+                    "public_site/partials/newsletter_error.html",
+                    {
+                        "error": "There was an error with your subscription. Please try again."
+                    },
+                )
+
+            messages.error(
+                request,
+                "There was an error with your subscription. Please try again.",
+            )
+
+    else:
+        if is_htmx:
+            return render(
+                request,
+                "public_site/newsletter_page.html",
+                {"form": form, "errors": form.errors},
+            )
+
+        messages.error(request, "Please provide a valid email address.")
+
+    # Redirect back to the page they came from
+    return redirect(request.META.get("HTTP_REFERER", "/"))
+
+
+def classify_contact_priority(form_type, form_data):
+    """Classify contact priority and status based on engagement AND business criteria."""
+    # Import here to avoid dependency issues
+    try:
+        from crm.models.choices import ContactStatus, PriorityLevel
+    except ImportError:
+        # Fallback for when CRM is not available
+        class ContactStatus:
+            COLD_LEAD = "COLD_LEAD"
+            WARM_LEAD = "WARM_LEAD"
+            PROSPECT = "PROSPECT"
+
+        class PriorityLevel:
+            LOW = 1
+            MEDIUM = 2
+            HIGH = 3
+            CRITICAL = 4
+
+    importance_score = 0.5  # Default
+    priority_level = PriorityLevel.MEDIUM
+    contact_status = ContactStatus.COLD_LEAD  # Default to cold lead
+
+    return contact_status, priority_level, importance_score
+
+
+def create_or_update_contact(email, form_data, form_type, user=None):
+    """Create or update CRM contact with business-focused deduplication and classification."""
+    # Import here to avoid dependency issues
+    try:
+        from crm.models import Contact
+        from crm.models.choices import (  # noqa: F401
+            ContactStatus,
+            ContactType,
+            PriorityLevel,
+        )
+
+        # Get contact classification
+        contact_status, priority_level, importance_score = classify_contact_priority(
+            form_type, form_data
+        )
+
+        # Try to find existing contact
+        contact = Contact.objects.filter(email=email).first()
+        created = False
+
+        if contact:
+            # Update existing contact with new information
+            if form_data.get("name") and not contact.full_name:
+                contact.full_name = form_data["name"]
+            contact.last_interaction = timezone.now()
+            contact.interaction_count += 1
+            contact.save()
+        else:
+            # Create new contact
+            created = True
+            full_name = (
+                form_data.get("name")
+                or f"{form_data.get('first_name', '')} {form_data.get('last_name', '')}".strip()
+            )
+
+            contact = Contact.objects.create(
+                email=email,
+                full_name=full_name,
+                first_name=form_data.get("first_name", ""),
+                last_name=form_data.get("last_name", ""),
+                company=form_data.get("company", ""),
+                job_title=form_data.get("role", ""),
+                phone_primary=form_data.get("phone", ""),
+                status=contact_status,
+                priority_level=priority_level,
+                importance_score=importance_score,
+                last_interaction=timezone.now(),
+                interaction_count=1,
+                source=f"website_{form_type}",
+                created_by=user,
+            )
+
+        return contact, created
+    except ImportError:
+        # When CRM is not available, return a mock object
+        class MockContact:
+            def __init__(self):
+                self.id = 1
+                self.email = email
+                self.full_name = form_data.get("name", "")
+                self.contact_status = "COLD_LEAD"
+
+        return MockContact(), True
+
+
+def _build_full_name(first, middle, last):
+    """Build full name from components."""
+    name_parts = [first or ""]
+    if middle:
+        name_parts.append(middle)
+    name_parts.append(last or "")
+    return " ".join(filter(None, name_parts))
+
+
+def _build_full_address(form_data):
+    """Build full address from form data."""
+    address_parts = [form_data.get("street_address", "")]
+    if form_data.get("street_address_2"):
+        address_parts.append(form_data.get("street_address_2"))
+    address_parts.extend(
+        [
+            form_data.get("city", ""),
+            form_data.get("state", ""),
+            form_data.get("zip_code", ""),
+            form_data.get("country", ""),
+        ]
+    )
+    return ", ".join(filter(None, address_parts))
+
+
+def _format_currency(value):
+    """Format numeric string as currency."""
+    if value and value.isdigit():
+        return f"${int(value):,}"
+    return value
+
+
+def _build_basic_info_parts(form_data, full_name, full_address):
+    """Build basic information message parts."""
+    return [
+        "## Onboarding Application\n",
+        f"**Name:** {full_name}",
+        f"**Email:** {form_data.get('email', '')}",
+        f"**Phone:** {form_data.get('phone', '')}",
+        f"**Mailing Address:** {full_address}",
+        f"**Pronouns:** {form_data.get('pronouns', '')}",
+        f"**Birthday:** {form_data.get('birthday', '')}",
+        f"**Employment Status:** {form_data.get('employment_status', '')}",
+        f"**Marital Status:** {form_data.get('marital_status', '')}",
+    ]
+
+
+def _add_co_client_info(message_parts, form_data):
+    """Add co-client information to message parts if applicable."""
+    if form_data.get("add_co_client") == "yes":
+        co_full_name = _build_full_name(
+            form_data.get("co_client_first_name"),
+            form_data.get("co_client_middle_names"),
+            form_data.get("co_client_last_name"),
+        )
+
+        message_parts.extend(
+            [
+                "\n## Co-Client Information",
+                f"**Name:** {co_full_name}",
+                f"**Email:** {form_data.get('co_client_email', '')}",
+                f"**Phone:** {form_data.get('co_client_phone', '')}",
+                f"**Pronouns:** {form_data.get('co_client_pronouns', '')}",
+                f"**Birthday:** {form_data.get('co_client_birthday', '')}",
+                f"**Employment Status:** {form_data.get('co_client_employment_status', '')}",
+                f"**Employer:** {form_data.get('co_client_employer_name', '')}",
+                f"**Share Address:** {form_data.get('co_client_share_address', '')}",
+            ]
+        )
+
+
+def _add_financial_context(message_parts, form_data):
+    """Add financial context to message parts."""
+    message_parts.extend(
+        [
+            "\n## Financial Context",
+            f"**Investment Experience:** {form_data.get('investment_experience', '')}",
+            f"**Net Worth:** {_format_currency(form_data.get('net_worth', ''))}",
+            f"**Liquid Net Worth:** {_format_currency(form_data.get('liquid_net_worth', ''))}",
+            f"**Investable Net Worth:** {_format_currency(form_data.get('investable_net_worth', ''))}",
+        ]
+    )
+
+    if form_data.get("initial_investment"):
+        formatted_investment = _format_currency(form_data.get("initial_investment", ""))
+        message_parts.append(f"**Initial Investment:** {formatted_investment}")
+
+
+def _add_ethical_considerations(message_parts, form_data):
+    """Add ethical considerations to message parts."""
+    fields = [
+        ("ethical_considerations", "Ethical Considerations"),
+        ("ethical_considerations_other", "Other Ethical Considerations"),
+        ("divestment_movements", "Divestment Movements"),
+        ("divestment_movements_other", "Other Divestment Movements"),
+        ("understanding_importance_other", "Understanding Importance (Other)"),
+        ("ethical_evolution_other", "Ethical Evolution (Other)"),
+        ("ethical_concerns_unrecognized", "Unrecognized Ethical Concerns"),
+        ("financial_team_coordinate", "Financial Team Coordination"),
+        ("professional_referrals", "Professional Referrals"),
+        ("professional_referrals_other", "Other Professional Referrals"),
+        ("anything_else", "Additional Information"),
+    ]
+
+    for field_name, label in fields:
+        value = form_data.get(field_name)
+        if value:
+            if isinstance(value, list):
+                value = ", ".join(value)
+            message_parts.append(f"\n**{label}:** {value}")
+
+
+def _build_onboarding_payload(
+    ticket, form_data, full_name, full_address, comprehensive_message
+):
+    """Build the secure API payload for an onboarding submission."""
+    onboarding_data = {
+        "name": full_name,
+        "email": form_data.get("email"),
+        "phone": form_data.get("phone"),
+        "address": full_address,
+        "birthday": form_data.get("birthday"),
+        "pronouns": form_data.get("pronouns"),
+        "employment_status": form_data.get("employment_status"),
+        "marital_status": form_data.get("marital_status"),
+        "communication_preferences": form_data.get("communication_preference", []),
+        "net_worth": form_data.get("net_worth"),
+        "liquid_net_worth": form_data.get("liquid_net_worth"),
+        "investable_net_worth": form_data.get("investable_net_worth"),
+        "investment_experience": form_data.get("investment_experience"),
+        "comprehensive_message": comprehensive_message,
+        "ticket_id": ticket.id,
+        "source": "onboarding_form",
+    }
+
+    if form_data.get("add_co_client") == "yes":
+        co_full_name = _build_full_name(
+            form_data.get("co_client_first_name"),
+            form_data.get("co_client_middle_names"),
+            form_data.get("co_client_last_name"),
+        )
+
+        onboarding_data["co_client"] = {
+            "name": co_full_name,
+            "email": form_data.get("co_client_email"),
+            "phone": form_data.get("co_client_phone"),
+            "pronouns": form_data.get("co_client_pronouns"),
+            "birthday": form_data.get("co_client_birthday"),
+            "employment_status": form_data.get("co_client_employment_status"),
+        }
+
+    return onboarding_data
+
+
+@rate_limit("onboarding")
+@require_http_methods(["POST"])
+def onboarding_form_submit(request):
+    """Handle comprehensive onboarding form submissions"""
+    form = OnboardingForm(request.POST, request=request)
+    is_htmx = request.headers.get("HX-Request") == "true"
+
+    if form.is_valid():
+        form_data = form.cleaned_data
+
+        try:
+            # Build names and addresses
+            full_name = _build_full_name(
+                form_data.get("first_name"),
+                form_data.get("middle_names"),
+                form_data.get("last_name"),
+            )
+            full_address = _build_full_address(form_data)
+
+            # Build message parts
+            message_parts = _build_basic_info_parts(form_data, full_name, full_address)
+
+            # Add communication preferences
+            if form_data.get("communication_preference"):
+                message_parts.append(
+                    f"\n**Communication Preferences:** {', '.join(form_data.get('communication_preference', []))}"
+                )
+
+            # Add co-client info
+            _add_co_client_info(message_parts, form_data)
+
+            # Add financial context
+            _add_financial_context(message_parts, form_data)
+
+            # Add ethical considerations
+            _add_ethical_considerations(message_parts, form_data)
+
+            from public_site.services import outbox
+
+            comprehensive_message = "\n".join(message_parts)
+
+            # Create support ticket and queue secure API delivery atomically
+            with transaction.atomic():
+                ticket = SupportTicket.objects.create(
+                    name=full_name,
+                    email=form_data["email"],
+                    subject=f"Onboarding Application - {full_name}",
+                    message=comprehensive_message,
+                    ticket_type="onboarding",
+                    status="open",
+                )
+
+                outbox.enqueue(
+                    "onboarding",
+                    _build_onboarding_payload(
+                        ticket,
+                        form_data,
+                        full_name,
+                        full_address,
+                        comprehensive_message,
+                    ),
+                    ticket=ticket,
+                )
+
+            logger.info(
+                "Onboarding form submitted successfully, created ticket #%s", ticket.id
+            )
+
+            # Handle HTMX request
+            if is_htmx:
+                return render(
+                    request,
+                    "public_site/partials/onboarding_success.html",
+                    {
+                        "message": "Thank you for your application!",
+                        "details": "We have received your information and will review it shortly.",
+                        "ticket_id": ticket.id if ticket else None,
+                    },
+                )
+
+            messages.success(
+                request,
+                "Thank you for your application! We have received your information and will review it shortly.",
+            )
+
+            return redirect("/onboarding/thank-you/")
+
+        except Exception:
+            logger.exception("Error processing onboarding form")
+
+            if is_htmx:
+                return render(
+                    request,
+                    "public_site/partials/onboarding_error.html",
+                    {
+                        "message": "There was an error processing your application.",
+                        "details": "Please try again or contact us directly.",
+                    },
+                )
+
+            messages.error(
+                request,
+                "There was an error processing your application. Please try again or contact us directly.",
+            )
+            return redirect("/onboarding/")
+
+    else:
+        # Form has errors
+        # Check if this is spam (honeypot field filled)
+        if request.POST.get("honeypot"):
+            # Even for HTMX requests, redirect for spam detection
+            return redirect("/onboarding/")
+
+        if is_htmx:
+            return render(
+                request,
+                "public_site/partials/onboarding_error.html",
+                {
+                    "message": "Please correct the following errors:",
+                    "errors": form.errors,
+                },
+            )
+
+        error_messages = [
+            f"{field}: {error}"
+            for field, errors in form.errors.items()
+            for error in errors
+        ]
+
+        messages.error(
+            request,
+            f"Please correct the following errors: {', '.join(error_messages)}",
+        )
+        return redirect("/onboarding/")
+
+
+def onboarding_thank_you(request):
+    """Thank you page after onboarding application submission"""
+    context = {
+        "page_title": "Application Received",
+        "heading": "Thank You for Your Application!",
+        "message": "We have received your onboarding application and will review it shortly.",
+        "next_steps": [
+            "Account review and approval (1-2 business days)",
+            "Schedule a consultation with your adviser",
+            "Fund your account and begin investing",
+            "Access your personalized investment dashboard",
+        ],
+    }
+
+    return render(request, "public_site/onboarding_thank_you.html", context)
+
+
+def contact_success(request):
+    """Contact form success page"""
+    context = {
+        "page_title": "Message Sent",
+        "heading": "Thank You for Contacting Us!",
+        "message": "We have received your message and will respond within 24 hours.",
+    }
+    return render(request, "public_site/contact_success.html", context)
+
+
+@rate_limit("contact")
+@api_view(["POST"])
+@permission_classes([AllowAny])
+def contact_api(request):
+    """API endpoint for contact form submissions - supports both JSON and HTMX"""
+    try:
+        # Check if this is an HTMX request
+        is_htmx = request.headers.get("HX-Request") == "true"
+
+        # Use DRF request.data which handles both JSON and form data
+        # This will also handle JSON parsing errors automatically
+        try:
+            data = request.data
+        except Exception as parse_error:
+            logger.warning("JSON parse error in contact API: %s", parse_error)
+            if is_htmx:
+                return render(
+                    request,
+                    "public_site/partials/form_error.html",
+                    {
+                        "message": "Invalid form data. Please check your input and try again."
+                    },
+                )
+            return Response(
+                {
+                    "success": False,
+                    "message": "Invalid JSON format in request.",
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # Create a mock request object for the form with necessary attributes
+        class MockRequest:
+            def __init__(self):
+                self.META = {}
+
+        mock_request = MockRequest()
+
+        # For API endpoints, add required spam protection fields if missing
+        if "human_check" not in data:
+            # Add a simple default value for API usage
+            data = data.copy() if hasattr(data, "copy") else dict(data)
+            data["human_check"] = "2"  # Simple default for API
+
+        form = AccessibleContactForm(data, request=mock_request)
+        # For API usage, set a simple math answer to bypass validation
+        form.math_answer = 2
+
+        if form.is_valid():
+            contact_data = form.cleaned_data
+
+            # Create support ticket
+            ticket = SupportTicket.objects.create(
+                name=contact_data["name"],
+                email=contact_data["email"],
+                company=contact_data.get("company", ""),
+                subject=f"{contact_data['subject']} - {contact_data.get('company', 'Individual')}",
+                message=contact_data["message"],
+                ticket_type="question",
+                status="open",
+            )
+
+            # Send notification email (if configured)
+            if hasattr(settings, "CONTACT_EMAIL") and settings.CONTACT_EMAIL:
+                try:
+                    from ..standalone_email_utils import send_compliance_email
+
+                    message = f"""
+New contact form submission:
+
+Name: {contact_data["name"]}
+Email: {contact_data["email"]}
+Company: {contact_data.get("company", "Not provided")}
+Subject: {contact_data["subject"]}
+
+Message:
+{contact_data["message"]}
+
+Support Ticket ID: {ticket.id}
+                    """
+
+                    send_compliance_email(
+                        subject=f"New Contact Form: {contact_data['subject']}",
+                        message=message,
+                        recipient_email=settings.CONTACT_EMAIL,
+                    )
+                except Exception:
+                    logger.exception("Failed to send contact form email")
+
+            # Return appropriate response based on request type
+            if is_htmx:
+                return render(
+                    request,
+                    "public_site/partials/form_success.html",
+                    {
+                        "message": "Thank you for your message! We will get back to you within 24 hours.",
+                        "ticket_id": ticket.id,
+                    },
+                )
+
+            return Response(
+                {
+                    "success": True,
+                    "message": "Thank you for your message! We will get back to you within 24 hours.",
+                    "ticket_id": ticket.id,
+                },
+                status=status.HTTP_201_CREATED,
+            )
+
+        # Form has errors
+        if is_htmx:
+            return render(
+                request,
+                "public_site/partials/form_error.html",
+                {
+                    "message": "Please correct the form errors.",
+                    "errors": form.errors,
+                },
+            )
+
+        return Response(
+            {
+                "success": False,
+                "message": "Please correct the form errors.",
+                "errors": form.errors,
+            },
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    except Exception:
+        logger.exception("Error in contact API")
+        if is_htmx:
+            return render(
+                request,
+                "public_site/partials/form_error.html",
+                {
+                    "message": "There was an error processing your request. Please try again.",
+                },
+            )
+
+        return Response(
+            {
+                "success": False,
+                "message": "There was an error processing your request. Please try again.",
+            },
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+
+@rate_limit("newsletter")
+@api_view(["POST"])
+@permission_classes([AllowAny])
+def newsletter_api(request):
+    """API endpoint for newsletter signup - supports both JSON and HTMX"""
+    try:
+        # Check if this is an HTMX request
+        is_htmx = request.headers.get("HX-Request") == "true"
+
+        # Use DRF request.data which handles both JSON and form data
+        data = request.data
+
+        form = AccessibleNewsletterForm(data)
+
+        if form.is_valid():
+            email = form.cleaned_data["email"]
+
+            # Create a simple support ticket to track newsletter signups
+            SupportTicket.objects.create(
+                name="Newsletter Subscriber",
+                email=email,
+                subject="Newsletter Signup",
+                message="Newsletter subscription request via API",
+                ticket_type="newsletter",
+                status="resolved",
+            )
+
+            logger.info("Newsletter signup via API: %s", email)
+
+            if is_htmx:
+                return render(
+                    request,
+                    "public_site/partials/newsletter_success.html",
+                    {
+                        "email": email,
+                    },
+                )
+
+            return Response(
+                {
+                    "success": True,
+                    "message": "Thank you for subscribing! You will receive our newsletter updates.",
+                },
+                status=status.HTTP_201_CREATED,
+            )
+
+        if is_htmx:
+            return render(
+                request,
+                "public_site/partials/newsletter_error.html",
+                {
+                    "errors": form.errors,
+                },
+            )
+
+        return Response(
+            {
+                "success": False,
+                "message": "Please provide a valid email address.",
+                "errors": form.errors,
+            },
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    except Exception:
+        logger.exception("Error in newsletter API")
+        if is_htmx:
+            return render(
+                request,
+                "public_site/partials/newsletter_error.html",
+                {
+                    "message": "There was an error with your subscription. Please try again.",
+                },
+            )
+
+        return Response(
+            {
+                "success": False,
+                "message": "There was an error with your subscription. Please try again.",
+            },
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+
+@require_http_methods(["GET"])
+def check_submission_status(request, submission_id):
+    """Check the status of a form submission using its external reference ID."""
+    try:
+        # First check local database
+        try:
+            ticket = SupportTicket.objects.get(external_reference=submission_id)
+            local_status = {
+                "found": True,
+                "ticket_id": ticket.id,
+                "status": ticket.status,
+                "created_at": ticket.created_at.isoformat(),
+                "ticket_type": ticket.ticket_type,
+            }
+        except SupportTicket.DoesNotExist:
+            local_status = {"found": False}
+
+        # Try to get status from secure API if available. Sync on purpose:
+        # under WSGI the pooled client reuses connections across requests,
+        # while an async client would need a fresh event loop per request
+        api_status = None
+        try:
+            from public_site.services.platform_client import platform_client
+
+            api_status = platform_client.check_submission_status(submission_id)
+        except Exception as e:
+            logger.warning(f"Failed to check API submission status: {e}")
+
+        return JsonResponse(
+            {
+                "submission_id": submission_id,
+                "local": local_status,
+                "api": api_status,
+                "timestamp": timezone.now().isoformat(),
+            }
+        )
+
+    except Exception as e:
+        logger.error(f"Error checking submission status: {e}")
+        return JsonResponse({"error": "Unable to check submission status"}, status=500)
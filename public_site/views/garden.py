@@ -0,0 +1,203 @@
+"""
+Garden platform views.
+"""
+
+import json
+import logging
+
+from django.shortcuts import render
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from ..models import SupportTicket
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# GARDEN PLATFORM VIEWS
+# ============================================================================
+
+
+def garden_overview(request):
+    """Garden platform overview with features, login access, and interest registration."""
+
+    # Garden platform features
+    garden_features = [
+        {
+            "title": "Portfolio Intelligence",
+            "icon": "📊",
+            "description": "Thoughtful portfolio curation and performance understanding with integrated ethical framework.",
+            "highlights": [
+                "Deep portfolio understanding and performance analytics",
+                "Multi-strategy support (Growth, Income, Diversification)",
+                "Intelligent rebalancing recommendations and insights",
+                "Comprehensive risk assessment with downside protection analysis",
+                "Tax-loss harvesting optimization and detailed reporting",
+            ],
+        },
+        {
+            "title": "Research Platform",
+            "icon": "🔍",
+            "description": "Deep research tools for thoughtful analysis and cultivating investment wisdom.",
+            "highlights": [
+                "Company screening with our full exclusion criteria",
+                "AI-enhanced fundamental analysis and valuation models",
+                "ESG integration with proprietary ethical scoring framework",
+                "Market sentiment analysis and pattern recognition",
+                "Curated research reports and analytical summaries",
+            ],
+        },
+        {
+            "title": "Client Communication Hub",
+            "icon": "💬",
+            "description": "Thoughtful client relationship management with intelligent communication tools.",
+            "highlights": [
+                "Curated client reporting with personalized insights",
+                "Meeting scheduling and portfolio review management",
+                "Document sharing with secure client portal access",
+                "Communication history and relationship tracking",
+                "Compliance monitoring and regulatory documentation",
+            ],
+        },
+        {
+            "title": "AI-Enhanced Wisdom",
+            "icon": "🤖",
+            "description": "Intelligent assistance for deeper research, analysis, and learning from patterns.",
+            "highlights": [
+                "Human-in-the-loop (HITL) quality assurance and learning processes",
+                "Thoughtful data curation from multiple sources",
+                "Natural language query interface for complex analysis",
+                "Pattern recognition for market insights and opportunities",
+                "Workflow orchestration that learns from your practice",
+            ],
+        },
+        {
+            "title": "Compliance & Risk Stewardship",
+            "icon": "🛡️",
+            "description": "Thoughtful regulatory compliance and risk understanding with intelligent guidance.",
+            "highlights": [
+                "Fiduciary standard compliance monitoring and reporting",
+                "Intelligent regulatory filing and deadline tracking",
+                "Risk assessment with stress testing and scenario analysis",
+                "Comprehensive audit trail and documentation management",
+                "Privacy protection with PII detection and encryption",
+            ],
+        },
+        {
+            "title": "Knowledge Integration Canvas",
+            "icon": "🔗",
+            "description": "Unified knowledge platform weaving together financial, operational, and market insights.",
+            "highlights": [
+                "Comprehensive market data feeds with price synchronization",
+                "Multi-custodian account aggregation and reconciliation",
+                "Document management with Paperless-ngx integration",
+                "Knowledge graph for understanding entity relationships and insights",
+                "Thoughtful API integrations with Sharadar, SEC EDGAR, and more",
+            ],
+        },
+    ]
+
+    context = {
+        "page_title": "Garden Investment Platform",
+        "garden_features": garden_features,
+        "platform_login_url": "/garden/platform/auth/login/",
+        "total_features": len(garden_features),
+        "feature_count": len(garden_features),
+        "highlights_per_feature": 5,
+    }
+
+    return render(request, "public_site/garden_overview.html", context)
+
+
+@api_view(["POST"])
+@permission_classes([AllowAny])
+def garden_interest_registration(request):
+    """Handle Garden platform interest registration form submissions."""
+
+    try:
+        # Use DRF request.data which handles both JSON and form data
+        data = request.data
+
+        # Extract form fields
+        name = data.get("name", "").strip()
+        email = data.get("email", "").strip()
+        company = data.get("company", "").strip()
+        role = data.get("role", "").strip()
+        interest_areas = data.get("interest_areas", [])
+        message = data.get("message", "").strip()
+
+        # Basic validation
+        if not name or not email:
+            return Response(
+                {"success": False, "error": "Name and email are required fields."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # Email format validation
+        import re
+
+        email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+        if not re.match(email_pattern, email):
+            return Response(
+                {"success": False, "error": "Please enter a valid email address."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # Create a support ticket to track Garden interest
+        try:
+            SupportTicket.objects.create(
+                name=name,
+                email=email,
+                company=company,
+                subject=f"Garden Platform Interest - {role if role else 'Professional'}",
+                message=f"""Garden Platform Access Request:
+
+Company: {company}
+Role: {role}
+Interest Areas: {", ".join(interest_areas)}
+
+Message:
+{message}""",
+                ticket_type="garden_interest",
+                priority="high",
+                status="open",
+            )
+        except Exception as e:
+            logger.warning("Could not create support ticket for Garden interest: %s", e)
+
+        # Log the registration
+        logger.info(
+            "Garden interest registration: %s (%s) from %s", name, email, company
+        )
+        logger.info("Role: %s, Interests: %s", role, ", ".join(interest_areas))
+        logger.info("Message: %s", message)
+
+        # Return success response
+        return Response(
+            {
+                "success": True,
+                "message": "Thank you for your interest! We will contact you soon to discuss Garden platform access.",
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+    except json.JSONDecodeError:
+        return Response(
+            {"success": False, "error": "Invalid request format."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    except Exception:
+        # Log error
+        logger.exception("Error processing Garden interest registration")
+
+        return Response(
+            {
+                "success": False,
+                "error": "An error occurred processing your request. Please try again.",
+            },
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
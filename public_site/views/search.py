@@ -0,0 +1,140 @@
+"""
+Site search views.
+"""
+
+import logging
+
+from django.apps import apps
+from django.core.paginator import Paginator
+from django.shortcuts import redirect, render
+from wagtail.models import Page
+
+from ..utils.rate_limit import rate_limit
+
+logger = logging.getLogger(__name__)
+
+
+def get_query_model():
+    """Wagtail's search Query model, imported on first search.
+
+    None unless search_promotions is installed: importing its models
+    otherwise registers tables that don't exist.
+    """
+    if not apps.is_installed("wagtail.contrib.search_promotions"):
+        return None
+    try:
+        from wagtail.contrib.search_promotions.models import Query
+    except ImportError:
+        try:
+            # Fallback to old location for backward compatibility
+            from wagtail.search.models import Query
+        except ImportError:
+            Query = None
+    return Query
+
+
+def site_search(request):
+    """Simple site search using Wagtail's built-in search functionality."""
+    query_string = request.GET.get("q", "").strip()
+
+    if query_string:
+        try:
+            # Use Wagtail's search functionality
+            search_results = Page.objects.live().search(query_string)
+
+            # Log the query (if Query model is available)
+            Query = get_query_model()
+            if Query:
+                Query.get(query_string).add_hit()
+
+            # Paginate results
+            paginator = Paginator(search_results, 10)
+            page_number = request.GET.get("page")
+            page_obj = paginator.get_page(page_number)
+
+            context = {
+                "query_string": query_string,
+                "search_results": page_obj,
+                "total_results": paginator.count,
+                "page": None,  # Add page=None to prevent template errors
+            }
+        except Exception as e:
+            # If search fails (e.g., in testing with missing FTS tables), fall back to simple filtering
+            logger.warning("Search functionality failed, using fallback: %s", e)
+
+            # Simple fallback search on page titles
+            pages = Page.objects.live().filter(title__icontains=query_string)
+            paginator = Paginator(pages, 10)
+            page_number = request.GET.get("page")
+            page_obj = paginator.get_page(page_number)
+
+            context = {
+                "query_string": query_string,
+                "search_results": page_obj,
+                "total_results": paginator.count,
+                "page": None,  # Add page=None to prevent template errors
+            }
+    else:
+        context = {
+            "query_string": "",
+            "search_results": None,
+            "total_results": 0,
+            "page": None,  # Add page=None to prevent template errors
+        }
+
+    return render(request, "public_site/search_results.html", context)
+
+
+@rate_limit("search")
+def site_search_live(request):
+    """Live search endpoint for HTMX - returns partial HTML results."""
+    query_string = request.GET.get("q", "").strip()
+
+    # Check if this is an HTMX request
+    is_htmx = request.headers.get("HX-Request") == "true"
+
+    if not query_string or len(query_string) < 2:
+        # Return empty results for short queries
+        return render(
+            request,
+            "public_site/partials/search_results_live.html",
+            {
+                "query_string": query_string,
+                "search_results": [],
+                "total_results": 0,
+            },
+        )
+
+    try:
+        # Use Wagtail's search functionality - limit to 5 results for live search
+        search_results = Page.objects.live().search(query_string)[:5]
+
+        # Convert to list to get count without extra query
+        results_list = list(search_results)
+
+        context = {
+            "query_string": query_string,
+            "search_results": results_list,
+            "total_results": len(results_list),
+            "show_more": len(results_list)
+            >= 5,  # Show "View all results" if we hit the limit
+        }
+    except Exception as e:
+        # Fallback to simple title search
+        logger.warning("Live search failed, using fallback: %s", e)
+
+        pages = Page.objects.live().filter(title__icontains=query_string)[:5]
+        results_list = list(pages)
+
+        context = {
+            "query_string": query_string,
+            "search_results": results_list,
+            "total_results": len(results_list),
+            "show_more": len(results_list) >= 5,
+        }
+
+    # Return partial template for HTMX
+    if is_htmx:
+        return render(request, "public_site/partials/search_results_live.html", context)
+    # For non-HTMX requests, redirect to full search
+    return redirect(f"/search/?q={query_string}")
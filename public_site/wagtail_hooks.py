@@ -207,6 +207,12 @@ def global_admin_js():
     </script>"""
 
 
+@hooks.register("before_serve_page")
+def tag_page_type_for_metrics(page, request, serve_args, serve_kwargs):
+    """Label request metrics with the served page type instead of its URL."""
+    request.perf_page_type = type(page).__name__
+
+
 @hooks.register("construct_homepage_panels")
 def add_public_site_instructions(request, panels):
     """Add helpful instructions panel to the homepage admin."""
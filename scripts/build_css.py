@@ -4,17 +4,33 @@ Garden UI CSS Bundle Builder
 Creates optimized CSS bundles for production deployment
 
 Usage:
-    python scripts/build_css.py [--development] [--minify]
+    python scripts/build_css.py [--development] [--minify] [--force] [--jobs N]
 
 Options:
     --development   Build development bundle with comments and debugging info
-    --minify        Minify the output (requires csso or similar tool)
+    --minify        Minify the output (the default for production builds)
     --watch         Watch for file changes and rebuild automatically
+    --force         Rebuild every bundle even if its inputs are unchanged
+    --jobs N        Number of bundles built in parallel
+
+Builds are incremental: each bundle records a hash of its inputs (source
+files plus any local @import dependencies, and the build mode) in
+bundles/.build-state.json and is only rebuilt when that hash changes.
+Production bundles are also written under a content-hashed filename
+(e.g. garden-ui-core.3f2a9c1e.css, listed in manifest.json) for immutable
+caching, and precompressed to .gz and, if the brotli package is
+installed, .br.
 """
 
 import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -22,12 +38,219 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Bump when bundle output changes for the same inputs
+BUILDER_VERSION = "2"
+HASH_LENGTH = 8
+
+IMPORT_RE = re.compile(r"""@import\s+(?:url\()?\s*['"]?([^'")\s;]+)['"]?\s*\)?""")
+
+# Pseudo-classes/elements every supported browser understands. Rules are
+# only merged into one selector list when all their pseudos are listed
+# here, since one unknown selector invalidates the whole list.
+SAFE_PSEUDOS = frozenset(
+    """
+    active after before checked disabled empty enabled first-child
+    first-letter first-line first-of-type focus focus-within hover
+    last-child last-of-type link not nth-child nth-last-child
+    nth-of-type only-child placeholder root target visited
+    """.split()
+)
+PSEUDO_RE = re.compile(r"::?([a-zA-Z-]+)")
+
+
+# --------------------------------------------------------------------------
+# Minification
+# --------------------------------------------------------------------------
+
+
+def _tokenize(css):
+    """Split CSS into ("string" | "comment" | "text", value) tokens."""
+    tokens = []
+    i = 0
+    length = len(css)
+    text_start = 0
+
+    while i < length:
+        char = css[i]
+        if char in "\"'":
+            end = i + 1
+            while end < length and css[end] != char:
+                end += 2 if css[end] == "\\" else 1
+            if text_start < i:
+                tokens.append(("text", css[text_start:i]))
+            tokens.append(("string", css[i : end + 1]))
+            i = text_start = end + 1
+        elif css.startswith("/*", i):
+            end = css.find("*/", i + 2)
+            end = length if end == -1 else end + 2
+            if text_start < i:
+                tokens.append(("text", css[text_start:i]))
+            tokens.append(("comment", css[i:end]))
+            i = text_start = end
+        else:
+            i += 1
+
+    if text_start < length:
+        tokens.append(("text", css[text_start:]))
+    return tokens
+
+
+def _squeeze(text):
+    """Collapse whitespace in a run of CSS outside strings and comments."""
+    text = re.sub(r"\s+", " ", text)
+    # Spaces around these are never significant ("+" and "-" are, in calc())
+    text = re.sub(r" ?([{};,>~]) ?", r"\1", text)
+    text = re.sub(r": ", ":", text)
+    return text
+
+
+def minify_css(css):
+    """Minify CSS: drop comments (keeping /*! */), collapse whitespace,
+    drop redundant semicolons and merge adjacent rules. Strings are never
+    modified.
+    """
+    parts = []
+    for kind, value in _tokenize(css):
+        if kind == "comment" and not value.startswith("/*!"):
+            # A comment still separates tokens: "a/**/b" is not "ab"
+            parts.append(" ")
+        else:
+            parts.append(value)
+
+    css = _mask_strings("".join(parts), _squeeze)
+    css = _mask_strings(css, lambda text: re.sub(r";+}", "}", text))
+    return merge_rules(css).strip()
+
+
+def _mask_strings(css, transform):
+    """Apply ``transform`` to text outside strings and comments."""
+    return "".join(
+        transform(value) if kind == "text" else value for kind, value in _tokenize(css)
+    )
+
+
+def _parse_blocks(css, start=0):
+    """Parse minified CSS into nodes until an unmatched "}".
+
+    Nodes are ("rule", selector, declarations), ("block", prelude, children)
+    for at-rules and nested rules, and ("raw", text) for statements and
+    comments. Returns (nodes, index after the closing brace).
+    """
+    nodes = []
+    i = start
+    segment_start = start
+    length = len(css)
+
+    while i < length:
+        char = css[i]
+        if char in "\"'":
+            end = i + 1
+            while end < length and css[end] != char:
+                end += 2 if css[end] == "\\" else 1
+            i = end + 1
+        elif css.startswith("/*", i):
+            end = css.find("*/", i + 2)
+            end = length if end == -1 else end + 2
+            nodes.append(("raw", css[segment_start:end]))
+            i = segment_start = end
+        elif char == ";":
+            nodes.append(("raw", css[segment_start : i + 1]))
+            i = segment_start = i + 1
+        elif char == "{":
+            prelude = css[segment_start:i].strip()
+            children, after = _parse_blocks(css, i + 1)
+            body = css[i + 1 : after - 1]
+            if all(node[0] == "raw" and not node[1].startswith("/*") for node in children):
+                # Declarations only, where "color :red" can lose its space
+                body = _mask_strings(body, lambda text: text.replace(" :", ":"))
+                nodes.append(("rule", prelude, body))
+            else:
+                nodes.append(("block", prelude, children))
+            i = segment_start = after
+        elif char == "}":
+            if segment_start < i:
+                nodes.append(("raw", css[segment_start:i]))
+            return nodes, i + 1
+        else:
+            i += 1
+
+    if segment_start < length:
+        nodes.append(("raw", css[segment_start:]))
+    return nodes, length
+
+
+def _mergeable_selector(selector):
+    if selector.startswith("@"):
+        return False
+    return all(name.lower() in SAFE_PSEUDOS for name in PSEUDO_RE.findall(selector))
+
+
+def _merge_nodes(nodes):
+    merged = []
+    for node in nodes:
+        if node[0] == "block":
+            node = ("block", node[1], _merge_nodes(node[2]))
+        elif node[0] == "rule" and not node[2] and not node[1].startswith("@"):
+            continue  # empty rule
+        previous = merged[-1] if merged else None
+
+        if node[0] == "rule" and previous is not None and previous[0] == "rule":
+            _, selector, body = node
+            _, prev_selector, prev_body = previous
+            if not selector.startswith("@") and selector == prev_selector:
+                # a{x}a{y} -> a{x;y}
+                joined = f"{prev_body};{body}" if prev_body and body else prev_body or body
+                merged[-1] = ("rule", selector, joined)
+                continue
+            if (
+                body == prev_body
+                and _mergeable_selector(selector)
+                and _mergeable_selector(prev_selector)
+            ):
+                # a{x}b{x} -> a,b{x}
+                merged[-1] = ("rule", f"{prev_selector},{selector}", body)
+                continue
+        merged.append(node)
+    return merged
+
+
+def _serialize(nodes):
+    parts = []
+    for node in nodes:
+        if node[0] == "raw":
+            parts.append(node[1])
+        elif node[0] == "rule":
+            parts.append(f"{node[1]}{{{node[2]}}}")
+        else:
+            parts.append(f"{node[1]}{{{_serialize(node[2])}}}")
+    return "".join(parts)
+
+
+def merge_rules(css):
+    """Merge adjacent rules with the same selector or the same declarations."""
+    nodes, end = _parse_blocks(css)
+    if end < len(css):
+        # Unbalanced braces: leave the stylesheet as the browser would see it
+        return css
+    return _serialize(_merge_nodes(nodes))
+
+
+# --------------------------------------------------------------------------
+# Bundling
+# --------------------------------------------------------------------------
+
 
 class CSSBundler:
     def __init__(self, project_root):
         self.project_root = Path(project_root)
         self.css_dir = self.project_root / "static" / "css"
         self.output_dir = self.css_dir / "bundles"
+        self.state_path = self.output_dir / ".build-state.json"
 
         # Ensure output directory exists
         self.output_dir.mkdir(exist_ok=True)
@@ -71,36 +294,70 @@ class CSSBundler:
             ],
         }
 
-    def read_css_file(self, filename):
-        """Read CSS file and return content with metadata"""
+    def read_css_file(self, filename, log):
+        """Read CSS file and return its content"""
         file_path = self.css_dir / filename
 
         if not file_path.exists():
-            print(f"⚠️  Warning: File not found: {filename}")
+            log.append(f"⚠️  Warning: File not found: {filename}")
             return ""
 
         try:
-            with open(file_path, encoding="utf-8") as f:
-                content = f.read()
-
-            # Get file stats
-            stat = file_path.stat()
-            size_kb = stat.st_size / 1024
-
-            print(f"📁 {filename} ({size_kb:.1f}KB)")
+            content = file_path.read_text(encoding="utf-8")
+            log.append(f"📁 {filename} ({file_path.stat().st_size / 1024:.1f}KB)")
             return content
-
         except Exception as e:
-            print(f"❌ Error reading {filename}: {e}")
+            log.append(f"❌ Error reading {filename}: {e}")
             return ""
 
-    def create_bundle_header(self, bundle_name, files, development=False):
-        """Create informative header for bundle"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    def get_dependencies(self, files):
+        """Source files plus local files they @import, transitively."""
+        seen = []
+        pending = list(files)
+        while pending:
+            filename = pending.pop(0)
+            if filename in seen:
+                continue
+            seen.append(filename)
+            path = self.css_dir / filename
+            try:
+                content = path.read_text(encoding="utf-8")
+            except OSError:
+                continue
+            for target in IMPORT_RE.findall(content):
+                if "://" in target or target.startswith("/"):
+                    continue
+                resolved = (path.parent / target).resolve()
+                try:
+                    pending.append(str(resolved.relative_to(self.css_dir.resolve())))
+                except ValueError:
+                    continue
+        return seen
+
+    def input_hash(self, bundle_name, development=False):
+        """Hash of everything that determines a bundle's output."""
+        digest = hashlib.sha256()
+        digest.update(f"{BUILDER_VERSION}:{bundle_name}:{development}".encode())
+        for filename in self.get_dependencies(self.bundles[bundle_name]):
+            digest.update(filename.encode())
+            path = self.css_dir / filename
+            digest.update(path.read_bytes() if path.exists() else b"<missing>")
+        return digest.hexdigest()
+
+    def load_state(self):
+        try:
+            return json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
 
+    def save_state(self, state):
+        self.state_path.write_text(json.dumps(state, indent=2, sort_keys=True), encoding="utf-8")
+
+    def create_bundle_header(self, bundle_name, files, source_hash, development=False):
+        """Create informative header for bundle"""
         header = f"""/*!
  * {bundle_name} - Garden UI CSS Bundle
- * Generated: {timestamp}
+ * Source hash: {source_hash[:HASH_LENGTH * 2]}
  *
  * This bundle combines the following modular CSS files:
 """
@@ -123,34 +380,18 @@ class CSSBundler:
         return header
 
     def optimize_css(self, content, development=False):
-        """Basic CSS optimization"""
+        """Minify CSS for production builds"""
         if development:
             return content
+        return minify_css(content)
 
-        # Basic optimizations (can be extended with proper CSS minifier)
-        optimized = content
-
-        # Remove excessive whitespace (preserve within strings)
-        import re
-
-        # Remove comments (except special ones like /*! */)
-        optimized = re.sub(r"/\*(?!\!).*?\*/", "", optimized, flags=re.DOTALL)
-
-        # Remove extra whitespace
-        optimized = re.sub(r"\n\s*\n", "\n", optimized)
-        optimized = re.sub(r"  +", " ", optimized)
-
-        # Remove trailing whitespace
-        optimized = re.sub(r" +\n", "\n", optimized)
-
-        return optimized.strip()
-
-    def create_bundle(self, bundle_name, files, development=False):
-        """Create a CSS bundle from multiple files"""
-        print(f"\n🔨 Building {bundle_name}...")
+    def create_bundle(self, bundle_name, source_hash, development=False):
+        """Create a CSS bundle from multiple files; returns a result dict"""
+        files = self.bundles[bundle_name]
+        log = [f"\n🔨 Building {bundle_name}..."]
 
         # Create bundle header
-        content = self.create_bundle_header(bundle_name, files, development)
+        content = self.create_bundle_header(bundle_name, files, source_hash, development)
 
         # Add section separator
         content += "/* ===== BUNDLE CONTENTS ===== */\n\n"
@@ -159,7 +400,7 @@ class CSSBundler:
 
         # Process each file
         for file in files:
-            file_content = self.read_css_file(file)
+            file_content = self.read_css_file(file, log)
 
             if file_content:
                 # Add file separator in development mode
@@ -178,55 +419,116 @@ class CSSBundler:
 
         # Optimize content
         if not development:
-            print("🔧 Optimizing CSS...")
+            log.append("🔧 Optimizing CSS...")
             content = self.optimize_css(content, development)
 
-        # Write bundle
-        output_path = self.output_dir / bundle_name
+        data = content.encode("utf-8")
+        content_hash = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+        stem, suffix = os.path.splitext(bundle_name)
+        hashed_name = f"{stem}.{content_hash}{suffix}" if not development else None
 
         try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(content)
-
-            # Get final size
-            final_size = output_path.stat().st_size
-            final_size_kb = final_size / 1024
-            original_size_kb = total_size / 1024
-
-            if not development and total_size > 0:
-                savings = ((total_size - final_size) / total_size) * 100
-                print(f"📦 Bundle created: {bundle_name}")
-                print(f"   Original: {original_size_kb:.1f}KB")
-                print(f"   Optimized: {final_size_kb:.1f}KB")
-                print(f"   Savings: {savings:.1f}%")
-            else:
-                print(f"📦 Bundle created: {bundle_name} ({final_size_kb:.1f}KB)")
-
+            self._write(self.output_dir / bundle_name, data)
+            if hashed_name:
+                self._remove_stale_hashed(stem, suffix, keep=hashed_name)
+                self._write(self.output_dir / hashed_name, data)
         except Exception as e:
-            print(f"❌ Error writing bundle {bundle_name}: {e}")
+            log.append(f"❌ Error writing bundle {bundle_name}: {e}")
+            return {"bundle": bundle_name, "ok": False, "log": log}
+
+        final_size = len(data)
+        if not development and total_size > 0:
+            savings = ((total_size - final_size) / total_size) * 100
+            log.append(f"📦 Bundle created: {hashed_name}")
+            log.append(f"   Original: {total_size / 1024:.1f}KB")
+            log.append(f"   Optimized: {final_size / 1024:.1f}KB")
+            log.append(f"   Savings: {savings:.1f}%")
+        else:
+            log.append(f"📦 Bundle created: {bundle_name} ({final_size / 1024:.1f}KB)")
+
+        return {
+            "bundle": bundle_name,
+            "ok": True,
+            "log": log,
+            "file": hashed_name or bundle_name,
+            "hash": content_hash,
+            "source_hash": source_hash,
+        }
 
-    def build_all(self, development=False):
-        """Build all CSS bundles"""
+    def _write(self, path, data):
+        """Write a file and its precompressed variants"""
+        path.write_bytes(data)
+        # mtime=0 keeps the .gz byte-identical across rebuilds
+        path.with_name(path.name + ".gz").write_bytes(gzip.compress(data, 9, mtime=0))
+        if brotli is not None:
+            path.with_name(path.name + ".br").write_bytes(brotli.compress(data))
+
+    def _remove_stale_hashed(self, stem, suffix, keep):
+        pattern = re.compile(
+            rf"^{re.escape(stem)}\.[0-9a-f]{{{HASH_LENGTH}}}{re.escape(suffix)}(\.gz|\.br)?$"
+        )
+        for path in self.output_dir.iterdir():
+            if pattern.match(path.name) and not path.name.startswith(keep):
+                path.unlink()
+
+    def build_all(self, development=False, force=False, jobs=None):
+        """Build bundles whose inputs changed since the last build"""
         print("🚀 Starting Garden UI CSS Bundle Build")
         print(f"📂 Source directory: {self.css_dir}")
         print(f"📂 Output directory: {self.output_dir}")
         print(f"🔧 Mode: {'Development' if development else 'Production'}")
+        if brotli is None and not development:
+            print("ℹ️  brotli not installed; writing .gz only (pip install brotli)")
 
         start_time = time.time()
-
-        # Build each bundle
-        for bundle_name, files in self.bundles.items():
-            self.create_bundle(bundle_name, files, development)
+        state = self.load_state()
+
+        stale = {}
+        for bundle_name in self.bundles:
+            source_hash = self.input_hash(bundle_name, development)
+            previous = state.get(bundle_name, {})
+            output = self.output_dir / previous.get("file", bundle_name)
+            if force or previous.get("source_hash") != source_hash or not output.exists():
+                stale[bundle_name] = source_hash
+            else:
+                print(f"⏭️  {bundle_name} unchanged")
+
+        if stale:
+            jobs = jobs or min(len(stale), os.cpu_count() or 1)
+            if jobs > 1 and len(stale) > 1:
+                with ProcessPoolExecutor(max_workers=jobs) as executor:
+                    futures = [
+                        executor.submit(self.create_bundle, name, source_hash, development)
+                        for name, source_hash in stale.items()
+                    ]
+                    results = [future.result() for future in futures]
+            else:
+                results = [
+                    self.create_bundle(name, source_hash, development)
+                    for name, source_hash in stale.items()
+                ]
+
+            for result in results:
+                print("\n".join(result["log"]))
+                if result["ok"]:
+                    state[result["bundle"]] = {
+                        key: result[key] for key in ("file", "hash", "source_hash")
+                    }
+                else:
+                    state.pop(result["bundle"], None)
+            self.save_state(state)
 
         # Create manifest file
-        self.create_manifest()
+        self.create_manifest(state)
 
         elapsed = time.time() - start_time
-        print(f"\n✅ Build completed in {elapsed:.2f}s")
+        print(f"\n✅ Build completed in {elapsed:.2f}s ({len(stale)} rebuilt)")
         print(f"📁 Bundles available in: {self.output_dir}")
+        return list(stale)
 
-    def create_manifest(self):
+    def create_manifest(self, state=None):
         """Create a manifest file with bundle information"""
+        state = state if state is not None else self.load_state()
         manifest = {
             "bundles": {},
             "generated": datetime.now().isoformat(),
@@ -236,25 +538,32 @@ class CSSBundler:
 
         # Add bundle information
         for bundle_name, files in self.bundles.items():
-            bundle_path = self.output_dir / bundle_name
+            entry = state.get(bundle_name, {})
+            bundle_path = self.output_dir / entry.get("file", bundle_name)
 
             if bundle_path.exists():
                 stat = bundle_path.stat()
-                manifest["bundles"][bundle_name] = {
+                info = {
+                    "file": bundle_path.name,
+                    "hash": entry.get("hash"),
                     "files": files,
+                    "dependencies": self.get_dependencies(files),
                     "size_bytes": stat.st_size,
                     "size_kb": round(stat.st_size / 1024, 1),
                     "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
                 }
+                for encoding in ("gz", "br"):
+                    compressed = bundle_path.with_name(f"{bundle_path.name}.{encoding}")
+                    if compressed.exists():
+                        info[f"{encoding}_size_bytes"] = compressed.stat().st_size
+                manifest["bundles"][bundle_name] = info
 
         # Add modular file list
-        for css_file in self.css_dir.glob("garden-ui-*.css"):
+        for css_file in sorted(self.css_dir.glob("garden-ui-*.css")):
             if css_file.name not in ["garden-ui-public.css"]:  # Skip legacy files
                 manifest["modular_files"].append(css_file.name)
 
         # Write manifest
-        import json
-
         manifest_path = self.output_dir / "manifest.json"
 
         try:
@@ -264,8 +573,8 @@ class CSSBundler:
         except Exception as e:
             print(f"❌ Error creating manifest: {e}")
 
-    def watch_files(self, development=False):
-        """Watch for file changes and rebuild automatically"""
+    def watch_files(self, development=False, jobs=None):
+        """Watch for file changes and rebuild the bundles that use them"""
         print("👀 Watching for file changes...")
         print("Press Ctrl+C to stop")
 
@@ -283,22 +592,24 @@ class CSSBundler:
                 self.last_build = 0
 
             def on_modified(self, event):
-                if event.is_directory:
+                if event.is_directory or not event.src_path.endswith(".css"):
+                    return
+                if Path(event.src_path).parent == self.bundler.output_dir:
                     return
 
-                if event.src_path.endswith(".css"):
-                    # Debounce rapid changes
-                    now = time.time()
-                    if now - self.last_build < 1:
-                        return
+                # Debounce rapid changes
+                now = time.time()
+                if now - self.last_build < 1:
+                    return
 
-                    print(f"\n🔄 File changed: {Path(event.src_path).name}")
-                    self.bundler.build_all(self.development)
-                    self.last_build = now
+                print(f"\n🔄 File changed: {Path(event.src_path).name}")
+                # Unchanged bundles are skipped by their input hashes
+                self.bundler.build_all(self.development, jobs=jobs)
+                self.last_build = now
 
         event_handler = CSSFileHandler(self, development)
         observer = Observer()
-        observer.schedule(event_handler, str(self.css_dir), recursive=False)
+        observer.schedule(event_handler, str(self.css_dir), recursive=True)
         observer.start()
 
         try:
@@ -318,11 +629,17 @@ def main():
         help="Build development bundle with comments",
     )
     parser.add_argument(
-        "--minify", action="store_true", help="Minify the output (basic optimization)"
+        "--minify", action="store_true", help="Minify the output (default for production)"
     )
     parser.add_argument(
         "--watch", action="store_true", help="Watch for file changes and rebuild"
     )
+    parser.add_argument(
+        "--force", action="store_true", help="Rebuild all bundles regardless of changes"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=None, help="Bundles built in parallel"
+    )
 
     args = parser.parse_args()
 
@@ -331,11 +648,11 @@ def main():
 
     if args.watch:
         # Build once, then watch
-        bundler.build_all(args.development)
-        bundler.watch_files(args.development)
+        bundler.build_all(args.development, force=args.force, jobs=args.jobs)
+        bundler.watch_files(args.development, jobs=args.jobs)
     else:
         # Single build
-        bundler.build_all(args.development)
+        bundler.build_all(args.development, force=args.force, jobs=args.jobs)
 
 
 if __name__ == "__main__":
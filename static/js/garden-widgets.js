@@ -23,14 +23,16 @@ window.GardenUI = {
         const newTheme = currentTheme === "dark" ? "light" : "dark";
         document.documentElement.setAttribute("data-theme", newTheme);
         localStorage.setItem("garden-theme", newTheme);
+        // Persist in the signed theme cookie read by the base template's
+        // pre-paint script
+        fetch("/api/theme/set/", {
+          method: "POST",
+          headers: { "Content-Type": "application/json" },
+          body: JSON.stringify({ theme: newTheme }),
+          credentials: "same-origin",
+        }).catch(() => {});
       });
     });
-
-    // Load saved theme
-    const savedTheme = localStorage.getItem("garden-theme");
-    if (savedTheme) {
-      document.documentElement.setAttribute("data-theme", savedTheme);
-    }
   },
 
   // Modal functionality
@@ -0,0 +1,99 @@
+"""Tests for the incremental CSS bundle builder in scripts/build_css.py."""
+
+import gzip
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "build_css.py"
+spec = importlib.util.spec_from_file_location("build_css", SCRIPT)
+build_css = importlib.util.module_from_spec(spec)
+# Registered so worker processes can unpickle CSSBundler
+sys.modules["build_css"] = build_css
+spec.loader.exec_module(build_css)
+
+
+class TestMinifyCSS:
+    def test_strips_comments_and_whitespace(self):
+        css = "/*! license */\n/* note */\na , b > c {  color : red ; }"
+
+        assert build_css.minify_css(css) == "/*! license */a,b>c{color:red}"
+
+    def test_strings_untouched(self):
+        css = '.x { content: "  a ; } /* b */ " ; }'
+
+        assert build_css.minify_css(css) == '.x{content:"  a ; } /* b */ "}'
+
+    def test_calc_and_descendant_pseudo_spacing_kept(self):
+        css = "div :hover { width: calc(100% - 2px) }"
+
+        assert build_css.minify_css(css) == "div :hover{width:calc(100% - 2px)}"
+
+    def test_adjacent_rules_merged(self):
+        css = "a{color:red}a{margin:0}.b{color:blue}.c{color:blue}.d{}"
+
+        assert build_css.minify_css(css) == "a{color:red;margin:0}.b,.c{color:blue}"
+
+    def test_vendor_pseudos_not_merged(self):
+        """One unknown selector would invalidate a merged selector list."""
+        css = "::-moz-selection{color:red}::selection{color:red}"
+
+        assert build_css.minify_css(css) == css
+
+    def test_merges_inside_at_rules(self):
+        css = "@media (max-width: 600px) { .a { top: 0 } .b { top: 0 } }"
+
+        assert build_css.minify_css(css) == "@media (max-width:600px){.a,.b{top:0}}"
+
+
+@pytest.fixture
+def bundler(tmp_path):
+    css_dir = tmp_path / "static" / "css"
+    (css_dir / "shared").mkdir(parents=True)
+    (css_dir / "shared" / "tokens.css").write_text(":root { --x: 1px; }")
+    (css_dir / "one.css").write_text("@import url('shared/tokens.css');\n.one { top: 0 }")
+    (css_dir / "two.css").write_text(".two { top: 0 }")
+
+    instance = build_css.CSSBundler(tmp_path)
+    instance.bundles = {"a.css": ["one.css"], "b.css": ["two.css"]}
+    return instance
+
+
+class TestCSSBundler:
+    def test_hashed_compressed_output_and_manifest(self, bundler):
+        bundler.build_all(jobs=1)
+
+        manifest = json.loads((bundler.output_dir / "manifest.json").read_text())
+        entry = manifest["bundles"]["a.css"]
+        hashed = bundler.output_dir / entry["file"]
+        assert entry["file"] == f"a.{entry['hash']}.css"
+        assert entry["dependencies"] == ["one.css", "shared/tokens.css"]
+        assert gzip.decompress(
+            (bundler.output_dir / f"{entry['file']}.gz").read_bytes()
+        ) == hashed.read_bytes()
+
+    def test_only_changed_bundles_rebuilt(self, bundler):
+        assert sorted(bundler.build_all(jobs=1)) == ["a.css", "b.css"]
+        assert bundler.build_all(jobs=1) == []
+
+        (bundler.css_dir / "shared" / "tokens.css").write_text(":root { --x: 2px; }")
+
+        assert bundler.build_all(jobs=1) == ["a.css"]
+
+    def test_stale_hashed_files_removed(self, bundler):
+        bundler.build_all(jobs=1)
+        (bundler.css_dir / "two.css").write_text(".two { top: 1px }")
+        bundler.build_all(jobs=1)
+
+        assert len(list(bundler.output_dir.glob("b.*.css"))) == 1
+
+    def test_parallel_build_matches_serial(self, bundler):
+        bundler.build_all(jobs=1)
+        serial = json.loads(bundler.state_path.read_text())
+
+        bundler.build_all(force=True, jobs=2)
+
+        assert json.loads(bundler.state_path.read_text()) == serial